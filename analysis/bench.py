@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+bench.py — Benchmark the analysis pipeline on synthetic studies of several sizes.
+
+For each scale, generates a synthetic study tree with synth_data.py, checks
+it against data/schemas/ (synth_data.validate), and times every pipeline
+stage against it in a fresh interpreter (DSQI_STUDY_ROOT):
+
+    load      every data_loader loader
+    collect   dsqi_collect.py --reuse-cloc for every artifact
+    score     dsqi_score.py
+    A … J     each extended analysis (J in dry-run mode)
+    reports   report_build.py --force
+
+Each stage is run --repeat times and the fastest run is kept. Results are
+appended to a JSONL history (with git commit and timestamp) and compared
+with the median of the previous --baseline runs at the same scale: a stage
+slower than that by more than --threshold (and by at least --min-delta
+seconds) is flagged as a regression and the run exits with status 1.
+
+With --memory, each stage is run once more under memtrack.py (outside the
+timed runs, since tracemalloc slows Python down) to record its peak RSS,
+peak traced heap and top allocation sites. Peak RSS is gated the same way
+as time, and against any --mem-budget limits.
+
+Usage:
+    python analysis/bench.py                          # Scales 5, 50, 200
+    python analysis/bench.py --scales 5 50 --repeat 3
+    python analysis/bench.py --stages load A B reports
+    python analysis/bench.py --no-record              # Don't append to history
+    python analysis/bench.py --memory --mem-budget H=300 collect=80
+    python analysis/bench.py --mem-budgets budgets.json   # {"*": 400, "H@200": 600}
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_callable
+from run_extended import ANALYSES
+import synth_data
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+ROOT = Path(__file__).resolve().parent.parent
+HISTORY_PATH = ROOT / "analysis" / "output" / "benchmarks" / "bench-history.jsonl"
+
+DEFAULT_SCALES = [5, 50, 200]
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_MIN_DELTA = 0.05
+DEFAULT_BASELINE = 5
+DEFAULT_MIN_DELTA_MB = 5.0
+
+MEMTRACK = str(ROOT / "analysis" / "memtrack.py")
+
+LOAD_SNIPPET = """
+import data_loader as d
+d.load_registry(); d.load_dsqi_files(); d.load_expert_flat()
+d.load_coordinator_flat(); d.load_session_logs(); d.load_wakatime_logs()
+"""
+
+STAGES = ["load", "collect", "score", *ANALYSES, "reports"]
+
+
+# ── Stages ──
+
+def stage_commands(stage: str, n_artifacts: int, figures: bool) -> list[list[str]]:
+    """Commands (run in sequence) that make up one stage."""
+    py = sys.executable
+    analysis = str(ROOT / "analysis")
+    if stage == "load":
+        return [[py, "-c", f"import sys; sys.path.insert(0, {analysis!r})\n{LOAD_SNIPPET}"]]
+    if stage == "collect":
+        return [[py, f"{analysis}/dsqi_collect.py", "--artifact", str(i), "--reuse-cloc"]
+                for i in range(1, n_artifacts + 1)]
+    if stage == "score":
+        return [[py, f"{analysis}/dsqi_score.py"]]
+    if stage == "reports":
+        return [[py, f"{analysis}/report_build.py", "--force"]]
+    cmd = [py, f"{analysis}/run_extended.py", "--only", stage, "--dry-run"]
+    if not figures:
+        cmd.append("--no-figures")
+    return [cmd]
+
+
+def _run(cmd: list[str], env: dict):
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        lines = (proc.stderr or proc.stdout).strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {proc.returncode}")
+
+
+def _clear_figures(root: Path):
+    # Rendered figures are cached by hash; clear them so each run renders
+    shutil.rmtree(root / "data" / "extended-analysis" / "figures", ignore_errors=True)
+
+
+def time_stage(root: Path, stage: str, n_artifacts: int, figures: bool) -> float:
+    """Run one stage against a study tree; return wall-clock seconds.
+
+    Raises:
+        RuntimeError: if any command of the stage fails.
+    """
+    if figures:
+        _clear_figures(root)
+    env = synth_data.study_env(root)
+    start = time.perf_counter()
+    for cmd in stage_commands(stage, n_artifacts, figures):
+        _run(cmd, env)
+    return time.perf_counter() - start
+
+
+def measure_stage_memory(root: Path, stage: str, n_artifacts: int, figures: bool) -> dict:
+    """Run one stage under memtrack.py; return the report of its hungriest command.
+
+    Raises:
+        RuntimeError: if any command of the stage fails.
+    """
+    if figures:
+        _clear_figures(root)
+    env = synth_data.study_env(root)
+    worst = None
+    with tempfile.TemporaryDirectory(prefix="dsqi-mem-") as tmp:
+        report_path = Path(tmp) / "memtrack.json"
+        for cmd in stage_commands(stage, n_artifacts, figures):
+            _run([cmd[0], MEMTRACK, "--json", str(report_path), *cmd[1:]], env)
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+            if worst is None or (report["peak_rss_mb"] or 0) > (worst["peak_rss_mb"] or 0):
+                worst = report
+    worst.pop("exit_code", None)
+    return worst
+
+
+def parse_budgets(pairs: list[str], path: Path | None) -> dict[str, float]:
+    """Memory budgets in MB keyed by "STAGE", "STAGE@N" or "*" (any stage)."""
+    budgets = {}
+    if path:
+        budgets.update({k: float(v) for k, v in json.loads(path.read_text(encoding="utf-8")).items()})
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"expected STAGE=MB, got {pair!r}")
+        budgets[key] = float(value)
+    return budgets
+
+
+def budget_for(budgets: dict[str, float], stage: str, scale: int) -> float | None:
+    for key in (f"{stage}@{scale}", stage, f"*@{scale}", "*"):
+        if key in budgets:
+            return budgets[key]
+    return None
+
+
+# ── History ──
+
+def git_commit() -> str | None:
+    try:
+        proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, cwd=ROOT)
+    except FileNotFoundError:
+        return None
+    return proc.stdout.strip() or None
+
+
+def load_history(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baseline_for(history: list[dict], scale: int, stage: str, last: int,
+                 metric=lambda record, scale, stage: record.get("results", {}).get(str(scale), {}).get(stage),
+                 **match) -> float | None:
+    """Median of a stage's metric (default: seconds) over the last `last` comparable runs.
+
+    Runs are comparable if they ran on this host and agree on every field
+    in `match` (e.g. reviewers, figures).
+    """
+    samples = []
+    for record in reversed(history):
+        if record.get("host") != platform.node() or any(record.get(k) != v for k, v in match.items()):
+            continue
+        value = metric(record, scale, stage)
+        if value is not None:
+            samples.append(value)
+        if len(samples) >= last:
+            break
+    return statistics.median(samples) if samples else None
+
+
+def peak_rss_metric(record: dict, scale: int, stage: str) -> float | None:
+    return (record.get("memory") or {}).get(str(scale), {}).get(stage, {}).get("peak_rss_mb")
+
+
+def compare(value: float | None, base: float | None, threshold: float, min_delta: float,
+            fmt: str) -> tuple[str, bool]:
+    """Table cell for a value against its baseline, and whether it regressed."""
+    if value is None:
+        return "✗ failed", False
+    if base is None:
+        return format(value, fmt), False
+    change = (value - base) / base if base else 0.0
+    regressed = change > threshold and value - base >= min_delta
+    return f"{value:{fmt}} ({change:+.0%}){' ✗' if regressed else ''}", regressed
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline on synthetic data")
+    parser.add_argument("--scales", nargs="+", type=int, default=DEFAULT_SCALES, metavar="N",
+                        help=f"Artifact counts to benchmark (default: {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument("--reviewers", type=int, default=3, help="Expert reviewers per study (default: 3)")
+    parser.add_argument("--stages", nargs="+", metavar="STAGE",
+                        help=f"Stages to run (default: all of {' '.join(STAGES)})")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per stage; the fastest is kept (default: 1)")
+    parser.add_argument("--figures", action="store_true", help="Include figure rendering in A–J timings")
+    parser.add_argument("--seed", type=int, default=synth_data.DEFAULT_SEED)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Relative slowdown flagged as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help=f"Ignore slowdowns smaller than this many seconds (default: {DEFAULT_MIN_DELTA})")
+    parser.add_argument("--baseline", type=int, default=DEFAULT_BASELINE,
+                        help=f"Compare against the median of this many previous runs (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH, help="JSONL history file")
+    parser.add_argument("--no-record", action="store_true", help="Don't append this run to the history")
+    parser.add_argument("--memory", action="store_true",
+                        help="Also measure peak memory per stage (one extra run under memtrack.py)")
+    parser.add_argument("--mem-budget", nargs="+", metavar="STAGE=MB",
+                        help="Peak-RSS budgets; STAGE may be '*' or carry a scale, e.g. H@200=600 (implies --memory)")
+    parser.add_argument("--mem-budgets", type=Path, metavar="FILE",
+                        help="JSON object of peak-RSS budgets in MB, keyed as for --mem-budget (implies --memory)")
+    parser.add_argument("--min-delta-mb", type=float, default=DEFAULT_MIN_DELTA_MB,
+                        help=f"Ignore peak-RSS growth smaller than this many MB (default: {DEFAULT_MIN_DELTA_MB})")
+    parser.add_argument("--keep", type=Path, metavar="DIR",
+                        help="Generate the synthetic trees under DIR and keep them")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "bench")
+
+    try:
+        budgets = parse_budgets(args.mem_budget, args.mem_budgets)
+    except (ValueError, OSError) as e:
+        parser.error(f"invalid memory budget: {e}")
+    memory = args.memory or bool(budgets)
+
+    stages = STAGES
+    if args.stages:
+        selected = [s if s in ("load", "collect", "score", "reports") else s.upper() for s in args.stages]
+        invalid = [s for s in selected if s not in STAGES]
+        if invalid:
+            parser.error(f"unknown stages: {', '.join(invalid)} (valid: {', '.join(STAGES)})")
+        stages = [s for s in STAGES if s in selected]  # keep pipeline order
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Pipeline Benchmark                                      ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    history = load_history(args.history)
+    work_dir = args.keep or Path(tempfile.mkdtemp(prefix="dsqi-bench-"))
+    results, mem_results, failures = {}, {}, []
+
+    try:
+        for scale in args.scales:
+            root = work_dir / f"synth-{scale}"
+            print(f"▸ {scale} artifacts × {args.reviewers} reviewers")
+            with tracing.span("bench.generate", artifacts=scale):
+                if root.exists():
+                    shutil.rmtree(root)
+                synth_data.generate(root, scale, args.reviewers, args.seed)
+                if synth_data.jsonschema is not None:
+                    errors, _ = synth_data.validate(root)
+                    if errors:
+                        print(f"  ✗ Synthetic tree is not schema-valid: {errors[0]}")
+                        sys.exit(1)
+                if "collect" not in stages or "score" not in stages:
+                    # Later stages need Layer 1; build it outside the timed stages
+                    if synth_data.score(root, scale):
+                        print("  ✗ Could not build Layer 1 DSQI files")
+                        sys.exit(1)
+
+            results[str(scale)] = {}
+            for stage in stages:
+                with tracing.span(f"bench.{stage}", artifacts=scale):
+                    try:
+                        seconds = min(time_stage(root, stage, scale, args.figures)
+                                      for _ in range(max(1, args.repeat)))
+                    except RuntimeError as e:
+                        print(f"  ✗ {stage:<8} failed: {e}")
+                        failures.append(f"{stage}@{scale}")
+                        results[str(scale)][stage] = None
+                        continue
+                results[str(scale)][stage] = round(seconds, 4)
+                line = f"  · {stage:<8} {seconds:8.3f}s"
+                if memory:
+                    with tracing.span(f"bench.{stage}.memory", artifacts=scale):
+                        try:
+                            report = measure_stage_memory(root, stage, scale, args.figures)
+                        except RuntimeError as e:
+                            print(f"  ✗ {stage:<8} failed under memtrack: {e}")
+                            failures.append(f"{stage}@{scale}")
+                            continue
+                    mem_results.setdefault(str(scale), {})[stage] = report
+                    line += f"   peak RSS {report['peak_rss_mb']:7.1f} MB   traced {report['peak_traced_mb']:7.1f} MB"
+                print(line)
+            print()
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    # ── Compare with history ──
+    regressions, over_budget = [], []
+    rows = []
+    match = {"reviewers": args.reviewers, "figures": args.figures}
+    for stage in stages:
+        row = [stage]
+        for scale in args.scales:
+            base = baseline_for(history, scale, stage, args.baseline, **match)
+            cell, regressed = compare(results[str(scale)].get(stage), base,
+                                      args.threshold, args.min_delta, ".3f")
+            if regressed:
+                regressions.append(f"{stage}@{scale}")
+            row.append(cell)
+        rows.append(row)
+    print(tabulate(rows, headers=["Stage"] + [f"N={s} (s)" for s in args.scales],
+                   tablefmt="simple_outline"))
+    print()
+
+    if memory:
+        rows = []
+        for stage in stages:
+            row = [stage]
+            for scale in args.scales:
+                report = mem_results.get(str(scale), {}).get(stage)
+                value = report["peak_rss_mb"] if report else None
+                base = baseline_for(history, scale, stage, args.baseline, metric=peak_rss_metric, **match)
+                cell, regressed = compare(value, base, args.threshold, args.min_delta_mb, ".1f")
+                if regressed:
+                    regressions.append(f"{stage}@{scale} (memory)")
+                limit = budget_for(budgets, stage, scale)
+                if value is not None and limit is not None and value > limit:
+                    over_budget.append(f"{stage}@{scale} ({value:.0f} > {limit:.0f} MB)")
+                    cell += " ✗ over budget"
+                row.append(cell)
+            rows.append(row)
+        print(tabulate(rows, headers=["Stage"] + [f"N={s} peak RSS (MB)" for s in args.scales],
+                       tablefmt="simple_outline"))
+        print()
+
+        # Top allocation sites at the largest scale
+        largest = str(max(args.scales))
+        print(f"  Top allocation sites at N={largest}:")
+        for stage in stages:
+            report = mem_results.get(largest, {}).get(stage)
+            if report and report["top"]:
+                print(f"    {stage}")
+                for site in report["top"][:3]:
+                    print(f"      {site['size_mb']:8.2f} MB  {site['site']}")
+        print()
+
+    if not args.no_record:
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "seed": args.seed,
+            "reviewers": args.reviewers,
+            "repeat": args.repeat,
+            "figures": args.figures,
+            "results": results,
+        }
+        if memory:
+            record["memory"] = mem_results
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with args.history.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        try:
+            shown = args.history.relative_to(ROOT)
+        except ValueError:
+            shown = args.history
+        print(f"  → Results appended to {shown}")
+
+    if failures:
+        print(f"  ✗ Failed stages: {', '.join(failures)}")
+    if regressions:
+        print(f"  ✗ Regressions (> {args.threshold:.0%} above baseline): {', '.join(regressions)}")
+    if over_budget:
+        print(f"  ✗ Over memory budget: {', '.join(over_budget)}")
+    if failures or regressions or over_budget:
+        sys.exit(1)
+    print("  ✓ No regressions")
+
+
+if __name__ == "__main__":
+    main()
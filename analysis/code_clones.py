@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+code_clones.py — Cross-artifact code-clone detection.
+
+AI-generated artifacts reuse scaffold code (game loops, level runners,
+button styles), so maintaining several of them means maintaining the same
+code several times. This script measures how much of each artifact's
+source is shared with some other artifact.
+
+Method:
+    1. Tokenise every source file under artifacts/*/src/ (found with
+       source_scan.py; comments and whitespace dropped, so reformatted
+       copies still match)
+    2. Hash every run of KGRAM tokens and keep one fingerprint per WINDOW
+       consecutive hashes (winnowing): any copied run of at least
+       KGRAM + WINDOW - 1 tokens is guaranteed to share a fingerprint
+    3. Split each file into overlapping blocks of BLOCK_LINES lines and
+       index the MinHash signature of each block's fingerprints in an LSH
+       index, so a shared block is found without comparing every file pair
+    4. Confirm candidate file pairs from different artifacts on their exact
+       shared fingerprints; pairs sharing at least MIN_SHARED are clones.
+       Boilerplate found in most artifacts is left out of this step (as in
+       MOSS), so a large catalogue does not turn into all-pairs matching
+
+Fingerprints, block signatures, LSH buckets and candidate pairs are kept
+in data/static-analysis/clone-index.json, keyed by file path and content
+hash. A file whose size and mtime match its entry is not read again, and a
+run only re-fingerprints, MinHash-signs and queries files that are new or
+changed, so adding one artifact does not re-read or re-hash the whole
+catalogue.
+
+Reports, per artifact: code lines, lines covered by fingerprints shared
+with another artifact, their ratio, and the clone pairs. dsqi_collect.py
+stores an artifact's entry as raw_metrics["code_clones"].
+
+Usage:
+    python analysis/code_clones.py
+    python analysis/code_clones.py --pairs 20        # Show more clone pairs
+    python analysis/code_clones.py --rebuild         # Re-fingerprint every file
+    python analysis/code_clones.py --json out.json
+"""
+
+import argparse
+import base64
+import bisect
+import hashlib
+import json
+import re
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, save_json
+from lazy_import import lazy_module, lazy_callable
+from source_scan import scan
+import tracing
+
+minhash = lazy_module("minhash")
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
+INDEX_PATH = STUDY_ROOT / "data" / "static-analysis" / "clone-index.json"
+
+TOOL = "winnowing fingerprints + MinHash LSH (code_clones.py)"
+INDEX_VERSION = 2
+
+# ── Parameters ──
+# A copied run of KGRAM + WINDOW - 1 = 24 tokens (about two lines of JS) is
+# always detected; runs shorter than KGRAM tokens never are.
+KGRAM = 15
+WINDOW = 10
+BLOCK_LINES = 40           # LSH block length; blocks overlap by half
+LSH_THRESHOLD = 0.3        # block similarity at which file pairs are compared
+MIN_SHARED = 4             # shared fingerprints for a file pair to count as a clone
+COMMON_SHARE = 0.1         # fingerprints in more artifacts than this are boilerplate …
+COMMON_MIN_ARTIFACTS = 10  # … but only once they are in more than this many
+MAX_PAIRS = 20             # clone pairs stored per artifact in raw_metrics
+
+SOURCE_SUFFIXES = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".css", ".html", ".htm", ".py")
+
+_TOKEN_RE = re.compile(
+    r"(?P<space>\s+)"
+    r"|(?P<comment>//[^\n]*|/\*.*?\*/|<!--.*?-->)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)"
+    r"|(?P<token>[A-Za-z_$][\w$]*|\d[\w.]*|\S)",
+    re.DOTALL,
+)
+_PY_TOKEN_RE = re.compile(
+    r"(?P<space>\s+)"
+    r"|(?P<comment>#[^\n]*)"
+    r"|(?P<string>\"\"\".*?\"\"\"|'''.*?'''|\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*')"
+    r"|(?P<token>[A-Za-z_][\w]*|\d[\w.]*|\S)",
+    re.DOTALL,
+)
+
+
+# ── Fingerprinting ──
+
+def tokenize(text: str, suffix: str) -> list[tuple[str, int]]:
+    """(token, line number) pairs with whitespace and comments removed."""
+    pattern = _PY_TOKEN_RE if suffix == ".py" else _TOKEN_RE
+    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+    tokens = []
+    for m in pattern.finditer(text):
+        kind = m.lastgroup
+        if kind in ("space", "comment"):
+            continue
+        tokens.append((m.group(), bisect.bisect_right(line_starts, m.start())))
+    return tokens
+
+
+def winnow(tokens: list[tuple[str, int]], k: int = KGRAM, w: int = WINDOW) -> list[list[int]]:
+    """Winnowed fingerprints as [hash, first line, last line] of their k-gram.
+
+    In each window of w consecutive k-gram hashes the minimum is selected
+    (the rightmost one on ties), and each selected position is recorded once.
+    """
+    if len(tokens) < k:
+        return []
+    words = [t for t, _ in tokens]
+    hashes = [zlib.crc32("\x00".join(words[i:i + k]).encode("utf-8"))
+              for i in range(len(tokens) - k + 1)]
+    if len(hashes) < w:
+        w = len(hashes)
+    fingerprints, last = [], -1
+    for start in range(len(hashes) - w + 1):
+        window = hashes[start:start + w]
+        low = min(window)
+        pos = start + w - 1 - window[::-1].index(low)
+        if pos != last:
+            fingerprints.append([low, tokens[pos][1], tokens[pos + k - 1][1]])
+            last = pos
+    return fingerprints
+
+
+def fingerprint_file(path: Path, raw: bytes | None = None) -> dict:
+    """Fingerprints and code-line count of one source file."""
+    if raw is None:
+        raw = path.read_bytes()
+    tracing.add("bytes_read", len(raw))
+    tracing.add("files_fingerprinted")
+    tokens = tokenize(raw.decode("utf-8", errors="replace"), path.suffix.lower())
+    code_ranges = []
+    for line in sorted({line for _, line in tokens}):
+        if code_ranges and code_ranges[-1][1] == line - 1:
+            code_ranges[-1][1] = line
+        else:
+            code_ranges.append([line, line])
+    return {
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "code_lines": sum(last - first + 1 for first, last in code_ranges),
+        "code_ranges": code_ranges,
+        "fingerprints": winnow(tokens),
+    }
+
+
+def source_files(artifacts_dir: Path = ARTIFACTS_DIR) -> dict[str, Path]:
+    """Map "slug/relative/path" → file for every source file under artifacts/*/src/."""
+    files = {}
+    if not artifacts_dir.exists():
+        return files
+    for artifact in sorted(artifacts_dir.iterdir()):
+        for f in scan(artifact / "src", suffixes=SOURCE_SUFFIXES, count=False):
+            files[f"{artifact.name}/{f['rel']}"] = f["path"]
+    return files
+
+
+# ── Persistent index ──
+
+def load_index(path: Path = INDEX_PATH) -> dict:
+    """Stored index, or an empty one if missing or built with other parameters."""
+    empty = _empty_index()
+    if not path.exists():
+        return empty
+    try:
+        index = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return empty
+    if index.get("version") != INDEX_VERSION or index.get("params") != _params():
+        return empty
+    return index
+
+
+def _params() -> dict:
+    return {"kgram": KGRAM, "window": WINDOW, "block_lines": BLOCK_LINES, "lsh_threshold": LSH_THRESHOLD}
+
+
+def _empty_index() -> dict:
+    return {"version": INDEX_VERSION, "params": _params(), "files": {},
+            "common": [], "lsh": [], "candidates": [], "next_block": 0}
+
+
+@tracing.traced()
+def update_index(index: dict, files: dict[str, Path], retired: dict | None = None) -> dict:
+    """Bring the index up to date with `files`; returns counts of what changed.
+
+    A file whose size and mtime match its stored entry is not read; one
+    whose content hash still matches keeps its fingerprints and block
+    signatures, so only new and changed files are tokenised again. The
+    block signatures of replaced and removed entries
+    are collected in `retired`, so find_clones() can take them out of the
+    stored LSH buckets.
+    """
+    stored = index["files"]
+    retired = {} if retired is None else retired
+    counts = {"reused": 0, "rehashed": 0, "fingerprinted": 0, "removed": 0}
+    for key in set(stored) - set(files):
+        retired[key] = stored.pop(key).get("blocks", [])
+        counts["removed"] += 1
+    for key, path in files.items():
+        st = path.stat()
+        entry = stored.get(key)
+        if entry and [entry.get("mtime_ns"), entry.get("size")] == [st.st_mtime_ns, st.st_size]:
+            counts["reused"] += 1
+            continue
+        raw = path.read_bytes()
+        if entry and entry["sha256"] == hashlib.sha256(raw).hexdigest():
+            entry["mtime_ns"], entry["size"] = st.st_mtime_ns, st.st_size  # touched, not changed
+            counts["reused"] += 1
+            counts["rehashed"] += 1
+            continue
+        if entry:
+            retired[key] = entry.get("blocks", [])
+        stored[key] = {**fingerprint_file(path, raw), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        counts["fingerprinted"] += 1
+    return counts
+
+
+def save_index(index: dict, path: Path = INDEX_PATH):
+    save_json(path, index, indent=None)
+
+
+# ── Detection ──
+
+def _blocks(fingerprints: list[list[int]]):
+    """Fingerprint hashes of overlapping BLOCK_LINES-line blocks of a file."""
+    if not fingerprints:
+        return
+    firsts = [first for _, first, _ in fingerprints]  # non-decreasing
+    step = BLOCK_LINES // 2
+    start = 1
+    while True:
+        lo = bisect.bisect_left(firsts, start)
+        hi = bisect.bisect_left(firsts, start + BLOCK_LINES)
+        if hi > lo:
+            yield {h for h, _, _ in fingerprints[lo:hi]}
+        if start + BLOCK_LINES > firsts[-1]:
+            break
+        start += step
+
+
+def _artifact(key: str) -> str:
+    return key.split("/", 1)[0]
+
+
+def _signature(stored: str):
+    return np.frombuffer(base64.b64decode(stored), dtype=np.uint32)
+
+
+def _covered_lines(entry: dict, hashes: set) -> int:
+    """Code lines of a file spanned by fingerprints in `hashes`."""
+    covered = set()
+    for h, first, last in entry["fingerprints"]:
+        if h in hashes:
+            covered.update(range(first, last + 1))
+    if not covered:
+        return 0
+    return sum(1 for first, last in entry["code_ranges"]
+               for line in range(first, last + 1) if line in covered)
+
+
+@tracing.traced()
+def update_candidates(index: dict, common: set, retired: dict) -> tuple[set, int]:
+    """Candidate file pairs from the stored LSH buckets, brought up to date.
+
+    Blocks are MinHash-signed and queried only for files that are new or
+    changed, or that hold a fingerprint which became (or stopped being)
+    boilerplate since the last run. Their old blocks, and those of removed
+    files (`retired`), are taken out of the buckets first; pairs stored
+    between untouched files are kept.
+
+    Each stored block is [block id, signature]; signatures are kept as
+    base64 uint32 (MinHash values are below 2**31) and the LSH buckets
+    hold block ids.
+
+    Returns:
+        (candidate pairs, number of files whose blocks were signed)
+    """
+    files = index["files"]
+    flipped = common ^ set(index["common"])
+    stale = {key for key, entry in files.items()
+             if "blocks" not in entry
+             or flipped and any(h in flipped for h, _, _ in entry["fingerprints"])}
+    gone = stale | set(retired)
+
+    lsh = minhash.LSHIndex.from_state(index["lsh"], threshold=LSH_THRESHOLD)
+    for key in gone:
+        old = retired[key] if key in retired else files[key].get("blocks", [])
+        for block_id, stored in old:
+            lsh.remove(block_id, _signature(stored))
+    candidates = {(a, b) for a, b in index["candidates"] if a not in gone and b not in gone}
+    block_files = {block_id: key for key, entry in files.items() if key not in gone
+                   for block_id, _ in entry.get("blocks", ())}
+
+    hasher = minhash.MinHasher()
+    for key in sorted(stale):
+        blocks = []
+        for block in _blocks(files[key]["fingerprints"]):
+            block -= common
+            if not block:
+                continue
+            sig = hasher.signature_of_hashes(list(block)).astype(np.uint32)
+            for other in map(block_files.get, lsh.query(sig)):
+                if _artifact(other) != _artifact(key):
+                    candidates.add((key, other) if key < other else (other, key))
+            block_id = index["next_block"]
+            index["next_block"] += 1
+            lsh.add(block_id, sig)
+            block_files[block_id] = key
+            blocks.append([block_id, base64.b64encode(sig.tobytes()).decode("ascii")])
+        files[key]["blocks"] = blocks
+        tracing.add("blocks_signed", len(blocks))
+
+    index["common"] = sorted(common)
+    index["lsh"] = lsh.state()
+    index["candidates"] = sorted(candidates)
+    return candidates, len(stale)
+
+
+@tracing.traced()
+def find_clones(index: dict, retired: dict | None = None) -> dict:
+    """Clone pairs and per-artifact duplicated-code ratios from an up-to-date index.
+
+    A line is duplicated when a fingerprint covering it also occurs in
+    another artifact. Fingerprints found in more than COMMON_SHARE of the
+    artifacts (and more than COMMON_MIN_ARTIFACTS) count towards that
+    ratio but are left out of pair matching: code everybody has says
+    nothing about which two artifacts were copied from each other.
+
+    The index's block signatures, LSH buckets and candidate pairs are
+    updated in place (see update_candidates()).
+    """
+    files = index["files"]
+    owners = {}
+    for key, entry in files.items():
+        slug = _artifact(key)
+        for h, _, _ in entry["fingerprints"]:
+            owners.setdefault(h, set()).add(slug)
+    n_artifacts = len({_artifact(key) for key in files})
+    common_limit = max(COMMON_MIN_ARTIFACTS, COMMON_SHARE * n_artifacts)
+    common = {h for h, slugs in owners.items() if len(slugs) > common_limit}
+
+    # ── Per-artifact duplicated lines ──
+    artifacts = {}
+    for key, entry in files.items():
+        slug = _artifact(key)
+        shared = {h for h, _, _ in entry["fingerprints"] if len(owners[h]) > 1}
+        stats = artifacts.setdefault(slug, {"files": 0, "code_lines": 0, "duplicated_lines": 0})
+        stats["files"] += 1
+        stats["code_lines"] += entry["code_lines"]
+        stats["duplicated_lines"] += _covered_lines(entry, shared)
+
+    # ── Candidate file pairs from LSH over blocks ──
+    candidates, signed = update_candidates(index, common, retired or {})
+    tracing.add("candidate_pairs", len(candidates))
+
+    # ── Verify on exact shared fingerprints ──
+    hash_sets = {key: {h for h, _, _ in entry["fingerprints"]} - common for key, entry in files.items()}
+    pairs = []
+    for a, b in sorted(candidates):
+        shared = hash_sets[a] & hash_sets[b]
+        if len(shared) < MIN_SHARED:
+            continue
+        pairs.append({
+            "a": a,
+            "b": b,
+            "shared_fingerprints": len(shared),
+            "similarity": round(len(shared) / len(hash_sets[a] | hash_sets[b]), 4),
+            "lines_a": _covered_lines(files[a], shared),
+            "lines_b": _covered_lines(files[b], shared),
+        })
+    pairs.sort(key=lambda p: (-p["shared_fingerprints"], p["a"], p["b"]))
+
+    for stats in artifacts.values():
+        stats["duplicated_ratio"] = (round(stats["duplicated_lines"] / stats["code_lines"], 4)
+                                     if stats["code_lines"] else 0.0)
+        stats["clone_pairs"] = []
+    for p in pairs:
+        artifacts[_artifact(p["a"])]["clone_pairs"].append(p)
+        artifacts[_artifact(p["b"])]["clone_pairs"].append(p)
+
+    return {"common_fingerprints": len(common), "signed": signed, "pairs": pairs, "artifacts": artifacts}
+
+
+def detect_clones(rebuild: bool = False, artifacts_dir: Path = ARTIFACTS_DIR,
+                  index_path: Path = INDEX_PATH) -> dict:
+    """Update the stored index from the source tree and report clones.
+
+    Returns:
+        {"tool", "params", "index": counts of reused (rehashed: stat changed,
+         content not), fingerprinted and removed files and of files whose
+         blocks were signed, "pairs": [...],
+         "artifacts": {slug: {...}}}
+    """
+    with tracing.span("code_clones"):
+        index = _empty_index() if rebuild else load_index(index_path)
+        retired = {}
+        counts = update_index(index, source_files(artifacts_dir), retired)
+        result = find_clones(index, retired)
+        counts["signed"] = result.pop("signed")
+        if counts["signed"] or counts["rehashed"] or counts["removed"] or not index_path.exists():
+            save_index(index, index_path)
+    return {"tool": TOOL, "params": {**_params(), "min_shared": MIN_SHARED, "common_share": COMMON_SHARE},
+            "index": counts, **result}
+
+
+def artifact_metric(clones: dict, slug: str) -> dict:
+    """One artifact's entry in the shape stored as raw_metrics["code_clones"]."""
+    stats = clones["artifacts"].get(slug, {"files": 0, "code_lines": 0, "duplicated_lines": 0,
+                                           "duplicated_ratio": 0.0, "clone_pairs": []})
+    pairs = []
+    for p in stats["clone_pairs"][:MAX_PAIRS]:
+        own, other = ("a", "b") if _artifact(p["a"]) == slug else ("b", "a")
+        pairs.append({
+            "file": p[own].split("/", 1)[1],
+            "other_artifact": _artifact(p[other]),
+            "other_file": p[other].split("/", 1)[1],
+            "shared_fingerprints": p["shared_fingerprints"],
+            "similarity": p["similarity"],
+            "duplicated_lines": p[f"lines_{own}"],
+        })
+    return {
+        "tool": clones["tool"],
+        "params": clones["params"],
+        "code_lines": stats["code_lines"],
+        "duplicated_lines": stats["duplicated_lines"],
+        "duplicated_ratio": stats["duplicated_ratio"],
+        "clone_pair_count": len(stats["clone_pairs"]),
+        "clone_pairs": pairs,
+    }
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect code shared between artifacts")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Ignore the stored index and re-fingerprint every file")
+    parser.add_argument("--pairs", type=int, default=10, metavar="N",
+                        help="Clone pairs to list (default: 10)")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the full report as JSON")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "code_clones")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Cross-Artifact Code Clones                              ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    clones = detect_clones(rebuild=args.rebuild)
+    counts = clones["index"]
+    print(f"  Index: {counts['fingerprinted']} file(s) fingerprinted, {counts['reused']} reused, "
+          f"{counts['removed']} removed; blocks of {counts['signed']} file(s) signed")
+    print()
+
+    if not clones["artifacts"]:
+        print(f"  ⚠ No source files found under {ARTIFACTS_DIR}")
+        return
+
+    print("▸ Duplicated code per artifact")
+    rows = [[slug, s["files"], s["code_lines"], s["duplicated_lines"],
+             f"{100 * s['duplicated_ratio']:.1f}%", len(s["clone_pairs"])]
+            for slug, s in sorted(clones["artifacts"].items())]
+    print(tabulate(rows, headers=["Artifact", "Files", "Code lines", "Duplicated", "Ratio", "Pairs"],
+                   tablefmt="simple_outline"))
+    print()
+
+    if clones["pairs"]:
+        print(f"▸ Clone pairs ({min(args.pairs, len(clones['pairs']))} of {len(clones['pairs'])})")
+        rows = [[p["a"], p["b"], p["shared_fingerprints"], f"{p['similarity']:.2f}",
+                 p["lines_a"], p["lines_b"]] for p in clones["pairs"][:args.pairs]]
+        print(tabulate(rows, headers=["File A", "File B", "Shared", "Jaccard", "Lines A", "Lines B"],
+                       tablefmt="simple_outline"))
+    else:
+        print("  ✓ No cross-artifact clones found")
+
+    if args.json:
+        save_json(args.json, clones)
+        print(f"\n  ✓ Report saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,20 +5,61 @@ data_loader.py — Shared data loading module for all extended analysis scripts.
 Provides standardised functions to load and flatten the three-layer evaluation
 data, development logs, and artifact registry.
 
+Paths resolve against the repository root, or against the study tree named
+by the DSQI_STUDY_ROOT environment variable (e.g. a synthetic tree from
+synth_data.py). An alternative tree supplies its own artifact list through
+its artifact-registry.json.
+
+Files are read concurrently (LOAD_WORKERS threads) and parsed with orjson
+when it is installed, falling back to the stdlib json module. Throughput
+of every load is accumulated in load_stats(); run this module directly to
+time a cold load of the whole tree.
+
+With validation enabled (enable_validation() or DSQI_VALIDATE=1), every
+document is checked against its schema in data/schemas/ as it is loaded.
+Compiled validators are reused and documents whose content hash already
+passed are skipped, so there is no separate validation pass over the files.
+
+A long-running process (watch.py) can keep_warm(): the layer loaders then
+return results kept from the previous call until invalidate() drops the
+layers whose files changed. Kept results are shared; treat them as
+read-only.
+
 Usage:
     from data_loader import (
         ROOT, ARTIFACT_SLUGS, ARTIFACT_NAMES,
         load_registry, load_dsqi_files, load_expert_reviews,
         load_expert_flat, load_coordinator_reviews,
+        ExpertObservation, CoordinatorObservation,
     )
 """
 
+import hashlib
 import json
+import os
+import re
+import reprlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
+from json_stream import JSONStream
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ── Paths ──
 
-ROOT = Path(__file__).resolve().parent.parent
+STUDY_ROOT_ENV = "DSQI_STUDY_ROOT"
+
+ROOT = Path(os.environ.get(STUDY_ROOT_ENV) or Path(__file__).resolve().parent.parent).resolve()
 DATA_DIR = ROOT / "data"
 DSQI_DIR = DATA_DIR / "evaluations" / "layer1-dsqi"
 EXPERT_DIR = DATA_DIR / "evaluations" / "layer2-expert-review"
@@ -27,6 +68,8 @@ DEV_LOG_DIR = DATA_DIR / "development-logs"
 REGISTRY_PATH = DATA_DIR / "artifact-registry.json"
 OUTPUT_DIR = DATA_DIR / "extended-analysis"
 FIGURES_DIR = OUTPUT_DIR / "figures"
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / "data" / "schemas"
+VALIDATION_CACHE = ROOT / "analysis" / "output" / ".validation-cache.json"
 
 # ── Constants ──
 
@@ -46,6 +89,12 @@ ARTIFACT_NAMES = {
     "05-lexical-analyser-trainer": "Lexical Analyser Trainer",
 }
 
+if os.environ.get(STUDY_ROOT_ENV):
+    # Alternative study tree: take the artifact list from its own registry
+    _registry_artifacts = json.loads(REGISTRY_PATH.read_bytes())["artifacts"]
+    ARTIFACT_SLUGS = [a["slug"] for a in _registry_artifacts]
+    ARTIFACT_NAMES = {a["slug"]: a["name"] for a in _registry_artifacts}
+
 ICAP_SCORES = {
     "passive": 0.25,
     "active": 0.50,
@@ -82,16 +131,428 @@ HEURISTIC_LABELS = [
 
 # ── Generic helpers ──
 
-def load_json(path: Path) -> dict:
-    """Load a JSON file and return as dict."""
-    return json.loads(path.read_text(encoding="utf-8"))
+JSON_PARSER = "orjson" if orjson is not None else "json"
+LOAD_WORKERS = min(8, (os.cpu_count() or 1) + 4)  # I/O bound: threads wait on reads, not CPU
+
+_stats_lock = threading.Lock()
+_stats = {"files": 0, "bytes": 0, "seconds": 0.0}
+
+
+def parse_json(raw: bytes):
+    """Parse JSON bytes with orjson if available, else the stdlib parser.
+
+    Falls back to json.loads for documents orjson rejects but the stdlib
+    accepts (NaN/Infinity literals, integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _record_load(files: int, nbytes: int, seconds: float):
+    with _stats_lock:
+        _stats["files"] += files
+        _stats["bytes"] += nbytes
+        _stats["seconds"] += seconds
+    tracing.add("bytes_read", nbytes)
+    tracing.add("files_read", files)
+
+
+def load_stats() -> dict:
+    """Cumulative load throughput for this process.
+
+    Returns:
+        dict with files, bytes, seconds (wall time spent loading),
+        files_per_s, mb_per_s, parser and workers
+    """
+    with _stats_lock:
+        files, nbytes, seconds = _stats["files"], _stats["bytes"], _stats["seconds"]
+    return {
+        "files": files,
+        "bytes": nbytes,
+        "seconds": round(seconds, 4),
+        "files_per_s": round(files / seconds, 1) if seconds else None,
+        "mb_per_s": round(nbytes / seconds / 1e6, 2) if seconds else None,
+        "parser": JSON_PARSER,
+        "workers": LOAD_WORKERS,
+    }
+
+
+def load_json(path: Path, layer: str | None = None) -> dict:
+    """Load a JSON file and return as dict.
+
+    With `layer` (a LAYER_SCHEMAS key) the document is validated when
+    validation is enabled.
+    """
+    with tracing.span("read_json", file=path.name):
+        start = time.perf_counter()
+        raw = path.read_bytes()
+        data = parse_json(raw)
+        _record_load(1, len(raw), time.perf_counter() - start)
+    if layer:
+        check_documents(layer, [(path, raw, data)])
+    return data
+
+
+def read_many(paths: list[Path], workers: int | None = None) -> list[bytes]:
+    """Read files concurrently; returns their bytes in the order given."""
+    return [raw for raw, _ in _map_files(paths, lambda raw: None, workers)]
+
+
+def load_json_many(paths: list[Path], workers: int | None = None, layer: str | None = None) -> list:
+    """Read and parse JSON files concurrently; returns documents in the order given.
+
+    With `layer` the documents are validated when validation is enabled.
+    """
+    paths = list(paths)
+    results = _map_files(paths, parse_json, workers)
+    if layer:
+        check_documents(layer, [(path, raw, data) for path, (raw, data) in zip(paths, results)])
+    return [data for _, data in results]
+
+
+def _map_files(paths: list[Path], parse, workers: int | None) -> list[tuple[bytes, object]]:
+    def read(path):
+        raw = path.read_bytes()
+        return raw, parse(raw)
+
+    paths = list(paths)
+    workers = min(workers or LOAD_WORKERS, len(paths))
+    with tracing.span("read_many", files=len(paths), workers=workers):
+        start = time.perf_counter()
+        if workers <= 1:
+            results = [read(p) for p in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(read, paths))
+        _record_load(len(paths), sum(len(raw) for raw, _ in results), time.perf_counter() - start)
+    return results
+
+
+# ── Validation ──
+
+VALIDATE_ENV = "DSQI_VALIDATE"
+
+# Layer → default schema. A document's own "schema" tag (the survey tool
+# exports) selects data/schemas/{tag}.schema.json instead when that exists.
+LAYER_SCHEMAS = {
+    "registry": "artifact-registry",
+    "dsqi": "dsqi-result",
+    "expert": "expert-review",
+    "coordinator": "coordinator-review",
+    "sessions": "dev-session",  # a sessions-*.json file is a list of entries
+}
+
+_SCHEMA_TAG = re.compile(r"^[a-z0-9][a-z0-9.-]*$")
+
+_validate = os.environ.get(VALIDATE_ENV, "") not in ("", "0")
+_validators = {}  # (schema name, list file?, sub-schema key) → compiled validator
+_schema_digests = {}  # schema name → sha256 of the schema file
+_cache = None  # persisted: {"validated": {schema digest: [doc digests]}, "files": {...}}
+_cache_dirty = False
+
+
+class DataValidationError(ValueError):
+    """A loaded document does not match its schema."""
+
+
+def enable_validation(enabled: bool = True):
+    """Validate documents against data/schemas/ as they are loaded."""
+    global _validate
+    _validate = enabled
+
+
+def validation_enabled() -> bool:
+    return _validate
+
+
+def schema_name_for(layer: str, doc) -> str:
+    """Schema used for a document of this layer (its "schema" tag, if known)."""
+    tag = doc.get("schema") if isinstance(doc, dict) else None
+    if isinstance(tag, str) and _SCHEMA_TAG.match(tag) and (SCHEMA_DIR / f"{tag}.schema.json").exists():
+        return tag
+    return LAYER_SCHEMAS[layer]
+
+
+def _validator(name: str, many: bool = False, member: str | None = None):
+    """Compiled validator for a schema; cached for the life of the process.
+
+    many:   validate a list whose items follow the schema
+    member: validate one item of the schema's array property `member`
+    """
+    key = (name, many, member)
+    if key not in _validators:
+        try:
+            import jsonschema
+        except ImportError:
+            print("  ⚠ jsonschema not available — loading without validation")
+            enable_validation(False)
+            return None
+        raw = (SCHEMA_DIR / f"{name}.schema.json").read_bytes()
+        _schema_digests[name] = hashlib.sha256(raw).hexdigest()
+        schema = json.loads(raw)
+        if member:
+            schema = schema["properties"][member]["items"]
+        elif many:
+            schema = {"type": "array", "items": schema}
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        _validators[key] = cls(schema)
+    return _validators[key]
+
+
+def warm_validators() -> int:
+    """Compile every schema in data/schemas/ now (worker.py); returns how many are cached."""
+    for path in sorted(SCHEMA_DIR.glob("*.schema.json")):
+        if _validator(path.name.removesuffix(".schema.json")) is None:
+            return 0
+    _validator(LAYER_SCHEMAS["sessions"], many=True)
+    return len(_validators)
+
+
+def iter_schema_errors(layer: str, doc):
+    """jsonschema errors of a document, for callers that inspect them (synth_data.py)."""
+    return _validator(schema_name_for(layer, doc), many=layer == "sessions").iter_errors(doc)
+
+
+def schema_errors(layer: str, doc, limit: int | None = None) -> list[str]:
+    """Validation messages for a document ("path: message"), best match first."""
+    import jsonschema
+
+    errors = sorted(iter_schema_errors(layer, doc), key=jsonschema.exceptions.relevance)
+    return [f"{_error_path(e)}: {_error_message(e)}" for e in errors[:limit]]
+
+
+def _error_path(error, prefix=()) -> str:
+    return "/".join(str(p) for p in (*prefix, *error.absolute_path)) or "(root)"
+
+
+MAX_ERROR_MESSAGE = 300
+_short = reprlib.Repr()
+_short.maxlevel, _short.maxlist, _short.maxstring, _short.maxother = 1, 4, 60, 60
+
+
+def _error_message(error) -> str:
+    """error.message with the offending instance abbreviated.
+
+    jsonschema quotes the whole instance (a maxItems error on the registry
+    quotes every artifact); past MAX_ERROR_MESSAGE characters it is
+    shortened with reprlib, or the message rebuilt from the keyword.
+    """
+    message = error.message
+    if len(message) <= MAX_ERROR_MESSAGE:
+        return message
+    message = message.replace(repr(error.instance), _short.repr(error.instance))
+    if len(message) <= MAX_ERROR_MESSAGE:
+        return message
+    return f"{_short.repr(error.instance)} fails {error.validator}: {_short.repr(error.validator_value)}"
+
+
+def _raise_if_invalid(validator, instance, path: Path, prefix=()):
+    import jsonschema
+
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise DataValidationError(f"{path.name}: {_error_path(error, prefix)}: {_error_message(error)}")
+
+
+def _load_cache() -> dict:
+    global _cache
+    if _cache is None:
+        try:
+            stored = json.loads(VALIDATION_CACHE.read_bytes())
+            _cache = {
+                "validated": {k: set(v) for k, v in stored.get("validated", {}).items()},
+                "files": stored.get("files", {}),
+            }
+        except (OSError, ValueError):
+            _cache = {"validated": {}, "files": {}}
+    return _cache
+
+
+def _save_cache():
+    global _cache_dirty
+    if not _cache_dirty:
+        return
+    # Keep entries for the current schema versions only
+    current = {hashlib.sha256(p.read_bytes()).hexdigest() for p in SCHEMA_DIR.glob("*.schema.json")}
+    validated = {k: sorted(v) for k, v in _cache["validated"].items() if k in current}
+    files = {k: v for k, v in _cache["files"].items() if v[-1] in current}
+    try:
+        VALIDATION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        VALIDATION_CACHE.write_text(json.dumps({"validated": validated, "files": files}), encoding="utf-8")
+    except OSError:
+        pass  # read-only tree: validate again next time
+    _cache_dirty = False
+
+
+def check_documents(layer: str, docs: list[tuple[Path, bytes, object]]):
+    """Validate parsed documents, skipping content that already passed.
+
+    No-op unless validation is enabled; loaders call this for every layer
+    they read, and report_build for the files it reads itself.
+
+    Args:
+        layer: LAYER_SCHEMAS key
+        docs:  (path, raw bytes, parsed document) per file
+
+    Raises:
+        DataValidationError naming the file, the JSON path and the problem
+    """
+    global _cache_dirty
+    if not _validate:
+        return
+    cache = _load_cache()
+    with tracing.span("validate", layer=layer, files=len(docs)):
+        for path, raw, doc in docs:
+            name = schema_name_for(layer, doc)
+            validator = _validator(name, many=layer == "sessions")
+            if validator is None:
+                return
+            seen = cache["validated"].setdefault(_schema_digests[name], set())
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest in seen:
+                tracing.add("validation_cached")
+                continue
+            _raise_if_invalid(validator, doc, path)
+            seen.add(digest)
+            _cache_dirty = True
+            tracing.add("validated")
+    _save_cache()
+
+
+class _StreamCheck:
+    """Validates a streamed document member by member.
+
+    Array items are checked against the schema's item sub-schema as they
+    arrive and the remaining members once the file ends, so validation
+    keeps the stream's constant memory. A file whose size and mtime match
+    an entry recorded after it last passed is not checked again.
+    """
+
+    def __init__(self, layer: str, path: Path, member: str):
+        self.layer, self.path, self.member = layer, path, member
+        self.header = {}
+        self.index = 0
+        self.active = _validate and not self._unchanged()
+
+    def _stat(self) -> list[int]:
+        st = self.path.stat()
+        return [st.st_size, st.st_mtime_ns]
+
+    def _unchanged(self) -> bool:
+        entry = _load_cache()["files"].get(str(self.path))
+        if not entry or entry[:2] != self._stat():
+            return False
+        name, schema_digest = entry[3], entry[4]
+        if _validator(name) is None:
+            return True  # jsonschema missing: validation is off
+        if _schema_digests[name] != schema_digest:
+            return False
+        tracing.add("validation_cached")
+        return True
+
+    def add_member(self, key: str, value):
+        if self.active:
+            self.header[key] = value
+
+    def add_item(self, value):
+        if not self.active:
+            return
+        validator = _validator(schema_name_for(self.layer, self.header), member=self.member)
+        if validator is None:
+            self.active = False
+            return
+        _raise_if_invalid(validator, value, self.path, prefix=(self.member, self.index))
+        self.index += 1
+
+    def finish(self, digest: str):
+        global _cache_dirty
+        if not self.active:
+            return
+        name = schema_name_for(self.layer, self.header)
+        validator = _validator(name)
+        if validator is None:
+            return
+        _raise_if_invalid(validator, {**self.header, self.member: []}, self.path)
+        cache = _load_cache()
+        cache["validated"].setdefault(_schema_digests[name], set()).add(digest)
+        cache["files"][str(self.path)] = [*self._stat(), digest, name, _schema_digests[name]]
+        _cache_dirty = True
+        tracing.add("validated")
+        _save_cache()
 
 
 def save_json(path: Path, data, indent: int = 2):
     """Save data as pretty-printed JSON."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=indent, ensure_ascii=False) + "\n",
-                    encoding="utf-8")
+    with tracing.span("write_json", file=path.name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = (json.dumps(data, indent=indent, ensure_ascii=False) + "\n").encode("utf-8")
+        path.write_bytes(raw)
+        tracing.add("bytes_written", len(raw))
+        tracing.add("files_written")
+
+
+# ── Content-hash caches ──
+
+CACHE_MAX_ENTRIES = 20000
+
+
+class ContentCache(dict):
+    """Analyser results keyed by content hash, kept in one JSON file across runs.
+
+    Used as a plain {digest: result} dict. The file is stamped with `key`
+    (cache version, tool versions, source hashes); a file with another
+    stamp loads empty. save() writes only when entries were added, keeps
+    the `max_entries` most recently used, and replaces the file atomically,
+    so concurrent runs (watch.py, the worker, a manual collect) never read
+    a truncated cache.
+    """
+
+    def __init__(self, path: Path, key: dict, max_entries: int = CACHE_MAX_ENTRIES):
+        super().__init__()
+        self.path, self.key, self.max_entries = Path(path), key, max_entries
+        self._used = set()
+        self._dirty = False
+        try:
+            stored = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+        if isinstance(stored, dict) and stored.get("key") == key:
+            super().update(stored.get("results", {}))
+
+    def __getitem__(self, digest):
+        self._used.add(digest)
+        return super().__getitem__(digest)
+
+    def __setitem__(self, digest, result):
+        self._used.add(digest)
+        self._dirty = True
+        super().__setitem__(digest, result)
+
+    def get(self, digest, default=None):
+        return self[digest] if digest in self else default
+
+    def update(self, *args, **kwargs):
+        for digest, result in dict(*args, **kwargs).items():
+            self[digest] = result
+
+    def save(self):
+        if not self._dirty:
+            return
+        # Entries used in this run go last, so trimming drops the stalest
+        keep = [d for d in self if d not in self._used] + [d for d in self if d in self._used]
+        results = {d: dict.__getitem__(self, d) for d in keep[-self.max_entries:]}
+        raw = json.dumps({"key": self.key, "results": results}).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(raw)
+        os.replace(tmp, self.path)
+        tracing.add("bytes_written", len(raw))
+        self._dirty = False
 
 
 def ensure_output_dirs():
@@ -101,13 +562,158 @@ def ensure_output_dirs():
     (OUTPUT_DIR / "qualitative").mkdir(parents=True, exist_ok=True)
 
 
+# ── Observation records ──
+
+class _Observation:
+    """Fixed-field, slotted record that reads like the dict row it replaces.
+
+    Supports row["key"], row.get("key"), keys()/items(), iteration over
+    keys and dict(row). Fields listed in TEXT_FIELDS are None when the row
+    was loaded with text=False.
+    """
+    __slots__ = ()
+    FIELDS: tuple = ()
+    TEXT_FIELDS: frozenset = frozenset()
+
+    def __init__(self, *values):
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+
+    def __getitem__(self, key):
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._FIELD_SET else default
+
+    def __contains__(self, key):
+        return key in self._FIELD_SET
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def keys(self):
+        return self.FIELDS
+
+    def values(self):
+        return [getattr(self, name) for name in self.FIELDS]
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self.FIELDS]
+
+    def as_dict(self) -> dict:
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (_Observation, dict)):
+            return self.as_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+
+def _intern(value):
+    """Intern strings so repeated names, slugs and levels share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ExpertObservation(_Observation):
+    """One artifact-per-reviewer expert observation (see load_expert_flat)."""
+    FIELDS = (
+        "reviewer_name", "reviewer_role", "reviewer_experience_years", "reviewer_institution",
+        "artifact_id",
+        "icap_level", "icap_justification",
+        "constructionism_meaningful_score", "constructionism_meaningful_justification",
+        "constructionism_building_score", "constructionism_building_justification",
+        *(f"heuristic_{k}" for k in HEURISTIC_KEYS),
+        "heuristic_comments",
+        "E1_score", "E1_justification", "E2_score", "E2_justification",
+        "open_most_positive", "open_most_negative", "open_other_comments",
+    )
+    TEXT_FIELDS = frozenset({
+        "icap_justification", "constructionism_meaningful_justification",
+        "constructionism_building_justification", "heuristic_comments",
+        "E1_justification", "E2_justification",
+        "open_most_positive", "open_most_negative", "open_other_comments",
+    })
+    __slots__ = FIELDS
+
+
+class CoordinatorObservation(_Observation):
+    """One coordinator review of one artifact (see load_coordinator_flat)."""
+    FIELDS = (
+        "artifact_id", "coordinator_name", "department", "module", "module_name",
+        "Q1_curriculum_relevance", "Q2_concept_challenge", "Q3_objective_coverage", "P1_average",
+        "Q4_engagement_mode",
+        "Q5_ease_of_integration", "Q6_likelihood_of_use",
+        "Q7_benefit", "Q8_drawback",
+    )
+    TEXT_FIELDS = frozenset({"Q7_benefit", "Q8_drawback"})
+    __slots__ = FIELDS
+
+
+# ── Warm layers ──
+
+_warm = None  # layer → {(loader, args): result} while keep_warm() is on
+
+
+def keep_warm(enabled: bool = True):
+    """Keep loaded layers in memory between calls (see invalidate)."""
+    global _warm
+    _warm = {} if enabled else None
+
+
+def invalidate(*layers: str):
+    """Drop kept results of these layers ("registry", "dsqi", "expert",
+    "coordinator", "sessions"), or of every layer when none are given."""
+    if _warm is None:
+        return
+    if not layers:
+        _warm.clear()
+    for layer in layers:
+        _warm.pop(layer, None)
+
+
+def _kept(layer: str):
+    """Serve a loader's result from the warm cache of `layer` when keep_warm() is on."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _warm is None:
+                return fn(*args, **kwargs)
+            results = _warm.setdefault(layer, {})
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            if key in results:
+                tracing.add("warm_hits")
+            else:
+                results[key] = fn(*args, **kwargs)
+            # A fresh top-level container, so callers may sort or extend it
+            return results[key].copy()
+        return wrapper
+    return decorate
+
+
 # ── Registry ──
 
+@_kept("registry")
+@tracing.traced()
 def load_registry() -> dict:
     """Load the full artifact-registry.json."""
-    return load_json(REGISTRY_PATH)
+    return load_json(REGISTRY_PATH, layer="registry")
 
 
+@tracing.traced()
 def load_registry_artifacts() -> list[dict]:
     """Return just the artifacts list from the registry."""
     return load_registry()["artifacts"]
@@ -115,39 +721,132 @@ def load_registry_artifacts() -> list[dict]:
 
 # ── Layer 1: DSQI self-evaluation ──
 
+@_kept("dsqi")
+@tracing.traced()
 def load_dsqi_files() -> dict[str, dict]:
     """Load all Layer 1 DSQI result files.
 
     Returns:
         dict mapping slug → DSQI data dict
     """
-    results = {}
-    for slug in ARTIFACT_SLUGS:
-        path = DSQI_DIR / f"dsqi-{slug}.json"
-        if path.exists():
-            results[slug] = load_json(path)
-    return results
+    found = [(slug, DSQI_DIR / f"dsqi-{slug}.json") for slug in ARTIFACT_SLUGS]
+    found = [(slug, path) for slug, path in found if path.exists()]
+    docs = load_json_many([path for _, path in found], layer="dsqi")
+    return {slug: data for (slug, _), data in zip(found, docs)}
 
 
 # ── Layer 2: Expert reviews ──
 
+@_kept("expert")
+@tracing.traced()
 def load_expert_reviews() -> list[dict]:
     """Load all expert review files (one per reviewer, each containing all 5 artifacts).
 
     Returns:
         list of expert review dicts (top-level, with .reviewer and .artifacts[])
     """
-    reviews = []
+    return load_json_many(sorted(EXPERT_DIR.glob("dsqi-review-*.json")), layer="expert")
+
+
+def iter_expert_artifacts():
+    """Stream expert reviews as (reviewer, artifact) pairs.
+
+    Each dsqi-review-*.json is read incrementally (json_stream), so only one
+    artifact review per file is in memory at a time and consumers start
+    before a large file has been fully parsed. With validation enabled each
+    artifact is checked as it is decoded.
+
+    Yields:
+        (reviewer dict, artifact review dict), in file then document order
+    """
     for path in sorted(EXPERT_DIR.glob("dsqi-review-*.json")):
-        reviews.append(load_json(path))
-    return reviews
+        with tracing.span("stream_json", file=path.name):
+            check = _StreamCheck("expert", path, "artifacts")
+            stream = JSONStream(path, "artifacts", hash_content=check.active)
+            reviewer = None
+            pending = []  # artifacts seen before the reviewer block (unusual key order)
+            for kind, key, value in stream:
+                if kind == "item":
+                    check.add_item(value)
+                    if reviewer is None:
+                        pending.append(value)
+                    else:
+                        yield reviewer, value
+                else:
+                    check.add_member(key, value)
+                    if key == "reviewer":
+                        reviewer = value
+                        for artifact in pending:
+                            yield reviewer, artifact
+                        pending = []
+            check.finish(stream.digest())
+            if pending:
+                raise KeyError(f"'reviewer' missing from {path.name}")
+            _record_load(1, stream.bytes_read, stream.seconds)
+
+
+def iter_expert_flat(text: bool = True):
+    """Yield expert observations one at a time; see load_expert_flat."""
+    keep = _intern if text else (lambda value: None)
+    current, head = None, None
+    count = 0
+    for reviewer, artifact in iter_expert_artifacts():
+        if reviewer is not current:
+            current = reviewer
+            head = (
+                _intern(reviewer["name"]),
+                _intern(reviewer.get("role", "")),
+                reviewer.get("experience_years"),
+                _intern(reviewer.get("institution", "")),
+            )
+        construct = artifact["constructionism"]
+        heuristics = artifact["heuristics"]
+        dsqi = artifact["dsqi"]
+        open_ended = artifact["open_ended"]
+        count += 1
+        yield ExpertObservation(
+            *head,
+            _intern(artifact["artifact_id"]),
+            # ICAP
+            _intern(artifact["icap"]["level"]),
+            keep(artifact["icap"]["justification"]),
+            # Constructionism
+            construct["meaningful_artifact"]["score"],
+            keep(construct["meaningful_artifact"]["justification"]),
+            construct["learning_through_building"]["score"],
+            keep(construct["learning_through_building"]["justification"]),
+            # Heuristics (all 10 + comments)
+            *(heuristics[k] for k in HEURISTIC_KEYS),
+            keep(heuristics.get("comments", "")),
+            # DSQI E1/E2
+            dsqi["E1_conceptual_fidelity"]["score"],
+            keep(dsqi["E1_conceptual_fidelity"]["justification"]),
+            dsqi["E2_process_replicability"]["score"],
+            keep(dsqi["E2_process_replicability"]["justification"]),
+            # Open-ended
+            keep(open_ended["most_positive"]),
+            keep(open_ended["most_negative"]),
+            keep(open_ended.get("other_comments", "")),
+        )
+    tracing.add("observations", count)
 
 
-def load_expert_flat() -> list[dict]:
+@_kept("expert")
+@tracing.traced()
+def load_expert_flat(text: bool = True) -> list[ExpertObservation]:
     """Flatten expert reviews into one row per artifact-per-reviewer observation.
 
+    Built on the streaming reader, so peak memory is the flattened rows
+    plus one artifact review; use iter_expert_flat to consume rows without
+    keeping them.
+
+    Args:
+        text: include justification, comment and open-ended text. Score-only
+              analyses pass False so the review text is not kept in memory;
+              those fields are then None.
+
     Returns:
-        list of dicts, each with keys:
+        list of ExpertObservation records (dict-style access), with keys:
             reviewer_name, reviewer_role, reviewer_experience,
             artifact_id, icap_level, icap_justification,
             constructionism_meaningful (score + justification),
@@ -156,121 +855,135 @@ def load_expert_flat() -> list[dict]:
             E1_score, E1_justification, E2_score, E2_justification,
             open_ended (most_positive, most_negative, other_comments)
     """
-    flat = []
-    for review in load_expert_reviews():
-        reviewer = review["reviewer"]
-        for artifact in review["artifacts"]:
-            row = {
-                "reviewer_name": reviewer["name"],
-                "reviewer_role": reviewer.get("role", ""),
-                "reviewer_experience_years": reviewer.get("experience_years"),
-                "reviewer_institution": reviewer.get("institution", ""),
-                "artifact_id": artifact["artifact_id"],
-                # ICAP
-                "icap_level": artifact["icap"]["level"],
-                "icap_justification": artifact["icap"]["justification"],
-                # Constructionism
-                "constructionism_meaningful_score": artifact["constructionism"]["meaningful_artifact"]["score"],
-                "constructionism_meaningful_justification": artifact["constructionism"]["meaningful_artifact"]["justification"],
-                "constructionism_building_score": artifact["constructionism"]["learning_through_building"]["score"],
-                "constructionism_building_justification": artifact["constructionism"]["learning_through_building"]["justification"],
-                # Heuristics (all 10 + comments)
-                **{f"heuristic_{k}": artifact["heuristics"][k] for k in HEURISTIC_KEYS},
-                "heuristic_comments": artifact["heuristics"].get("comments", ""),
-                # DSQI E1/E2
-                "E1_score": artifact["dsqi"]["E1_conceptual_fidelity"]["score"],
-                "E1_justification": artifact["dsqi"]["E1_conceptual_fidelity"]["justification"],
-                "E2_score": artifact["dsqi"]["E2_process_replicability"]["score"],
-                "E2_justification": artifact["dsqi"]["E2_process_replicability"]["justification"],
-                # Open-ended
-                "open_most_positive": artifact["open_ended"]["most_positive"],
-                "open_most_negative": artifact["open_ended"]["most_negative"],
-                "open_other_comments": artifact["open_ended"].get("other_comments", ""),
-            }
-            flat.append(row)
-    return flat
+    return list(iter_expert_flat(text))
 
 
 # ── Layer 3: Coordinator reviews ──
 
+@_kept("coordinator")
+@tracing.traced()
 def load_coordinator_reviews() -> list[dict]:
     """Load all coordinator review files (one per artifact).
 
     Returns:
         list of coordinator review dicts
     """
-    reviews = []
-    for path in sorted(COORD_DIR.glob("dsqi-coordinator-*.json")):
-        reviews.append(load_json(path))
-    return reviews
+    return load_json_many(sorted(COORD_DIR.glob("dsqi-coordinator-*.json")), layer="coordinator")
 
 
-def load_coordinator_flat() -> list[dict]:
+@_kept("coordinator")
+@tracing.traced()
+def load_coordinator_flat(text: bool = True) -> list[CoordinatorObservation]:
     """Flatten coordinator reviews into one row per artifact.
 
+    Args:
+        text: include the open-ended Q7/Q8 answers (None when False).
+
     Returns:
-        list of dicts with keys:
+        list of CoordinatorObservation records (dict-style access), with keys:
             artifact_id, coordinator_name, department, module, module_name,
             Q1-Q3 scores, P1_average,
             Q4_engagement_mode (ICAP),
             Q5_ease_of_integration, Q6_likelihood_of_use,
             Q7_benefit, Q8_drawback
     """
+    keep = _intern if text else (lambda value: None)
     flat = []
     for review in load_coordinator_reviews():
-        row = {
-            "artifact_id": review["artifact_id"],
-            "coordinator_name": review["coordinator"]["name"],
-            "department": review["coordinator"].get("department", ""),
-            "module": review.get("module", ""),
-            "module_name": review.get("module_name", ""),
+        alignment = review["pedagogical_alignment"]
+        adoption = review["adoption_intention"]
+        flat.append(CoordinatorObservation(
+            _intern(review["artifact_id"]),
+            _intern(review["coordinator"]["name"]),
+            _intern(review["coordinator"].get("department", "")),
+            _intern(review.get("module", "")),
+            _intern(review.get("module_name", "")),
             # Pedagogical alignment
-            "Q1_curriculum_relevance": review["pedagogical_alignment"]["Q1_curriculum_relevance"],
-            "Q2_concept_challenge": review["pedagogical_alignment"]["Q2_concept_challenge"],
-            "Q3_objective_coverage": review["pedagogical_alignment"]["Q3_objective_coverage"],
-            "P1_average": review["pedagogical_alignment"]["P1_average"],
+            alignment["Q1_curriculum_relevance"],
+            alignment["Q2_concept_challenge"],
+            alignment["Q3_objective_coverage"],
+            alignment["P1_average"],
             # ICAP
-            "Q4_engagement_mode": review["icap"]["Q4_engagement_mode"],
+            _intern(review["icap"]["Q4_engagement_mode"]),
             # Adoption
-            "Q5_ease_of_integration": review["adoption_intention"]["Q5_ease_of_integration"],
-            "Q6_likelihood_of_use": review["adoption_intention"]["Q6_likelihood_of_use"],
+            adoption["Q5_ease_of_integration"],
+            adoption["Q6_likelihood_of_use"],
             # Open-ended
-            "Q7_benefit": review["open_ended"]["Q7_most_significant_benefit"],
-            "Q8_drawback": review["open_ended"]["Q8_most_significant_drawback"],
-        }
-        flat.append(row)
+            keep(review["open_ended"]["Q7_most_significant_benefit"]),
+            keep(review["open_ended"]["Q8_most_significant_drawback"]),
+        ))
     return flat
 
 
 # ── Development logs ──
 
+@_kept("sessions")
+@tracing.traced()
 def load_session_logs() -> dict[str, dict]:
     """Load development session logs.
 
     Returns:
         dict mapping slug → session data
     """
-    results = {}
-    for slug in ARTIFACT_SLUGS:
-        path = DEV_LOG_DIR / f"sessions-{slug}.json"
-        if path.exists():
-            results[slug] = load_json(path)
-    return results
+    found = [(slug, DEV_LOG_DIR / f"sessions-{slug}.json") for slug in ARTIFACT_SLUGS]
+    found = [(slug, path) for slug, path in found if path.exists()]
+    docs = load_json_many([path for _, path in found], layer="sessions")
+    return {slug: data for (slug, _), data in zip(found, docs)}
 
 
+@_kept("sessions")
+@tracing.traced()
 def load_wakatime_logs() -> dict[str, dict]:
     """Load WakaTime log files.
 
     Returns:
         dict mapping slug → wakatime data
     """
-    results = {}
+    found = []
     for path in sorted(DEV_LOG_DIR.glob("wakatime-*.json")):
         # Extract slug from filename: wakatime-{slug}-{date}.json
         name = path.stem  # e.g. "wakatime-01-unit-testing-gauntlet-2026-02-18"
         # Find slug by matching against known slugs
         for slug in ARTIFACT_SLUGS:
             if slug in name:
-                results[slug] = load_json(path)
+                found.append((slug, path))
                 break
-    return results
+    docs = load_json_many([path for _, path in found])
+    return {slug: data for (slug, _), data in zip(found, docs)}
+
+
+# ── Cold-load report ──
+
+def main():
+    import argparse
+    global LOAD_WORKERS
+
+    parser = argparse.ArgumentParser(description="Time a cold load of the study data tree")
+    parser.add_argument("--workers", type=int, default=LOAD_WORKERS,
+                        help=f"Reader threads (default: {LOAD_WORKERS}; 1 = sequential)")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "data_loader")
+
+    LOAD_WORKERS = max(1, args.workers)
+
+    print(f"  Study root: {ROOT}")
+    loaders = [load_dsqi_files, load_expert_reviews, load_coordinator_reviews,
+               load_session_logs, load_wakatime_logs]
+    for loader in loaders:
+        before = load_stats()
+        data = loader()
+        after = load_stats()
+        files = after["files"] - before["files"]
+        nbytes = after["bytes"] - before["bytes"]
+        print(f"  · {loader.__name__:<26} {files:>5} files  {nbytes / 1e6:8.2f} MB  "
+              f"{after['seconds'] - before['seconds']:7.3f}s  ({len(data)} loaded)")
+
+    stats = load_stats()
+    print(f"\n  ✓ {stats['files']} files, {stats['bytes'] / 1e6:.2f} MB in {stats['seconds']:.3f}s"
+          f"  —  {stats['files_per_s'] or 0:.0f} files/s, {stats['mb_per_s'] or 0:.1f} MB/s"
+          f"  ({stats['parser']}, {stats['workers']} workers)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+dep_graph.py — Transitive dependency graph of an artifact from its lockfile.
+
+count_dependencies() in dsqi_collect.py counts the direct dependencies a
+manifest declares; the maintenance cost of an artifact is the whole tree
+those pull in. This reads the lockfile next to the manifest (in src/ or
+the artifact root), builds the resolved graph and reports:
+
+    direct             top-level dependencies (direct_dev: dev-only ones)
+    total              distinct name@version packages reachable from them
+    production_total   the same, from the production dependencies only
+    max_depth          longest shortest chain from a direct dependency
+                       (direct = 1), i.e. the depth `npm ls` shows
+    duplicate_names    packages installed in more than one version, with
+                       the versions of the 20 most duplicated
+    entries            packages in the lockfile (reachable or not)
+    unresolved         dependency edges the lockfile has no package for
+
+Lockfiles, first found wins:
+
+    npm-shrinkwrap.json / package-lock.json   v1 ("dependencies" tree,
+                       edges from "requires") and v2/v3 ("packages" map,
+                       resolved node-style up the node_modules path)
+    yarn.lock          classic (v1) and berry (v2+) formats
+    requirements*.txt  pinned name==version lines; pip-compile "# via"
+                       comments give the edges, "-r" sources the roots
+
+Lockfiles are read as streams, never whole: JSON lockfiles one package at
+a time through json_stream.py, the others line by line, so multi-megabyte
+lockfiles stay cheap. Results are cached by the SHA-256 of the lockfile
+(and the manifest beside it) in output/.dep-graph-cache.json, so unchanged
+lockfiles are not parsed again. dsqi_collect.py stores the result as
+raw_metrics["dependency_analysis"]["dependency_graph"].
+
+Usage:
+    python analysis/dep_graph.py artifacts/01-unit-testing-gauntlet/src
+    python analysis/dep_graph.py path/to/package-lock.json
+    python analysis/dep_graph.py --all
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from collections import defaultdict, deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, ContentCache, parse_json, save_json
+from json_stream import JSONStream
+from lazy_import import lazy_callable
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
+CACHE_PATH = STUDY_ROOT / "analysis" / "output" / ".dep-graph-cache.json"
+CACHE_VERSION = 1
+
+TOOL = "lockfile dependency graph (dep_graph.py)"
+LOCKFILES = ("npm-shrinkwrap.json", "package-lock.json", "yarn.lock", "requirements.txt")
+TOP_DUPLICATES = 20
+
+
+# ── Graph ──
+
+class Graph:
+    """Packages keyed "name@version", their edges and the direct dependencies."""
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        self.nodes = {}                # id -> (name, version)
+        self.edges = defaultdict(set)  # id -> {id}
+        self.roots = {}                # id -> dev-only?
+        self.unresolved = 0
+
+    def node(self, name: str, version: str) -> str:
+        key = f"{name}@{version}"
+        self.nodes.setdefault(key, (name, version))
+        return key
+
+    def root(self, key: str, dev: bool):
+        self.roots[key] = self.roots.get(key, True) and dev
+
+    def depths(self, roots) -> dict:
+        """Breadth-first depth of every package reachable from `roots`."""
+        depth = {key: 1 for key in roots}
+        queue = deque(depth)
+        while queue:
+            key = queue.popleft()
+            for dep in self.edges.get(key, ()):
+                if dep not in depth:
+                    depth[dep] = depth[key] + 1
+                    queue.append(dep)
+        return depth
+
+    def metrics(self) -> dict:
+        depth = self.depths(self.roots)
+        production = self.depths(key for key, dev in self.roots.items() if not dev)
+        versions = defaultdict(set)
+        for key in depth:
+            name, version = self.nodes[key]
+            versions[name].add(version)
+        duplicates = sorted(((name, vs) for name, vs in versions.items() if len(vs) > 1),
+                            key=lambda item: (-len(item[1]), item[0]))
+        return {
+            "format": self.format,
+            "direct": len(self.roots),
+            "direct_dev": sum(self.roots.values()),
+            "total": len(depth),
+            "production_total": len(production),
+            "max_depth": max(depth.values(), default=0),
+            "duplicate_names": len(duplicates),
+            "duplicates": {name: sorted(vs) for name, vs in duplicates[:TOP_DUPLICATES]},
+            "entries": len(self.nodes),
+            "unresolved": self.unresolved,
+        }
+
+
+def _manifest_roots(manifest: dict | None) -> list[tuple[str, str, bool]]:
+    """(name, range, dev) of the dependencies a package.json declares."""
+    if not manifest:
+        return []
+    roots = []
+    for section, dev in (("dependencies", False), ("optionalDependencies", False),
+                         ("devDependencies", True)):
+        roots += [(name, spec, dev) for name, spec in (manifest.get(section) or {}).items()]
+    return roots
+
+
+# ── npm ──
+
+def _npm_resolve(packages: dict, path: str, name: str) -> str | None:
+    """Install path a require of `name` from `path` resolves to (node_modules lookup)."""
+    while True:
+        candidate = f"{path}/node_modules/{name}" if path else f"node_modules/{name}"
+        if candidate in packages:
+            entry = packages[candidate]
+            return entry[3] if entry[3] in packages else candidate  # follow workspace links
+        if not path:
+            return None
+        cut = path.rfind("/node_modules/")
+        path = path[:cut] if cut >= 0 else ""
+
+
+def _flatten_v1(packages: dict, path: str, name: str, entry: dict):
+    """Add a v1 "dependencies" entry and its nested tree to `packages` by install path."""
+    here = f"{path}/node_modules/{name}" if path else f"node_modules/{name}"
+    packages[here] = (name, entry.get("version", ""), tuple(entry.get("requires") or ()),
+                      None, bool(entry.get("dev")))
+    for child, child_entry in (entry.get("dependencies") or {}).items():
+        _flatten_v1(packages, here, child, child_entry)
+
+
+def parse_npm_lock(path: Path, manifest: dict | None = None) -> Graph:
+    """Graph of a package-lock.json / npm-shrinkwrap.json (lockfileVersion 1–3)."""
+    version = None
+    root = {}
+    packages = {}  # install path -> (name, version, dependency names, link target, dev)
+    legacy = {}    # v1 tree, flattened the same way
+    for kind, key, value in JSONStream(path, ("packages", "dependencies"), stream_objects=True):
+        if kind == "member":
+            if key == "lockfileVersion":
+                version = value
+            continue
+        if kind != "entry":
+            continue
+        name, entry = value
+        if key == "packages":
+            if name == "":
+                root = entry
+                continue
+            deps = tuple(entry.get("dependencies") or ()) + tuple(entry.get("optionalDependencies") or ())
+            target = entry.get("resolved") if entry.get("link") else None
+            packages[name] = (entry.get("name") or name.rpartition("node_modules/")[2],
+                              entry.get("version", ""), deps, target, bool(entry.get("dev")))
+        elif version is None or version < 2:
+            # v2 lockfiles repeat the tree under "dependencies" for old npm clients
+            _flatten_v1(legacy, "", name, entry)
+
+    if packages or (version or 0) >= 2:
+        graph = Graph(f"npm-lockfile-v{version or 2}")
+        root_deps = _manifest_roots(root) or _manifest_roots(manifest)
+    else:
+        graph = Graph("npm-lockfile-v1")
+        packages = legacy
+        root_deps = _manifest_roots(manifest)
+
+    keys = {}
+    for where, (name, ver, _, target, _) in packages.items():
+        if target is None or target not in packages:
+            keys[where] = graph.node(name, ver)
+    for where, (_, _, deps, target, _) in packages.items():
+        if where not in keys:
+            continue
+        for dep in deps:
+            resolved = _npm_resolve(packages, where, dep)
+            if resolved in keys:
+                graph.edges[keys[where]].add(keys[resolved])
+            else:
+                graph.unresolved += 1
+
+    if root_deps:
+        for name, _, dev in root_deps:
+            resolved = _npm_resolve(packages, "", name)
+            if resolved in keys:
+                graph.root(keys[resolved], dev)
+            else:
+                graph.unresolved += 1
+    else:
+        # No manifest: the top-level installs nothing else requires
+        required = set().union(*graph.edges.values()) if graph.edges else set()
+        for where, key in keys.items():
+            if "/node_modules/" not in where and key not in required:
+                graph.root(key, packages[where][4])
+    return graph
+
+
+# ── yarn ──
+
+_YARN_DEP = re.compile(r'^"?((?:@[^/\s"]+/)?[^\s":]+)"?:?\s+"?([^"]*)"?$')
+_YARN_SECTIONS = ("dependencies:", "optionalDependencies:")
+
+
+def _yarn_name(spec: str) -> str:
+    return spec[:spec.index("@", 1)] if "@" in spec[1:] else spec
+
+
+def parse_yarn_lock(path: Path, manifest: dict | None = None) -> Graph:
+    """Graph of a yarn.lock, classic (v1) or berry (v2+)."""
+    entries = []  # [specs, version, [(name, range)], workspace?]
+    current, section = None, False
+    berry = False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            indent = len(line) - len(line.lstrip(" "))
+            if indent == 0:
+                header = stripped.rstrip(":")
+                if header == "__metadata":
+                    berry, current = True, None
+                    continue
+                specs = [s.strip().strip('"') for s in header.split(",")]
+                current = [specs, "", [], any("@workspace:" in s for s in specs)]
+                entries.append(current)
+                section = False
+            elif current is None:
+                continue
+            elif indent == 2:
+                section = stripped in _YARN_SECTIONS
+                if stripped.startswith("version"):
+                    current[1] = stripped[len("version"):].lstrip(": ").strip('"')
+            elif section:
+                m = _YARN_DEP.match(stripped)
+                if m:
+                    current[2].append((m.group(1), m.group(2)))
+
+    graph = Graph("yarn-berry" if berry else "yarn-classic")
+    by_spec, by_name, keys = {}, {}, []
+    for specs, version, _, workspace in entries:
+        key = None if workspace else graph.node(_yarn_name(specs[0]), version)
+        keys.append(key)
+        for spec in specs:
+            by_spec[spec] = key
+        if key:
+            by_name.setdefault(_yarn_name(specs[0]), key)
+
+    def lookup(name: str, spec: str) -> str | None:
+        for candidate in (f"{name}@{spec}", f"{name}@npm:{spec}"):
+            if by_spec.get(candidate):
+                return by_spec[candidate]
+        return by_name.get(name)
+
+    workspace_roots = []
+    for (specs, _, deps, workspace), key in zip(entries, keys):
+        for name, spec in deps:
+            dep = lookup(name, spec)
+            if dep is None:
+                graph.unresolved += 1
+            elif workspace:
+                workspace_roots.append(dep)
+            else:
+                graph.edges[key].add(dep)
+
+    roots = [(name, spec, dev) for name, spec, dev in _manifest_roots(manifest)]
+    if roots:
+        for name, spec, dev in roots:
+            dep = lookup(name, spec)
+            if dep is None:
+                graph.unresolved += 1
+            else:
+                graph.root(dep, dev)
+    elif workspace_roots:
+        # Berry lists the workspace itself, without telling dev dependencies apart
+        for dep in workspace_roots:
+            graph.root(dep, False)
+    else:
+        required = set().union(*graph.edges.values()) if graph.edges else set()
+        for key in keys:
+            if key and key not in required:
+                graph.root(key, False)
+    return graph
+
+
+# ── pip ──
+
+_REQUIREMENT = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*(?:(===?|~=|>=|<=|!=|>|<)\s*([^\s;,#\\]+))?")
+
+
+def _pip_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_requirements(path: Path, manifest: dict | None = None) -> Graph:
+    """Graph of a pinned requirements file; pip-compile "# via" comments give the edges."""
+    graph = Graph("pip-requirements")
+    via = {}         # key -> [parent names or "-r …" sources]
+    keys = {}        # normalised name -> key
+    current, in_via = None, False
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.startswith("#"):
+                comment = stripped.lstrip("#").strip()
+                if current is None:
+                    continue
+                if comment.startswith("via"):
+                    rest = comment[3:].strip()
+                    in_via = not rest
+                    if rest:
+                        via[current].append(rest)
+                elif in_via and comment:
+                    via[current].append(comment)
+                continue
+            in_via = False
+            if stripped.startswith("-"):
+                continue  # options, -r/-c includes, --hash continuations
+            m = _REQUIREMENT.match(stripped)
+            if not m:
+                continue
+            name = _pip_name(m.group(1))
+            version = m.group(3) if m.group(2) in ("==", "===") else (
+                f"{m.group(2)}{m.group(3)}" if m.group(2) else "*")
+            current = graph.node(name, version)
+            keys[name] = current
+            via[current] = []
+
+    for key, sources in via.items():
+        direct = not sources
+        for source in sources:
+            if source.startswith("-r") or source.startswith("-c") or source.endswith(".in"):
+                direct = True
+                continue
+            parent = keys.get(_pip_name(source.split()[0]))
+            if parent is None:
+                graph.unresolved += 1
+            else:
+                graph.edges[parent].add(key)
+        if direct:
+            graph.root(key, False)
+    return graph
+
+
+PARSERS = {
+    "npm-shrinkwrap.json": parse_npm_lock,
+    "package-lock.json": parse_npm_lock,
+    "yarn.lock": parse_yarn_lock,
+}
+
+
+# ── Cache ──
+
+def load_cache(path: Path = CACHE_PATH) -> ContentCache:
+    """{sha256: graph metrics} (empty if stale or missing)."""
+    return ContentCache(path, {"version": CACHE_VERSION})
+
+
+def _digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# ── Analysis ──
+
+def find_lockfile(src_dir: Path) -> Path | None:
+    """The lockfile in src/ or the artifact root, in LOCKFILES order."""
+    for search_dir in (src_dir, src_dir.parent):
+        for name in LOCKFILES:
+            if (search_dir / name).is_file():
+                return search_dir / name
+        pinned = sorted(search_dir.glob("requirements*.txt"))
+        if pinned:
+            return pinned[0]
+    return None
+
+
+@tracing.traced()
+def analyse_lockfile(lockfile: Path, cache: dict | None = None) -> dict:
+    """Graph metrics of one lockfile (see the module docstring).
+
+    Args:
+        cache: {sha256: metrics}, read and updated in place (default: the
+               on-disk cache, saved when it changed)
+
+    Returns:
+        {"lockfile", "sha256", **Graph.metrics()}
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = load_cache()
+
+    manifest_path = lockfile.parent / "package.json"
+    digest = _digest(lockfile)
+    key = digest
+    if lockfile.suffix != ".txt" and manifest_path.is_file():
+        key += ":" + _digest(manifest_path)
+
+    if key in cache:
+        tracing.add("cache_hits")
+    else:
+        size = lockfile.stat().st_size
+        tracing.add("bytes_read", size)
+        manifest = None
+        if key != digest:
+            try:
+                manifest = parse_json(manifest_path.read_bytes())
+            except ValueError:
+                manifest = None
+        parse = PARSERS.get(lockfile.name, parse_requirements)
+        with tracing.span("parse", lockfile=lockfile.name, bytes=size):
+            cache[key] = parse(lockfile, manifest).metrics()
+        if own_cache:
+            cache.save()
+
+    return {"lockfile": lockfile.name, "sha256": digest, **cache[key]}
+
+
+def analyse(src_dir: Path, cache: dict | None = None) -> dict | None:
+    """Graph metrics of an artifact's lockfile, or None when it has none."""
+    lockfile = find_lockfile(src_dir)
+    if lockfile is None:
+        return None
+    return analyse_lockfile(lockfile, cache=cache)
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Transitive dependency graph from lockfiles")
+    parser.add_argument("src", nargs="*", type=Path, help="src/ directories or lockfiles to analyse")
+    parser.add_argument("--all", action="store_true", help="Analyse every artifacts/*/src")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the results as JSON")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "dep_graph")
+
+    targets = list(args.src)
+    if args.all:
+        targets += sorted(p / "src" for p in ARTIFACTS_DIR.iterdir() if (p / "src").is_dir())
+    if not targets:
+        parser.error("give src/ directories, lockfiles or --all")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Dependency Graph                                        ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    cache = load_cache()
+    results, rows = {}, []
+    for target in targets:
+        if target.is_file():
+            name, result = str(target), analyse_lockfile(target, cache=cache)
+        else:
+            name = target.parent.name if target.name == "src" else target.name
+            result = analyse(target, cache=cache)
+        results[name] = result
+        if result is None:
+            rows.append([name, "—", "—", "—", "—", "—", "—"])
+            continue
+        rows.append([name, result["format"], result["direct"], result["total"],
+                     result["production_total"], result["max_depth"], result["duplicate_names"]])
+        if len(targets) == 1 and result["duplicates"]:
+            for dup, versions in result["duplicates"].items():
+                print(f"  ⚠ {dup}: {', '.join(versions)}")
+            print()
+    cache.save()
+
+    print(tabulate(rows, headers=["Artifact", "Lockfile", "Direct", "Total", "Production",
+                                  "Max depth", "Duplicated"],
+                   tablefmt="simple_outline"))
+    missing = sum(r is None for r in results.values())
+    if missing:
+        print(f"\n  · {missing} without a lockfile (direct dependencies only)")
+
+    if args.json:
+        save_json(args.json, results)
+        print(f"\n  ✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,36 @@ dsqi_collect.py — Automatically collect DSQI raw metrics for an artifact.
 
 Gathers the measurable DSQI sub-metrics:
     M₁  Dependency count       (package.json / requirements.txt scan)
-    M₂  Code complexity        (regex-based cyclomatic complexity for JS/HTML/CSS/Python)
+    M₂  Code complexity        (regex-based cyclomatic complexity for JS files and
+                                inline <script> blocks; radon for Python, see
+                                py_complexity.py; HTML/CSS structure recorded
+                                alongside, see html_analysis.py)
     M₃  Deployment steps       (heuristic from project structure)
     C₁  Lines of Code          (cloc)
     C₂  Development time       (session logs + WakaTime)
     C₃  AI generation ratio    (session logs)
 
+Also records code shared with other artifacts (code_clones.py) under
+raw_metrics["code_clones"]; it is reported, not scored.
+
+Records raw, gzip and brotli transfer sizes of src/ (transfer_size.py) under
+raw_metrics["transfer_size"]. With --transfer-size-metric, the gzip total
+(KB, normalised by NORM["transfer_kb"]) enters M as a fourth sub-metric.
+
+Resolves the transitive dependency graph from a lockfile (dep_graph.py:
+package-lock.json, yarn.lock or pinned requirements) under
+raw_metrics["dependency_analysis"]["dependency_graph"]; M₁ still scores the
+direct count.
+
+Records the critical resource chain of the artifact's HTML pages
+(html_analysis.py: render-blocking scripts and stylesheets, inline payloads,
+critical-path bytes) under raw_metrics["critical_resources"]; reported only.
+
+Lints the JavaScript for hot-path performance anti-patterns (js_perf_lint.py:
+DOM queries and innerHTML writes in loops, layout thrashing, timers never
+cleared); per-function findings go to complexity.json, the summary to
+raw_metrics["performance_lint"]. Reported, not scored.
+
 Produces:
     - data/evaluations/layer1-dsqi/dsqi-{slug}.json   (partial — P and E left null for human input)
     - data/static-analysis/{slug}/cloc-output.json     (full cloc results)
@@ -18,6 +42,8 @@ Produces:
 Usage:
     python analysis/dsqi_collect.py --artifact 1
     python analysis/dsqi_collect.py --artifact 1 --deployment-steps 3
+    python analysis/dsqi_collect.py --artifact 1 --reuse-cloc
+    python analysis/dsqi_collect.py --artifact 1 --transfer-size-metric
     python analysis/dsqi_collect.py --artifact 1 --deploy-method "GitHub Pages" --deploy-steps-desc "git add,git commit,git push,enable Pages"
 """
 
@@ -31,7 +57,22 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-STUDY_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT
+from dsqi_norm import NORM, normalize, cloc_code_total
+from lazy_import import lazy_module, lazy_callable
+import tracing
+
+# The analysers are bound lazily, so importing the collector (dsqi_history.py,
+# the worker, --help) does not load every one of them.
+code_clones = lazy_module("code_clones")
+dep_graph = lazy_module("dep_graph")
+html_analysis = lazy_module("html_analysis")
+js_perf_lint = lazy_module("js_perf_lint")
+py_complexity = lazy_module("py_complexity")
+scan = lazy_callable("source_scan", "scan")
+transfer_size = lazy_module("transfer_size")
+
 REGISTRY_PATH = STUDY_ROOT / "data" / "artifact-registry.json"
 DEV_LOGS_DIR = STUDY_ROOT / "data" / "development-logs"
 DSQI_DIR = STUDY_ROOT / "data" / "evaluations" / "layer1-dsqi"
@@ -40,34 +81,22 @@ ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
 
 COLLECTOR_VERSION = "1.0.0"
 
-# ── Normalisation thresholds ─────────────────────────────────
-# These define the "worst case" anchors for normalisation to [0, 1].
-# Anything at or above the threshold scores 1.0 (worst).
-# Derived from the protocol: disposable software should be near zero.
-
-NORM = {
-    "dependency_count": 20,       # 0 deps = 0.0, 20+ deps = 1.0
-    "complexity_avg": 15,         # avg CC 1 ≈ 0.07, 15+ = 1.0
-    "deployment_steps": 10,       # 0 steps = 0.0, 10+ = 1.0
-    "lines_of_code": 5000,        # 0 = 0.0, 5000+ = 1.0
-    "dev_time_minutes": 480,      # 0 = 0.0, 8 hours+ = 1.0
-}
+# Normalisation thresholds (NORM) live in dsqi_norm.py, shared with dsqi_rescore.py.
 
 
 def load_json(path: Path) -> dict | list:
-    return json.loads(path.read_text(encoding="utf-8"))
+    with tracing.span("read_json", file=path.name):
+        raw = path.read_bytes()
+        tracing.add("bytes_read", len(raw))
+        return json.loads(raw)
 
 
 def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-
-
-def normalize(value: float, threshold: float) -> float:
-    """Normalize a value to [0, 1] by dividing by threshold, capped at 1."""
-    if threshold == 0:
-        return 0.0
-    return min(value / threshold, 1.0)
+    with tracing.span("write_json", file=path.name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+        path.write_bytes(raw)
+        tracing.add("bytes_written", len(raw))
 
 
 def get_artifact(registry: dict, artifact_id: int) -> dict | None:
@@ -79,13 +108,20 @@ def get_artifact(registry: dict, artifact_id: int) -> dict | None:
 
 # ── M₁: Dependency Count ────────────────────────────────────
 
+@tracing.traced()
 def count_dependencies(src_dir: Path) -> dict:
-    """Count production dependencies from package.json or requirements.txt."""
+    """Count production dependencies from package.json or requirements.txt.
+
+    The count is of direct dependencies (what M₁ scores); the transitive
+    graph from a lockfile, when there is one, is reported alongside as
+    "dependency_graph" (dep_graph.py).
+    """
     result = {
         "has_package_json": False,
         "has_requirements_txt": False,
         "production_dependencies": [],
         "dependency_count": 0,
+        "dependency_graph": dep_graph.analyse(src_dir),
     }
 
     # Check in src/ and one level up (artifact root)
@@ -119,7 +155,10 @@ def count_dependencies(src_dir: Path) -> dict:
 
 # ── M₂: Code Complexity ─────────────────────────────────────
 
-def compute_js_complexity(filepath: Path) -> dict:
+JS_SUFFIXES = (".js", ".ts", ".jsx", ".tsx")
+
+
+def compute_js_complexity(filepath: Path, name: str | None = None) -> dict:
     """
     Estimate cyclomatic complexity for a JavaScript file using regex-based
     counting of decision points. This is a lightweight alternative to
@@ -127,9 +166,17 @@ def compute_js_complexity(filepath: Path) -> dict:
 
     Decision points counted: if, else if, for, while, do, switch, case,
     catch, &&, ||, ?:
+
+    `name` is reported as the file (default: the file name).
     """
     code = filepath.read_text(encoding="utf-8", errors="replace")
+    tracing.add("bytes_read", filepath.stat().st_size)
+    tracing.add("files_scanned")
+    return js_source_complexity(code, name or filepath.name)
+
 
+def js_source_complexity(code: str, name: str) -> dict:
+    """Regex-based cyclomatic complexity of JavaScript source text (see compute_js_complexity)."""
     # Remove comments
     code = re.sub(r"//.*$", "", code, flags=re.MULTILINE)
     code = re.sub(r"/\*[\s\S]*?\*/", "", code)
@@ -159,7 +206,7 @@ def compute_js_complexity(filepath: Path) -> dict:
         decisions = len(decision_pattern.findall(code))
         complexity = decisions + 1
         return {
-            "file": filepath.name,
+            "file": name,
             "functions": 1,
             "average_complexity": complexity,
             "max_complexity": complexity,
@@ -175,7 +222,7 @@ def compute_js_complexity(filepath: Path) -> dict:
         complexities.append(decisions + 1)  # +1 for the default path
 
     return {
-        "file": filepath.name,
+        "file": name,
         "functions": len(complexities),
         "average_complexity": round(sum(complexities) / len(complexities), 2) if complexities else 1,
         "max_complexity": max(complexities) if complexities else 1,
@@ -183,19 +230,46 @@ def compute_js_complexity(filepath: Path) -> dict:
     }
 
 
-def compute_complexity(src_dir: Path) -> dict:
-    """Compute complexity for all JS files in src/."""
-    files_data = []
-    for f in sorted(src_dir.iterdir()):
-        if f.is_file() and f.suffix in (".js", ".ts", ".jsx", ".tsx"):
-            files_data.append(compute_js_complexity(f))
+@tracing.traced()
+def compute_complexity(src_dir: Path, markup: dict | None = None) -> dict:
+    """Compute complexity for all JS/TS and Python files under src/ (recursively, see source_scan.py).
+
+    Python files are measured with radon (py_complexity.py); both kinds
+    share one function-weighted overall_average. Files radon cannot parse
+    are listed with their error but left out of the averages.
+
+    `markup` is the structure from html_analysis.analyse_src: its inline
+    <script> blocks are measured as JavaScript units ("index.html#script@12")
+    and its HTML and CSS figures are added under "html" and "css".
+    """
+    sources = scan(src_dir, suffixes=JS_SUFFIXES + py_complexity.PY_SUFFIXES, count=False)
+    files_data = [compute_js_complexity(f["path"], name=f["rel"])
+                  for f in sources if f["path"].suffix.lower() in JS_SUFFIXES]
+    if markup is not None:
+        files_data += [js_source_complexity(s["code"], f"{s['page']}#script@{s['line']}")
+                       for s in markup["inline_scripts"]]
+    tool = "regex-based cyclomatic complexity (dsqi_collect.py)"
+    py_files = [(f["path"], f["rel"]) for f in sources if f["path"].suffix.lower() in py_complexity.PY_SUFFIXES]
+    if py_files:
+        if py_complexity.HAS_RADON:
+            files_data += py_complexity.analyse_files(py_files)
+            files_data.sort(key=lambda f: f["file"])
+            tool += "; " + py_complexity.TOOL
+        else:
+            print(f"  ⚠ radon not available — {len(py_files)} Python file(s) not measured")
+    failed = [f for f in files_data if "error" in f]
+    files_data = [f for f in files_data if "error" not in f]
+
+    structure = {"html": markup["html"], "css": markup["css"]} if markup is not None else {}
 
     if not files_data:
         return {
-            "tool": "regex-based cyclomatic complexity (dsqi_collect.py)",
+            "tool": tool,
             "files": [],
+            **({"unparsed_files": failed} if failed else {}),
             "overall_average": 1.0,
             "overall_max": 1,
+            **structure,
         }
 
     total_funcs = sum(f["functions"] for f in files_data)
@@ -204,15 +278,18 @@ def compute_complexity(src_dir: Path) -> dict:
     overall_max = max(f["max_complexity"] for f in files_data)
 
     return {
-        "tool": "regex-based cyclomatic complexity (dsqi_collect.py)",
+        "tool": tool,
         "files": files_data,
+        **({"unparsed_files": failed} if failed else {}),
         "overall_average": overall_avg,
         "overall_max": overall_max,
+        **structure,
     }
 
 
 # ── M₃: Deployment Steps ────────────────────────────────────
 
+@tracing.traced()
 def estimate_deployment(src_dir: Path, method: str | None = None, steps_desc: list | None = None) -> dict:
     """Estimate deployment complexity."""
     if steps_desc:
@@ -267,6 +344,7 @@ def estimate_deployment(src_dir: Path, method: str | None = None, steps_desc: li
 
 # ── C₁: Lines of Code (cloc) ────────────────────────────────
 
+@tracing.traced()
 def run_cloc(src_dir: Path, output_path: Path) -> dict:
     """Run cloc and return results. Save full output to static-analysis dir."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -309,6 +387,7 @@ def run_cloc(src_dir: Path, output_path: Path) -> dict:
 
 # ── C₂ & C₃: Dev Time & AI Ratio (from session logs) ───────
 
+@tracing.traced()
 def get_dev_metrics_from_logs(slug: str) -> dict:
     """Extract development time and AI ratio from session logs."""
     log_path = DEV_LOGS_DIR / f"sessions-{slug}.json"
@@ -348,21 +427,22 @@ def get_dev_metrics_from_logs(slug: str) -> dict:
 
 # ── Assemble DSQI JSON ───────────────────────────────────────
 
+@tracing.traced()
 def build_dsqi_result(artifact: dict, dep_info: dict, complexity: dict,
                       deployment: dict, cloc_data: dict, dev_metrics: dict,
-                      args) -> dict:
-    """Assemble the partial DSQI result JSON (P and E left null for human input)."""
+                      args, clones: dict | None = None, transfer: dict | None = None,
+                      transfer_in_m: bool = False, critical: dict | None = None,
+                      perf_lint: dict | None = None) -> dict:
+    """Assemble the partial DSQI result JSON (P and E left null for human input).
+
+    With transfer_in_m, M averages four sub-metrics: the three above plus
+    the normalised gzip transfer size.
+    """
 
     now = datetime.now(timezone.utc).isoformat()
 
     # Extract total code lines from cloc
-    cloc_total = 0
-    if "SUM" in cloc_data:
-        cloc_total = cloc_data["SUM"].get("code", 0)
-    elif cloc_data:
-        for lang, vals in cloc_data.items():
-            if isinstance(vals, dict) and "code" in vals and lang != "header":
-                cloc_total += vals["code"]
+    cloc_total = cloc_code_total(cloc_data)
 
     # ── Raw values ──
     m1_deps = dep_info["dependency_count"]
@@ -380,7 +460,17 @@ def build_dsqi_result(artifact: dict, dep_info: dict, complexity: dict,
     c2_norm = normalize(c2_time, NORM["dev_time_minutes"])
 
     # Composite scores (average of sub-metrics)
-    M = round((m1_norm + m2_norm + m3_norm) / 3, 4)
+    m_parts = [m1_norm, m2_norm, m3_norm]
+    transfer_fields = {}
+    if transfer_in_m and transfer is not None:
+        m4_kb = transfer_size.transfer_kb(transfer)
+        m4_norm = normalize(m4_kb, NORM["transfer_kb"])
+        m_parts.append(m4_norm)
+        transfer_fields = {
+            "transfer_size_kb": m4_kb,
+            "transfer_size_normalized": round(m4_norm, 4),
+        }
+    M = round(sum(m_parts) / len(m_parts), 4)
     C = round((c1_norm + c2_norm + (1 - c3_ai)) / 3, 4)
     # Note: for C, AI ratio is inverted: high AI ratio = low human effort = lower C score
     # (1 - ai_ratio) represents the human effort fraction
@@ -399,6 +489,7 @@ def build_dsqi_result(artifact: dict, dep_info: dict, complexity: dict,
             "cyclomatic_complexity_normalized": round(m2_norm, 4),
             "deployment_steps": m3_steps,
             "deployment_steps_normalized": round(m3_norm, 4),
+            **transfer_fields,
             "M_score": M,
         },
 
@@ -455,6 +546,12 @@ def build_dsqi_result(artifact: dict, dep_info: dict, complexity: dict,
                 "total_lines": dev_metrics["total_lines"],
                 "source": dev_metrics["source"],
             },
+            **({"code_clones": clones} if clones is not None else {}),
+            **({"transfer_size": {k: v for k, v in transfer.items() if k != "cached"}}
+               if transfer is not None else {}),
+            **({"critical_resources": critical} if critical is not None else {}),
+            **({"performance_lint": {"tool": perf_lint["tool"], **perf_lint["summary"]}}
+               if perf_lint is not None else {}),
         },
     }
 
@@ -467,7 +564,13 @@ def main():
     parser.add_argument("--deployment-steps", type=int, help="Override: number of deployment steps")
     parser.add_argument("--deploy-method", help="Deployment method name (e.g. 'GitHub Pages')")
     parser.add_argument("--deploy-steps-desc", help="Comma-separated deployment step descriptions")
+    parser.add_argument("--reuse-cloc", action="store_true",
+                        help="Reuse an existing static-analysis cloc-output.json instead of running cloc")
+    parser.add_argument("--transfer-size-metric", action="store_true",
+                        help="Include gzip transfer size in M as a fourth sub-metric")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "dsqi_collect")
 
     # Load registry
     registry = load_json(REGISTRY_PATH)
@@ -493,14 +596,47 @@ def main():
     print("▸ M₁: Counting dependencies...")
     dep_info = count_dependencies(src_dir)
     print(f"  Dependencies: {dep_info['dependency_count']} {dep_info['production_dependencies']}")
+    graph = dep_info["dependency_graph"]
+    if graph is not None:
+        print(f"  Lockfile ({graph['lockfile']}): {graph['total']} packages "
+              f"({graph['production_total']} production), depth {graph['max_depth']}, "
+              f"{graph['duplicate_names']} in several versions")
 
     # ── M₂: Complexity ──
     print("▸ M₂: Computing cyclomatic complexity...")
-    complexity = compute_complexity(src_dir)
+    # One pass over the HTML/CSS: critical resources (reported below) and
+    # the markup structure, whose inline scripts count towards M₂
+    critical, markup = html_analysis.analyse_src(src_dir)
+    complexity = compute_complexity(src_dir, markup)
     print(f"  Average complexity: {complexity['overall_average']}")
     print(f"  Max complexity: {complexity['overall_max']}")
     for f in complexity.get("files", []):
         print(f"    {f['file']:30s} avg={f['average_complexity']:.1f}  max={f['max_complexity']}  functions={f['functions']}")
+    for f in complexity.get("unparsed_files", []):
+        print(f"    ✗ {f['file']:28s} {f['error']}")
+    html, css = complexity["html"], complexity["css"]
+    print(f"  HTML: {html['elements']} elements, max DOM depth {html['max_depth']}  "
+          f"CSS: {css['rules']} rules, {css['selectors']} selectors, "
+          f"max specificity ({','.join(map(str, css['max_specificity']))})")
+
+    # ── Performance lint ──
+    print("▸ Linting JavaScript hot paths...")
+    perf_lint = js_perf_lint.lint_artifact(src_dir)
+    summary = perf_lint["summary"]
+    print(f"  Findings: {summary['findings']} in {summary['functions_flagged']}/{summary['functions']} functions  "
+          f"score: {summary['score']}  [reported only]")
+    for rule, count in summary["by_rule"].items():
+        if count:
+            print(f"    {rule:20s} {count}")
+
+    # ── Code clones ──
+    print("▸ Detecting code shared with other artifacts...")
+    clones = code_clones.artifact_metric(code_clones.detect_clones(), slug)
+    print(f"  Duplicated: {clones['duplicated_lines']}/{clones['code_lines']} code lines "
+          f"({100 * clones['duplicated_ratio']:.1f}%), clone pairs: {clones['clone_pair_count']}")
+    for p in clones["clone_pairs"][:5]:
+        print(f"    {p['file']:20s} ↔ {p['other_artifact']}/{p['other_file']}  "
+              f"shared={p['shared_fingerprints']}  lines={p['duplicated_lines']}")
 
     # ── M₃: Deployment ──
     print("▸ M₃: Estimating deployment steps...")
@@ -515,10 +651,31 @@ def main():
     for s in deployment["steps_description"]:
         print(f"    - {s}")
 
+    # ── Transfer size ──
+    print("▸ Measuring transfer size...")
+    transfer = transfer_size.measure(src_dir)
+    total = transfer["total"]
+    print(f"  Raw: {total['bytes'] / 1024:.1f} KB  gzip: {total['gzip'] / 1024:.1f} KB  "
+          f"brotli: {total['brotli'] / 1024:.1f} KB ({transfer['brotli_method']})  "
+          f"{'[in M]' if args.transfer_size_metric else '[reported only]'}")
+
+    # ── Critical resource chain ──
+    print("▸ Critical resource chain...")
+    print(f"  Entry page: {critical['entry_page'] or '—'}  "
+          f"render-blocking: {critical['render_blocking_count']} ({critical['render_blocking_remote']} remote)  "
+          f"critical path: {critical['critical_path_bytes'] / 1024:.1f} KB "
+          f"(gzip {critical['critical_path_gzip'] / 1024:.1f} KB, {critical['critical_path_length']} fetches)")
+    if critical["render_blocking_remote"]:
+        print("  ⚠ Remote render-blocking resources — their bytes are not counted")
+
     # ── C₁: Lines of Code ──
-    print("▸ C₁: Running cloc...")
     cloc_output_path = STATIC_DIR / slug / "cloc-output.json"
-    cloc_data = run_cloc(src_dir, cloc_output_path)
+    if args.reuse_cloc and cloc_output_path.exists():
+        print(f"▸ C₁: Reusing {cloc_output_path.relative_to(STUDY_ROOT)}...")
+        cloc_data = load_json(cloc_output_path)
+    else:
+        print("▸ C₁: Running cloc...")
+        cloc_data = run_cloc(src_dir, cloc_output_path)
     if "SUM" in cloc_data:
         s = cloc_data["SUM"]
         print(f"  Code: {s.get('code', 0)}  Comments: {s.get('comment', 0)}  Blank: {s.get('blank', 0)}  Total: {s.get('code', 0) + s.get('comment', 0) + s.get('blank', 0)}")
@@ -536,12 +693,15 @@ def main():
 
     # ── Save complexity data ──
     complexity_path = STATIC_DIR / slug / "complexity.json"
-    save_json(complexity_path, complexity)
+    save_json(complexity_path, {**complexity, "performance_lint": perf_lint})
     print(f"\n  Saved: {complexity_path.relative_to(STUDY_ROOT)}")
 
     # ── Assemble & save DSQI result ──
     print("\n▸ Assembling DSQI result...")
-    dsqi = build_dsqi_result(artifact, dep_info, complexity, deployment, cloc_data, dev_metrics, args)
+    dsqi = build_dsqi_result(artifact, dep_info, complexity, deployment, cloc_data, dev_metrics, args,
+                             clones=clones, transfer=transfer,
+                             transfer_in_m=args.transfer_size_metric, critical=critical,
+                             perf_lint=perf_lint)
 
     dsqi_path = DSQI_DIR / f"dsqi-{slug}.json"
     save_json(dsqi_path, dsqi)
@@ -567,4 +727,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("dsqi_collect", main)
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+dsqi_history.py — DSQI maintenance and creation cost across an artifact's git history.
+
+dsqi_collect.py measures the working tree; this replays the commits that
+touched artifacts/{slug}/ and measures each one, without checking anything
+out. A single `git cat-file --batch` process reads commit, tree and blob
+objects straight from the object store, and results are cached by object
+hash:
+
+    blobs   line counts and complexity of every file content, in
+            output/.dsqi-history-cache.json, so a file unchanged over 500
+            commits (or reverted to an earlier version) is analysed once
+    trees   file lists of unchanged subtrees, and the whole row of a
+            commit whose src/ tree and manifests match an earlier one
+
+Per commit:
+
+    files, lines, loc   source files, lines and code lines (blank and
+                        comment-only lines excluded, as cloc counts them)
+    complexity          function-weighted average and maximum, as M₂ in
+                        dsqi_collect.py (JavaScript by regex, inline
+                        <script> blocks, Python with radon)
+    dependency_count    direct dependencies in package.json / requirements.txt
+    session             the latest development session started before the
+                        commit; dev time and AI ratio are summed up to it
+    M_score, C_score    as dsqi_collect.py computes them; deployment steps
+                        are not recorded in git and are taken from the
+                        current DSQI result
+
+The table is written next to the session logs, as
+data/development-logs/dsqi-history-{slug}.json.
+
+Usage:
+    python analysis/dsqi_history.py --artifact 1
+    python analysis/dsqi_history.py --all --max-commits 500
+    python analysis/dsqi_history.py --artifact 2 --rev main --no-save
+"""
+
+import argparse
+import hashlib
+import re
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, ContentCache, parse_json, save_json
+from dsqi_norm import NORM, normalize
+from lazy_import import lazy_callable, lazy_module
+from source_scan import DEFAULT_EXCLUDES, EXT_LANG, is_ignored, language_for, parse_rules
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+dsqi_collect = lazy_module("dsqi_collect")
+html_analysis = lazy_module("html_analysis")
+py_complexity = lazy_module("py_complexity")
+
+REGISTRY_PATH = STUDY_ROOT / "data" / "artifact-registry.json"
+DEV_LOGS_DIR = STUDY_ROOT / "data" / "development-logs"
+DSQI_DIR = STUDY_ROOT / "data" / "evaluations" / "layer1-dsqi"
+CACHE_PATH = STUDY_ROOT / "analysis" / "output" / ".dsqi-history-cache.json"
+CACHE_VERSION = 1
+# Modules whose code produces a cached blob result; their source is part of the cache key
+ANALYSER_SOURCES = ("dsqi_collect.py", "html_analysis.py", "py_complexity.py")
+
+TOOL = "git object replay (dsqi_history.py)"
+_EXCLUDE_RULES = parse_rules(DEFAULT_EXCLUDES)
+
+# Strings are matched so that comment markers inside them are left alone;
+# only the "comment" group is removed
+_COMMENTS = {
+    "JavaScript": re.compile(r"(?P<str>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\[\s\S])*`)"
+                             r"|(?P<comment>//[^\n]*|/\*[\s\S]*?\*/)"),
+    "CSS": re.compile(r"(?P<str>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*')|(?P<comment>/\*[\s\S]*?\*/)"),
+    "HTML": re.compile(r"(?P<comment><!--[\s\S]*?-->)"),
+    "Python": re.compile(r"(?P<str>[rbuRBU]{0,2}(?:'''[\s\S]*?'''|\"\"\"[\s\S]*?\"\"\"|"
+                         r"'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\"))|(?P<comment>#[^\n]*)"),
+}
+for _lang in ("TypeScript", "JSX", "TSX"):
+    _COMMENTS[_lang] = _COMMENTS["JavaScript"]
+
+
+# ── Git objects ──
+
+class ObjectReader:
+    """Reads git objects through one long-running `git cat-file --batch`."""
+
+    def __init__(self, repo: Path):
+        self._proc = subprocess.Popen(["git", "-C", str(repo), "cat-file", "--batch"],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def read(self, oid: str) -> tuple[str, bytes]:
+        """(type, content) of an object; KeyError if the repository lacks it."""
+        self._proc.stdin.write(oid.encode() + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) < 3:
+            raise KeyError(oid)
+        data = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # trailing newline
+        tracing.add("bytes_read", len(data))
+        return header[1].decode(), data
+
+    def tree(self, oid: str) -> list[tuple[str, str, str]]:
+        """(mode, name, oid) entries of a tree object."""
+        _, data = self.read(oid)
+        width = len(oid) // 2  # 20 bytes for SHA-1 repositories, 32 for SHA-256
+        entries, i = [], 0
+        while i < len(data):
+            space = data.index(b" ", i)
+            nul = data.index(b"\0", space)
+            entries.append((data[i:space].decode(), data[space + 1:nul].decode("utf-8", "surrogateescape"),
+                            data[nul + 1:nul + 1 + width].hex()))
+            i = nul + 1 + width
+        return entries
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def commits_touching(path: str, rev: str = "HEAD", max_commits: int | None = None) -> list[dict]:
+    """Oldest-first {"commit", "date", "subject"} of the commits that changed `path`."""
+    cmd = ["git", "-C", str(STUDY_ROOT), "log", "--reverse", "--format=%H%x00%cI%x00%s"]
+    if max_commits:
+        cmd.append(f"--max-count={max_commits}")
+    result = subprocess.run(cmd + [rev, "--", path], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git log failed for {rev}")
+    commits = []
+    for line in result.stdout.splitlines():
+        oid, date, subject = line.split("\0", 2)
+        commits.append({"commit": oid, "date": date, "subject": subject})
+    return commits
+
+
+def _subtree(reader: ObjectReader, tree: str, path: list[str]) -> str | None:
+    """Oid of the tree at `path` below `tree`, or None if it does not exist."""
+    for part in path:
+        for mode, name, oid in reader.tree(tree):
+            if name == part and mode == "40000":
+                tree = oid
+                break
+        else:
+            return None
+    return tree
+
+
+def _files(reader: ObjectReader, tree: str, prefix: str, memo: dict) -> list[tuple[str, str]]:
+    """(path, blob oid) of every file under a tree, skipping what source_scan.py skips."""
+    key = (tree, prefix)
+    if key not in memo:
+        files = []
+        for mode, name, oid in reader.tree(tree):
+            rel = f"{prefix}{name}"
+            if name.startswith("."):
+                continue
+            if mode == "40000":
+                if not is_ignored(_EXCLUDE_RULES, rel, True):
+                    files += _files(reader, oid, rel + "/", memo)
+            elif mode.startswith("100") and not is_ignored(_EXCLUDE_RULES, rel, False):
+                files.append((rel, oid))
+        memo[key] = files
+    return memo[key]
+
+
+# ── Blob metrics ──
+
+def code_lines(text: str, language: str) -> tuple[int, int]:
+    """(lines, code lines) of a source: blank and comment-only lines are not code."""
+    lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    pattern = _COMMENTS.get(language)
+    if pattern is not None:
+        text = pattern.sub(lambda m: "\n" * m.group().count("\n") if m.lastgroup == "comment" else m.group(),
+                           text)
+    return lines, sum(1 for line in text.splitlines() if line.strip())
+
+
+def analyse_blob(name: str, raw: bytes) -> dict:
+    """Line counts and complexity units of one file content (independent of its path).
+
+    Returns:
+        {"lines", "loc", "complexity": [per-unit entries as in
+         complexity.json, "file" relative to the file itself]}
+    """
+    text = raw.decode("utf-8", errors="replace")
+    language = language_for(name)
+    lines, loc = code_lines(text, language)
+    suffix = Path(name).suffix.lower()
+    units = []
+    if suffix in dsqi_collect.JS_SUFFIXES:
+        units.append(dsqi_collect.js_source_complexity(text, ""))
+    elif suffix in py_complexity.PY_SUFFIXES and py_complexity.HAS_RADON:
+        result = py_complexity.analyse_source(text)
+        result.pop("blocks", None)
+        units.append({"file": "", **result})
+    elif language == "HTML":
+        parser = html_analysis.PageParser()
+        parser.feed(text)
+        parser.close()
+        units += [dsqi_collect.js_source_complexity(s["code"], f"#script@{s['line']}")
+                  for s in parser.inline_scripts]
+    return {"lines": lines, "loc": loc, "complexity": units}
+
+
+def load_cache(path: Path = CACHE_PATH) -> ContentCache:
+    """{blob oid: analyse_blob result} (empty if stale or missing).
+
+    The key covers the radon version and the source of the JS, HTML and
+    Python analysers, so a change to how a blob is measured is never
+    answered from rows computed by the old code.
+    """
+    return ContentCache(path, {"version": CACHE_VERSION, "radon": _radon_version(),
+                               "analysers": _analyser_hash()})
+
+
+def _analyser_hash() -> str:
+    digest = hashlib.sha256()
+    for name in ANALYSER_SOURCES:
+        digest.update(hashlib.sha256((Path(__file__).resolve().parent / name).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _radon_version() -> str | None:
+    return py_complexity._radon_version() if py_complexity.HAS_RADON else None
+
+
+# ── Per-commit rows ──
+
+def _direct_dependencies(reader: ObjectReader, manifests: list[tuple[str, str]]) -> int:
+    """Direct dependency count from the first package.json / requirements.txt found."""
+    for name, oid in manifests:
+        _, raw = reader.read(oid)
+        if name == "package.json":
+            try:
+                return len(parse_json(raw).get("dependencies") or {})
+            except (ValueError, AttributeError):
+                return 0
+        return sum(1 for line in raw.decode("utf-8", "replace").splitlines()
+                   if line.strip() and not line.strip().startswith("#"))
+    return 0
+
+
+def _sessions_until(sessions: list[dict], date: str) -> tuple[int | None, dict]:
+    """Latest session started at or before `date`, and dev totals up to it."""
+    when = datetime.fromisoformat(date)
+    number, minutes, ai, total = None, 0, 0, 0
+    for s in sessions:
+        started = s.get("timestamp")
+        if not started or datetime.fromisoformat(started) > when:
+            continue
+        number = s.get("session_number", number)
+        minutes += s.get("duration_minutes", 0) or 0
+        ai += s.get("code_ai_generated_lines", 0) or 0
+        total += s.get("total_lines", 0) or 0
+    return number, {"dev_minutes": minutes, "ai_ratio": round(ai / total, 4) if total else 1.0}
+
+
+def _scores(row: dict, deployment_steps: int) -> dict:
+    m = (normalize(row["dependency_count"], NORM["dependency_count"])
+         + normalize(row["complexity_avg"], NORM["complexity_avg"])
+         + normalize(deployment_steps, NORM["deployment_steps"])) / 3
+    c = (normalize(row["loc"], NORM["lines_of_code"])
+         + normalize(row["dev_minutes"], NORM["dev_time_minutes"])
+         + (1 - row["ai_ratio"])) / 3
+    return {"M_score": round(m, 4), "C_score": round(c, 4)}
+
+
+def _measure(reader: ObjectReader, files: list[tuple[str, str]], cache: dict, stats: dict) -> dict:
+    """Totals and M₂ complexity of one src/ tree from its files' blob metrics."""
+    count = lines = loc = 0
+    units = []
+    for rel, oid in files:
+        if Path(rel).suffix.lower() not in EXT_LANG:
+            continue
+        count += 1
+        if oid in cache:
+            stats["reused"] += 1
+        else:
+            _, raw = reader.read(oid)
+            with tracing.span("analyse_blob", file=rel):
+                cache[oid] = analyse_blob(rel, raw)
+            stats["analysed"] += 1
+        metrics = cache[oid]
+        lines += metrics["lines"]
+        loc += metrics["loc"]
+        units += [{**u, "file": rel + u["file"]} for u in metrics["complexity"] if "error" not in u]
+
+    functions = sum(u["functions"] for u in units)
+    return {
+        "files": count,
+        "lines": lines,
+        "loc": loc,
+        "functions": functions,
+        "complexity_avg": round(sum(u["average_complexity"] * u["functions"] for u in units) / functions, 2)
+                          if functions else 1.0,
+        "complexity_max": max((u["max_complexity"] for u in units), default=1),
+    }
+
+
+@tracing.traced()
+def artifact_history(artifact: dict, rev: str = "HEAD", max_commits: int | None = None,
+                     cache: dict | None = None) -> dict:
+    """Per-commit metric table for one artifact (see the module docstring).
+
+    Args:
+        cache: {blob oid: metrics}, read and updated in place (default: the
+               on-disk cache, saved afterwards)
+    """
+    slug = artifact["slug"]
+    own_cache = cache is None
+    if own_cache:
+        cache = load_cache()
+
+    log_path = DEV_LOGS_DIR / f"sessions-{slug}.json"
+    sessions = parse_json(log_path.read_bytes()) if log_path.exists() else []
+    sessions = sorted(sessions, key=lambda s: s.get("timestamp") or "")
+    dsqi_path = DSQI_DIR / f"dsqi-{slug}.json"
+    deployment_steps = (parse_json(dsqi_path.read_bytes())["maintenance_cost"].get("deployment_steps") or 0
+                        if dsqi_path.exists() else 0)
+
+    stats = {"analysed": 0, "reused": 0}
+    rows, measured, memo = [], {}, {}
+    with ObjectReader(STUDY_ROOT) as reader:
+        for commit in commits_touching(f"artifacts/{slug}", rev, max_commits):
+            _, raw = reader.read(commit["commit"])
+            root = raw.split(b"\n", 1)[0].split()[1].decode()  # "tree <oid>"
+            artifact_tree = _subtree(reader, root, ["artifacts", slug])
+            src_tree = _subtree(reader, artifact_tree, ["src"]) if artifact_tree else None
+            if src_tree is None:
+                continue
+            manifests = [(name, oid) for tree in (src_tree, artifact_tree)
+                         for mode, name, oid in reader.tree(tree)
+                         if name in ("package.json", "requirements.txt") and mode.startswith("100")]
+            manifests.sort(key=lambda m: m[0] != "package.json")  # package.json wins, as in dsqi_collect
+            key = (src_tree, tuple(manifests))
+            if key not in measured:
+                measured[key] = {**_measure(reader, _files(reader, src_tree, "", memo), cache, stats),
+                                 "dependency_count": _direct_dependencies(reader, manifests)}
+            session, dev = _sessions_until(sessions, commit["date"])
+            row = {"commit": commit["commit"][:12], "date": commit["date"], "subject": commit["subject"],
+                   "session": session, **measured[key], **dev}
+            rows.append({**row, **_scores(row, deployment_steps)})
+
+    if own_cache:
+        cache.save()
+    tracing.add("blobs_analysed", stats["analysed"])
+    tracing.add("blobs_reused", stats["reused"])
+    return {
+        "artifact_id": artifact["id"],
+        "artifact_slug": slug,
+        "tool": TOOL,
+        "rev": rev,
+        "deployment_steps": deployment_steps,
+        "commits": rows,
+        "blobs": stats,
+    }
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="DSQI M and C metrics for every commit of an artifact")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--artifact", type=int, help="Artifact ID (1-5)")
+    target.add_argument("--all", action="store_true", help="Every artifact in the registry")
+    parser.add_argument("--rev", default="HEAD", help="Revision whose history is walked (default: HEAD)")
+    parser.add_argument("--max-commits", type=int, help="Only the most recent N commits")
+    parser.add_argument("--no-save", action="store_true", help="Print the table without writing it")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "dsqi_history")
+
+    registry = parse_json(REGISTRY_PATH.read_bytes())
+    artifacts = [a for a in registry["artifacts"] if args.all or a["id"] == args.artifact]
+    if not artifacts:
+        print(f"  ✗ Artifact {args.artifact} not found in registry", file=sys.stderr)
+        sys.exit(1)
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  DSQI History                                            ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    cache = load_cache()
+    for artifact in artifacts:
+        try:
+            history = artifact_history(artifact, args.rev, args.max_commits, cache=cache)
+        except RuntimeError as e:
+            print(f"  ✗ {artifact['slug']}: {e}", file=sys.stderr)
+            sys.exit(1)
+        stats = history.pop("blobs")
+        print(f"▸ {artifact['slug']}: {len(history['commits'])} commit(s), "
+              f"{stats['analysed']} blob(s) analysed, {stats['reused']} reused")
+        if not history["commits"]:
+            print("  · no commits touch its src/")
+            print()
+            continue
+        print(tabulate([[r["commit"][:8], r["date"][:10], r["session"] if r["session"] is not None else "—",
+                         r["files"], r["loc"], r["complexity_avg"], r["dependency_count"],
+                         r["dev_minutes"], r["M_score"], r["C_score"]] for r in history["commits"]],
+                       headers=["Commit", "Date", "Session", "Files", "LOC", "Avg CC", "Deps",
+                                "Dev min", "M", "C"],
+                       tablefmt="simple_outline"))
+        if not args.no_save:
+            out = DEV_LOGS_DIR / f"dsqi-history-{artifact['slug']}.json"
+            save_json(out, history)
+            print(f"  ✓ Saved to {out.relative_to(STUDY_ROOT)}")
+        print()
+    cache.save()
+
+
+if __name__ == "__main__":
+    main()
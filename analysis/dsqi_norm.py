@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+dsqi_norm.py — Normalisation thresholds and helpers shared by the M and C scorers.
+
+dsqi_collect.py scores freshly collected metrics with these; dsqi_rescore.py
+and dsqi_history.py replay them over stored raw metrics. Kept free of
+imports so the lightweight CLIs do not load the collector and its analysers.
+
+Usage:
+    from dsqi_norm import NORM, normalize, cloc_code_total
+"""
+
+# ── Normalisation thresholds ─────────────────────────────────
+# These define the "worst case" anchors for normalisation to [0, 1].
+# Anything at or above the threshold scores 1.0 (worst).
+# Derived from the protocol: disposable software should be near zero.
+
+NORM = {
+    "dependency_count": 20,       # 0 deps = 0.0, 20+ deps = 1.0
+    "complexity_avg": 15,         # avg CC 1 ≈ 0.07, 15+ = 1.0
+    "deployment_steps": 10,       # 0 steps = 0.0, 10+ = 1.0
+    "lines_of_code": 5000,        # 0 = 0.0, 5000+ = 1.0
+    "dev_time_minutes": 480,      # 0 = 0.0, 8 hours+ = 1.0
+    "transfer_kb": 500,           # gzip KB over the wire; optional M sub-metric
+}
+
+
+def normalize(value: float, threshold: float) -> float:
+    """Normalize a value to [0, 1] by dividing by threshold, capped at 1."""
+    if threshold == 0:
+        return 0.0
+    return min(value / threshold, 1.0)
+
+
+def cloc_code_total(cloc_data: dict) -> int:
+    """Total code lines from cloc output (SUM row, or summed per language)."""
+    if "SUM" in cloc_data:
+        return cloc_data["SUM"].get("code", 0)
+    total = 0
+    for lang, vals in cloc_data.items():
+        if isinstance(vals, dict) and "code" in vals and lang != "header":
+            total += vals["code"]
+    return total
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+dsqi_rescore.py — What-if DSQI re-scoring from cached raw metrics.
+
+Re-computes M, C and the composite DSQI for every artifact under alternative
+normalisation thresholds (NORM in dsqi_norm.py) and weight schemes
+(WEIGHTS in dsqi_score.py). Only the raw_metrics block already stored in each
+Layer 1 DSQI file is read — nothing is re-collected and no artifact source
+tree is touched. P and E are taken as already scored by dsqi_score.py.
+
+All scenarios are evaluated in one vectorised pass: raw metrics form an
+(artifacts × metrics) array, scenario thresholds a (scenarios × metrics)
+array, and normalisation broadcasts to (scenarios × artifacts × metrics).
+
+Scenario keys:
+    Thresholds: dependency_count, complexity_avg, deployment_steps,
+                lines_of_code, dev_time_minutes, transfer_kb
+    Weights:    w1_maintenance, w2_creation, w3_pedagogical, w4_purity
+    Options:    transfer_in_m=1 adds normalised gzip transfer size (from
+                raw_metrics.transfer_size) to M as a fourth sub-metric;
+                artifacts collected without it keep three
+
+Output:
+    analysis/output/dsqi_rescore.json
+
+Usage:
+    python analysis/dsqi_rescore.py                      # built-in scenarios
+    python analysis/dsqi_rescore.py --scenario strict-loc:lines_of_code=2500
+    python analysis/dsqi_rescore.py --scenario page-weight:transfer_in_m=1,transfer_kb=250
+    python analysis/dsqi_rescore.py --scenario baseline --scenario equal:w1_maintenance=0.25,w2_creation=0.25,w3_pedagogical=0.25,w4_purity=0.25
+    python analysis/dsqi_rescore.py --scenarios-file scenarios.json --components
+
+A scenarios file is a JSON list of {"name": ..., "norm": {...}, "weights": {...},
+"transfer_in_m": bool}; keys left out fall back to the current NORM / WEIGHTS
+values (and transfer_in_m to false).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
+from data_loader import (
+    ROOT, ARTIFACT_SLUGS, ARTIFACT_NAMES,
+    load_json, load_dsqi_files, save_json,
+)
+from dsqi_norm import NORM, cloc_code_total
+from dsqi_score import WEIGHTS
+from transfer_size import transfer_kb
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+OUTPUT_DIR = ROOT / "analysis" / "output"
+
+# Column order of the raw-metric array (matches the NORM keys)
+METRIC_KEYS = [
+    "dependency_count",
+    "complexity_avg",
+    "deployment_steps",
+    "lines_of_code",
+    "dev_time_minutes",
+    "transfer_kb",
+]
+M_KEYS = 3  # leading METRIC_KEYS averaged into M; transfer_kb joins when a scenario opts in
+
+WEIGHT_KEYS = ["w1_maintenance", "w2_creation", "w3_pedagogical", "w4_purity"]
+
+BUILTIN_SCENARIOS = [
+    {"name": "baseline"},
+    {"name": "strict-thresholds", "norm": {k: v / 2 for k, v in NORM.items()}},
+    {"name": "lenient-thresholds", "norm": {k: v * 2 for k, v in NORM.items()}},
+    {"name": "with-transfer-size", "transfer_in_m": True},
+    {"name": "equal-weights", "weights": {k: 0.25 for k in WEIGHT_KEYS}},
+    {"name": "pedagogy-first", "weights": {
+        "w1_maintenance": 0.15, "w2_creation": 0.15,
+        "w3_pedagogical": 0.4, "w4_purity": 0.3,
+    }},
+]
+
+
+# ── Raw metric extraction ──
+
+def extract_raw(dsqi: dict) -> dict:
+    """Pull the raw M/C inputs for one artifact from its DSQI file.
+
+    Prefers raw_metrics (as written by dsqi_collect.py) and falls back to the
+    un-normalised values in maintenance_cost / creation_cost.
+    """
+    raw = dsqi.get("raw_metrics", {})
+    mc = dsqi.get("maintenance_cost", {})
+    cc = dsqi.get("creation_cost", {})
+
+    cloc = raw.get("cloc")
+    transfer = raw.get("transfer_size")
+    return {
+        "dependency_count": raw.get("dependency_analysis", {}).get(
+            "dependency_count", mc.get("dependency_count", 0)),
+        "complexity_avg": raw.get("complexity", {}).get(
+            "overall_average", mc.get("cyclomatic_complexity_avg", 0)),
+        "deployment_steps": raw.get("deployment", {}).get(
+            "steps_count", mc.get("deployment_steps", 0)),
+        "lines_of_code": cloc_code_total(cloc) if cloc else cc.get("lines_of_code", 0),
+        "dev_time_minutes": raw.get("dev_time", {}).get(
+            "wall_clock_minutes", cc.get("development_time_minutes", 0)),
+        "transfer_kb": transfer_kb(transfer) if transfer else mc.get("transfer_size_kb", np.nan),
+        "ai_ratio": raw.get("ai_ratio", {}).get(
+            "ratio", cc.get("ai_generation_ratio", 1.0)),
+    }
+
+
+@tracing.traced()
+def load_raw_arrays(dsqi_files: dict) -> dict:
+    """Stack raw metrics, AI ratio, P and E for all artifacts into arrays."""
+    slugs = [s for s in ARTIFACT_SLUGS if s in dsqi_files]
+    raw_rows, ai, p, e, stored = [], [], [], [], []
+
+    for slug in slugs:
+        d = dsqi_files[slug]
+        r = extract_raw(d)
+        raw_rows.append([r[k] for k in METRIC_KEYS])
+        ai.append(r["ai_ratio"])
+        p_score = d.get("pedagogical_alignment", {}).get("P_score")
+        e_score = d.get("pedagogical_purity", {}).get("E_score")
+        p.append(np.nan if p_score is None else p_score)
+        e.append(np.nan if e_score is None else e_score)
+        stored.append(np.nan if d.get("dsqi_score") is None else d["dsqi_score"])
+
+    return {
+        "slugs": slugs,
+        "raw": np.array(raw_rows, dtype=float).reshape(len(slugs), len(METRIC_KEYS)),
+        "ai_ratio": np.array(ai, dtype=float),
+        "P": np.array(p, dtype=float),
+        "E": np.array(e, dtype=float),
+        "stored_dsqi": np.array(stored, dtype=float),
+    }
+
+
+# ── Scenarios ──
+
+def build_scenario(name: str, norm: dict | None = None, weights: dict | None = None,
+                   transfer_in_m: bool = False) -> dict:
+    """Complete a scenario with the current NORM / WEIGHTS for unspecified keys."""
+    norm = norm or {}
+    weights = weights or {}
+    unknown = [k for k in norm if k not in NORM] + [k for k in weights if k not in WEIGHTS]
+    if unknown:
+        raise ValueError(f"scenario '{name}': unknown keys {', '.join(unknown)}")
+    return {
+        "name": name,
+        "norm": {k: float(norm.get(k, NORM[k])) for k in METRIC_KEYS},
+        "weights": {k: float(weights.get(k, WEIGHTS[k])) for k in WEIGHT_KEYS},
+        "transfer_in_m": bool(transfer_in_m),
+    }
+
+
+def parse_scenario_arg(spec: str) -> dict:
+    """Parse NAME[:key=value,key=value] from the command line."""
+    name, _, assignments = spec.partition(":")
+    norm, weights, transfer_in_m = {}, {}, False
+    for item in filter(None, (a.strip() for a in assignments.split(","))):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"scenario '{name}': expected key=value, got '{item}'")
+        key = key.strip()
+        if key == "transfer_in_m":
+            transfer_in_m = value.strip().lower() in ("1", "true", "yes")
+            continue
+        target = weights if key in WEIGHTS else norm
+        target[key] = float(value)
+    return build_scenario(name.strip(), norm, weights, transfer_in_m)
+
+
+def load_scenarios_file(path: Path) -> list[dict]:
+    data = load_json(path)
+    if isinstance(data, dict):
+        data = data.get("scenarios", [])
+    return [build_scenario(s["name"], s.get("norm"), s.get("weights"), s.get("transfer_in_m", False))
+            for s in data]
+
+
+# ── Vectorised re-scoring ──
+
+@tracing.traced()
+def rescore(arrays: dict, scenarios: list[dict]) -> dict:
+    """Evaluate every scenario against every artifact in one pass.
+
+    Returns arrays of shape (n_scenarios, n_artifacts) for M, C, DSQI and rank.
+    Rounding mirrors dsqi_collect.py / dsqi_score.py (M and C to 4 dp before
+    they enter the composite), so the baseline reproduces the stored scores.
+    """
+    raw = arrays["raw"]                                                   # (A, K)
+    thresholds = np.array([[s["norm"][k] for k in METRIC_KEYS] for s in scenarios])  # (S, K)
+    weights = np.array([[s["weights"][k] for k in WEIGHT_KEYS] for s in scenarios])   # (S, 4)
+
+    safe = np.where(thresholds > 0, thresholds, 1.0)[:, None, :]
+    normed = np.where(thresholds[:, None, :] > 0,
+                      np.minimum(raw[None, :, :] / safe, 1.0), 0.0)       # (S, A, K)
+
+    # Transfer size joins M only where the scenario opts in and it was collected
+    with_transfer = (np.array([s["transfer_in_m"] for s in scenarios])[:, None]
+                     & ~np.isnan(raw[:, METRIC_KEYS.index("transfer_kb")])[None, :])   # (S, A)
+    m_sum = normed[:, :, 0:M_KEYS].sum(axis=2)
+    transfer = np.nan_to_num(normed[:, :, METRIC_KEYS.index("transfer_kb")])
+    M = np.round(np.where(with_transfer, (m_sum + transfer) / (M_KEYS + 1), m_sum / M_KEYS), 4)
+    C = np.round((normed[:, :, 3] + normed[:, :, 4] + (1 - arrays["ai_ratio"])[None, :]) / 3, 4)
+
+    components = np.stack([
+        1 - M,
+        1 - C,
+        np.broadcast_to(arrays["P"], M.shape),
+        np.broadcast_to(arrays["E"], M.shape),
+    ], axis=2)                                                            # (S, A, 4)
+    dsqi = np.round(np.einsum("sak,sk->sa", components, weights), 4)
+
+    # Rank 1 = highest DSQI within each scenario (NaN sorts last)
+    order = np.argsort(-np.nan_to_num(dsqi, nan=-np.inf), axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, dsqi.shape[1] + 1)[None, :].repeat(len(scenarios), 0), axis=1)
+
+    return {"M": M, "C": C, "DSQI": dsqi, "rank": ranks}
+
+
+def _num(value):
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def build_report(arrays: dict, scenarios: list[dict], scores: dict) -> dict:
+    slugs = arrays["slugs"]
+    report = {
+        "report": "DSQI What-If Re-Scoring",
+        "source": "raw_metrics cached in data/evaluations/layer1-dsqi/",
+        "raw_metrics": {
+            slug: {
+                **dict(zip(METRIC_KEYS, (None if np.isnan(v) else float(v) for v in arrays["raw"][i]))),
+                "ai_ratio": float(arrays["ai_ratio"][i]),
+                "P_score": _num(arrays["P"][i]),
+                "E_score": _num(arrays["E"][i]),
+            }
+            for i, slug in enumerate(slugs)
+        },
+        "scenarios": [],
+    }
+    for s_idx, scenario in enumerate(scenarios):
+        dsqi_row = scores["DSQI"][s_idx]
+        report["scenarios"].append({
+            **scenario,
+            "mean_dsqi": _num(np.nanmean(dsqi_row)) if not np.all(np.isnan(dsqi_row)) else None,
+            "artifacts": {
+                slug: {
+                    "M": _num(scores["M"][s_idx, i]),
+                    "C": _num(scores["C"][s_idx, i]),
+                    "DSQI": _num(dsqi_row[i]),
+                    "rank": int(scores["rank"][s_idx, i]),
+                }
+                for i, slug in enumerate(slugs)
+            },
+        })
+    return report
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if DSQI re-scoring from cached raw metrics")
+    parser.add_argument("--scenario", action="append", default=[], metavar="NAME[:k=v,...]",
+                        help="Add a scenario (repeatable); keys are NORM thresholds or WEIGHTS")
+    parser.add_argument("--scenarios-file", type=Path, help="JSON file with a list of scenarios")
+    parser.add_argument("--components", action="store_true",
+                        help="Also print the M and C tables per scenario")
+    parser.add_argument("--no-save", action="store_true", help="Print tables only")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "dsqi_rescore")
+
+    try:
+        scenarios = [parse_scenario_arg(s) for s in args.scenario]
+        if args.scenarios_file:
+            scenarios += load_scenarios_file(args.scenarios_file)
+    except (ValueError, KeyError) as e:
+        print(f"  ✗ Invalid scenario: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not scenarios:
+        scenarios = [build_scenario(s["name"], s.get("norm"), s.get("weights"), s.get("transfer_in_m", False))
+                     for s in BUILTIN_SCENARIOS]
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  DSQI What-If Re-Scoring                                 ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    arrays = load_raw_arrays(load_dsqi_files())
+    if not arrays["slugs"]:
+        print("  ✗ No DSQI files found.")
+        sys.exit(1)
+
+    scores = rescore(arrays, scenarios)
+    names = [s["name"] for s in scenarios]
+    slugs = arrays["slugs"]
+
+    print(f"  Artifacts: {len(slugs)}  |  Scenarios: {len(scenarios)}")
+    print()
+
+    # Scenario definitions (only what differs from the current constants)
+    rows = []
+    for s in scenarios:
+        changed = [f"{k}={v:g}" for k, v in s["norm"].items() if v != NORM[k]]
+        changed += [f"{k}={v:g}" for k, v in s["weights"].items() if v != WEIGHTS[k]]
+        if s["transfer_in_m"]:
+            changed.append("transfer size in M")
+        rows.append([s["name"], ", ".join(changed) or "(current NORM / WEIGHTS)"])
+    print("▸ Scenarios")
+    print(tabulate(rows, headers=["Scenario", "Overrides"], tablefmt="simple_outline"))
+    for s in scenarios:
+        total = sum(s["weights"].values())
+        if abs(total - 1.0) > 1e-6:
+            print(f"  ⚠ '{s['name']}': weights sum to {total:g}, DSQI is no longer bounded by 1")
+    missing = int(np.isnan(arrays["raw"][:, METRIC_KEYS.index("transfer_kb")]).sum())
+    if missing and any(s["transfer_in_m"] for s in scenarios):
+        print(f"  ⚠ {missing} artifact(s) have no transfer_size raw metric "
+              f"(re-run dsqi_collect.py) — their M keeps three sub-metrics")
+    print()
+
+    def side_by_side(key, with_rank=False):
+        table = []
+        for i, slug in enumerate(slugs):
+            row = [ARTIFACT_NAMES.get(slug, slug)]
+            for s_idx in range(len(scenarios)):
+                value = scores[key][s_idx, i]
+                cell = "—" if np.isnan(value) else f"{value:.4f}"
+                if with_rank and not np.isnan(value):
+                    cell += f" (#{scores['rank'][s_idx, i]})"
+                row.append(cell)
+            table.append(row)
+        return table
+
+    print("▸ DSQI by Scenario (rank in brackets)")
+    print(tabulate(side_by_side("DSQI", with_rank=True), headers=["Artifact"] + names,
+                   tablefmt="simple_outline"))
+    print()
+
+    if args.components:
+        for key, label in [("M", "Maintenance Cost (M)"), ("C", "Creation Cost (C)")]:
+            print(f"▸ {label} by Scenario")
+            print(tabulate(side_by_side(key), headers=["Artifact"] + names,
+                           tablefmt="simple_outline"))
+            print()
+
+    # Sanity check: an unmodified scenario must reproduce the stored scores
+    for s_idx, s in enumerate(scenarios):
+        if s == build_scenario(s["name"]):
+            diff = np.nanmax(np.abs(scores["DSQI"][s_idx] - arrays["stored_dsqi"])) \
+                if not np.all(np.isnan(arrays["stored_dsqi"])) else float("nan")
+            status = "✓" if np.isnan(diff) or diff < 1e-3 else "⚠"
+            print(f"  {status} '{s['name']}' vs stored dsqi_score: max |Δ| = {diff:.4f}")
+            break
+
+    if not args.no_save:
+        out_path = OUTPUT_DIR / "dsqi_rescore.json"
+        save_json(out_path, build_report(arrays, scenarios, scores))
+        print(f"  → Report saved to {out_path.relative_to(ROOT)}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,11 +26,11 @@ import json
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-DSQI_DIR = ROOT / "data" / "evaluations" / "layer1-dsqi"
-EXPERT_DIR = ROOT / "data" / "evaluations" / "layer2-expert-review"
-COORD_DIR = ROOT / "data" / "evaluations" / "layer3-coordinator-review"
-REGISTRY_PATH = ROOT / "data" / "artifact-registry.json"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import (
+    DSQI_DIR, COORD_DIR, REGISTRY_PATH, ARTIFACT_SLUGS, iter_expert_artifacts,
+)
+import tracing
 
 ICAP_SCORES = {
     "passive": 0.25,
@@ -46,21 +46,19 @@ WEIGHTS = {
     "w4_purity": 0.2,
 }
 
-ARTIFACT_SLUGS = [
-    "01-unit-testing-gauntlet",
-    "02-big-o-visualiser",
-    "03-sql-injection-simulator",
-    "04-css-flexbox-trainer",
-    "05-lexical-analyser-trainer",
-]
-
 
 def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
+    with tracing.span("read_json", file=path.name):
+        raw = path.read_bytes()
+        tracing.add("bytes_read", len(raw))
+        return json.loads(raw)
 
 
 def save_json(path: Path, data):
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    with tracing.span("write_json", file=path.name):
+        raw = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+        path.write_bytes(raw)
+        tracing.add("bytes_written", len(raw))
 
 
 def norm_1_5(score):
@@ -70,6 +68,7 @@ def norm_1_5(score):
 
 # ── P Score (Pedagogical Alignment) from Coordinator Reviews ──
 
+@tracing.traced()
 def compute_p_scores():
     """Compute P scores for each artifact from coordinator reviews."""
     p_scores = {}
@@ -105,31 +104,29 @@ def compute_p_scores():
 
 # ── E Score (Pedagogical Purity) from Expert Reviews ──
 
+@tracing.traced()
 def compute_e_scores():
     """Compute E scores for each artifact, averaged across expert reviewers."""
     # Collect per-artifact, per-reviewer E scores
     artifact_e_data = {slug: [] for slug in ARTIFACT_SLUGS}
 
-    for path in sorted(EXPERT_DIR.glob("dsqi-review-*.json")):
-        data = load_json(path)
-        reviewer_name = data["reviewer"]["name"]
-
-        for artifact in data["artifacts"]:
-            slug = artifact["artifact_id"]
-            e1_raw = artifact["dsqi"]["E1_conceptual_fidelity"]["score"]
-            e2_raw = artifact["dsqi"]["E2_process_replicability"]["score"]
-            e1_norm = norm_1_5(e1_raw)
-            e2_norm = norm_1_5(e2_raw)
-            e_avg = (e1_norm + e2_norm) / 2
-
-            artifact_e_data[slug].append({
-                "reviewer": reviewer_name,
-                "E1_raw": e1_raw,
-                "E1_normalized": round(e1_norm, 4),
-                "E2_raw": e2_raw,
-                "E2_normalized": round(e2_norm, 4),
-                "E_per_reviewer": round(e_avg, 4),
-            })
+    # Streamed: one artifact review in memory at a time
+    for reviewer, artifact in iter_expert_artifacts():
+        slug = artifact["artifact_id"]
+        e1_raw = artifact["dsqi"]["E1_conceptual_fidelity"]["score"]
+        e2_raw = artifact["dsqi"]["E2_process_replicability"]["score"]
+        e1_norm = norm_1_5(e1_raw)
+        e2_norm = norm_1_5(e2_raw)
+        e_avg = (e1_norm + e2_norm) / 2
+
+        artifact_e_data[slug].append({
+            "reviewer": reviewer["name"],
+            "E1_raw": e1_raw,
+            "E1_normalized": round(e1_norm, 4),
+            "E2_raw": e2_raw,
+            "E2_normalized": round(e2_norm, 4),
+            "E_per_reviewer": round(e_avg, 4),
+        })
 
     # Average across reviewers
     e_scores = {}
@@ -155,6 +152,7 @@ def compute_e_scores():
 
 # ── Update DSQI JSON files ──
 
+@tracing.traced()
 def update_dsqi_files(p_scores, e_scores, verbose=False):
     """Patch each DSQI JSON file with P, E, and final DSQI score."""
     results = []
@@ -242,18 +240,17 @@ def update_dsqi_files(p_scores, e_scores, verbose=False):
 
 # ── Update artifact-registry.json ──
 
+@tracing.traced()
 def update_registry(results):
     """Update the artifact registry with final DSQI scores and review counts."""
     registry = load_json(REGISTRY_PATH)
 
     # Count expert reviews per artifact
     expert_counts = {slug: 0 for slug in ARTIFACT_SLUGS}
-    for path in EXPERT_DIR.glob("dsqi-review-*.json"):
-        data = load_json(path)
-        for artifact in data["artifacts"]:
-            slug = artifact["artifact_id"]
-            if slug in expert_counts:
-                expert_counts[slug] += 1
+    for _, artifact in iter_expert_artifacts():
+        slug = artifact["artifact_id"]
+        if slug in expert_counts:
+            expert_counts[slug] += 1
 
     for artifact in registry["artifacts"]:
         slug = artifact["slug"]
@@ -289,18 +286,14 @@ def update_registry(results):
     save_json(REGISTRY_PATH, registry)
 
 
-# ── Main ──
+# ── Scoring ──
 
-def main():
-    parser = argparse.ArgumentParser(description="Compute final DSQI scores from all evaluation layers")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed computation")
-    args = parser.parse_args()
-
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║  DSQI Final Scoring                                     ║")
-    print("╚══════════════════════════════════════════════════════════╝")
-    print()
+def score(verbose: bool = False) -> list[dict]:
+    """Fill P, E and the DSQI score into every DSQI file and the registry.
 
+    Returns:
+        [{"slug", "M", "C", "P", "E", "DSQI"}] in ARTIFACT_SLUGS order
+    """
     # Compute P and E
     print("▸ Computing P scores from coordinator reviews...")
     p_scores = compute_p_scores()
@@ -318,7 +311,7 @@ def main():
 
     print()
     print("▸ Updating DSQI files with P, E, and final scores...")
-    results = update_dsqi_files(p_scores, e_scores, verbose=args.verbose)
+    results = update_dsqi_files(p_scores, e_scores, verbose=verbose)
 
     print()
     print("▸ Updating artifact registry...")
@@ -350,6 +343,24 @@ def main():
         print(f"  Mean DSQI across {len(mean_dsqi)} artifacts: {avg:.4f}")
         print(f"  Range: [{min(mean_dsqi):.4f}, {max(mean_dsqi):.4f}]")
     print()
+    return results
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute final DSQI scores from all evaluation layers")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed computation")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "dsqi_score")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  DSQI Final Scoring                                     ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    score(verbose=args.verbose)
 
 
 if __name__ == "__main__":
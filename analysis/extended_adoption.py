@@ -15,15 +15,17 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_registry_artifacts, load_coordinator_flat,
     save_json, ensure_output_dirs, OUTPUT_DIR,
 )
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 def spearman_rho(x, y):
@@ -165,8 +167,11 @@ def run(verbose=False):
 def main():
     parser = argparse.ArgumentParser(description="Analysis E: Adoption Intention")
     parser.add_argument("--verbose", "-v", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose)
+    tracing.enable_from_args(args, "extended_adoption")
+    with tracing.span("analysis.E"):
+        run(verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -15,14 +15,54 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_expert_flat, save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+
+def render_scatter(data):
+    """Figure F: meaningful-artifact vs learning-through-building scatter."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    # Fixed seed so an unchanged figure re-renders identically
+    rng = np.random.default_rng(0)
+    colors = plt.cm.Set2(np.linspace(0, 1, len(data["series"])))
+    for idx, series in enumerate(data["series"]):
+        m_scores, b_scores = series["meaningful"], series["building"]
+        if m_scores and b_scores:
+            # Add jitter for overlapping points
+            jitter = rng.normal(0, 0.05, len(m_scores))
+            ax.scatter(
+                np.array(m_scores) + jitter,
+                np.array(b_scores) + jitter,
+                label=series["label"],
+                color=colors[idx], s=80, alpha=0.8, edgecolors="black", linewidth=0.5
+            )
+
+    ax.set_xlabel("Meaningful Artifact (1–5)", fontsize=12)
+    ax.set_ylabel("Learning through Building (1–5)", fontsize=12)
+    ax.set_title("Constructionism Alignment: Expert Ratings", fontsize=13)
+    ax.set_xlim(0.5, 5.5)
+    ax.set_ylim(0.5, 5.5)
+    ax.set_xticks([1, 2, 3, 4, 5])
+    ax.set_yticks([1, 2, 3, 4, 5])
+    ax.legend(fontsize=8, loc="lower right")
+    ax.axhline(y=3, color="gray", linestyle="--", alpha=0.3)
+    ax.axvline(x=3, color="gray", linestyle="--", alpha=0.3)
+    ax.set_aspect("equal")
+
+    fig.tight_layout()
+    return fig
 
 
 def run(verbose=False, figures=True):
@@ -139,46 +179,19 @@ def run(verbose=False, figures=True):
 
     # ── Scatter plot ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            fig, ax = plt.subplots(figsize=(8, 6))
-
-            colors = plt.cm.Set2(np.linspace(0, 1, len(ARTIFACT_SLUGS)))
-            for idx, slug in enumerate(ARTIFACT_SLUGS):
-                art = results["artifacts"].get(slug, {})
-                m_scores = art.get("meaningful_artifact", {}).get("scores", [])
-                b_scores = art.get("learning_through_building", {}).get("scores", [])
-                if m_scores and b_scores:
-                    # Add jitter for overlapping points
-                    jitter = np.random.normal(0, 0.05, len(m_scores))
-                    ax.scatter(
-                        np.array(m_scores) + jitter,
-                        np.array(b_scores) + jitter,
-                        label=ARTIFACT_NAMES[slug],
-                        color=colors[idx], s=80, alpha=0.8, edgecolors="black", linewidth=0.5
-                    )
-
-            ax.set_xlabel("Meaningful Artifact (1–5)", fontsize=12)
-            ax.set_ylabel("Learning through Building (1–5)", fontsize=12)
-            ax.set_title("Constructionism Alignment: Expert Ratings", fontsize=13)
-            ax.set_xlim(0.5, 5.5)
-            ax.set_ylim(0.5, 5.5)
-            ax.set_xticks([1, 2, 3, 4, 5])
-            ax.set_yticks([1, 2, 3, 4, 5])
-            ax.legend(fontsize=8, loc="lower right")
-            ax.axhline(y=3, color="gray", linestyle="--", alpha=0.3)
-            ax.axvline(x=3, color="gray", linestyle="--", alpha=0.3)
-            ax.set_aspect("equal")
-
-            fig_path = FIGURES_DIR / "F_constructionism_scatter.png"
-            plt.tight_layout()
-            plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-            plt.close()
-            print(f"  ✓ Figure saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+        if figure_pool.available():
+            figure_pool.submit(FIGURES_DIR / "F_constructionism_scatter.png",
+                               "extended_constructionism:render_scatter", {
+                "series": [
+                    {
+                        "label": ARTIFACT_NAMES[slug],
+                        "meaningful": results["artifacts"].get(slug, {}).get("meaningful_artifact", {}).get("scores", []),
+                        "building": results["artifacts"].get(slug, {}).get("learning_through_building", {}).get("scores", []),
+                    }
+                    for slug in ARTIFACT_SLUGS
+                ],
+            })
+        else:
             print("  ⚠ matplotlib not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/F_constructionism_analysis.json")
@@ -189,8 +202,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis F: Constructionism Alignment")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_constructionism")
+    with tracing.span("analysis.F"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
@@ -25,15 +25,18 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_registry_artifacts, load_dsqi_files, load_expert_flat,
     load_coordinator_flat, save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 def spearman_rho(x, y):
@@ -63,13 +66,37 @@ def interpret_rho(rho):
         return "negligible"
 
 
+def render_matrix(data):
+    """Figure I: lower-triangle Spearman correlation heatmap."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    matrix = np.array(data["matrix"])
+    # Shorten labels
+    short_labels = [v.replace("_", "\n")[:18] for v in data["labels"]]
+
+    fig, ax = plt.subplots(figsize=(12, 10))
+    mask = np.triu(np.ones_like(matrix, dtype=bool), k=1)
+    sns.heatmap(matrix, mask=mask, annot=True, fmt=".2f",
+               xticklabels=short_labels, yticklabels=short_labels,
+               cmap="RdBu_r", center=0, vmin=-1, vmax=1,
+               square=True, linewidths=0.5, ax=ax,
+               cbar_kws={"label": "Spearman's ρ"})
+    ax.set_title("Cross-Layer Correlation Matrix (Spearman, n=5)", fontsize=13)
+    plt.setp(ax.get_xticklabels(), fontsize=7, rotation=45, ha="right")
+    plt.setp(ax.get_yticklabels(), fontsize=7)
+
+    fig.tight_layout()
+    return fig
+
+
 def run(verbose=False, figures=True):
     ensure_output_dirs()
 
     registry = load_registry_artifacts()
     dsqi_files = load_dsqi_files()
-    expert_flat = load_expert_flat()
-    coord_flat = load_coordinator_flat()
+    expert_flat = load_expert_flat(text=False)
+    coord_flat = load_coordinator_flat(text=False)
 
     print("╔══════════════════════════════════════════════════════════╗")
     print("║  Analysis I — Cross-Layer Correlations                   ║")
@@ -221,12 +248,7 @@ def run(verbose=False, figures=True):
 
     # ── Correlation matrix heatmap ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-
+        if figure_pool.available("seaborn"):
             # Build correlation matrix from all variable vectors
             all_vars = set()
             for slug in ARTIFACT_SLUGS:
@@ -244,26 +266,12 @@ def run(verbose=False, figures=True):
                         rho, _ = spearman_rho(x, y)
                         matrix[i, j] = rho if rho is not None else 0
 
-                # Shorten labels
-                short_labels = [v.replace("_", "\n")[:18] for v in complete_vars]
-
-                fig, ax = plt.subplots(figsize=(12, 10))
-                mask = np.triu(np.ones_like(matrix, dtype=bool), k=1)
-                sns.heatmap(matrix, mask=mask, annot=True, fmt=".2f",
-                           xticklabels=short_labels, yticklabels=short_labels,
-                           cmap="RdBu_r", center=0, vmin=-1, vmax=1,
-                           square=True, linewidths=0.5, ax=ax,
-                           cbar_kws={"label": "Spearman's ρ"})
-                ax.set_title("Cross-Layer Correlation Matrix (Spearman, n=5)", fontsize=13)
-                plt.xticks(fontsize=7, rotation=45, ha="right")
-                plt.yticks(fontsize=7)
-
-                fig_path = FIGURES_DIR / "I_correlation_matrix.png"
-                plt.tight_layout()
-                plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-                plt.close()
-                print(f"  ✓ Figure saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+                figure_pool.submit(FIGURES_DIR / "I_correlation_matrix.png",
+                                   "extended_correlations:render_matrix", {
+                    "labels": complete_vars,
+                    "matrix": matrix.tolist(),
+                })
+        else:
             print("  ⚠ matplotlib/seaborn not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/I_cross_layer_correlations.json")
@@ -274,8 +282,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis I: Cross-Layer Correlations")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_correlations")
+    with tracing.span("analysis.I"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
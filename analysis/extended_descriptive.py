@@ -14,17 +14,18 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-import pandas as pd
-from tabulate import tabulate
-
 # Ensure analysis/ is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES, HEURISTIC_KEYS, HEURISTIC_LABELS,
     load_registry_artifacts, load_dsqi_files, load_expert_flat,
     load_coordinator_flat, save_json, ensure_output_dirs, OUTPUT_DIR,
 )
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 def describe_series(values, label):
@@ -49,8 +50,8 @@ def run(verbose=False):
 
     registry = load_registry_artifacts()
     dsqi_files = load_dsqi_files()
-    expert_flat = load_expert_flat()
-    coord_flat = load_coordinator_flat()
+    expert_flat = load_expert_flat(text=False)
+    coord_flat = load_coordinator_flat(text=False)
 
     results = {"layer1_dsqi": [], "layer1_development": [], "layer2_expert": [], "layer3_coordinator": []}
 
@@ -219,8 +220,11 @@ def run(verbose=False):
 def main():
     parser = argparse.ArgumentParser(description="Analysis A: Descriptive Statistics")
     parser.add_argument("--verbose", "-v", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose)
+    tracing.enable_from_args(args, "extended_descriptive")
+    with tracing.span("analysis.A"):
+        run(verbose=args.verbose)
 
 
 if __name__ == "__main__":
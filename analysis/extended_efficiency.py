@@ -15,15 +15,54 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_registry_artifacts, load_dsqi_files, load_session_logs,
     load_wakatime_logs, save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+
+def render_bars(data):
+    """Figure G: development time, lines of code and DSQI per artifact."""
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+
+    names = data["names"]
+    x = np.arange(len(names))
+
+    # Dev time
+    axes[0].bar(x, data["minutes"], color="#2196F3", alpha=0.8)
+    axes[0].set_ylabel("Minutes")
+    axes[0].set_title("Development Time")
+    axes[0].set_xticks(x)
+    axes[0].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
+
+    # Lines of code
+    axes[1].bar(x, data["loc"], color="#FF9800", alpha=0.8)
+    axes[1].set_ylabel("Lines of Code")
+    axes[1].set_title("Lines of Code")
+    axes[1].set_xticks(x)
+    axes[1].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
+
+    # DSQI score
+    axes[2].bar(x, data["dsqi"], color="#4CAF50", alpha=0.8)
+    axes[2].set_ylabel("DSQI Score")
+    axes[2].set_title("DSQI Score")
+    axes[2].set_ylim(0, 1)
+    axes[2].set_xticks(x)
+    axes[2].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
+
+    fig.suptitle("Development Efficiency Overview", fontsize=14, fontweight="bold")
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    return fig
 
 
 def run(verbose=False, figures=True):
@@ -189,48 +228,15 @@ def run(verbose=False, figures=True):
 
     # ── Bar chart ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-
-            names = [ARTIFACT_NAMES[a["artifact_id"]][:15] for a in results["artifacts"]]
-            x = np.arange(len(names))
-
-            # Dev time
-            axes[0].bar(x, [a["wall_clock_minutes"] for a in results["artifacts"]],
-                        color="#2196F3", alpha=0.8)
-            axes[0].set_ylabel("Minutes")
-            axes[0].set_title("Development Time")
-            axes[0].set_xticks(x)
-            axes[0].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
-
-            # Lines of code
-            axes[1].bar(x, [a["lines_of_code"] for a in results["artifacts"]],
-                        color="#FF9800", alpha=0.8)
-            axes[1].set_ylabel("Lines of Code")
-            axes[1].set_title("Lines of Code")
-            axes[1].set_xticks(x)
-            axes[1].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
-
-            # DSQI score
-            axes[2].bar(x, [a["dsqi_score"] for a in results["artifacts"]],
-                        color="#4CAF50", alpha=0.8)
-            axes[2].set_ylabel("DSQI Score")
-            axes[2].set_title("DSQI Score")
-            axes[2].set_ylim(0, 1)
-            axes[2].set_xticks(x)
-            axes[2].set_xticklabels(names, rotation=45, ha="right", fontsize=8)
-
-            plt.suptitle("Development Efficiency Overview", fontsize=14, fontweight="bold")
-            plt.tight_layout(rect=[0, 0, 1, 0.95])
-            fig_path = FIGURES_DIR / "G_efficiency_bars.png"
-            plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-            plt.close()
-            print(f"  ✓ Figure saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+        if figure_pool.available():
+            figure_pool.submit(FIGURES_DIR / "G_efficiency_bars.png",
+                               "extended_efficiency:render_bars", {
+                "names": [ARTIFACT_NAMES[a["artifact_id"]][:15] for a in results["artifacts"]],
+                "minutes": [a["wall_clock_minutes"] for a in results["artifacts"]],
+                "loc": [a["lines_of_code"] for a in results["artifacts"]],
+                "dsqi": [a["dsqi_score"] for a in results["artifacts"]],
+            })
+        else:
             print("  ⚠ matplotlib not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/G_efficiency_analysis.json")
@@ -241,8 +247,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis G: Development Efficiency")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_efficiency")
+    with tracing.span("analysis.G"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
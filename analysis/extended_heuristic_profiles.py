@@ -15,19 +15,65 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES, HEURISTIC_KEYS, HEURISTIC_LABELS,
     load_expert_flat, save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+
+def render_radar(data):
+    """Figure C: one heuristic radar per artifact plus the grand mean."""
+    import matplotlib.pyplot as plt
+
+    labels = data["labels"]
+    rows = -(-(len(data["panels"]) + 1) // 3)  # artifact panels + grand mean, 3 per row
+    fig, axes = plt.subplots(rows, 3, figsize=(18, 6 * rows),
+                              subplot_kw=dict(polar=True))
+    axes_flat = axes.flatten()
+
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
+    angles += angles[:1]  # close the polygon
+
+    for idx, panel in enumerate(data["panels"]):
+        ax = axes_flat[idx]
+        means = panel["means"] + panel["means"][:1]
+
+        ax.fill(angles, means, alpha=0.25)
+        ax.plot(angles, means, "o-", linewidth=2)
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels([l[:12] for l in labels], size=7)
+        ax.set_ylim(0, 5)
+        ax.set_yticks([1, 2, 3, 4, 5])
+        ax.set_title(panel["title"], size=11, fontweight="bold", pad=20)
+
+    # Grand mean in the subplot after the last artifact
+    ax = axes_flat[len(data["panels"])]
+    grand_means = data["grand_means"] + data["grand_means"][:1]
+    ax.fill(angles, grand_means, alpha=0.25, color="gray")
+    ax.plot(angles, grand_means, "o-", linewidth=2, color="gray")
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels([l[:12] for l in labels], size=7)
+    ax.set_ylim(0, 5)
+    ax.set_yticks([1, 2, 3, 4, 5])
+    ax.set_title("Grand Mean (all artifacts)", size=11, fontweight="bold", pad=20)
+    for ax in axes_flat[len(data["panels"]) + 1:]:
+        ax.set_visible(False)
+
+    fig.suptitle("Heuristic Usability Profiles", size=14, fontweight="bold")
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+    return fig
 
 
 def run(verbose=False, figures=True):
     ensure_output_dirs()
-    expert_flat = load_expert_flat()
+    expert_flat = load_expert_flat(text=False)
 
     results = {"artifacts": {}, "cross_artifact": {}, "flagged_items": []}
 
@@ -110,51 +156,22 @@ def run(verbose=False, figures=True):
 
     # ── Generate radar charts ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            fig, axes = plt.subplots(2, 3, figsize=(18, 12),
-                                      subplot_kw=dict(polar=True))
-            axes_flat = axes.flatten()
-
-            angles = np.linspace(0, 2 * np.pi, len(HEURISTIC_LABELS), endpoint=False).tolist()
-            angles += angles[:1]  # close the polygon
-
-            for idx, slug in enumerate(ARTIFACT_SLUGS):
-                ax = axes_flat[idx]
-                profile = results["artifacts"].get(slug, {})
-                means = [profile.get(label, {}).get("mean", 0) for label in HEURISTIC_LABELS]
-                means += means[:1]
-
-                ax.fill(angles, means, alpha=0.25)
-                ax.plot(angles, means, "o-", linewidth=2)
-                ax.set_xticks(angles[:-1])
-                ax.set_xticklabels([l[:12] for l in HEURISTIC_LABELS], size=7)
-                ax.set_ylim(0, 5)
-                ax.set_yticks([1, 2, 3, 4, 5])
-                ax.set_title(ARTIFACT_NAMES[slug], size=11, fontweight="bold", pad=20)
-
-            # Grand mean in 6th subplot
-            ax = axes_flat[5]
-            grand_means = [results["cross_artifact"][label]["grand_mean"] for label in HEURISTIC_LABELS]
-            grand_means += grand_means[:1]
-            ax.fill(angles, grand_means, alpha=0.25, color="gray")
-            ax.plot(angles, grand_means, "o-", linewidth=2, color="gray")
-            ax.set_xticks(angles[:-1])
-            ax.set_xticklabels([l[:12] for l in HEURISTIC_LABELS], size=7)
-            ax.set_ylim(0, 5)
-            ax.set_yticks([1, 2, 3, 4, 5])
-            ax.set_title("Grand Mean (all artifacts)", size=11, fontweight="bold", pad=20)
-
-            plt.suptitle("Heuristic Usability Profiles", size=14, fontweight="bold")
-            plt.tight_layout(rect=[0, 0, 1, 0.96])
-            fig_path = FIGURES_DIR / "C_heuristic_radar.png"
-            plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-            plt.close()
-            print(f"  ✓ Radar chart saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+        if figure_pool.available():
+            figure_pool.submit(FIGURES_DIR / "C_heuristic_radar.png",
+                               "extended_heuristic_profiles:render_radar", {
+                "labels": HEURISTIC_LABELS,
+                "panels": [
+                    {
+                        "title": ARTIFACT_NAMES[slug],
+                        "means": [results["artifacts"].get(slug, {}).get(label, {}).get("mean", 0)
+                                  for label in HEURISTIC_LABELS],
+                    }
+                    for slug in ARTIFACT_SLUGS
+                ],
+                "grand_means": [results["cross_artifact"][label]["grand_mean"]
+                                for label in HEURISTIC_LABELS],
+            })
+        else:
             print("  ⚠ matplotlib not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/C_heuristic_profiles.json")
@@ -165,8 +182,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis C: Heuristic Usability Profiles")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true", help="Skip figure generation")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_heuristic_profiles")
+    with tracing.span("analysis.C"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
@@ -15,26 +15,56 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES, ICAP_SCORES,
-    load_dsqi_files, load_expert_reviews, load_coordinator_flat,
+    load_dsqi_files, load_expert_flat, load_coordinator_flat,
     save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 ICAP_LEVELS = ["passive", "active", "constructive", "interactive"]
 ICAP_TO_NUM = {level: i for i, level in enumerate(ICAP_LEVELS)}
 
 
+def render_source_bars(data):
+    """Figure D: grouped bar chart of ICAP classifications by source."""
+    import matplotlib.pyplot as plt
+
+    levels = data["levels"]
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    x = np.arange(len(levels))
+    width = 0.25
+    source_labels = ["Self", "Experts", "Coordinator"]
+    colors = ["#2196F3", "#FF9800", "#4CAF50"]
+
+    for i, (source, color) in enumerate(zip(["self", "experts", "coordinator"], colors)):
+        ax.bar(x + i * width, data["counts"][source], width,
+               label=source_labels[i], color=color, alpha=0.8)
+
+    ax.set_xticks(x + width)
+    ax.set_xticklabels([l.title() for l in levels])
+    ax.set_ylabel("Count")
+    ax.set_title("ICAP Classifications by Source")
+    ax.legend()
+    ax.set_ylim(bottom=0)
+
+    fig.tight_layout()
+    return fig
+
+
 def run(verbose=False, figures=True):
     ensure_output_dirs()
 
     dsqi_files = load_dsqi_files()
-    expert_reviews = load_expert_reviews()
-    coord_flat = load_coordinator_flat()
+    expert_flat = load_expert_flat(text=False)
+    coord_flat = load_coordinator_flat(text=False)
 
     results = {"artifacts": [], "cross_tabulation": {}, "agreement_metrics": {}}
 
@@ -48,14 +78,10 @@ def run(verbose=False, figures=True):
         entry["classifications"]["self"] = self_icap
 
         # Expert reviewers (Layer 2)
-        expert_icaps = []
-        for review in expert_reviews:
-            art = next((a for a in review["artifacts"] if a["artifact_id"] == slug), None)
-            if art:
-                expert_icaps.append({
-                    "reviewer": review["reviewer"]["name"],
-                    "level": art["icap"]["level"],
-                })
+        expert_icaps = [
+            {"reviewer": r["reviewer_name"], "level": r["icap_level"]}
+            for r in expert_flat if r["artifact_id"] == slug
+        ]
         entry["classifications"]["experts"] = expert_icaps
 
         # Coordinator (Layer 3)
@@ -209,36 +235,14 @@ def run(verbose=False, figures=True):
 
     # ── Alluvial / flow diagram ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            fig, ax = plt.subplots(figsize=(12, 6))
-
-            # Simplified: grouped bar chart of ICAP classifications by source
-            x = np.arange(len(ICAP_LEVELS))
-            width = 0.25
-            source_labels = ["Self", "Experts", "Coordinator"]
-            colors = ["#2196F3", "#FF9800", "#4CAF50"]
-
-            for i, (source, color) in enumerate(zip(["self", "experts", "coordinator"], colors)):
-                counts = [sources[source][level] for level in ICAP_LEVELS]
-                ax.bar(x + i * width, counts, width, label=source_labels[i], color=color, alpha=0.8)
-
-            ax.set_xticks(x + width)
-            ax.set_xticklabels([l.title() for l in ICAP_LEVELS])
-            ax.set_ylabel("Count")
-            ax.set_title("ICAP Classifications by Source")
-            ax.legend()
-            ax.set_ylim(bottom=0)
-
-            fig_path = FIGURES_DIR / "D_icap_alluvial.png"
-            plt.tight_layout()
-            plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-            plt.close()
-            print(f"  ✓ Figure saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+        if figure_pool.available():
+            figure_pool.submit(FIGURES_DIR / "D_icap_alluvial.png",
+                               "extended_icap:render_source_bars", {
+                "levels": ICAP_LEVELS,
+                "counts": {source: [sources[source][level] for level in ICAP_LEVELS]
+                           for source in ("self", "experts", "coordinator")},
+            })
+        else:
             print("  ⚠ matplotlib not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/D_icap_concordance.json")
@@ -249,8 +253,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis D: ICAP Concordance")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_icap")
+    with tracing.span("analysis.D"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
@@ -20,20 +20,22 @@ import argparse
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
-try:
-    import krippendorff
-except ImportError:
-    print("ERROR: 'krippendorff' package required. Install with: pip install krippendorff")
-    sys.exit(1)
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, HEURISTIC_KEYS, HEURISTIC_LABELS, ICAP_SCORES,
     load_expert_reviews, save_json, ensure_output_dirs, OUTPUT_DIR,
 )
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
+
+try:
+    krippendorff = lazy_module("krippendorff")
+except ImportError:
+    print("ERROR: 'krippendorff' package required. Install with: pip install krippendorff")
+    sys.exit(1)
 
 
 def build_rating_matrix(reviews, artifact_slugs, extract_fn):
@@ -213,8 +215,11 @@ def run(verbose=False):
 def main():
     parser = argparse.ArgumentParser(description="Analysis B: Inter-Rater Reliability")
     parser.add_argument("--verbose", "-v", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose)
+    tracing.enable_from_args(args, "extended_irr")
+    with tracing.span("analysis.B"):
+        run(verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -13,9 +13,17 @@ Segments extracted:
 
 Workflow:
     1. Extract all text segments from review JSONs
-    2. Send segments + codebook to Claude for deductive coding
-    3. Aggregate coded segments by category
-    4. Output frequency table, coded segments, and category summary
+    2. Collapse near-duplicate segments (MinHash over character shingles)
+       to one representative per cluster
+    3. Pre-code locally: segments with a clear TF-IDF match to one codebook
+       category are coded without the model
+    4. Pack the remaining segments into requests up to the input/output
+       token budgets
+    5. Send each batch + codebook to Claude for deductive coding; batches
+       that come back truncated or unparseable are split and retried
+    6. Copy each representative's codes to the other members of its cluster
+    7. Aggregate coded segments by category
+    8. Output frequency table, coded segments, and category summary
 
 Cost estimate: ~145 segments × ~200 tokens/segment ≈ $3–5 total.
 
@@ -23,26 +31,59 @@ Usage:
     python analysis/extended_qualitative.py
     python analysis/extended_qualitative.py --dry-run     # Extract segments only
     python analysis/extended_qualitative.py --verbose
+    python analysis/extended_qualitative.py --input-budget 20000 --output-budget 16000
+    python analysis/extended_qualitative.py --precode-threshold 0.15   # code more locally
+    python analysis/extended_qualitative.py --no-precode               # model codes everything
+    python analysis/extended_qualitative.py --dedupe-threshold 0.9     # collapse only closer matches
 """
 
 import argparse
 import json
+import math
 import os
 import sys
 from pathlib import Path
 
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_expert_reviews, load_coordinator_flat, load_json,
     save_json, ensure_output_dirs, OUTPUT_DIR,
 )
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 CODEBOOK_PATH = Path(__file__).resolve().parent.parent / "data" / "extended-analysis" / "qualitative" / "codebook.json"
 
+MODEL = "claude-sonnet-4-20250514"
+
+# ── Token budgets ──
+# Estimates are local (no tokenizer round-trip): English prose averages ~4
+# characters per token, so 3.5 leaves headroom. Each coded segment returns
+# one JSON object with 1–3 codes and a one-sentence rationale each.
+CHARS_PER_TOKEN = 3.5
+OUTPUT_TOKENS_PER_SEGMENT = 110
+DEFAULT_INPUT_BUDGET = 12000   # prompt tokens per request
+DEFAULT_OUTPUT_BUDGET = 8192   # max_tokens per request
+BUDGET_MARGIN = 0.9            # plan to 90% of each budget
+
+# ── Local pre-coding ──
+# Character n-grams (3–5, within words) tolerate inflection ("engaging" vs
+# "engagement") in short free-text answers better than whole words.
+PRECODE_THRESHOLD = 0.2   # minimum cosine similarity to code a segment locally
+PRECODE_RATIO = 1.5       # best category must beat the runner-up by this factor
+PRECODE_MAX_CODES = 3
+PRECODE_MIN_WORDS = 6     # very short answers share too few n-grams to judge
+
+# ── Near-duplicate collapsing ──
+# Reviewers reuse stock phrases ("Very engaging") and paste one comment
+# across artifacts; segments whose 5-character shingle sets have Jaccard
+# similarity at or above the threshold are coded once.
+DEDUPE_THRESHOLD = 0.8
+
 
 def extract_segments():
     """Extract all open-ended text segments from reviews."""
@@ -161,8 +202,232 @@ IMPORTANT: Return ONLY the JSON array, no other text."""
     return prompt
 
 
-def code_with_claude(segments, codebook, api_key, model="claude-sonnet-4-20250514"):
-    """Send segments to Claude API for coding."""
+def category_documents(codebook):
+    """One text per codebook category: label, description, keywords and examples."""
+    return [
+        " ".join([
+            cat["label"],
+            cat["description"],
+            " ".join(cat.get("example_keywords", [])),
+            " ".join(cat.get("example_segments", [])),
+        ])
+        for cat in codebook["categories"]
+    ]
+
+
+def collapse_duplicates(segments, threshold=DEDUPE_THRESHOLD):
+    """Group near-duplicate segments and keep the first of each group.
+
+    Returns:
+        (representative segments in input order,
+         {representative id: [other member segments]})
+    """
+    try:
+        import minhash
+    except ImportError:
+        print("  ⚠ numpy not available — skipping near-duplicate collapsing")
+        return segments, {}
+
+    with tracing.span("dedupe", segments=len(segments)):
+        clusters = minhash.cluster([seg["text"] for seg in segments], threshold=threshold)
+    representatives, members = [], {}
+    for cluster in clusters:
+        rep = segments[cluster[0]]
+        representatives.append(rep)
+        if len(cluster) > 1:
+            members[rep["id"]] = [segments[i] for i in cluster[1:]]
+    tracing.add("collapsed", len(segments) - len(representatives))
+    return representatives, members
+
+
+def fan_out(coded, members):
+    """Add a copy of each coded item for the other members of its cluster.
+
+    Copies carry the member's own metadata and "duplicate_of" naming the
+    representative whose codes they share.
+    """
+    result = []
+    for item in coded:
+        result.append(item)
+        for seg in members.get(item["segment_id"], []):
+            result.append({
+                **item,
+                "codes": [dict(code) for code in item["codes"]],
+                "segment_id": seg["id"],
+                "source": seg["source"],
+                "artifact_id": seg["artifact_id"],
+                "text": seg["text"],
+                "field": seg["field"],
+                "duplicate_of": item["segment_id"],
+            })
+    return result
+
+
+def precode_segments(segments, codebook, threshold=PRECODE_THRESHOLD, ratio=PRECODE_RATIO):
+    """Code segments with an unambiguous TF-IDF match to one category locally.
+
+    Segments and category documents share one sparse TF-IDF space; a segment
+    is coded locally when it has at least PRECODE_MIN_WORDS words and its
+    most similar category reaches `threshold` and beats the runner-up by
+    `ratio`. Other categories above the threshold are added as secondary
+    codes (up to PRECODE_MAX_CODES in total).
+
+    Returns:
+        (coded items in the model's output format with coded_by="tfidf",
+         segments to forward to the model)
+    """
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import linear_kernel
+    except ImportError:
+        print("  ⚠ scikit-learn not available — skipping local pre-coding")
+        return [], segments
+    if not segments:
+        return [], segments
+
+    categories = codebook["categories"]
+    docs = category_documents(codebook)
+    texts = [seg["text"] for seg in segments]
+    with tracing.span("precode", segments=len(segments)):
+        vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(3, 5), sublinear_tf=True)
+        vectorizer.fit(docs + texts)
+        # Rows are L2-normalised, so the linear kernel is cosine similarity
+        similarity = linear_kernel(vectorizer.transform(texts), vectorizer.transform(docs))
+
+    coded, forwarded = [], []
+    for i, (seg, scores) in enumerate(zip(segments, similarity)):
+        order = scores.argsort()[::-1]
+        best, runner_up = scores[order[0]], scores[order[1]] if len(order) > 1 else 0.0
+        if (best < threshold or best < ratio * runner_up
+                or len(seg["text"].split()) < PRECODE_MIN_WORDS):
+            forwarded.append(seg)
+            continue
+        codes = []
+        for rank, k in enumerate(order[:PRECODE_MAX_CODES]):
+            if scores[k] < threshold:
+                break
+            codes.append({
+                "code": categories[k]["code"],
+                "confidence": "HIGH" if rank == 0 and best >= 2 * threshold else "MEDIUM",
+                "rationale": f"Local TF-IDF match to {categories[k]['label']} "
+                             f"(similarity {scores[k]:.2f}, runner-up {runner_up:.2f})",
+            })
+        coded.append({
+            "segment_index": i + 1,
+            "codes": codes,
+            "segment_id": seg["id"],
+            "source": seg["source"],
+            "artifact_id": seg["artifact_id"],
+            "text": seg["text"],
+            "field": seg["field"],
+            "coded_by": "tfidf",
+        })
+    tracing.add("precoded", len(coded))
+    return coded, forwarded
+
+
+def precode_agreement(precoded, previous):
+    """Share of local primary codes the model also assigned in an earlier run."""
+    model_codes = {item.get("segment_id"): {c["code"] for c in item.get("codes", [])}
+                   for item in previous if item.get("coded_by", "model") == "model"}
+    compared = [item for item in precoded if item["segment_id"] in model_codes]
+    agreed = sum(item["codes"][0]["code"] in model_codes[item["segment_id"]] for item in compared)
+    return agreed, len(compared)
+
+
+def estimate_tokens(text):
+    """Rough token count for a piece of prompt text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def segment_tokens(seg):
+    """Estimated prompt tokens for one segment's entry in the segment block."""
+    return estimate_tokens(
+        f"[000] Source: {seg['label']} | Artifact: {seg['artifact_name']} | "
+        f"Reviewer: {seg['reviewer']}\n\"{seg['text']}\"\n"
+    )
+
+
+def plan_batches(segments, codebook, input_budget=DEFAULT_INPUT_BUDGET,
+                 output_budget=DEFAULT_OUTPUT_BUDGET):
+    """Pack segments, in order, into as few requests as the budgets allow.
+
+    A batch is closed when the next segment would push the estimated prompt
+    past the input budget or the expected response past the output budget
+    (both less BUDGET_MARGIN). A segment too large for any batch is sent
+    on its own.
+
+    Returns:
+        list of batches, each {"segments": [...], "input_tokens": est,
+        "output_tokens": est}
+    """
+    overhead = estimate_tokens(build_coding_prompt([], codebook))
+    input_limit = input_budget * BUDGET_MARGIN
+    output_limit = output_budget * BUDGET_MARGIN
+
+    batches = []
+    current, tokens = [], overhead
+    for seg in segments:
+        cost = segment_tokens(seg)
+        if current and (tokens + cost > input_limit
+                        or (len(current) + 1) * OUTPUT_TOKENS_PER_SEGMENT > output_limit):
+            batches.append(current)
+            current, tokens = [], overhead
+        current.append(seg)
+        tokens += cost
+    if current:
+        batches.append(current)
+
+    return [{
+        "segments": batch,
+        "input_tokens": overhead + sum(segment_tokens(seg) for seg in batch),
+        "output_tokens": len(batch) * OUTPUT_TOKENS_PER_SEGMENT,
+    } for batch in batches]
+
+
+def format_plan(plan, input_budget, output_budget):
+    """One-line summary of a batch plan."""
+    if not plan:
+        return "  Batch plan: no segments"
+    sizes = [len(b["segments"]) for b in plan]
+    est_in = sum(b["input_tokens"] for b in plan)
+    est_out = sum(b["output_tokens"] for b in plan)
+    fill = max(max(b["input_tokens"] / input_budget, b["output_tokens"] / output_budget) for b in plan)
+    return (f"  Batch plan: {len(plan)} request(s), {min(sizes)}–{max(sizes)} segments each, "
+            f"~{est_in:,} input + ~{est_out:,} output tokens (fullest batch at {fill:.0%} of budget)")
+
+
+def _parse_response(response_text):
+    """JSON array from a model response, tolerating a markdown code fence."""
+    response_text = response_text.strip()
+    if response_text.startswith("```"):
+        lines = response_text.split("\n")
+        json_lines = []
+        in_block = False
+        for line in lines:
+            if line.startswith("```") and not in_block:
+                in_block = True
+                continue
+            elif line.startswith("```") and in_block:
+                break
+            elif in_block:
+                json_lines.append(line)
+        response_text = "\n".join(json_lines)
+    coded = json.loads(response_text)
+    if not isinstance(coded, list):
+        raise ValueError("response is not a JSON array")
+    return coded
+
+
+def code_with_claude(segments, codebook, api_key, model=MODEL,
+                     input_budget=DEFAULT_INPUT_BUDGET, output_budget=DEFAULT_OUTPUT_BUDGET):
+    """Send segments to Claude API for coding, packed by token budget.
+
+    A batch whose response is truncated (stop_reason "max_tokens"), is not
+    valid JSON or leaves segments uncoded is split in half and the uncoded
+    segments are retried. A single segment that still fails has its raw
+    response saved to qualitative/raw_response_batch_<segment id>.txt.
+    """
     try:
         import anthropic
     except ImportError:
@@ -171,69 +436,85 @@ def code_with_claude(segments, codebook, api_key, model="claude-sonnet-4-2025051
 
     client = anthropic.Anthropic(api_key=api_key)
 
-    # Process in batches of 30 to stay within token limits
-    batch_size = 30
+    plan = plan_batches(segments, codebook, input_budget, output_budget)
+    print(format_plan(plan, input_budget, output_budget))
+
     all_coded = []
+    stats = {"requests": 0, "retries": 0, "failed": 0, "input_tokens": 0, "output_tokens": 0}
+    queue = [(f"{i + 1}", batch["segments"]) for i, batch in enumerate(plan)]
 
-    for batch_start in range(0, len(segments), batch_size):
-        batch = segments[batch_start:batch_start + batch_size]
+    while queue:
+        label, batch = queue.pop(0)
         prompt = build_coding_prompt(batch, codebook)
+        est_in = estimate_tokens(prompt)
+        max_tokens = min(output_budget, max(1024, 2 * len(batch) * OUTPUT_TOKENS_PER_SEGMENT))
+
+        print(f"  → Sending batch {label} ({len(batch)} segments, ~{est_in:,} tokens) to {model}...")
+        with tracing.span("code_batch", batch=label, segments=len(batch)):
+            message = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+            )
+        stats["requests"] += 1
 
-        print(f"  → Sending batch {batch_start // batch_size + 1} "
-              f"({len(batch)} segments) to {model}...")
-
-        message = client.messages.create(
-            model=model,
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        response_text = message.content[0].text.strip()
+        if hasattr(message, "usage"):
+            usage = message.usage
+            stats["input_tokens"] += usage.input_tokens
+            stats["output_tokens"] += usage.output_tokens
+            print(f"    Tokens: input={usage.input_tokens} (est. {est_in}), output={usage.output_tokens}")
 
-        # Parse JSON from response
+        response_text = message.content[0].text
+        coded_indices = set()
+        error = None
         try:
-            # Handle possible markdown code block wrapping
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                json_lines = []
-                in_block = False
-                for line in lines:
-                    if line.startswith("```") and not in_block:
-                        in_block = True
-                        continue
-                    elif line.startswith("```") and in_block:
-                        break
-                    elif in_block:
-                        json_lines.append(line)
-                response_text = "\n".join(json_lines)
-
-            coded_batch = json.loads(response_text)
-
+            coded_batch = _parse_response(response_text)
             # Merge segment metadata with coding results
             for item in coded_batch:
                 seg_idx = item["segment_index"] - 1
-                if 0 <= seg_idx < len(batch):
+                if 0 <= seg_idx < len(batch) and seg_idx not in coded_indices:
                     seg = batch[seg_idx]
                     item["segment_id"] = seg["id"]
                     item["source"] = seg["source"]
                     item["artifact_id"] = seg["artifact_id"]
                     item["text"] = seg["text"]
                     item["field"] = seg["field"]
+                    item["coded_by"] = "model"
                     all_coded.append(item)
-
-        except json.JSONDecodeError as e:
-            print(f"  ⚠ Failed to parse response for batch: {e}")
+                    coded_indices.add(seg_idx)
+        except (ValueError, KeyError, TypeError) as e:  # JSONDecodeError is a ValueError
+            error = e
+        if error is None and getattr(message, "stop_reason", None) == "max_tokens":
+            error = "response truncated at max_tokens"
+
+        missing = [seg for i, seg in enumerate(batch) if i not in coded_indices]
+        if not missing:
+            continue
+
+        reason = error or f"{len(missing)} segment(s) not coded"
+        if len(missing) > 1:
+            half = len(missing) // 2
+            print(f"  ⚠ Batch {label}: {reason} — retrying {len(missing)} segment(s) in two halves")
+            queue[:0] = [(f"{label}a", missing[:half]), (f"{label}b", missing[half:])]
+            stats["retries"] += 2
+        elif len(batch) > 1:
+            print(f"  ⚠ Batch {label}: {reason} — retrying {missing[0]['id']} alone")
+            queue.insert(0, (f"{label}r", missing))
+            stats["retries"] += 1
+        else:
+            seg = missing[0]
+            print(f"  ⚠ Batch {label}: {reason} — giving up on {seg['id']}")
+            stats["failed"] += 1
             # Save raw response for debugging
             save_json(
-                OUTPUT_DIR / "qualitative" / f"raw_response_batch_{batch_start}.txt",
-                {"raw": response_text, "error": str(e)}
+                OUTPUT_DIR / "qualitative" / f"raw_response_batch_{seg['id']}.txt",
+                {"raw": response_text, "error": str(reason)}
             )
 
-        # Report usage
-        if hasattr(message, "usage"):
-            usage = message.usage
-            print(f"    Tokens: input={usage.input_tokens}, output={usage.output_tokens}")
-
+    print(f"  Requests: {stats['requests']} ({stats['retries']} retried), "
+          f"segments coded: {len(all_coded)}/{len(segments)}, failed: {stats['failed']}")
+    if stats["requests"]:
+        print(f"  Tokens used: input={stats['input_tokens']:,}, output={stats['output_tokens']:,}")
     return all_coded
 
 
@@ -276,7 +557,9 @@ def aggregate_results(coded_segments, codebook):
     }
 
 
-def run(verbose=False, dry_run=False):
+def run(verbose=False, dry_run=False, input_budget=DEFAULT_INPUT_BUDGET,
+        output_budget=DEFAULT_OUTPUT_BUDGET, precode=True, precode_threshold=PRECODE_THRESHOLD,
+        dedupe=True, dedupe_threshold=DEDUPE_THRESHOLD):
     ensure_output_dirs()
 
     print("╔══════════════════════════════════════════════════════════╗")
@@ -312,10 +595,39 @@ def run(verbose=False, dry_run=False):
     })
     print(f"  ✓ Segments saved to data/extended-analysis/qualitative/extracted_segments.json")
 
+    # ── Near-duplicate collapsing ──
+    unique, members = segments, {}
+    if dedupe:
+        unique, members = collapse_duplicates(segments, threshold=dedupe_threshold)
+        collapsed = len(segments) - len(unique)
+        print(f"  Near-duplicate clusters: {len(members)} ({collapsed} segments collapsed, "
+              f"Jaccard ≥ {dedupe_threshold}), unique segments: {len(unique)}")
+        if verbose:
+            for rep in unique:
+                if rep["id"] in members:
+                    print(f"    · ×{len(members[rep['id']]) + 1:<4} {rep['text'][:60]}")
+
+    # ── Local pre-coding ──
+    precoded, forwarded = [], unique
+    if precode:
+        precoded, forwarded = precode_segments(unique, codebook, threshold=precode_threshold)
+        print(f"  Pre-coded locally: {len(precoded)} (TF-IDF ≥ {precode_threshold}), "
+              f"forwarded to model: {len(forwarded)}")
+        previous_path = qual_dir / "coded_segments.json"
+        if precoded and previous_path.exists():
+            agreed, compared = precode_agreement(precoded, load_json(previous_path))
+            if compared:
+                print(f"    Agreement with previous model codes: {agreed}/{compared}")
+        if verbose:
+            for item in precoded:
+                print(f"    · {item['codes'][0]['code']:<18} {item['text'][:60]}")
+
     if dry_run:
         print()
         print("  [DRY RUN] Skipping API call. Use without --dry-run to proceed.")
-        print(f"  Estimated cost: ~${len(segments) * 0.03:.2f}")
+        print(format_plan(plan_batches(forwarded, codebook, input_budget, output_budget),
+                          input_budget, output_budget))
+        print(f"  Estimated cost: ~${len(forwarded) * 0.03:.2f}")
 
         # Show segment preview
         print()
@@ -337,7 +649,14 @@ def run(verbose=False, dry_run=False):
 
     # ── Code segments ──
     print()
-    coded_segments = code_with_claude(segments, codebook, api_key)
+    coded_segments = list(precoded)
+    if forwarded:
+        model_coded = code_with_claude(forwarded, codebook, api_key,
+                                       input_budget=input_budget, output_budget=output_budget)
+        if model_coded is None:
+            return None
+        coded_segments += model_coded
+    coded_segments = fan_out(coded_segments, members)
 
     if not coded_segments:
         print("  ✗ No coded segments returned.")
@@ -402,8 +721,26 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--dry-run", action="store_true",
                         help="Extract segments only, skip API call")
+    parser.add_argument("--input-budget", type=int, default=DEFAULT_INPUT_BUDGET, metavar="TOKENS",
+                        help=f"Prompt tokens per request (default: {DEFAULT_INPUT_BUDGET})")
+    parser.add_argument("--output-budget", type=int, default=DEFAULT_OUTPUT_BUDGET, metavar="TOKENS",
+                        help=f"max_tokens per request (default: {DEFAULT_OUTPUT_BUDGET})")
+    parser.add_argument("--no-precode", action="store_true",
+                        help="Send every segment to the model (skip local TF-IDF pre-coding)")
+    parser.add_argument("--precode-threshold", type=float, default=PRECODE_THRESHOLD, metavar="SIM",
+                        help=f"Minimum TF-IDF similarity to code locally (default: {PRECODE_THRESHOLD})")
+    parser.add_argument("--no-dedupe", action="store_true",
+                        help="Code every segment separately (skip near-duplicate collapsing)")
+    parser.add_argument("--dedupe-threshold", type=float, default=DEDUPE_THRESHOLD, metavar="JACCARD",
+                        help=f"Shingle similarity at which segments are coded once (default: {DEDUPE_THRESHOLD})")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, dry_run=args.dry_run)
+    tracing.enable_from_args(args, "extended_qualitative")
+    with tracing.span("analysis.J"):
+        run(verbose=args.verbose, dry_run=args.dry_run,
+            input_budget=args.input_budget, output_budget=args.output_budget,
+            precode=not args.no_precode, precode_threshold=args.precode_threshold,
+            dedupe=not args.no_dedupe, dedupe_threshold=args.dedupe_threshold)
 
 
 if __name__ == "__main__":
@@ -21,14 +21,17 @@ import itertools
 import sys
 from pathlib import Path
 
-import numpy as np
-from tabulate import tabulate
-
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module, lazy_callable
 from data_loader import (
     ARTIFACT_SLUGS, ARTIFACT_NAMES,
     load_dsqi_files, save_json, ensure_output_dirs, OUTPUT_DIR, FIGURES_DIR,
 )
+import figure_pool
+import tracing
+
+np = lazy_module("numpy")
+tabulate = lazy_callable("tabulate", "tabulate")
 
 
 def kendall_tau(rank_a, rank_b):
@@ -68,6 +71,37 @@ def get_rankings(scores):
     return ranks.tolist()
 
 
+def render_sensitivity(data):
+    """Figure H: DSQI ranges under perturbation and Kendall's tau distribution."""
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Panel 1: DSQI ranges per artifact
+    ax = axes[0]
+    for i, d in enumerate(data["ranges"]):
+        ax.barh(i, d["range"], left=d["min"], height=0.6, alpha=0.7)
+        ax.plot(d["baseline"], i, "k|", markersize=20, markeredgewidth=2)
+    ax.set_yticks(range(len(data["names"])))
+    ax.set_yticklabels(data["names"], fontsize=9)
+    ax.set_xlabel("DSQI Score")
+    ax.set_title("DSQI Range under Weight Perturbation")
+    ax.axvline(x=data["baseline_mean"], color="gray", linestyle="--", alpha=0.5)
+
+    # Panel 2: Kendall's tau distribution
+    ax = axes[1]
+    ax.hist(data["taus"], bins=20, color="#2196F3", alpha=0.7, edgecolor="black")
+    ax.axvline(x=1.0, color="red", linestyle="--", label="Perfect agreement")
+    ax.set_xlabel("Kendall's τ (vs baseline)")
+    ax.set_ylabel("Count")
+    ax.set_title("Rank Stability Distribution")
+    ax.legend()
+
+    fig.suptitle("DSQI Sensitivity Analysis", fontsize=14, fontweight="bold")
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    return fig
+
+
 def run(verbose=False, figures=True):
     ensure_output_dirs()
     dsqi_files = load_dsqi_files()
@@ -250,41 +284,15 @@ def run(verbose=False, figures=True):
 
     # ── Heatmap ──
     if figures:
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-
-            fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-            # Panel 1: DSQI ranges per artifact
-            ax = axes[0]
-            for i, slug in enumerate(ARTIFACT_SLUGS):
-                d = results["summary"]["dsqi_ranges"][slug]
-                ax.barh(i, d["range"], left=d["min"], height=0.6, alpha=0.7)
-                ax.plot(d["baseline"], i, "k|", markersize=20, markeredgewidth=2)
-            ax.set_yticks(range(len(ARTIFACT_SLUGS)))
-            ax.set_yticklabels([ARTIFACT_NAMES[s] for s in ARTIFACT_SLUGS], fontsize=9)
-            ax.set_xlabel("DSQI Score")
-            ax.set_title("DSQI Range under Weight Perturbation")
-            ax.axvline(x=np.mean(baseline_scores), color="gray", linestyle="--", alpha=0.5)
-
-            # Panel 2: Kendall's tau distribution
-            ax = axes[1]
-            ax.hist(all_taus, bins=20, color="#2196F3", alpha=0.7, edgecolor="black")
-            ax.axvline(x=1.0, color="red", linestyle="--", label="Perfect agreement")
-            ax.set_xlabel("Kendall's τ (vs baseline)")
-            ax.set_ylabel("Count")
-            ax.set_title("Rank Stability Distribution")
-            ax.legend()
-
-            plt.suptitle("DSQI Sensitivity Analysis", fontsize=14, fontweight="bold")
-            plt.tight_layout(rect=[0, 0, 1, 0.95])
-            fig_path = FIGURES_DIR / "H_sensitivity_heatmap.png"
-            plt.savefig(fig_path, dpi=150, bbox_inches="tight")
-            plt.close()
-            print(f"  ✓ Figure saved to {fig_path.relative_to(OUTPUT_DIR.parent.parent)}")
-        except ImportError:
+        if figure_pool.available():
+            figure_pool.submit(FIGURES_DIR / "H_sensitivity_heatmap.png",
+                               "extended_sensitivity:render_sensitivity", {
+                "names": [ARTIFACT_NAMES[s] for s in ARTIFACT_SLUGS],
+                "ranges": [results["summary"]["dsqi_ranges"][s] for s in ARTIFACT_SLUGS],
+                "baseline_mean": float(np.mean(baseline_scores)),
+                "taus": [float(t) for t in all_taus],
+            })
+        else:
             print("  ⚠ matplotlib not available — skipping figures")
 
     print(f"  ✓ Results saved to data/extended-analysis/H_sensitivity_analysis.json")
@@ -295,8 +303,13 @@ def main():
     parser = argparse.ArgumentParser(description="Analysis H: DSQI Sensitivity Analysis")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--no-figures", action="store_true")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
-    run(verbose=args.verbose, figures=not args.no_figures)
+    tracing.enable_from_args(args, "extended_sensitivity")
+    with tracing.span("analysis.H"):
+        run(verbose=args.verbose, figures=not args.no_figures)
+    with tracing.span("figures.wait"):
+        figure_pool.wait()
 
 
 if __name__ == "__main__":
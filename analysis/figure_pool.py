@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+figure_pool.py — Background figure rendering for the extended analyses.
+
+Analyses hand over a figure as (output path, render spec, plot data) instead
+of drawing inline. The render spec names a module-level function
+("module:function") that takes the plot data and returns a matplotlib
+Figure; it runs in a process pool so the analysis keeps going while PNG
+encoding happens in the background.
+
+Each PNG carries a hash of its render spec, plot data, dpi and the render
+function's source in a tEXt chunk. A figure whose hash matches the existing
+file is skipped without importing matplotlib.
+
+Usage:
+    import figure_pool
+
+    figure_pool.submit(FIGURES_DIR / "X_chart.png",
+                       "extended_x:render_chart", {"values": [...]})
+    ...
+    figure_pool.wait()   # print results, shut down the pool
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+
+ANALYSIS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ANALYSIS_DIR))
+
+from data_loader import ROOT
+import tracing
+
+HASH_KEY = "DSQI-Figure-Hash"
+DEFAULT_DPI = 150
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+_pool = None
+_pending = []   # (path, future)
+_stats = {"rendered": 0, "skipped": 0, "failed": 0}
+
+
+# ── Hashing ──
+
+def figure_hash(render: str, data, dpi: int = DEFAULT_DPI) -> str:
+    """Hash a figure's render spec, plot data, dpi and render function source.
+
+    Only the render function counts: edits elsewhere in its module (the
+    analysis itself) do not invalidate figures whose drawing is unchanged.
+    """
+    import inspect
+
+    module_name, fn_name = render.split(":", 1)
+    source = inspect.getsource(getattr(importlib.import_module(module_name), fn_name)).encode("utf-8")
+    payload = json.dumps({"render": render, "data": data, "dpi": dpi},
+                         sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    digest.update(hashlib.sha256(source).digest())
+    return digest.hexdigest()
+
+
+def read_png_text(path: Path, key: str = HASH_KEY) -> str | None:
+    """Return the value of a tEXt/iTXt chunk from a PNG, or None if absent."""
+    try:
+        with path.open("rb") as f:
+            if f.read(8) != PNG_SIGNATURE:
+                return None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                length, ctype = struct.unpack(">I4s", header)
+                if ctype == b"IDAT" or ctype == b"IEND":
+                    return None  # matplotlib writes text chunks before image data
+                body = f.read(length)
+                f.seek(4, 1)  # CRC
+                if ctype == b"tEXt":
+                    keyword, _, value = body.partition(b"\0")
+                    if keyword.decode("latin-1") == key:
+                        return value.decode("latin-1")
+                elif ctype == b"iTXt":
+                    keyword, _, rest = body.partition(b"\0")
+                    if keyword.decode("latin-1") != key:
+                        continue
+                    compressed = rest[0]
+                    _lang, _, rest = rest[2:].partition(b"\0")
+                    _tkey, _, text = rest.partition(b"\0")
+                    if compressed:
+                        text = zlib.decompress(text)
+                    return text.decode("utf-8")
+    except OSError:
+        return None
+
+
+# ── Rendering (worker process) ──
+
+def _render(path: str, render: str, data, dpi: int, digest: str) -> tuple[int, int, int]:
+    """Render one figure in a worker process and write it with its hash.
+
+    Returns:
+        (wall-clock start ns, duration ns, worker pid) for tracing.
+    """
+    wall_ns, start_ns = time.time_ns(), time.perf_counter_ns()
+    sys.path.insert(0, str(ANALYSIS_DIR))
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    module_name, fn_name = render.split(":", 1)
+    fig = getattr(__import__(module_name), fn_name)(data)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=dpi, bbox_inches="tight", metadata={HASH_KEY: digest})
+    plt.close(fig)
+    return wall_ns, time.perf_counter_ns() - start_ns, os.getpid()
+
+
+# ── Public API ──
+
+def available(*modules: str) -> bool:
+    """True if matplotlib (and any extra plotting modules) can be imported."""
+    return all(importlib.util.find_spec(m) is not None
+               for m in ("matplotlib", *modules))
+
+
+def submit(path: Path, render: str, data, dpi: int = DEFAULT_DPI) -> bool:
+    """Queue a figure for background rendering unless it is unchanged.
+
+    Args:
+        path:   output PNG path
+        render: "module:function" — function(data) -> matplotlib Figure
+        data:   JSON-serialisable plot data
+        dpi:    output resolution
+
+    Returns:
+        True if the figure was queued, False if skipped as unchanged.
+    """
+    global _pool
+    path = Path(path)
+    with tracing.span("figure.submit", file=path.name) as sp:
+        digest = figure_hash(render, data, dpi)
+        if path.exists() and read_png_text(path) == digest:
+            _stats["skipped"] += 1
+            sp.set(skipped=True)
+            print(f"  · Figure unchanged: {path.relative_to(ROOT)} (skipped)")
+            return False
+
+        if _pool is None:
+            from concurrent.futures import ProcessPoolExecutor  # deferred: pulls in multiprocessing
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+        _pending.append((path, _pool.submit(_render, str(path), render, data, dpi, digest)))
+        return True
+
+
+def wait() -> dict:
+    """Block until all queued figures are written, print results, shut down the pool.
+
+    Returns:
+        dict with counts of rendered, skipped and failed figures since the
+        last call.
+    """
+    global _pool
+    for path, future in _pending:
+        try:
+            wall_ns, dur_ns, pid = future.result()
+        except Exception as e:
+            _stats["failed"] += 1
+            print(f"  ✗ Figure failed: {path.relative_to(ROOT)}: {e}")
+            continue
+        _stats["rendered"] += 1
+        tracing.record_span("figure.render", wall_ns, dur_ns, pid=pid, tid=pid,
+                            file=path.name, bytes_written=path.stat().st_size)
+        print(f"  ✓ Figure saved to {path.relative_to(ROOT)}")
+    _pending.clear()
+
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+    stats = dict(_stats)
+    for key in _stats:
+        _stats[key] = 0
+    return stats
@@ -4,7 +4,7 @@ generate_coordinator_report.py — Summarise coordinator review data.
 
 Reads Layer 3 coordinator review JSON files and produces a report with
 pedagogical alignment, ICAP classifications, adoption intention, and
-qualitative feedback.
+qualitative feedback. Built through report_build.py.
 
 Output:
     analysis/output/coordinator_report.json
@@ -13,44 +13,23 @@ Usage:
     python analysis/generate_coordinator_report.py
 """
 
-import json
+import argparse
 import statistics
+import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-COORD_DIR = ROOT / "data" / "evaluations" / "layer3-coordinator-review"
-OUTPUT_DIR = ROOT / "analysis" / "output"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
 
-ICAP_ORDER = ["passive", "active", "constructive", "interactive"]
 
-
-def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-
-
-def main():
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║  Coordinator Review Report Generator                     ║")
-    print("╚══════════════════════════════════════════════════════════╝\n")
-
-    reviews = []
-
-    for path in sorted(COORD_DIR.glob("dsqi-coordinator-*.json")):
-        data = load_json(path)
-        reviews.append(data)
-
-    print(f"  Loaded {len(reviews)} coordinator reviews\n")
+def build_report(model: dict, shared: dict, deps: dict) -> dict:
+    """Build the coordinator report from the Layer 3 section of the evaluation model."""
+    reviews = model["coordinator"]
 
     # Per-artifact summaries
     artifact_summaries = []
     all_q1, all_q2, all_q3, all_p1 = [], [], [], []
     all_q5, all_q6 = [], []
-    all_icap = []
 
     for review in sorted(reviews, key=lambda r: r["artifact_id"]):
         slug = review["artifact_id"]
@@ -78,7 +57,6 @@ def main():
         all_p1.append(p1)
         all_q5.append(q5)
         all_q6.append(q6)
-        all_icap.append(icap_mode)
 
         summary = {
             "artifact_id": slug,
@@ -108,8 +86,6 @@ def main():
         }
         artifact_summaries.append(summary)
 
-        print(f"  ✓ {name:<30} P1={p1:.2f}  ICAP={icap_mode:<14}  Q5={q5}  Q6={q6}  ({coordinator})")
-
     # Aggregates
     n = len(reviews)
     aggregate = {
@@ -124,7 +100,7 @@ def main():
             "P1_mean": round(statistics.mean(all_p1), 2),
             "P1_stdev": round(statistics.stdev(all_p1), 2) if n > 1 else 0,
         },
-        "icap_distribution": {level: all_icap.count(level) for level in ICAP_ORDER},
+        "icap_distribution": shared["coordinator"]["icap_distribution"],
         "adoption_intention": {
             "Q5_mean": round(statistics.mean(all_q5), 2),
             "Q5_stdev": round(statistics.stdev(all_q5), 2) if n > 1 else 0,
@@ -140,10 +116,25 @@ def main():
         "aggregate": aggregate,
     }
 
-    out_path = OUTPUT_DIR / "coordinator_report.json"
-    save_json(out_path, report)
-    print(f"\n  → Report saved to {out_path.relative_to(ROOT)}")
+    return report
+
+
+def print_report(report: dict, model: dict):
+    """Print the console summary for a freshly built coordinator report."""
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Coordinator Review Report Generator                     ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
 
+    print(f"  Loaded {report['aggregate']['n']} coordinator reviews\n")
+
+    for a in report["artifacts"]:
+        p1 = a["pedagogical_alignment"]["P1_average"]
+        icap_mode = a["icap"]["engagement_mode"]
+        q5 = a["adoption_intention"]["Q5_ease_of_integration"]
+        q6 = a["adoption_intention"]["Q6_likelihood_of_use"]
+        print(f"  ✓ {a['artifact_name']:<30} P1={p1:.2f}  ICAP={icap_mode:<14}  Q5={q5}  Q6={q6}  ({a['coordinator']})")
+
+    aggregate = report["aggregate"]
     print(f"\n  Aggregate:")
     print(f"    P1 mean: {aggregate['pedagogical_alignment']['P1_mean']} (SD={aggregate['pedagogical_alignment']['P1_stdev']})")
     print(f"    ICAP distribution: {aggregate['icap_distribution']}")
@@ -152,5 +143,17 @@ def main():
     print(f"    Q6 (Likelihood) mean: {aggregate['adoption_intention']['Q6_mean']}")
 
 
+def main():
+    import report_build
+    parser = argparse.ArgumentParser(description="Generate the coordinator review report")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "generate_coordinator_report")
+    status = report_build.build_targets(["coordinator"], force=True)
+    if status["coordinator"] != "built":
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("generate_coordinator_report", main)
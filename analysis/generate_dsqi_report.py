@@ -4,6 +4,7 @@ generate_dsqi_report.py — Generate DSQI comparison tables and charts.
 
 Reads Layer 1 DSQI JSON files, computes summary statistics, and produces
 a JSON report with per-artifact DSQI breakdowns plus aggregate statistics.
+Built through report_build.py, which loads the evaluation model once.
 
 Output:
     analysis/output/dsqi_report.json
@@ -12,30 +13,15 @@ Usage:
     python analysis/generate_dsqi_report.py
 """
 
-import json
+import argparse
 import statistics
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-DSQI_DIR = ROOT / "data" / "evaluations" / "layer1-dsqi"
-OUTPUT_DIR = ROOT / "analysis" / "output"
-
-ARTIFACT_SLUGS = [
-    "01-unit-testing-gauntlet",
-    "02-big-o-visualiser",
-    "03-sql-injection-simulator",
-    "04-css-flexbox-trainer",
-    "05-lexical-analyser-trainer",
-]
-
-ARTIFACT_NAMES = {
-    "01-unit-testing-gauntlet": "Unit Testing Gauntlet",
-    "02-big-o-visualiser": "Big-O Visualiser",
-    "03-sql-injection-simulator": "SQL Injection Simulator",
-    "04-css-flexbox-trainer": "CSS Flexbox Trainer",
-    "05-lexical-analyser-trainer": "Lexical Analyser Trainer",
-}
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from data_loader import ARTIFACT_NAMES
+import tracing
 
 WEIGHT_LABELS = {
     "w1_maintenance": "Maintenance Cost (M)",
@@ -45,30 +31,12 @@ WEIGHT_LABELS = {
 }
 
 
-def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-
-
-def main():
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║  DSQI Report Generator                                   ║")
-    print("╚══════════════════════════════════════════════════════════╝\n")
-
+def build_report(model: dict, shared: dict, deps: dict) -> dict:
+    """Build the DSQI report from the Layer 1 section of the evaluation model."""
     artifacts = []
     dsqi_scores = []
 
-    for slug in ARTIFACT_SLUGS:
-        path = DSQI_DIR / f"dsqi-{slug}.json"
-        if not path.exists():
-            print(f"  ⚠ Missing: {path.name}")
-            continue
-
-        data = load_json(path)
+    for slug, data in model["dsqi"].items():
         name = ARTIFACT_NAMES.get(slug, slug)
 
         M = data["maintenance_cost"]["M_score"]
@@ -131,8 +99,6 @@ def main():
         artifacts.append(artifact_entry)
         dsqi_scores.append(dsqi)
 
-        print(f"  ✓ {name:<30} DSQI = {dsqi:.4f}  (M={M:.4f}, C={C:.4f}, P={P:.4f}, E={E:.4f})")
-
     # Aggregate statistics
     if dsqi_scores:
         aggregate = {
@@ -185,13 +151,42 @@ def main():
         "rankings": rankings,
     }
 
-    out_path = OUTPUT_DIR / "dsqi_report.json"
-    save_json(out_path, report)
-    print(f"\n  → Report saved to {out_path.relative_to(ROOT)}")
+    return report
+
+
+def print_report(report: dict, model: dict):
+    """Print the console summary for a freshly built DSQI report."""
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  DSQI Report Generator                                   ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    for name in model["dsqi_missing"]:
+        print(f"  ⚠ Missing: {name}")
+
+    for a in report["artifacts"]:
+        M = a["maintenance"]["M_score"]
+        C = a["creation"]["C_score"]
+        P = a["pedagogical"]["P_score"]
+        E = a["purity"]["E_score"]
+        print(f"  ✓ {a['name']:<30} DSQI = {a['dsqi_score']:.4f}  (M={M:.4f}, C={C:.4f}, P={P:.4f}, E={E:.4f})")
+
+    aggregate = report["aggregate"]
     print(f"\n  Mean DSQI: {aggregate.get('mean', 'N/A')}")
     print(f"  Range: [{aggregate.get('min', 'N/A')}, {aggregate.get('max', 'N/A')}]")
     print(f"  All above 0.70: {aggregate.get('all_above_threshold', 'N/A')}")
 
 
+def main():
+    import report_build
+    parser = argparse.ArgumentParser(description="Generate the DSQI report")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "generate_dsqi_report")
+    status = report_build.build_targets(["dsqi"], force=True)
+    if status["dsqi"] != "built":
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("generate_dsqi_report", main)
@@ -4,7 +4,8 @@ generate_expert_report.py — Aggregate expert review data and calculate average
 
 Reads Layer 2 expert review JSON files and produces a comprehensive report
 with per-artifact and per-reviewer breakdowns for heuristics, ICAP, 
-constructionism, and DSQI E-scores.
+constructionism, and DSQI E-scores. Heuristic means, ICAP distributions
+and normalised E scores come from report_build.compute_shared().
 
 Output:
     analysis/output/expert_report.json
@@ -13,29 +14,15 @@ Usage:
     python analysis/generate_expert_report.py
 """
 
-import json
+import argparse
 import statistics
+import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-EXPERT_DIR = ROOT / "data" / "evaluations" / "layer2-expert-review"
-OUTPUT_DIR = ROOT / "analysis" / "output"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-ARTIFACT_SLUGS = [
-    "01-unit-testing-gauntlet",
-    "02-big-o-visualiser",
-    "03-sql-injection-simulator",
-    "04-css-flexbox-trainer",
-    "05-lexical-analyser-trainer",
-]
-
-ARTIFACT_NAMES = {
-    "01-unit-testing-gauntlet": "Unit Testing Gauntlet",
-    "02-big-o-visualiser": "Big-O Visualiser",
-    "03-sql-injection-simulator": "SQL Injection Simulator",
-    "04-css-flexbox-trainer": "CSS Flexbox Trainer",
-    "05-lexical-analyser-trainer": "Lexical Analyser Trainer",
-}
+from data_loader import ARTIFACT_NAMES
+import tracing
 
 HEURISTIC_LABELS = [
     ("visibility_of_status", "H1 Visibility of Status"),
@@ -50,75 +37,34 @@ HEURISTIC_LABELS = [
     ("instructional_scaffolding", "H10 Instructional Scaffolding"),
 ]
 
-ICAP_ORDER = ["passive", "active", "constructive", "interactive"]
-
-
-def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-
-
-def norm_1_5(score):
-    return (score - 1) / 4
-
 
-def main():
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║  Expert Review Report Generator                          ║")
-    print("╚══════════════════════════════════════════════════════════╝\n")
-
-    # Load all expert reviews
-    reviewers = []
-    all_reviews = []  # list of (reviewer_name, artifact_slug, artifact_data)
+def build_report(model: dict, shared: dict, deps: dict) -> dict:
+    """Build the expert review report from the Layer 2 model and shared aggregates."""
+    expert = shared["expert"]
 
-    for path in sorted(EXPERT_DIR.glob("dsqi-review-*.json")):
-        data = load_json(path)
-        reviewer = data["reviewer"]
-        reviewers.append({
-            "name": reviewer["name"],
-            "role": reviewer["role"],
-            "experience_years": reviewer["experience_years"],
-            "institution": reviewer["institution"],
-        })
-        for artifact in data["artifacts"]:
-            all_reviews.append((reviewer["name"], artifact["artifact_id"], artifact))
-
-    print(f"  Loaded {len(reviewers)} expert reviews with {len(all_reviews)} artifact observations\n")
+    reviewers = [
+        {
+            "name": data["reviewer"]["name"],
+            "role": data["reviewer"]["role"],
+            "experience_years": data["reviewer"]["experience_years"],
+            "institution": data["reviewer"]["institution"],
+        }
+        for data in model["expert"]
+    ]
 
     # Per-artifact aggregation
     artifact_reports = []
 
-    for slug in ARTIFACT_SLUGS:
+    for slug, observations in expert["by_artifact"].items():
         name = ARTIFACT_NAMES.get(slug, slug)
-        observations = [(r, a) for (r, s, a) in all_reviews if s == slug]
-        n = len(observations)
-
-        if n == 0:
-            continue
 
         # Heuristics
-        heuristic_data = {}
-        for key, label in HEURISTIC_LABELS:
-            scores = [a["heuristics"][key] for (_, a) in observations]
-            heuristic_data[label] = {
-                "scores": scores,
-                "mean": round(statistics.mean(scores), 2),
-                "min": min(scores),
-                "max": max(scores),
-            }
-
-        all_heuristic_scores = []
-        for key, _ in HEURISTIC_LABELS:
-            for _, a in observations:
-                all_heuristic_scores.append(a["heuristics"][key])
-        heuristic_grand_mean = round(statistics.mean(all_heuristic_scores), 2)
+        heuristic_data = {
+            label: expert["heuristics"][slug][key] for key, label in HEURISTIC_LABELS
+        }
 
         # ICAP classifications
-        icap_levels = [a["icap"]["level"] for (_, a) in observations]
+        icap_levels = expert["icap_levels"][slug]
         icap_justifications = [
             {"reviewer": r, "level": a["icap"]["level"], "justification": a["icap"]["justification"]}
             for (r, a) in observations
@@ -148,19 +94,9 @@ def main():
         }
 
         # E scores (conceptual fidelity + process replicability)
-        e1_scores = [a["dsqi"]["E1_conceptual_fidelity"]["score"] for (_, a) in observations]
-        e2_scores = [a["dsqi"]["E2_process_replicability"]["score"] for (_, a) in observations]
         e_data = {
-            "E1_conceptual_fidelity": {
-                "raw_scores": e1_scores,
-                "mean_raw": round(statistics.mean(e1_scores), 2),
-                "mean_normalized": round(statistics.mean([norm_1_5(s) for s in e1_scores]), 4),
-            },
-            "E2_process_replicability": {
-                "raw_scores": e2_scores,
-                "mean_raw": round(statistics.mean(e2_scores), 2),
-                "mean_normalized": round(statistics.mean([norm_1_5(s) for s in e2_scores]), 4),
-            },
+            "E1_conceptual_fidelity": expert["e_scores"][slug]["E1"],
+            "E2_process_replicability": expert["e_scores"][slug]["E2"],
         }
 
         # Open-ended comments
@@ -177,8 +113,8 @@ def main():
         artifact_reports.append({
             "id": slug,
             "name": name,
-            "n_reviewers": n,
-            "heuristic_grand_mean": heuristic_grand_mean,
+            "n_reviewers": len(observations),
+            "heuristic_grand_mean": expert["heuristic_grand_mean"][slug],
             "heuristics": heuristic_data,
             "icap": {
                 "levels": icap_levels,
@@ -190,43 +126,29 @@ def main():
             "open_ended": open_ended,
         })
 
-        print(f"  ✓ {name:<30} Heuristic M̄={heuristic_grand_mean}  ICAP={icap_levels}  E1 M̄={e_data['E1_conceptual_fidelity']['mean_raw']}  E2 M̄={e_data['E2_process_replicability']['mean_raw']}")
-
     # Cross-artifact heuristic aggregates
-    cross_heuristic = {}
-    for key, label in HEURISTIC_LABELS:
-        all_scores = []
-        for (_, _, a) in all_reviews:
-            all_scores.append(a["heuristics"][key])
-        cross_heuristic[label] = {
-            "grand_mean": round(statistics.mean(all_scores), 2),
-            "stdev": round(statistics.stdev(all_scores), 2) if len(all_scores) > 1 else 0,
-            "min": min(all_scores),
-            "max": max(all_scores),
-        }
-
-    # Cross-artifact ICAP summary
-    all_icap = [a["icap"]["level"] for (_, _, a) in all_reviews]
-    icap_distribution = {level: all_icap.count(level) for level in ICAP_ORDER}
+    cross_heuristic = {
+        label: expert["heuristics_cross"][key] for key, label in HEURISTIC_LABELS
+    }
 
     # Cross-artifact E score aggregates
-    all_e1_raw = [a["dsqi"]["E1_conceptual_fidelity"]["score"] for (_, _, a) in all_reviews]
-    all_e2_raw = [a["dsqi"]["E2_process_replicability"]["score"] for (_, _, a) in all_reviews]
+    e1_cross = expert["e_cross"]["E1"]
+    e2_cross = expert["e_cross"]["E2"]
 
-    report = {
+    return {
         "report": "Expert Review Report",
         "reviewers": reviewers,
         "n_reviewers": len(reviewers),
-        "n_observations": len(all_reviews),
+        "n_observations": len(expert["observations"]),
         "artifacts": artifact_reports,
         "cross_artifact": {
             "heuristics": cross_heuristic,
-            "icap_distribution": icap_distribution,
+            "icap_distribution": expert["icap_distribution"],
             "e_scores": {
-                "E1_grand_mean_raw": round(statistics.mean(all_e1_raw), 2),
-                "E1_grand_mean_normalized": round(statistics.mean([norm_1_5(s) for s in all_e1_raw]), 4),
-                "E2_grand_mean_raw": round(statistics.mean(all_e2_raw), 2),
-                "E2_grand_mean_normalized": round(statistics.mean([norm_1_5(s) for s in all_e2_raw]), 4),
+                "E1_grand_mean_raw": e1_cross["mean_raw"],
+                "E1_grand_mean_normalized": e1_cross["mean_normalized"],
+                "E2_grand_mean_raw": e2_cross["mean_raw"],
+                "E2_grand_mean_normalized": e2_cross["mean_normalized"],
             },
             "constructionism": {
                 "meaningful_grand_mean": round(statistics.mean(
@@ -239,18 +161,40 @@ def main():
         },
     }
 
-    out_path = OUTPUT_DIR / "expert_report.json"
-    save_json(out_path, report)
-    print(f"\n  → Report saved to {out_path.relative_to(ROOT)}")
 
-    # Summary
+def print_report(report: dict, model: dict):
+    """Print the console summary for a freshly built expert report."""
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Expert Review Report Generator                          ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    print(f"  Loaded {report['n_reviewers']} expert reviews with {report['n_observations']} artifact observations\n")
+
+    for a in report["artifacts"]:
+        e1 = a["e_scores"]["E1_conceptual_fidelity"]["mean_raw"]
+        e2 = a["e_scores"]["E2_process_replicability"]["mean_raw"]
+        print(f"  ✓ {a['name']:<30} Heuristic M̄={a['heuristic_grand_mean']}  ICAP={a['icap']['levels']}  E1 M̄={e1}  E2 M̄={e2}")
+
+    cross = report["cross_artifact"]
     print(f"\n  Cross-artifact heuristic grand means:")
-    for label, data in cross_heuristic.items():
+    for label, data in cross["heuristics"].items():
         print(f"    {label}: {data['grand_mean']}")
-    print(f"\n  ICAP distribution: {icap_distribution}")
-    print(f"  E1 (Conceptual Fidelity) grand mean: {report['cross_artifact']['e_scores']['E1_grand_mean_raw']}/5")
-    print(f"  E2 (Process Replicability) grand mean: {report['cross_artifact']['e_scores']['E2_grand_mean_raw']}/5")
+    print(f"\n  ICAP distribution: {cross['icap_distribution']}")
+    print(f"  E1 (Conceptual Fidelity) grand mean: {cross['e_scores']['E1_grand_mean_raw']}/5")
+    print(f"  E2 (Process Replicability) grand mean: {cross['e_scores']['E2_grand_mean_raw']}/5")
+
+
+def main():
+    import report_build
+    parser = argparse.ArgumentParser(description="Generate the expert review report")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "generate_expert_report")
+    status = report_build.build_targets(["expert"], force=True)
+    if status["expert"] != "built":
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("generate_expert_report", main)
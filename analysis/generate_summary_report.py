@@ -2,32 +2,27 @@
 """
 generate_summary_report.py — Synthesise all three evaluation layers.
 
-Reads the JSON outputs of generate_dsqi_report, generate_expert_report,
-and generate_coordinator_report, then produces a unified cross-layer
-summary with triangulated findings.
+Consumes the DSQI, expert and coordinator reports (passed in memory by
+report_build.py, which builds any stale upstream report first), then
+produces a unified cross-layer summary with triangulated findings.
 
 Output:
     analysis/output/summary_report.json
 
 Usage:
     python analysis/generate_summary_report.py
-    (Run the three individual generators first.)
+    python analysis/report_build.py              # All four reports
 """
 
-import json
+import argparse
 import statistics
+import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-OUTPUT_DIR = ROOT / "analysis" / "output"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-ARTIFACT_SLUGS = [
-    "01-unit-testing-gauntlet",
-    "02-big-o-visualiser",
-    "03-sql-injection-simulator",
-    "04-css-flexbox-trainer",
-    "05-lexical-analyser-trainer",
-]
+from data_loader import ARTIFACT_SLUGS, ARTIFACT_NAMES, ICAP_SCORES as ICAP_NUMERIC
+import tracing
 
 ARTIFACT_SHORT = {
     "01-unit-testing-gauntlet": "UTG",
@@ -37,55 +32,18 @@ ARTIFACT_SHORT = {
     "05-lexical-analyser-trainer": "LAT",
 }
 
-ARTIFACT_NAMES = {
-    "01-unit-testing-gauntlet": "Unit Testing Gauntlet",
-    "02-big-o-visualiser": "Big-O Visualiser",
-    "03-sql-injection-simulator": "SQL Injection Simulator",
-    "04-css-flexbox-trainer": "CSS Flexbox Trainer",
-    "05-lexical-analyser-trainer": "Lexical Analyser Trainer",
-}
-
-ICAP_NUMERIC = {"passive": 0.25, "active": 0.50, "constructive": 0.75, "interactive": 1.00}
-
-
-def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
 
-
-def save_json(path: Path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-
-
-def main():
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║  Summary Report Generator                                ║")
-    print("╚══════════════════════════════════════════════════════════╝\n")
-
-    # Load component reports
-    dsqi_path = OUTPUT_DIR / "dsqi_report.json"
-    expert_path = OUTPUT_DIR / "expert_report.json"
-    coord_path = OUTPUT_DIR / "coordinator_report.json"
-
-    for p in [dsqi_path, expert_path, coord_path]:
-        if not p.exists():
-            print(f"  ✗ Missing prerequisite: {p.name}")
-            print("    Run the individual report generators first.")
-            return
-    
-    dsqi_report = load_json(dsqi_path)
-    expert_report = load_json(expert_path)
-    coord_report = load_json(coord_path)
-
-    print("  ✓ Loaded dsqi_report.json")
-    print("  ✓ Loaded expert_report.json")
-    print("  ✓ Loaded coordinator_report.json\n")
+def build_report(model: dict, shared: dict, deps: dict) -> dict:
+    """Build the cross-layer summary from the three component reports."""
+    dsqi_report = deps["dsqi"]
+    expert_report = deps["expert"]
+    coord_report = deps["coordinator"]
 
     # Build per-artifact cross-layer view
     cross_layer_artifacts = []
 
     for slug in ARTIFACT_SLUGS:
-        short = ARTIFACT_SHORT[slug]
+        short = ARTIFACT_SHORT.get(slug, slug)
         name = ARTIFACT_NAMES[slug]
 
         # Layer 1: DSQI
@@ -147,12 +105,6 @@ def main():
 
         cross_layer_artifacts.append(artifact_summary)
 
-        # Print summary line
-        dsqi_val = artifact_summary.get("dsqi", {}).get("score", "?")
-        heur_val = artifact_summary.get("expert_heuristic_grand_mean", "?")
-        coord_p1 = artifact_summary.get("coordinator", {}).get("P1_average", "?")
-        print(f"  {short}  DSQI={dsqi_val}  Heuristic M̄={heur_val}  P1={coord_p1}  ICAP[self={icap_self}, coord={icap_coordinator}]")
-
     # Global aggregates
     dsqi_agg = dsqi_report.get("aggregate", {})
     coord_agg = coord_report.get("aggregate", {})
@@ -202,7 +154,7 @@ def main():
         if "adoption_mean" in coord:
             adoption_scores.append(coord["adoption_mean"])
 
-    summary_report = {
+    return {
         "report": "Cross-Layer Summary Report",
         "study_overview": {
             "n_artifacts": len(ARTIFACT_SLUGS),
@@ -239,12 +191,23 @@ def main():
         },
     }
 
-    out_path = OUTPUT_DIR / "summary_report.json"
-    save_json(out_path, summary_report)
-    print(f"\n  → Report saved to {out_path.relative_to(ROOT)}")
+
+def print_report(report: dict, model: dict):
+    """Print the console summary for a freshly built summary report."""
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Summary Report Generator                                ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    for a in report["artifacts"]:
+        tri = a["icap_triangulation"]
+        dsqi_val = a.get("dsqi", {}).get("score", "?")
+        heur_val = a.get("expert_heuristic_grand_mean", "?")
+        coord_p1 = a.get("coordinator", {}).get("P1_average", "?")
+        print(f"  {a['short']}  DSQI={dsqi_val}  Heuristic M̄={heur_val}  P1={coord_p1}  "
+              f"ICAP[self={tri['self_assessment']}, coord={tri['coordinator_assessment']}]")
 
     print(f"\n  ═══ Key Findings ═══")
-    kf = summary_report["key_findings"]
+    kf = report["key_findings"]
     print(f"  • All DSQI ≥ 0.70: {kf['all_above_threshold']}")
     print(f"  • Mean DSQI: {kf['mean_dsqi']}")
     print(f"  • DSQI range: {kf['dsqi_range']}")
@@ -252,5 +215,17 @@ def main():
     print(f"  • Mean adoption intention: {kf['mean_adoption_intention']}/5")
 
 
+def main():
+    import report_build
+    parser = argparse.ArgumentParser(description="Generate the cross-layer summary report")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "generate_summary_report")
+    status = report_build.build_targets(["summary"], force=True)
+    if status["summary"] != "built":
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("generate_summary_report", main)
@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+html_analysis.py — Critical resource chain of an artifact's HTML pages.
+
+Reads each .html file under src/ once, in chunks, with the stdlib
+streaming HTMLParser and records every resource the page pulls in:
+
+    stylesheets   <link rel="stylesheet">, plus @import chains inside
+                  local stylesheets
+    scripts       <script src>, with async / defer / type="module"
+    other links   icons, preloads, images
+
+Render-blocking, as browsers treat it:
+    - a stylesheet whose media applies to screens (no media, "all",
+      "screen", or a media query); print-only and disabled sheets do not
+      block
+    - a classic <script src> in <head> without async, defer or
+      type="module" (the parser stops until it is fetched and run)
+    - an inline <script> in <head> (it waits for the stylesheets above it)
+Classic scripts later in <body> are recorded as parser-blocking only.
+
+The critical path is the page plus every render-blocking resource and the
+stylesheets they @import: its byte count (raw and gzip, local files only),
+how many of its resources are remote (size unknown), and its length in
+sequential fetches (page → stylesheet → @import = 3).
+
+Inline payloads (<script> and <style> bodies, style="" attributes, on*
+handlers, data: URIs) are measured as well: they ship with every page load.
+
+The same pass records the structure of the markup and styles:
+
+    HTML   element count, maximum and average DOM depth, tag counts, and
+           the inline <script> code (for JS complexity in dsqi_collect.py)
+    CSS    for every stylesheet under src/ and every inline <style>: rule,
+           selector, declaration and at-rule counts, !important count and
+           the maximum selector specificity (ids, classes, types)
+
+Stylesheets read for the critical path are not read again.
+
+dsqi_collect.py stores the critical resources as
+raw_metrics["critical_resources"] and the structure in complexity.json.
+
+Usage:
+    python analysis/html_analysis.py artifacts/04-css-flexbox-trainer/src
+    python analysis/html_analysis.py --all
+"""
+
+import argparse
+import codecs
+import gzip
+import re
+import zlib
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, save_json
+from lazy_import import lazy_callable
+from source_scan import scan
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
+TOOL = "streaming HTMLParser resource graph (html_analysis.py)"
+STRUCTURE_TOOL = "streaming HTMLParser DOM + CSS rule scan (html_analysis.py)"
+CHUNK_SIZE = 64 * 1024
+HTML_SUFFIXES = (".html", ".htm")
+CSS_SUFFIXES = (".css",)
+
+VOID_ELEMENTS = frozenset("area base br col embed hr img input keygen link meta param source track wbr".split())
+# Elements whose end tag may be omitted: opening the key closes an open value
+IMPLIED_END = {
+    "li": {"li"}, "dt": {"dt", "dd"}, "dd": {"dt", "dd"}, "option": {"option"},
+    "tr": {"tr", "td", "th"}, "td": {"td", "th"}, "th": {"td", "th"},
+    "p": {"p"}, "div": {"p"}, "ul": {"p"}, "ol": {"p"}, "table": {"p"}, "section": {"p"},
+    "h1": {"p"}, "h2": {"p"}, "h3": {"p"}, "h4": {"p"}, "h5": {"p"}, "h6": {"p"},
+}
+JS_TYPES = frozenset({"", "text/javascript", "application/javascript", "module", "text/ecmascript"})
+NESTING_AT_RULES = frozenset({"media", "supports", "container", "layer", "document", "scope"})
+
+_NON_BLOCKING_MEDIA = {"print", "speech", "none"}
+_IMPORT_RE = re.compile(r"""@import\s+(?:url\(\s*)?["']?([^"')\s;]+)["']?\s*\)?([^;]*);""", re.I)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+
+
+# ── Parsing ──
+
+class PageParser(HTMLParser):
+    """Collects resources and inline payloads while an HTML page is fed in."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.resources = []
+        self.inline = {
+            "scripts": 0, "script_bytes": 0,
+            "styles": 0, "style_bytes": 0,
+            "style_attributes": 0, "style_attribute_bytes": 0,
+            "event_handlers": 0, "event_handler_bytes": 0,
+            "data_uri_bytes": 0,
+        }
+        self.in_head = False
+        self.seen_body = False
+        self._raw_text = None   # "script" / "style" while inside one
+        self._raw_line = 0
+        self._buffer = []
+        self._inline_blocking = False
+        self._script_is_js = False
+        # Structure
+        self.elements = 0
+        self.tag_counts = {}
+        self.max_depth = 0
+        self.depth_total = 0
+        self.inline_scripts = []   # {"line", "code"} of inline JavaScript
+        self.inline_styles = []    # {"line", "css"}
+        self._open = []
+        self._self_closing = False
+
+    # HTMLParser callbacks
+
+    def handle_starttag(self, tag, attrs):
+        self._open_element(tag)
+        attrs = {k: (v if v is not None else "") for k, v in attrs}
+        if tag == "head":
+            self.in_head = True
+        elif tag == "body":
+            self.in_head, self.seen_body = False, True
+        self._attribute_payloads(attrs)
+
+        line = self.getpos()[0]
+        if tag == "link" and attrs.get("href"):
+            rels = set(attrs.get("rel", "").lower().split())
+            if "stylesheet" in rels:
+                media = attrs.get("media", "").strip().lower()
+                blocking = ("alternate" not in rels and "disabled" not in attrs
+                            and media not in _NON_BLOCKING_MEDIA)
+                self._add("stylesheet", attrs["href"], line, blocking, media=media or None)
+            elif rels & {"preload", "modulepreload", "prefetch", "preconnect", "icon"}:
+                self._add(sorted(rels & {"preload", "modulepreload", "prefetch", "preconnect", "icon"})[0],
+                          attrs["href"], line, False)
+        elif tag == "script":
+            self._raw_text, self._buffer, self._raw_line = "script", [], line
+            self._script_is_js = attrs.get("type", "").strip().lower() in JS_TYPES
+            module = attrs.get("type", "").lower() == "module"
+            deferred = "async" in attrs or "defer" in attrs or module
+            if attrs.get("src"):
+                self._add("script", attrs["src"], line, self._in_head() and not deferred,
+                          parser_blocking=not deferred,
+                          loading="module" if module else "async" if "async" in attrs
+                          else "defer" if "defer" in attrs else "classic")
+            else:
+                self._inline_blocking = self._in_head() and not module
+        elif tag == "style":
+            self._raw_text, self._buffer, self._raw_line = "style", [], line
+        elif tag == "img" and attrs.get("src"):
+            self._add("image", attrs["src"], line, False)
+
+    def handle_startendtag(self, tag, attrs):
+        self._self_closing = True
+        self.handle_starttag(tag, attrs)
+        self._self_closing = False
+
+    def handle_endtag(self, tag):
+        if tag in self._open:
+            while self._open.pop() != tag:
+                pass
+        if tag == "head":
+            self.in_head = False
+        elif tag == self._raw_text:
+            self._end_raw_text("".join(self._buffer))
+            self._raw_text, self._buffer = None, []
+
+    def handle_data(self, data):
+        if self._raw_text:
+            self._buffer.append(data)
+
+    # Helpers
+
+    def _open_element(self, tag: str):
+        """Count an element and track the open-element stack for DOM depth."""
+        closes = IMPLIED_END.get(tag)
+        while closes and self._open and self._open[-1] in closes:
+            self._open.pop()
+        depth = len(self._open) + 1
+        self.elements += 1
+        self.tag_counts[tag] = self.tag_counts.get(tag, 0) + 1
+        self.max_depth = max(self.max_depth, depth)
+        self.depth_total += depth
+        if tag not in VOID_ELEMENTS and not self._self_closing:
+            self._open.append(tag)
+
+    def _in_head(self) -> bool:
+        # Elements before <body> are in the head even without a <head> tag
+        return self.in_head or not self.seen_body
+
+    def _end_raw_text(self, text: str):
+        size = len(text.encode("utf-8"))
+        if self._raw_text == "script":
+            if text.strip():
+                self.inline["scripts"] += 1
+                self.inline["script_bytes"] += size
+                if self._script_is_js:
+                    self.inline_scripts.append({"line": self._raw_line, "code": text})
+                if self._inline_blocking:
+                    self._add("inline-script", None, self.getpos()[0], True, bytes=size)
+        else:
+            self.inline["styles"] += 1
+            self.inline["style_bytes"] += size
+            self.inline_styles.append({"line": self._raw_line, "css": text})
+            for url, _ in _css_imports(text):
+                self._add("import", url, self.getpos()[0], True)
+
+    def _attribute_payloads(self, attrs: dict):
+        for name, value in attrs.items():
+            size = len(value.encode("utf-8"))
+            if name == "style":
+                self.inline["style_attributes"] += 1
+                self.inline["style_attribute_bytes"] += size
+            elif name.startswith("on"):
+                self.inline["event_handlers"] += 1
+                self.inline["event_handler_bytes"] += size
+            elif value.startswith("data:"):
+                self.inline["data_uri_bytes"] += size
+
+    def _add(self, kind: str, url: str | None, line: int, blocking: bool, **extra):
+        self.resources.append({
+            "kind": kind,
+            "url": url,
+            "line": line,
+            "in_head": self._in_head(),
+            "render_blocking": blocking,
+            **extra,
+        })
+
+
+def _css_imports(css: str) -> list[tuple[str, str]]:
+    """(url, media) of the @import rules of a stylesheet."""
+    return [(m.group(1), m.group(2).strip().lower()) for m in _IMPORT_RE.finditer(_CSS_COMMENT_RE.sub("", css))]
+
+
+def parse_page(path: Path) -> tuple[PageParser, int, int]:
+    """Feed an HTML file to a PageParser in chunks.
+
+    The same chunks are gzip-compressed as they go, so the page is read once.
+
+    Returns:
+        (parser, bytes, gzip bytes)
+    """
+    parser = PageParser()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    size = packed = 0
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            packed += len(compressor.compress(chunk))
+            parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    packed += len(compressor.flush())
+    tracing.add("bytes_read", size)
+    return parser, size, packed
+
+
+def page_structure(parser: PageParser) -> dict:
+    """DOM size and depth of a parsed page."""
+    return {
+        "elements": parser.elements,
+        "max_depth": parser.max_depth,
+        "average_depth": round(parser.depth_total / parser.elements, 2) if parser.elements else 0,
+        "distinct_tags": len(parser.tag_counts),
+        "tag_counts": dict(sorted(parser.tag_counts.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "inline_scripts": len(parser.inline_scripts),
+        "inline_styles": len(parser.inline_styles),
+    }
+
+
+# ── CSS ──
+
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_FUNCTIONAL_PSEUDO_RE = re.compile(r"::?([\w-]+)\(")
+_PSEUDO_ELEMENT_RE = re.compile(r"::[\w-]+|:(?:before|after|first-line|first-letter)\b")
+_PSEUDO_CLASS_RE = re.compile(r":[\w-]+")
+_ID_RE = re.compile(r"#[\w-]+")
+_CLASS_RE = re.compile(r"\.[\w-]+")
+_TYPE_RE = re.compile(r"(?<![\w-])[a-zA-Z][\w-]*")
+
+
+def _split_top_level(text: str, sep: str = ",") -> list[str]:
+    """Split on `sep` outside parentheses and brackets."""
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(text):
+        if c in "([":
+            depth += 1
+        elif c in ")]":
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def specificity(selector: str) -> tuple[int, int, int]:
+    """(ids, classes/attributes/pseudo-classes, types/pseudo-elements) of one selector.
+
+    :is(), :not() and :has() count their most specific argument, :where()
+    counts nothing, as in Selectors Level 4.
+    """
+    a = b = c = 0
+    # Functional pseudo-classes first: their arguments are selectors
+    while True:
+        m = _FUNCTIONAL_PSEUDO_RE.search(selector)
+        if m is None:
+            break
+        depth, end = 1, m.end()
+        while end < len(selector) and depth:
+            depth += {"(": 1, ")": -1}.get(selector[end], 0)
+            end += 1
+        name, inner = m.group(1).lower(), selector[m.end():end - 1]
+        if name in ("is", "not", "has", "matches"):
+            best = max((specificity(s) for s in _split_top_level(inner)), default=(0, 0, 0))
+            a, b, c = a + best[0], b + best[1], c + best[2]
+        elif name != "where":
+            b += 1  # :nth-child(2n+1), :lang(en), …
+        selector = selector[:m.start()] + " " + selector[end:]
+    b += len(_ATTRIBUTE_RE.findall(selector))
+    selector = _ATTRIBUTE_RE.sub(" ", selector)
+    c += len(_PSEUDO_ELEMENT_RE.findall(selector))
+    selector = _PSEUDO_ELEMENT_RE.sub(" ", selector)
+    b += len(_PSEUDO_CLASS_RE.findall(selector))
+    selector = _PSEUDO_CLASS_RE.sub(" ", selector)
+    a += len(_ID_RE.findall(selector))
+    selector = _ID_RE.sub(" ", selector)
+    b += len(_CLASS_RE.findall(selector))
+    selector = _CLASS_RE.sub(" ", selector)
+    c += len(_TYPE_RE.findall(selector))
+    return a, b, c
+
+
+def css_structure(css: str) -> dict:
+    """Rule, selector and declaration counts and the maximum specificity of a stylesheet.
+
+    Style rules inside @media/@supports/@container/@layer are counted; the
+    bodies of @keyframes, @font-face and other at-rules are not style rules.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    stats = {"rules": 0, "selectors": 0, "declarations": 0, "at_rules": 0, "important": 0}
+    most = (0, 0, 0)
+    n = len(css)
+
+    def skip_string(i: int) -> int:
+        quote, i = css[i], i + 1
+        while i < n and css[i] != quote:
+            i += 2 if css[i] == "\\" else 1
+        return i
+
+    def block_end(i: int) -> int:
+        """Index just past the "}" closing the block that starts at i."""
+        depth = 1
+        while i < n and depth:
+            if css[i] in "\"'":
+                i = skip_string(i)
+            elif css[i] == "{":
+                depth += 1
+            elif css[i] == "}":
+                depth -= 1
+            i += 1
+        return i
+
+    def parse(i: int) -> int:
+        nonlocal most
+        start = i
+        while i < n:
+            ch = css[i]
+            if ch in "\"'":
+                i = skip_string(i) + 1
+                continue
+            if ch == "{":
+                prelude = css[start:i].strip()
+                end = block_end(i + 1)
+                if prelude.startswith("@"):
+                    stats["at_rules"] += 1
+                    name = re.match(r"@([\w-]+)", prelude)
+                    if name and name.group(1).lower() in NESTING_AT_RULES:
+                        parse(i + 1)
+                else:
+                    selectors = _split_top_level(prelude)
+                    body = css[i + 1:end - 1]
+                    stats["rules"] += 1
+                    stats["selectors"] += len(selectors)
+                    stats["declarations"] += sum(1 for d in body.split(";") if ":" in d)
+                    stats["important"] += body.count("!important")
+                    most = max([most, *(specificity(sel) for sel in selectors)])
+                i = start = end
+                continue
+            if ch == "}":
+                return i + 1
+            if ch == ";":
+                if css[start:i].strip().startswith("@"):
+                    stats["at_rules"] += 1  # @import, @charset, @layer a, b;
+                start = i + 1
+            i += 1
+        return i
+
+    parse(0)
+    return {**stats, "max_specificity": list(most)}
+
+
+# ── Resource graph ──
+
+def _resolve(url: str, base_dir: Path) -> tuple[str, Path | None]:
+    """("remote" | "inline" | "local", local path or None) for a resource URL."""
+    parts = urlsplit(url)
+    if parts.scheme in ("http", "https") or url.startswith("//"):
+        return "remote", None
+    if parts.scheme == "data":
+        return "inline", None
+    if parts.scheme:
+        return "remote", None
+    return "local", (base_dir / unquote(parts.path)).resolve()
+
+
+def _local_stats(path: Path, sizes: dict) -> dict | None:
+    """Raw and gzip size of a local file (memoised in `sizes`)."""
+    if path not in sizes:
+        if not path.is_file():
+            sizes[path] = None
+        else:
+            raw = path.read_bytes()
+            tracing.add("bytes_read", len(raw))
+            sizes[path] = {"bytes": len(raw), "gzip": len(gzip.compress(raw, compresslevel=9, mtime=0)),
+                           "raw": raw}
+    return sizes[path]
+
+
+def _follow_imports(resource: dict, path: Path, src_dir: Path, sizes: dict, depth: int, seen: set) -> list:
+    """@import children of a local stylesheet, recursively."""
+    stats = _local_stats(path, sizes)
+    if stats is None or path in seen:
+        return []
+    seen.add(path)
+    children = []
+    css = stats["raw"].decode("utf-8", errors="replace")
+    for url, media in _css_imports(css):
+        where, child_path = _resolve(url, path.parent)
+        child = {"kind": "import", "url": url, "from": resource["file"] or resource["url"],
+                 "render_blocking": resource["render_blocking"] and media not in _NON_BLOCKING_MEDIA,
+                 "depth": depth + 1}
+        children.append(_describe(child, where, child_path, src_dir, sizes))
+        if where == "local":
+            children += _follow_imports(children[-1], child_path, src_dir, sizes, depth + 1, seen)
+    return children
+
+
+def _describe(resource: dict, where: str, path: Path | None, src_dir: Path, sizes: dict) -> dict:
+    resource["location"] = where
+    resource["file"] = None
+    resource["bytes"] = resource.get("bytes")
+    resource["gzip"] = None
+    if where == "local":
+        try:
+            resource["file"] = path.relative_to(src_dir.resolve()).as_posix()
+        except ValueError:
+            resource["file"] = None  # outside src/ (e.g. a shared favicon)
+        stats = _local_stats(path, sizes)
+        resource["missing"] = stats is None
+        if stats:
+            resource["bytes"], resource["gzip"] = stats["bytes"], stats["gzip"]
+    return resource
+
+
+def analyse_page(path: Path, src_dir: Path, sizes: dict | None = None) -> dict:
+    """Resource graph, inline payloads and critical path of one HTML page."""
+    return _analyse_page(path, src_dir, {} if sizes is None else sizes)[0]
+
+
+@tracing.traced()
+def _analyse_page(path: Path, src_dir: Path, sizes: dict) -> tuple[dict, PageParser]:
+    parser, size, page_gzip = parse_page(path)
+
+    resources = []
+    for res in parser.resources:
+        res["depth"] = 1
+        if res["kind"] == "inline-script":
+            resources.append(_describe(res, "inline", None, src_dir, sizes))
+            continue
+        where, local = _resolve(res["url"], path.parent)
+        resources.append(_describe(res, where, local, src_dir, sizes))
+        if res["kind"] in ("stylesheet", "import") and where == "local":
+            resources += _follow_imports(res, local, src_dir, sizes, 1, set())
+
+    critical = [r for r in resources if r["render_blocking"] and r["kind"] != "inline-script"]
+    page = {
+        "file": path.relative_to(src_dir).as_posix(),
+        "bytes": size,
+        "gzip": page_gzip,
+        "resources": resources,
+        "inline": parser.inline,
+        "render_blocking": [r["url"] for r in resources if r["render_blocking"] and r["url"]],
+        "parser_blocking_scripts": sum(1 for r in resources if r.get("parser_blocking")),
+        "critical_path": {
+            "resources": len(critical),
+            "bytes": size + sum(r["bytes"] or 0 for r in critical),
+            "gzip": page_gzip + sum(r["gzip"] or 0 for r in critical),
+            "remote": sum(1 for r in critical if r["location"] == "remote"),
+            "length": 1 + max((r["depth"] for r in critical), default=0),
+        },
+    }
+    return page, parser
+
+
+def analyse_artifact(src_dir: Path) -> dict:
+    """Critical resource metrics for every HTML page under src/ (see analyse_src)."""
+    return analyse_src(src_dir)[0]
+
+
+@tracing.traced()
+def analyse_src(src_dir: Path) -> tuple[dict, dict]:
+    """One pass over the HTML and CSS under src/.
+
+    The critical-resource summary fields describe index.html (or the first
+    page when there is none), the page a class actually opens.
+
+    Returns:
+        (critical resources, structure) where structure is
+        {"tool", "html": {"elements", "max_depth", "pages": [...]},
+         "css": {"rules", "selectors", "declarations", "at_rules",
+         "important", "max_specificity", "files": [...]},
+         "inline_scripts": [{"page", "line", "code"}]}
+    """
+    sizes = {}
+    sources = scan(src_dir, suffixes=HTML_SUFFIXES + CSS_SUFFIXES, count=False)
+    parsed = [_analyse_page(f["path"], src_dir, sizes)
+              for f in sources if f["path"].suffix.lower() in HTML_SUFFIXES]
+    pages = [page for page, _ in parsed]
+    main = next((p for p in pages if p["file"] == "index.html"), pages[0] if pages else None)
+    summary = {
+        "entry_page": main["file"] if main else None,
+        "render_blocking_count": len(main["render_blocking"]) if main else 0,
+        "render_blocking_remote": main["critical_path"]["remote"] if main else 0,
+        "critical_path_bytes": main["critical_path"]["bytes"] if main else 0,
+        "critical_path_gzip": main["critical_path"]["gzip"] if main else 0,
+        "critical_path_length": main["critical_path"]["length"] if main else 0,
+        "inline_bytes": (sum(v for k, v in main["inline"].items() if k.endswith("_bytes")) if main else 0),
+    }
+    critical = {"tool": TOOL, **summary, "pages": pages}
+
+    # Structure: stylesheets already read for the critical path come from `sizes`
+    html_pages = [{"file": page["file"], **page_structure(parser)} for page, parser in parsed]
+    css_files = []
+    for f in sources:
+        if f["path"].suffix.lower() in CSS_SUFFIXES:
+            stats = _local_stats(f["path"].resolve(), sizes)
+            css_files.append({"file": f["rel"], **css_structure(stats["raw"].decode("utf-8", errors="replace"))})
+    for page, parser in parsed:
+        css_files += [{"file": f"{page['file']}#style@{s['line']}", **css_structure(s["css"])}
+                      for s in parser.inline_styles]
+    structure = {
+        "tool": STRUCTURE_TOOL,
+        "html": {
+            "elements": sum(p["elements"] for p in html_pages),
+            "max_depth": max((p["max_depth"] for p in html_pages), default=0),
+            "pages": html_pages,
+        },
+        "css": {
+            **{k: sum(f[k] for f in css_files) for k in ("rules", "selectors", "declarations",
+                                                         "at_rules", "important")},
+            "max_specificity": max((f["max_specificity"] for f in css_files), default=[0, 0, 0]),
+            "files": css_files,
+        },
+        "inline_scripts": [{"page": page["file"], **s} for page, parser in parsed for s in parser.inline_scripts],
+    }
+    return critical, structure
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Critical resource chain and structure of artifact HTML/CSS")
+    parser.add_argument("src", nargs="*", type=Path, help="src/ directories to analyse")
+    parser.add_argument("--all", action="store_true", help="Analyse every artifacts/*/src")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the results as JSON")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "html_analysis")
+
+    dirs = list(args.src)
+    if args.all:
+        dirs += sorted(p / "src" for p in ARTIFACTS_DIR.iterdir() if (p / "src").is_dir())
+    if not dirs:
+        parser.error("give src/ directories or --all")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Critical Resource Chain                                 ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    results, rows, structure_rows = {}, [], []
+    for src in dirs:
+        name = src.parent.name if src.name == "src" else src.name
+        result, structure = analyse_src(src)
+        results[name] = {"critical_resources": result,
+                         "structure": {k: v for k, v in structure.items() if k != "inline_scripts"}}
+        html, css = structure["html"], structure["css"]
+        structure_rows.append([name, html["elements"], html["max_depth"], len(structure["inline_scripts"]),
+                               len(css["files"]), css["rules"], css["selectors"],
+                               ",".join(map(str, css["max_specificity"])), css["important"]])
+        rows.append([name, result["entry_page"] or "—", result["render_blocking_count"],
+                     result["render_blocking_remote"], f"{result['critical_path_bytes'] / 1024:.1f}",
+                     f"{result['critical_path_gzip'] / 1024:.1f}", result["critical_path_length"],
+                     f"{result['inline_bytes'] / 1024:.1f}"])
+        if len(dirs) == 1:
+            for page in result["pages"]:
+                print(f"▸ {page['file']}")
+                for r in page["resources"]:
+                    marker = "✗" if r["render_blocking"] else "·"
+                    size = f"{r['bytes'] / 1024:.1f} KB" if r["bytes"] is not None else r["location"]
+                    print(f"  {marker} {r['kind']:<13} {(r['url'] or '(inline)'):<60.60} {size}")
+                print()
+
+    print(tabulate(rows, headers=["Artifact", "Entry", "Blocking", "Remote", "Critical KB",
+                                  "Critical gzip KB", "Chain", "Inline KB"],
+                   tablefmt="simple_outline"))
+    print("  Critical KB counts local files only; remote blocking resources add unknown bytes.")
+    print()
+    print(tabulate(structure_rows, headers=["Artifact", "Elements", "DOM depth", "Inline JS",
+                                            "Stylesheets", "CSS rules", "Selectors", "Max specificity",
+                                            "!important"],
+                   tablefmt="simple_outline"))
+
+    if args.json:
+        save_json(args.json, results)
+        print(f"\n  ✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+js_perf_lint.py — Runtime-performance lint for artifact JavaScript.
+
+The artifacts do their DOM work from event handlers and game loops; what
+makes them stutter on lab machines is work repeated on those hot paths.
+On the token stream of js_tokens.py, each file is checked for:
+
+    dom-query-in-loop    querySelector/getElementById/… (or a one-line
+                         wrapper such as `$ = id => document.getElementById(id)`)
+                         inside a loop, iteration callback or hot path
+    html-write-in-loop   innerHTML/outerHTML assignment or += (a full
+                         re-parse) or insertAdjacentHTML in a loop or hot path
+    layout-thrash        a layout read (offsetWidth, getBoundingClientRect,
+                         getComputedStyle, …) after a DOM/style write in the
+                         same loop or hot path, forcing a synchronous reflow
+    uncleared-timer      setInterval whose handle is discarded, or never
+                         passed to clearInterval anywhere in the file
+    raf-loop-unbounded   a requestAnimationFrame callback that reschedules
+                         itself unconditionally, with no cancelAnimationFrame
+                         in the file
+    listener-in-loop     addEventListener inside a loop or hot path (one
+                         handler per element or per frame)
+
+Loops are for/while/do bodies and callbacks of forEach, map, filter, …
+Hot paths are requestAnimationFrame and setInterval callbacks and handlers
+of high-frequency events (mousemove, scroll, resize, …), whether inline or
+passed by name.
+
+Findings are attributed to the innermost function. Each rule has a weight
+(RULES); the file and artifact score is the weighted finding count per
+function (0 = clean).
+
+dsqi_collect.py stores the per-function findings in complexity.json and
+the summary in raw_metrics["performance_lint"]; reported, not scored.
+
+Usage:
+    python analysis/js_perf_lint.py artifacts/02-big-o-visualiser/src
+    python analysis/js_perf_lint.py --all
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, save_json
+from lazy_import import lazy_callable
+from source_scan import scan
+import js_tokens
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
+TOOL = "token-stream performance lint (js_perf_lint.py)"
+JS_SUFFIXES = (".js", ".mjs", ".jsx", ".ts", ".tsx")
+
+# rule: (weight, what to do about it)
+RULES = {
+    "dom-query-in-loop": (2, "look the element up once, outside the loop"),
+    "html-write-in-loop": (3, "build the markup first and assign it once"),
+    "layout-thrash": (3, "read layout before writing, or batch reads and writes"),
+    "uncleared-timer": (2, "keep the handle and clearInterval it when done"),
+    "raf-loop-unbounded": (2, "stop rescheduling when idle, or keep the id for cancelAnimationFrame"),
+    "listener-in-loop": (1, "delegate to one listener on a common parent"),
+}
+
+QUERY_METHODS = frozenset({"querySelector", "querySelectorAll", "getElementById", "getElementsByClassName",
+                           "getElementsByTagName", "getElementsByName"})
+ITERATION_METHODS = frozenset({"forEach", "map", "filter", "reduce", "reduceRight", "some", "every",
+                               "find", "findIndex", "findLast", "flatMap"})
+LAYOUT_READS = frozenset({"offsetTop", "offsetLeft", "offsetWidth", "offsetHeight", "offsetParent",
+                          "clientTop", "clientLeft", "clientWidth", "clientHeight",
+                          "scrollTop", "scrollLeft", "scrollWidth", "scrollHeight", "innerText",
+                          "getBoundingClientRect", "getClientRects", "getComputedStyle"})
+WRITE_PROPERTIES = frozenset({"innerHTML", "outerHTML", "textContent", "innerText", "className",
+                              "scrollTop", "scrollLeft"})
+WRITE_METHODS = frozenset({"appendChild", "insertBefore", "removeChild", "replaceChild", "replaceWith",
+                           "append", "prepend", "before", "after", "insertAdjacentHTML",
+                           "insertAdjacentElement", "setAttribute", "removeAttribute"})
+CLASSLIST_WRITES = frozenset({"add", "remove", "toggle", "replace"})
+HOT_EVENTS = frozenset({"mousemove", "pointermove", "touchmove", "scroll", "resize", "wheel",
+                        "drag", "dragover"})
+ASSIGNMENTS = frozenset({"=", "+=", "-=", "*=", "/=", "||=", "&&=", "??="})
+WRAPPER_MAX_TOKENS = 12  # a body this short that queries the DOM is a query helper
+
+
+class _File:
+    """Tokens, brackets and functions of one source file."""
+
+    def __init__(self, code: str):
+        self.tokens = js_tokens.tokenize(code)
+        self.pairs = js_tokens.match_brackets(self.tokens)
+        self.parents = js_tokens.enclosing_brackets(self.tokens)
+        self.opener_of = {close: open_ for open_, close in self.pairs.items()}
+        self.functions = js_tokens.find_functions(self.tokens, self.pairs, self.parents)
+
+    def punct(self, i: int, *values: str) -> bool:
+        return 0 <= i < len(self.tokens) and self.tokens[i].kind == "punct" and self.tokens[i].value in values
+
+    def member(self, i: int) -> bool:
+        """Token i is a property name (x.name or x?.name)."""
+        return self.punct(i - 1, ".", "?.")
+
+    def called(self, i: int) -> bool:
+        return self.punct(i + 1, "(") and (i + 1) in self.pairs
+
+    def global_call(self, i: int) -> bool:
+        """Token i is called as a global (f(…) or window.f(…))."""
+        return self.called(i) and (not self.member(i) or self.tokens[i - 2].value == "window")
+
+    def function_named(self, name: str, near: int):
+        """The function `name` refers to at token `near` (innermost enclosing one, else the closest)."""
+        named = [f for f in self.functions if f.name == name]
+        enclosing = [f for f in named if f.start <= near <= f.end]
+        if enclosing:
+            return enclosing[-1]
+        return min(named, key=lambda f: abs(f.start - near), default=None)
+
+    def callback_bodies(self, paren: int, arg: int = 0) -> list[tuple[int, int]]:
+        """Token ranges run by the callback passed as argument `arg` of the call at `paren`."""
+        close = self.pairs[paren]
+        args, start = [], paren + 1
+        for j in range(paren + 1, close):
+            if self.punct(j, ",") and self.parents[j] == paren:
+                args.append((start, j - 1))
+                start = j + 1
+        args.append((start, close - 1))
+        if arg >= len(args) or args[arg][0] > args[arg][1]:
+            return []
+        first, last = args[arg]
+        inline = [f for f in self.functions if f.start == first]
+        if inline:
+            return [(inline[0].body_start, inline[0].body_end)]
+        if first == last and self.tokens[first].kind == "name":
+            fn = self.function_named(self.tokens[first].value, paren)
+            if fn:
+                return [(fn.body_start, fn.body_end)]
+        return []
+
+
+# ── Hot regions ──
+
+def _statement_end(f: _File, start: int) -> int:
+    """Last token of the single statement starting at `start`."""
+    parent = f.parents[start]
+    j = start
+    while j < len(f.tokens):
+        if f.punct(j, "(", "[", "{") and j in f.pairs:
+            j = f.pairs[j] + 1
+            continue
+        if f.punct(j, ";") and f.parents[j] == parent:
+            return j
+        if f.parents[j] != parent:
+            return j - 1
+        j += 1
+    return len(f.tokens) - 1
+
+
+def hot_regions(f: _File) -> list[tuple[int, int, str, int]]:
+    """(first token, last token, description, line) of loops and hot paths."""
+    regions = []
+    tokens = f.tokens
+    for i, tok in enumerate(tokens):
+        if tok.kind == "keyword" and tok.value in ("for", "while") and f.punct(i + 1, "(") and (i + 1) in f.pairs:
+            body = f.pairs[i + 1] + 1
+            if f.punct(body, ";"):
+                continue  # do { … } while (…); or an empty loop
+            if f.punct(body, "{") and body in f.pairs:
+                regions.append((body + 1, f.pairs[body] - 1, f"{tok.value} loop", tok.line))
+            elif body < len(tokens):
+                regions.append((body, _statement_end(f, body), f"{tok.value} loop", tok.line))
+        elif tok.kind == "keyword" and tok.value == "do" and f.punct(i + 1, "{") and (i + 1) in f.pairs:
+            regions.append((i + 2, f.pairs[i + 1] - 1, "do loop", tok.line))
+        elif tok.kind != "name" or not f.called(i):
+            continue
+        elif tok.value in ITERATION_METHODS and f.member(i):
+            for start, end in f.callback_bodies(i + 1):
+                regions.append((start, end, f"{tok.value} callback", tok.line))
+        elif tok.value in ("requestAnimationFrame", "setInterval") and f.global_call(i):
+            for start, end in f.callback_bodies(i + 1):
+                regions.append((start, end, f"{tok.value} callback", tok.line))
+        elif tok.value == "addEventListener" and tokens[i + 2].kind == "str" \
+                and tokens[i + 2].value.strip("'\"") in HOT_EVENTS:
+            event = tokens[i + 2].value.strip("'\"")
+            for start, end in f.callback_bodies(i + 1, arg=1):
+                regions.append((start, end, f"{event} handler", tok.line))
+    # el.onmousemove = function / arrow / named handler
+    for i, tok in enumerate(tokens):
+        if tok.kind == "name" and tok.value.startswith("on") and tok.value[2:] in HOT_EVENTS \
+                and f.member(i) and f.punct(i + 1, "="):
+            inline = [fn for fn in f.functions if fn.start == i + 2]
+            if inline:
+                regions.append((inline[0].body_start, inline[0].body_end, f"{tok.value[2:]} handler", tok.line))
+            elif i + 2 < len(tokens) and tokens[i + 2].kind == "name":
+                fn = f.function_named(tokens[i + 2].value, i)
+                if fn:
+                    regions.append((fn.body_start, fn.body_end, f"{tok.value[2:]} handler", tok.line))
+    return sorted(set(regions))
+
+
+def _innermost(regions, i: int):
+    best = None
+    for region in regions:
+        if region[0] <= i <= region[1] and (best is None or region[1] - region[0] < best[1] - best[0]):
+            best = region
+    return best
+
+
+# ── Rules ──
+
+def _query_wrappers(f: _File) -> set[str]:
+    """Names of one-line helpers that just run a DOM query (e.g. $)."""
+    wrappers = set()
+    for fn in f.functions:
+        if fn.body_end - fn.body_start + 1 <= WRAPPER_MAX_TOKENS and any(
+                f.tokens[j].value in QUERY_METHODS and f.member(j)
+                for j in range(fn.body_start, fn.body_end + 1)):
+            wrappers.add(fn.name)
+    return wrappers
+
+
+def _is_layout_read(f: _File, i: int) -> bool:
+    tok = f.tokens[i]
+    if tok.kind != "name" or tok.value not in LAYOUT_READS:
+        return False
+    if tok.value == "getComputedStyle":
+        return f.called(i)
+    return f.member(i) and not f.punct(i + 1, *ASSIGNMENTS)
+
+
+def _is_dom_write(f: _File, i: int) -> bool:
+    tok = f.tokens[i]
+    if tok.kind != "name" or not f.member(i):
+        return False
+    if tok.value in WRITE_PROPERTIES and f.punct(i + 1, *ASSIGNMENTS):
+        return True
+    if tok.value in WRITE_METHODS and f.called(i):
+        return True
+    if tok.value in CLASSLIST_WRITES and f.called(i) and f.tokens[i - 2].value == "classList":
+        return True
+    # el.style.prop = … / el.style.setProperty(…)
+    return f.tokens[i - 2].value == "style" and f.member(i - 2) and (
+        f.punct(i + 1, *ASSIGNMENTS) or (tok.value == "setProperty" and f.called(i)))
+
+
+def _handle_expression(f: _File, call: int) -> str | None:
+    """`a.b` in `a.b = setInterval(…)` / `const a = setInterval(…)`; None if discarded."""
+    j = call - 1
+    if f.member(call) and f.tokens[call - 2].value == "window":
+        j = call - 3
+    if not f.punct(j, "="):
+        return None
+    parts = []
+    j -= 1
+    while j >= 0 and (f.tokens[j].kind == "name" or f.tokens[j].value == "this" or f.punct(j, ".")):
+        parts.append(f.tokens[j].value)
+        j -= 1
+    return "".join(reversed(parts)) or None
+
+
+def _cleared_handles(f: _File, clear: str) -> set[str]:
+    """Argument expressions passed to clearInterval/cancelAnimationFrame."""
+    handles = set()
+    for i, tok in enumerate(f.tokens):
+        if tok.kind == "name" and tok.value == clear and f.called(i):
+            handles.add("".join(t.value for t in f.tokens[i + 2:f.pairs[i + 1]]))
+    return handles
+
+
+def _conditional(f: _File, fn, i: int) -> bool:
+    """Whether token i only runs on some calls of fn (guarded, or after a return)."""
+    if fn is None:
+        return False
+    if any(f.tokens[j].kind == "keyword" and f.tokens[j].value == "return" for j in range(fn.body_start, i)):
+        return True
+    # enclosing blocks between the call and the function body
+    p = f.parents[i]
+    while p >= fn.body_start:
+        if f.punct(p, "{"):
+            before = p - 1
+            if f.punct(before, ")") and before in f.opener_of \
+                    and f.tokens[f.opener_of[before] - 1].value in ("if", "while", "for", "switch", "catch"):
+                return True
+            if f.tokens[before].value in ("else", "try", "finally"):
+                return True
+        p = f.parents[p]
+    # a guard in the same statement: if (…) x = rAF(…); / cond && rAF(…); / c ? rAF(…) : …
+    j = i - 1
+    while j >= fn.body_start and not f.punct(j, ";", "{", "}"):
+        if f.tokens[j].value in ("if", "&&", "||", "?", "??") and f.parents[j] == f.parents[i]:
+            return True
+        j -= 1
+    return False
+
+
+@tracing.traced()
+def lint_source(code: str) -> tuple[list[dict], int]:
+    """(findings, function count) for one JavaScript source.
+
+    Each finding: {"rule", "line", "function", "function_line", "message"}.
+    """
+    f = _File(code)
+    tokens = f.tokens
+    regions = hot_regions(f)
+    wrappers = _query_wrappers(f)
+    findings = []
+
+    def report(rule: str, i: int, message: str):
+        fn = js_tokens.enclosing_function(f.functions, i)
+        findings.append({"rule": rule, "line": tokens[i].line,
+                         "function": fn.name if fn else "(top level)",
+                         "function_line": fn.line if fn else None,
+                         "message": f"{message} — {RULES[rule][1]}"})
+
+    for i, tok in enumerate(tokens):
+        if tok.kind != "name":
+            continue
+        region = _innermost(regions, i)
+        where = f"in {region[2]} (line {region[3]})" if region else ""
+        if region and f.called(i) and ((tok.value in QUERY_METHODS and f.member(i))
+                                       or (tok.value in wrappers and not f.member(i))):
+            report("dom-query-in-loop", i, f"{tok.value}() {where}")
+        elif region and f.member(i) and ((tok.value in ("innerHTML", "outerHTML") and f.punct(i + 1, "=", "+="))
+                                         or (tok.value == "insertAdjacentHTML" and f.called(i))):
+            op = "" if tok.value == "insertAdjacentHTML" else f" {tokens[i + 1].value}"
+            report("html-write-in-loop", i, f"{tok.value}{op} {where}")
+        elif region and tok.value == "addEventListener" and f.called(i):
+            report("listener-in-loop", i, f"addEventListener() {where}")
+
+    # Layout thrash: a read after a write within one loop / hot path
+    for start, end, desc, line in regions:
+        wrote = None
+        for i in range(start, end + 1):
+            if wrote is None and _is_dom_write(f, i):
+                wrote = i
+            elif wrote is not None and _is_layout_read(f, i):
+                report("layout-thrash", i, f"{tokens[i].value} read after the write on line "
+                                           f"{tokens[wrote].line}, in {desc} (line {line})")
+                break
+
+    # Timers
+    cleared = _cleared_handles(f, "clearInterval")
+    cancelled = _cleared_handles(f, "cancelAnimationFrame")
+    for i, tok in enumerate(tokens):
+        if tok.kind != "name" or not f.global_call(i):
+            continue
+        if tok.value == "setInterval":
+            handle = _handle_expression(f, i)
+            if handle is None:
+                report("uncleared-timer", i, "setInterval() handle is discarded")
+            elif handle not in cleared:
+                report("uncleared-timer", i, f"setInterval() handle {handle} is never cleared")
+        elif tok.value == "requestAnimationFrame" and not cancelled:
+            fn = js_tokens.enclosing_function(f.functions, i)
+            target = [t.value for t in tokens[i + 2:f.pairs[i + 1]]]
+            if fn is not None and target == [fn.name] and not _conditional(f, fn, i):
+                report("raf-loop-unbounded", i, f"{fn.name}() reschedules itself every frame")
+
+    # One finding per rule and line (nested regions see the same token)
+    unique = {(d["rule"], d["line"]): d for d in findings}
+    return sorted(unique.values(), key=lambda d: (d["line"], d["rule"])), len(f.functions)
+
+
+def _summarise(findings: list[dict], functions: int) -> dict:
+    by_rule = {rule: 0 for rule in RULES}
+    for d in findings:
+        by_rule[d["rule"]] += 1
+    weighted = sum(RULES[rule][0] * n for rule, n in by_rule.items())
+    return {
+        "functions": functions,
+        "functions_flagged": len({(d["function"], d["function_line"]) for d in findings}),
+        "findings": len(findings),
+        "weighted_findings": weighted,
+        "by_rule": by_rule,
+        "score": round(weighted / functions, 3) if functions else 0.0,
+    }
+
+
+@tracing.traced()
+def lint_artifact(src_dir: Path) -> dict:
+    """Per-file, per-function findings and a summary for every JS file under src/.
+
+    Returns:
+        {"tool", "summary": {"files", "functions", "functions_flagged",
+         "findings", "weighted_findings", "by_rule", "score"},
+         "files": [{"file", "functions", "findings", "score", "by_function":
+         [{"function", "line", "findings": [{"rule", "line", "message"}]}]}]}
+    """
+    files, all_findings, all_functions = [], [], 0
+    for entry in scan(src_dir, suffixes=JS_SUFFIXES, count=False):
+        code = entry["path"].read_text(encoding="utf-8", errors="replace")
+        tracing.add("bytes_read", len(code))
+        findings, functions = lint_source(code)
+        by_function = {}
+        for d in findings:
+            key = (d["function"], d["function_line"])
+            by_function.setdefault(key, []).append({k: d[k] for k in ("rule", "line", "message")})
+        summary = _summarise(findings, functions)
+        files.append({
+            "file": entry["rel"],
+            "functions": functions,
+            "findings": summary["findings"],
+            "score": summary["score"],
+            "by_rule": summary["by_rule"],
+            "by_function": [{"function": name, "line": line, "findings": items}
+                            for (name, line), items in by_function.items()],
+        })
+        all_findings += [{**d, "function": f"{entry['rel']}:{d['function']}"} for d in findings]
+        all_functions += functions
+    return {
+        "tool": TOOL,
+        "summary": {"files": len(files), **_summarise(all_findings, all_functions)},
+        "files": files,
+    }
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path performance lint for artifact JavaScript")
+    parser.add_argument("src", nargs="*", type=Path, help="src/ directories to lint")
+    parser.add_argument("--all", action="store_true", help="Lint every artifacts/*/src")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the results as JSON")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "js_perf_lint")
+
+    dirs = list(args.src)
+    if args.all:
+        dirs += sorted(p / "src" for p in ARTIFACTS_DIR.iterdir() if (p / "src").is_dir())
+    if not dirs:
+        parser.error("give src/ directories or --all")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  JavaScript Performance Lint                             ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    results, rows = {}, []
+    for src in dirs:
+        name = src.parent.name if src.name == "src" else src.name
+        result = lint_artifact(src)
+        results[name] = result
+        s = result["summary"]
+        rows.append([name, s["files"], s["functions"], s["functions_flagged"],
+                     *(s["by_rule"][rule] for rule in RULES), s["score"]])
+        if len(dirs) == 1:
+            for entry in result["files"]:
+                for fn in entry["by_function"]:
+                    print(f"▸ {entry['file']}:{fn['line'] or '—'}  {fn['function']}")
+                    for d in fn["findings"]:
+                        print(f"  ⚠ {d['line']:>5}  {d['rule']:<20} {d['message']}")
+            print()
+
+    print(tabulate(rows, headers=["Artifact", "Files", "Functions", "Flagged",
+                                  "Query", "HTML", "Thrash", "Timer", "rAF", "Listener", "Score"],
+                   tablefmt="simple_outline"))
+    print("  Score: weighted findings per function (0 = clean); weights "
+          + ", ".join(f"{rule} {w}" for rule, (w, _) in RULES.items()))
+
+    if args.json:
+        save_json(args.json, results)
+        print(f"\n  ✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
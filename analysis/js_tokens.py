@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+js_tokens.py — A JavaScript token stream and function map for static analysis.
+
+Not a parser: enough of the lexical grammar to stop strings, comments,
+regular expressions and template literals from being mistaken for code,
+and enough structure to tell which function and which block every token
+belongs to.
+
+    tokenize(code)          [Token(kind, value, line, pos)], comments dropped
+                            kinds: name, keyword, num, str, template, regex, punct
+    match_brackets(tokens)  {index of an opening bracket: index of its closer}
+    enclosing_brackets(tokens)  index of the innermost open bracket around each token
+    find_functions(tokens)  [Function(name, start, end, body_start, body_end, line, end_line)]
+    enclosing_function(functions, i)  innermost function whose body holds token i
+
+Handled: "//" and "/* */" comments, '…' "…" strings with escapes, template
+literals with nested ${…} expressions, regex literals (told apart from
+division by the previous token), numeric separators and exponents.
+Functions: declarations and expressions, arrows (block and expression
+bodies), object and class methods, getters/setters. An unnamed function
+passed to a call is named after the callee (e.g. "forEach callback").
+
+Used by js_perf_lint.py.
+
+Usage:
+    python analysis/js_tokens.py artifacts/02-big-o-visualiser/src/game.js
+"""
+
+import argparse
+import re
+from collections import namedtuple
+from pathlib import Path
+
+Token = namedtuple("Token", "kind value line pos")
+Function = namedtuple("Function", "name start end body_start body_end line end_line")
+
+KEYWORDS = frozenset("""
+    break case catch class const continue debugger default delete do else export extends
+    finally for function if import in instanceof let new return super switch this throw
+    try typeof var void while with yield await async of static get set null true false
+""".split())
+
+# After these a "/" starts a regex literal, otherwise it divides
+_REGEX_AFTER_KEYWORDS = frozenset(
+    "return typeof instanceof in of new delete void throw case do else yield await".split())
+_CLOSERS = {")": "(", "]": "[", "}": "{"}
+_NOT_METHODS = frozenset("if for while switch catch function with return typeof".split())
+
+_NUMBER = (r"0[xX][\da-fA-F_]+n?|0[oO][0-7_]+n?|0[bB][01_]+n?|"
+           r"(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?")
+_PUNCT = (r">>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|&&=|\|\|=|\?\?=|"
+          r"=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.|\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|\*\*|<<|>>|"
+          r"[{}()\[\];,<>+\-*/%&|^!~?:=.@#]")
+# One alternation, tried at each position; templates and regex literals are
+# handled before it because they depend on what came earlier
+_TOKEN = re.compile("|".join([
+    r"(?P<space>\s+)",
+    r"(?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))",
+    r"(?P<str>'(?:[^'\\\n]|\\[\s\S])*'?|\"(?:[^\"\\\n]|\\[\s\S])*\"?)",
+    r"(?P<name>[A-Za-z_$\u00c0-\uffff][\w$\u00c0-\uffff]*)",
+    rf"(?P<num>{_NUMBER})",
+    rf"(?P<punct>{_PUNCT})",
+]))
+_REGEX_BODY = re.compile(r"(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+
+
+# ── Tokens ──
+
+def _regex_allowed(prev: Token | None) -> bool:
+    if prev is None:
+        return True
+    if prev.kind == "punct":
+        return prev.value not in (")", "]", "}", "++", "--")
+    if prev.kind == "keyword":
+        return prev.value in _REGEX_AFTER_KEYWORDS
+    return False
+
+
+def tokenize(code: str) -> list[Token]:
+    """Tokens of a JavaScript source, without comments or whitespace."""
+    tokens = []
+    braces = []  # "{" for a block/object, "${" for a template substitution
+    line, pos, n = 1, 0, len(code)
+
+    def scan_template(start: int) -> int:
+        """Scan template text from `start` (after "`" or "}"); return the next position."""
+        nonlocal line
+        i = start
+        while i < n:
+            c = code[i]
+            if c == "\\":
+                i += 2
+                continue
+            if c == "`":
+                tokens.append(Token("template", code[start:i], line, start))
+                line += code.count("\n", start, i)
+                return i + 1
+            if c == "$" and code.startswith("${", i):
+                tokens.append(Token("template", code[start:i], line, start))
+                line += code.count("\n", start, i)
+                braces.append("${")
+                return i + 2
+            i += 1
+        tokens.append(Token("template", code[start:], line, start))
+        line += code.count("\n", start)
+        return n
+
+    while pos < n:
+        c = code[pos]
+        if c == "`":
+            pos = scan_template(pos + 1)
+            continue
+        if c == "}" and braces and braces[-1] == "${":
+            braces.pop()
+            pos = scan_template(pos + 1)
+            continue
+        if c == "/" and code[pos + 1:pos + 2] not in ("/", "*") and _regex_allowed(tokens[-1] if tokens else None):
+            m = _REGEX_BODY.match(code, pos + 1)
+            if m:
+                tokens.append(Token("regex", code[pos:m.end()], line, pos))
+                pos = m.end()
+                continue
+        m = _TOKEN.match(code, pos)
+        if m is None:
+            pos += 1  # stray character (e.g. "\\" outside a string)
+            continue
+        kind, value = m.lastgroup, m.group()
+        if kind in ("space", "comment"):
+            line += value.count("\n")
+        else:
+            if kind == "name" and value in KEYWORDS:
+                kind = "keyword"
+            elif kind == "punct":
+                if value == "{":
+                    braces.append("{")
+                elif value == "}" and braces:
+                    braces.pop()
+            tokens.append(Token(kind, value, line, pos))
+            line += value.count("\n") if kind == "str" else 0
+        pos = m.end()
+    return tokens
+
+
+def match_brackets(tokens: list[Token]) -> dict[int, int]:
+    """Index of each opening (, [ or { mapped to its closing token.
+
+    Unbalanced brackets (broken or truncated input) are left unmatched.
+    """
+    pairs, stack = {}, []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "punct":
+            continue
+        if tok.value in "([{":
+            stack.append(i)
+        elif tok.value in _CLOSERS:
+            while stack and tokens[stack[-1]].value != _CLOSERS[tok.value]:
+                stack.pop()
+            if stack:
+                pairs[stack.pop()] = i
+    return pairs
+
+
+# ── Functions ──
+
+def _is(tok: Token | None, *values: str) -> bool:
+    return tok is not None and tok.kind in ("punct", "keyword") and tok.value in values
+
+
+def enclosing_brackets(tokens: list[Token]) -> list[int]:
+    """Index of the innermost open bracket around each token (-1 at top level)."""
+    parents, stack = [], []
+    for tok in tokens:
+        if tok.kind == "punct" and tok.value in _CLOSERS and stack:
+            stack.pop()
+        parents.append(stack[-1] if stack else -1)
+        if tok.kind == "punct" and tok.value in "([{":
+            stack.append(len(parents) - 1)
+    return parents
+
+
+def _binding_name(tokens: list[Token], i: int) -> str | None:
+    """Name a function expression starting at `i` is bound to (x = …, x: …, x(…) {)."""
+    prev = tokens[i - 1] if i else None
+    if _is(prev, "=", ":") and i >= 2 and tokens[i - 2].kind in ("name", "str", "keyword"):
+        target = tokens[i - 2].value.strip("'\"")
+        if _is(prev, "=") and i >= 4 and _is(tokens[i - 3], "."):
+            return f"{tokens[i - 4].value}.{target}"
+        return target
+    return None
+
+
+def _expression_end(tokens: list[Token], pairs: dict[int, int], i: int) -> int:
+    """Last token of an arrow's expression body starting at `i`."""
+    j = i
+    while j < len(tokens):
+        tok = tokens[j]
+        if tok.kind == "punct":
+            if tok.value in "([{" and j in pairs:
+                j = pairs[j] + 1
+                continue
+            if tok.value in (")", "]", "}", ",", ";"):
+                return j - 1
+        j += 1
+    return len(tokens) - 1
+
+
+def find_functions(tokens: list[Token], pairs: dict[int, int] | None = None,
+                   parents: list[int] | None = None) -> list[Function]:
+    """Every function in the token stream, in source order.
+
+    start/end span the whole function (from its name or parameters to the
+    last body token); body_start/body_end the body alone (inside the
+    braces for a block body).
+    """
+    pairs = match_brackets(tokens) if pairs is None else pairs
+    opener_of = {close: open_ for open_, close in pairs.items()}
+    parents = enclosing_brackets(tokens) if parents is None else parents
+    functions = []
+
+    def call_name(start: int) -> str | None:
+        # A function passed straight to a call is named after the callee
+        paren = parents[start]
+        if paren > 0 and _is(tokens[paren], "(") and tokens[paren - 1].kind == "name" \
+                and _is(tokens[start - 1], "(", ","):
+            return f"{tokens[paren - 1].value} callback"
+        return None
+
+    def add(name, start, body_open):
+        if _is(tokens[body_open], "{"):
+            close = pairs.get(body_open)
+            if close is None:
+                return
+            body_start, body_end, end = body_open + 1, close - 1, close
+        else:
+            body_start = body_open
+            body_end = end = _expression_end(tokens, pairs, body_open)
+        functions.append(Function(name or call_name(start) or "(anonymous)", start, end,
+                                  body_start, body_end, tokens[start].line, tokens[end].line))
+
+    for i, tok in enumerate(tokens):
+        if tok.kind == "keyword" and tok.value == "function":
+            j = i + 1
+            if _is(tokens[j] if j < len(tokens) else None, "*"):
+                j += 1
+            name = None
+            if j < len(tokens) and tokens[j].kind == "name":
+                name, j = tokens[j].value, j + 1
+            if j < len(tokens) and _is(tokens[j], "(") and j in pairs:
+                body = pairs[j] + 1
+                start = i - 1 if i and _is(tokens[i - 1], "async") else i
+                if body < len(tokens) and _is(tokens[body], "{"):
+                    add(name or _binding_name(tokens, start), start, body)
+        elif tok.kind == "punct" and tok.value == "=>":
+            prev = tokens[i - 1]
+            if prev.kind == "name":
+                start = i - 1
+            elif _is(prev, ")") and (i - 1) in opener_of:
+                start = opener_of[i - 1]
+            else:
+                continue
+            if start and _is(tokens[start - 1], "async"):
+                start -= 1
+            if i + 1 < len(tokens):
+                add(_binding_name(tokens, start), start, i + 1)
+        elif tok.kind == "punct" and tok.value == "(" and i in pairs and i:
+            # Method shorthand: name(params) { … } in a class body or object literal
+            prev = tokens[i - 1]
+            after = pairs[i] + 1
+            if (prev.kind in ("name", "keyword") and prev.value not in _NOT_METHODS
+                    and after < len(tokens) and _is(tokens[after], "{")
+                    and (i < 2 or not _is(tokens[i - 2], ".", "function"))):
+                before = tokens[i - 2] if i >= 2 else None
+                if before is None or _is(before, "{", "}", ",", ";", "static", "get", "set", "async", "*"):
+                    if prev.kind == "keyword" and prev.value not in ("get", "set", "static", "constructor"):
+                        continue
+                    add(prev.value, i - 1, after)
+
+    functions.sort(key=lambda f: (f.start, -f.end))
+    return functions
+
+
+def enclosing_function(functions: list[Function], index: int) -> Function | None:
+    """Innermost function whose body contains token `index`."""
+    best = None
+    for fn in functions:
+        if fn.body_start > index:
+            break
+        if fn.body_start <= index <= fn.body_end:
+            best = fn
+    return best
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the tokens and functions of a JavaScript file")
+    parser.add_argument("file", type=Path, help="JavaScript file")
+    parser.add_argument("--tokens", action="store_true", help="Also print every token")
+    args = parser.parse_args()
+
+    code = args.file.read_text(encoding="utf-8", errors="replace")
+    tokens = tokenize(code)
+    if args.tokens:
+        for tok in tokens:
+            print(f"  {tok.line:>5}  {tok.kind:<8} {tok.value[:60]}")
+    functions = find_functions(tokens)
+    for fn in functions:
+        print(f"  {fn.line:>5}–{fn.end_line:<5} {fn.name}")
+    print(f"\n  {len(tokens)} tokens, {len(functions)} functions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+json_stream.py — Incremental reader for large JSON documents.
+
+Reads a top-level JSON object in fixed-size chunks and yields its members
+as events, decoding the elements of one chosen array member one at a time
+instead of materialising the whole array:
+
+    ("member", key, value)           a complete top-level member
+    ("item", key, value)             one element of the streamed array
+    ("entry", key, (name, value))    one member of a streamed object
+                                     (stream_objects=True, e.g. the
+                                     "packages" of a package-lock.json)
+
+Only the element being decoded (plus one read chunk) is held in memory, so
+a reviewer file with thousands of artifacts is flattened in constant memory
+and consumers receive rows before the file has been fully read. Values are
+decoded with the stdlib json scanner (JSONDecoder.raw_decode).
+
+Usage:
+    from json_stream import JSONStream
+
+    stream = JSONStream(path, "artifacts")
+    for kind, key, value in stream:
+        ...
+    stream.bytes_read, stream.seconds
+
+    for kind, key, value in JSONStream(lock, ("packages", "dependencies"), stream_objects=True):
+        ...
+"""
+
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+
+CHUNK_SIZE = 64 * 1024  # characters per read
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+# Characters that could still extend a number cut off at the buffer edge
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+
+class JSONStream:
+    """Iterate the members of a top-level JSON object, streaming one array.
+
+    Args:
+        path:       JSON file whose top level is an object
+        stream_key: member (or tuple of members) whose array elements are
+                    yielded one by one; any other member (or a non-array
+                    value under this key) is yielded whole as a "member" event
+        chunk_size: characters read per refill
+        hash_content: also compute the SHA-256 of the file as it is read
+        stream_objects: also stream an object under stream_key, one
+                    ("entry", key, (name, value)) event per member
+
+    After iteration, bytes_read and seconds (time spent reading and
+    decoding, excluding the consumer) are available for throughput stats,
+    and digest() returns the content hash when hash_content was set.
+
+    Raises:
+        json.JSONDecodeError on malformed input (positions are relative to
+        the current buffer, with the file name in the message).
+    """
+
+    def __init__(self, path: Path, stream_key: str | tuple, chunk_size: int = CHUNK_SIZE,
+                 hash_content: bool = False, stream_objects: bool = False):
+        self.path = Path(path)
+        self.stream_key = stream_key
+        self._stream_keys = {stream_key} if isinstance(stream_key, str) else set(stream_key)
+        self.stream_objects = stream_objects
+        self.chunk_size = chunk_size
+        self.hash_content = hash_content
+        self._sha256 = None
+        self.bytes_read = 0
+        self.seconds = 0.0
+        self._file = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        # newline="" keeps the text identical to the bytes on disk
+        with open(self.path, "r", encoding="utf-8", newline="") as self._file:
+            start = time.perf_counter()
+            self.bytes_read = 0
+            self._sha256 = hashlib.sha256() if self.hash_content else None
+            self._buf, self._pos, self._eof = "", 0, False
+            self._expect("{")
+            if self._peek() == "}":
+                self._pos += 1
+                return
+            while True:
+                key = self._value()
+                if not isinstance(key, str):
+                    self._error("Expecting property name")
+                self._expect(":")
+                streamed = key in self._stream_keys
+                if streamed and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            item = self._value()
+                            self.seconds += time.perf_counter() - start
+                            yield ("item", key, item)
+                            start = time.perf_counter()
+                            if self._delimiter(",]") == "]":
+                                break
+                elif streamed and self.stream_objects and self._peek() == "{":
+                    self._pos += 1
+                    if self._peek() == "}":
+                        self._pos += 1
+                    else:
+                        while True:
+                            name = self._value()
+                            if not isinstance(name, str):
+                                self._error("Expecting property name")
+                            self._expect(":")
+                            item = self._value()
+                            self.seconds += time.perf_counter() - start
+                            yield ("entry", key, (name, item))
+                            start = time.perf_counter()
+                            if self._delimiter(",}") == "}":
+                                break
+                else:
+                    value = self._value()
+                    self.seconds += time.perf_counter() - start
+                    yield ("member", key, value)
+                    start = time.perf_counter()
+                if self._delimiter(",}") == "}":
+                    break
+            if self._peek() is not None:
+                self._error("Extra data")
+            self.seconds += time.perf_counter() - start
+
+    def digest(self) -> str | None:
+        """SHA-256 hex digest of the bytes read so far (hash_content only)."""
+        return self._sha256.hexdigest() if self._sha256 is not None else None
+
+    def items(self):
+        """Yield only the elements of the streamed array."""
+        for kind, _, value in self:
+            if kind == "item":
+                yield value
+
+    # ── Buffer handling ──
+
+    def _fill(self, size: int) -> bool:
+        """Append up to `size` characters; False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        data = chunk.encode("utf-8")
+        self.bytes_read += len(data)
+        if self._sha256 is not None:
+            self._sha256.update(data)
+        # Drop consumed text so the buffer stays about one chunk long
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str | None:
+        """Next non-whitespace character (not consumed), or None at EOF."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill(self.chunk_size):
+                return None
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _delimiter(self, chars: str) -> str:
+        char = self._peek()
+        if char is None or char not in chars:
+            self._error(f"Expecting one of {' '.join(repr(c) for c in chars)}")
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode one complete JSON value at the current position."""
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value runs past the buffer: read more (doubling, so a value
+                # much larger than one chunk is re-scanned O(log n) times)
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number cut at the buffer edge decodes as a shorter prefix
+            # ("4." → 4): read on until a delimiter follows it
+            if _NUMBER_TAIL.fullmatch(self._buf, end) and self._fill(size):
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, message: str):
+        raise json.JSONDecodeError(f"{message} ({self.path.name})", self._buf, self._pos)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+lazy_import.py — Deferred imports for heavy scientific and API dependencies.
+
+numpy, tabulate, jsonschema, krippendorff and friends dominate the cold
+start of every analysis CLI, even for runs (``--help``, ``--only A``,
+cached reports) that never touch them. These helpers bind the name at
+module import time but defer executing the dependency until first use.
+
+A missing package still fails at import time, so the existing
+``try: ... except ImportError`` guards keep working unchanged.
+
+Usage:
+    from lazy_import import lazy_module, lazy_callable
+
+    np = lazy_module("numpy")
+    tabulate = lazy_callable("tabulate", "tabulate")
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+
+_lock = threading.Lock()
+
+
+def lazy_module(name: str):
+    """Return a module object whose body runs on first attribute access.
+
+    Raises:
+        ImportError: if the module cannot be found.
+    """
+    with _lock:
+        if name in sys.modules:
+            return sys.modules[name]
+
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"No module named '{name}'", name=name)
+
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
+
+
+def lazy_callable(module_name: str, attr: str):
+    """Return a stand-in for ``from module_name import attr`` that imports on first call.
+
+    Raises:
+        ImportError: if the module cannot be found.
+    """
+    if module_name not in sys.modules and importlib.util.find_spec(module_name) is None:
+        raise ImportError(f"No module named '{module_name}'", name=module_name)
+
+    target = None
+
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_name), attr)
+        return target(*args, **kwargs)
+
+    call.__name__ = attr
+    call.__qualname__ = attr
+    call.__doc__ = f"Lazily imported {module_name}.{attr}."
+    return call
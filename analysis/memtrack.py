@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+memtrack.py — Peak-memory measurement for analysis stages.
+
+Tracks a block of code (or a whole script) with tracemalloc and reports:
+    peak_traced_mb   peak Python heap allocated inside the block
+    peak_rss_mb      peak resident set size of the process (ru_maxrss)
+    top              allocation sites holding the most memory at the peak
+
+tracemalloc only records its own peak as a number. To attribute the peak to
+source lines, a sampler thread snapshots the heap whenever allocated memory
+reaches a new high (by at least 10%), so `top` reflects the snapshot nearest
+to the peak.
+
+In code:
+    import memtrack
+
+    with memtrack.Tracker() as mem:
+        run_analysis()
+    print(memtrack.format_report(mem.report()))
+
+As a runner (used by bench.py; works for any script):
+    python analysis/memtrack.py analysis/extended_sensitivity.py --no-figures
+    python analysis/memtrack.py --json out.json -c "import data_loader; data_loader.load_expert_flat()"
+"""
+
+import argparse
+import json
+import os
+import runpy
+import sys
+import sysconfig
+import threading
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_TOP = 5
+DEFAULT_FRAMES = 1
+SAMPLE_INTERVAL = 0.02  # seconds
+SNAPSHOT_GROWTH = 1.10  # re-snapshot when the heap grows 10% past the last snapshot
+MIN_SNAPSHOT_BYTES = 1 << 20
+
+MB = 1024 * 1024
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss / MB if sys.platform == "darwin" else rss / 1024
+
+
+class Tracker:
+    """Context manager measuring peak memory of the enclosed block."""
+
+    def __init__(self, top: int = DEFAULT_TOP, frames: int = DEFAULT_FRAMES):
+        self.top = top
+        self.frames = frames
+        self._owns_tracing = False
+        self._stop = threading.Event()
+        self._sampler = None
+        self._snapshot = None
+        self._snapshot_size = 0
+        self._peak = 0
+        self._baseline = 0
+        self._rss = None
+
+    def __enter__(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        self._sampler = threading.Thread(target=self._sample, name="memtrack", daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._sampler.join()
+        current, self._peak = tracemalloc.get_traced_memory()
+        if self._snapshot is None or current >= self._snapshot_size:
+            self._take_snapshot(current)
+        if self._owns_tracing:
+            tracemalloc.stop()
+        self._rss = peak_rss_mb()
+        return False
+
+    def _take_snapshot(self, current: int):
+        self._snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            # Module code objects; import cost is startup_budget.py's concern
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<frozen runpy>"),
+        ])
+        self._snapshot_size = current
+
+    def _sample(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            current = tracemalloc.get_traced_memory()[0]
+            if (current - self._baseline >= MIN_SNAPSHOT_BYTES
+                    and current >= self._snapshot_size * SNAPSHOT_GROWTH):
+                self._take_snapshot(current)
+
+    def report(self) -> dict:
+        """Peak memory and the top allocation sites at (or near) the peak."""
+        top = []
+        if self._snapshot is not None:
+            for stat in self._snapshot.statistics("lineno")[:self.top]:
+                frame = stat.traceback[0]
+                top.append({
+                    "site": f"{_short_path(frame.filename)}:{frame.lineno}",
+                    "size_mb": round(stat.size / MB, 3),
+                    "count": stat.count,
+                })
+        return {
+            "peak_traced_mb": round(self._peak / MB, 3),
+            "peak_rss_mb": round(self._rss, 1) if self._rss is not None else None,
+            "top": top,
+        }
+
+
+def _short_path(filename: str) -> str:
+    """Shorten a source path for display (repo-relative, or from site-packages)."""
+    root = str(Path(__file__).resolve().parent.parent) + os.sep
+    if filename.startswith(root):
+        return filename[len(root):]
+    marker = f"site-packages{os.sep}"
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    stdlib = sysconfig.get_paths()["stdlib"] + os.sep
+    if filename.startswith(stdlib):
+        return filename[len(stdlib):]
+    return filename
+
+
+def format_report(report: dict, indent: str = "  ") -> str:
+    """Human-readable peak memory summary with top allocation sites."""
+    rss = report["peak_rss_mb"]
+    lines = [f"{indent}Peak traced: {report['peak_traced_mb']:.1f} MB"
+             + (f"  |  Peak RSS: {rss:.1f} MB" if rss is not None else "")]
+    for site in report["top"]:
+        lines.append(f"{indent}  {site['size_mb']:8.2f} MB  {site['count']:>8} blocks  {site['site']}")
+    return "\n".join(lines)
+
+
+# ── Runner ──
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a script under tracemalloc and report its peak memory",
+        usage="%(prog)s [--json OUT] [--top N] (-c CODE | script.py [args ...])",
+    )
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the report as JSON")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Allocation sites to report (default: {DEFAULT_TOP})")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES,
+                        help=f"Traceback depth per allocation (default: {DEFAULT_FRAMES})")
+    parser.add_argument("-c", dest="code", metavar="CODE", help="Program passed in as a string")
+    parser.add_argument("script", nargs="?", help="Script to run")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the script")
+    args = parser.parse_args()
+    if not args.code and not args.script:
+        parser.error("a script or -c CODE is required")
+
+    exit_code = 0
+    namespace = {"__name__": "__main__"}  # kept alive so the final snapshot still sees its data
+    with Tracker(top=args.top, frames=args.frames) as mem:
+        try:
+            if args.code:
+                sys.argv = ["-c", *([args.script] if args.script else []), *args.args]
+                exec(compile(args.code, "<string>", "exec"), namespace)
+            else:
+                script = str(Path(args.script).resolve())
+                sys.argv = [script, *args.args]
+                sys.path.insert(0, str(Path(script).parent))
+                namespace = runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+
+    report = {**mem.report(), "exit_code": exit_code}
+    print(f"\n{'─' * 60}\n  Memory: {args.script or '-c'}\n{format_report(report)}", file=sys.stderr)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
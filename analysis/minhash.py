@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+minhash.py — Near-duplicate detection with MinHash and locality-sensitive hashing.
+
+Texts are reduced to sets of shingles; a MinHash signature of NUM_PERM
+values estimates the Jaccard similarity of two sets as the share of
+positions where their signatures agree. Signatures are split into bands
+and hashed into buckets (LSH), so only texts that collide in some band are
+compared, instead of all pairs. Candidates are verified on their exact
+shingle Jaccard and grouped with union-find.
+
+Used by extended_qualitative.py to collapse near-duplicate review segments
+and by code_clones.py to find code shared between artifacts.
+
+Usage:
+    import minhash
+
+    clusters = minhash.cluster(texts, threshold=0.8)   # [[0, 7, 12], [3], ...]
+
+    hasher = minhash.MinHasher()
+    index = minhash.LSHIndex(threshold=0.8)
+    index.add("a", hasher.signature(minhash.shingles(text_a)))
+    index.query(hasher.signature(minhash.shingles(text_b)))   # {"a"} if similar
+"""
+
+import base64
+import re
+import zlib
+
+import numpy as np
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+DEFAULT_THRESHOLD = 0.8
+LSH_RECALL = 0.99  # chance that a pair exactly at the threshold is compared
+
+_PRIME = (1 << 31) - 1  # hash values are reduced mod a Mersenne prime < 2**31
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalise(text: str) -> str:
+    """Lower-case, drop punctuation and collapse whitespace."""
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> set[str]:
+    """Character k-shingles of the normalised text (whole text if shorter)."""
+    text = normalise(text)
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """MinHash signatures from NUM_PERM universal hash functions (a·x + b mod p)."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, tokens) -> np.ndarray:
+        """Signature (uint64 array of num_perm values) for a set of str/bytes tokens."""
+        return self.signature_of_hashes(
+            [zlib.crc32(t.encode("utf-8") if isinstance(t, str) else t) for t in tokens])
+
+    def signature_of_hashes(self, hashes) -> np.ndarray:
+        """Signature for a collection of tokens already hashed to integers."""
+        if not len(hashes):
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        base = np.asarray(hashes, dtype=np.uint64) & np.uint64(_PRIME)
+        # a < 2**31 and base < 2**31, so a·x + b fits in uint64
+        return ((np.outer(base, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def signatures(self, token_sets) -> np.ndarray:
+        """Stacked signatures, one row per token set."""
+        if not token_sets:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        return np.vstack([self.signature(tokens) for tokens in token_sets])
+
+
+def estimated_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+
+def bands_for(threshold: float, num_perm: int = NUM_PERM, recall: float = LSH_RECALL) -> tuple[int, int]:
+    """(bands, rows) with the most rows per band that still makes a pair at
+    the threshold a candidate with probability ≥ recall.
+
+    A pair with Jaccard s collides in some band with probability
+    1 - (1 - s^rows)^bands. False candidates are removed by exact
+    verification, so the split is tuned for recall, not for the knee of
+    the S-curve.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class LSHIndex:
+    """Banded LSH buckets over MinHash signatures; keys can be any hashable."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM):
+        self.bands, self.rows = bands_for(threshold, num_perm)
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key, signature: np.ndarray):
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray) -> set:
+        """Keys sharing at least one band with the signature."""
+        found = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def remove(self, key, signature: np.ndarray):
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def state(self) -> list[dict]:
+        """Buckets as JSON-serialisable data (base64 band key → keys), for a persisted index."""
+        return [{base64.b64encode(band_key).decode("ascii"): keys for band_key, keys in buckets.items()}
+                for buckets in self._buckets]
+
+    @classmethod
+    def from_state(cls, state: list[dict], threshold: float = DEFAULT_THRESHOLD,
+                   num_perm: int = NUM_PERM) -> "LSHIndex":
+        """Index with the buckets saved by state(); empty if they were banded differently."""
+        index = cls(threshold, num_perm)
+        if len(state) == index.bands:
+            index._buckets = [{base64.b64decode(band_key): list(keys) for band_key, keys in buckets.items()}
+                              for buckets in state]
+        return index
+
+    def candidate_pairs(self) -> set[tuple]:
+        """All key pairs that share a bucket in any band."""
+        pairs = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        pairs.add((keys[i], keys[j]) if keys[i] <= keys[j] else (keys[j], keys[i]))
+        return pairs
+
+
+class UnionFind:
+    """Disjoint sets with path halving and union by size."""
+
+    def __init__(self, n: int = 0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> int:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+    def groups(self) -> list[list[int]]:
+        """Members of each set, in order of first member."""
+        groups = {}
+        for x in range(len(self.parent)):
+            groups.setdefault(self.find(x), []).append(x)
+        return list(groups.values())
+
+
+def cluster(texts: list[str], threshold: float = DEFAULT_THRESHOLD,
+            k: int = SHINGLE_SIZE, num_perm: int = NUM_PERM) -> list[list[int]]:
+    """Group texts whose shingle Jaccard similarity is at least `threshold`.
+
+    Texts identical after normalisation are grouped directly; the distinct
+    texts go through MinHash LSH, and each candidate pair is confirmed on
+    its exact Jaccard. Groups are transitive (single linkage).
+
+    Returns:
+        lists of indices into `texts`, each in input order, ordered by
+        their first member
+    """
+    uf = UnionFind(len(texts))
+
+    # Exact duplicates: no hashing needed
+    first = {}
+    for i, text in enumerate(texts):
+        key = normalise(text)
+        if key in first:
+            uf.union(first[key], i)
+        else:
+            first[key] = i
+
+    distinct = list(first.values())
+    if len(distinct) > 1:
+        sets = [shingles(texts[i], k) for i in distinct]
+        sigs = MinHasher(num_perm).signatures(sets)
+        index = LSHIndex(threshold, num_perm)
+        for pos in range(len(distinct)):
+            index.add(pos, sigs[pos])
+        for a, b in index.candidate_pairs():
+            if jaccard(sets[a], sets[b]) >= threshold:
+                uf.union(distinct[a], distinct[b])
+
+    return uf.groups()
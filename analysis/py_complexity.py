@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+py_complexity.py — Cyclomatic complexity and maintainability of Python sources (radon).
+
+The Python counterpart of the regex-based JavaScript complexity in
+dsqi_collect.py, for artifacts written in Python. radon walks the AST, so
+decision points are counted exactly rather than estimated:
+
+    per function  cyclomatic complexity and rank (A–F) of every function,
+                  method and closure (class bodies are not units of their own)
+    per file      functions, average / max / total complexity (the same keys
+                  as the JavaScript entries, so both merge into one weighted
+                  overall_average) and the maintainability index (0–100)
+
+A file without functions counts as one unit with its module-level
+complexity. A file radon cannot parse is reported with an "error" and left
+out of the averages.
+
+Files are analysed in a process pool (radon is pure Python and CPU bound),
+and results are cached by content hash in output/.py-complexity-cache.json,
+so unchanged files are not parsed again.
+
+Usage:
+    from py_complexity import analyse_files
+    analyse_files([(path, "pkg/module.py"), ...])     # one entry per file
+
+    python analysis/py_complexity.py path/to/src
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, ContentCache
+from lazy_import import lazy_callable, lazy_module
+from source_scan import scan
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+try:
+    cc_visit = lazy_callable("radon.complexity", "cc_visit")
+    cc_rank = lazy_callable("radon.complexity", "cc_rank")
+    mi_visit = lazy_callable("radon.metrics", "mi_visit")
+    radon_visitors = lazy_module("radon.visitors")
+    HAS_RADON = True
+except ImportError:
+    HAS_RADON = False
+
+TOOL = "radon cyclomatic complexity + maintainability index (py_complexity.py)"
+PY_SUFFIXES = (".py",)
+CACHE_PATH = STUDY_ROOT / "analysis" / "output" / ".py-complexity-cache.json"
+CACHE_VERSION = 1
+ANALYSIS_WORKERS = min(8, os.cpu_count() or 1)
+POOL_MIN_FILES = 4  # below this, starting worker processes costs more than it saves
+
+
+def _radon_version() -> str:
+    from importlib.metadata import version
+    return version("radon")
+
+
+# ── Analysis ──
+
+def _units(blocks):
+    """Functions, methods and closures of radon's blocks (classes skipped)."""
+    for block in blocks:
+        if hasattr(block, "methods"):
+            continue  # a Class: its methods are listed separately
+        yield block
+        yield from _units(block.closures)
+
+
+def analyse_source(code: str) -> dict:
+    """Complexity of one Python source (without the file name).
+
+    Returns:
+        {"functions", "average_complexity", "max_complexity",
+         "total_complexity", "maintainability_index", "blocks": [{"name",
+         "line", "complexity", "rank"}]}, or {"error"} if it does not parse
+    """
+    try:
+        units = list(_units(cc_visit(code)))
+        mi = mi_visit(code, True)
+    except (SyntaxError, ValueError) as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    blocks = [{"name": f"{u.classname}.{u.name}" if u.classname else u.name,
+               "line": u.lineno, "complexity": u.complexity, "rank": cc_rank(u.complexity)}
+              for u in units]
+    if blocks:
+        complexities = [b["complexity"] for b in blocks]
+    else:
+        # Treat the module body as one unit
+        complexities = [radon_visitors.ComplexityVisitor.from_code(code).complexity]
+    return {
+        "functions": len(complexities),
+        "average_complexity": round(sum(complexities) / len(complexities), 2),
+        "max_complexity": max(complexities),
+        "total_complexity": sum(complexities),
+        "maintainability_index": round(mi, 2),
+        "blocks": blocks,
+    }
+
+
+def _analyse_blob(raw: bytes) -> dict:
+    """Pool worker: analyse one file's bytes."""
+    return analyse_source(raw.decode("utf-8", errors="replace"))
+
+
+# ── Cache ──
+
+def load_cache(path: Path = CACHE_PATH) -> ContentCache:
+    """{sha256: result} for the installed radon version (empty if stale or missing)."""
+    return ContentCache(path, {"version": CACHE_VERSION, "radon": _radon_version()})
+
+
+@tracing.traced()
+def analyse_files(files: list[tuple[Path, str]], workers: int | None = None,
+                  cache: dict | None = None) -> list[dict]:
+    """Per-file complexity entries for (path, reported name) pairs.
+
+    Args:
+        workers: worker processes (default ANALYSIS_WORKERS; a pool is only
+                 started for POOL_MIN_FILES or more uncached files)
+        cache:   {sha256: result}, read and updated in place (default: the
+                 on-disk cache, saved when it changed)
+
+    Returns:
+        [{"file", "language": "Python", **analyse_source(...)}] in input order
+    """
+    if not HAS_RADON or not files:
+        return []
+    own_cache = cache is None
+    if own_cache:
+        cache = load_cache()
+
+    blobs = [path.read_bytes() for path, _ in files]
+    digests = [hashlib.sha256(raw).hexdigest() for raw in blobs]
+    todo = sorted({d: raw for d, raw in zip(digests, blobs) if d not in cache}.items())
+    tracing.add("bytes_read", sum(len(raw) for raw in blobs))
+    tracing.add("files_scanned", len(files))
+
+    if todo:
+        workers = min(workers or ANALYSIS_WORKERS, len(todo))
+        with tracing.span("radon", files=len(todo), workers=workers):
+            if workers <= 1 or len(todo) < POOL_MIN_FILES:
+                results = [_analyse_blob(raw) for _, raw in todo]
+            else:
+                from concurrent.futures import ProcessPoolExecutor  # deferred: pulls in multiprocessing
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_analyse_blob, [raw for _, raw in todo],
+                                            chunksize=max(1, len(todo) // (workers * 4))))
+        cache.update((d, r) for (d, _), r in zip(todo, results))
+        if own_cache:
+            cache.save()
+
+    return [{"file": name, "language": "Python", **cache[d]} for (_, name), d in zip(files, digests)]
+
+
+# ── Main ──
+
+def main():
+    parser = argparse.ArgumentParser(description="radon complexity of the Python files under a directory")
+    parser.add_argument("root", type=Path, help="Directory to analyse (e.g. an artifact's src/)")
+    parser.add_argument("--workers", type=int, default=ANALYSIS_WORKERS,
+                        help=f"Worker processes (default: {ANALYSIS_WORKERS})")
+    parser.add_argument("--functions", action="store_true", help="List every function")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "py_complexity")
+
+    if not HAS_RADON:
+        print("  ⚠ radon not available — install it with: pip install radon")
+        sys.exit(1)
+
+    files = [(f["path"], f["rel"]) for f in scan(args.root, suffixes=PY_SUFFIXES, count=False)]
+    results = analyse_files(files, workers=args.workers)
+    rows = []
+    for r in results:
+        if "error" in r:
+            rows.append([r["file"], "—", "—", "—", "—", f"✗ {r['error']}"])
+            continue
+        rows.append([r["file"], r["functions"], r["average_complexity"], r["max_complexity"],
+                     r["maintainability_index"], ""])
+        if args.functions:
+            for b in r["blocks"]:
+                print(f"  {r['file']}:{b['line']:<5} {b['rank']} {b['complexity']:>3}  {b['name']}")
+    if args.functions and results:
+        print()
+    print(tabulate(rows, headers=["File", "Functions", "Avg CC", "Max CC", "MI", ""],
+                   tablefmt="simple_outline"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+report_build.py — Build graph for the core generate_*_report scripts.
+
+Loads the three-layer evaluation model once, computes the aggregates shared
+between reports (heuristic means, ICAP distributions, normalised E scores)
+once, and renders every report target from that shared state. Independent
+targets run in parallel; the summary target consumes the other three
+reports in memory instead of re-reading them from disk.
+
+Each target is stamped with a hash of its inputs (evaluation files,
+generator source, upstream stamps). Targets whose stamp is unchanged and
+whose output still exists are skipped.
+
+Output:
+    analysis/output/{dsqi,expert,coordinator,summary}_report.json
+    analysis/output/.report-build.json   (input stamps)
+
+Usage:
+    python analysis/report_build.py                    # Build stale reports
+    python analysis/report_build.py --force            # Rebuild everything
+    python analysis/report_build.py --only expert      # One target (+ stale deps)
+    python analysis/report_build.py --jobs 1           # Serial build
+    python analysis/report_build.py --trace            # Write Chrome trace + metrics
+"""
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from data_loader import (
+    ROOT, DSQI_DIR, EXPERT_DIR, COORD_DIR,
+    ARTIFACT_SLUGS, HEURISTIC_KEYS, load_json, parse_json, read_many,
+    DataValidationError, check_documents, enable_validation, validation_enabled,
+)
+import tracing
+
+REPORT_DIR = ROOT / "analysis" / "output"
+STAMP_PATH = REPORT_DIR / ".report-build.json"
+STAMP_VERSION = 1
+
+ICAP_ORDER = ["passive", "active", "constructive", "interactive"]
+
+# name → (generator module, output file, model layers read, upstream targets)
+TARGETS = {
+    "dsqi":        ("generate_dsqi_report",        "dsqi_report.json",        ("dsqi",),        ()),
+    "expert":      ("generate_expert_report",      "expert_report.json",      ("expert",),      ()),
+    "coordinator": ("generate_coordinator_report", "coordinator_report.json", ("coordinator",), ()),
+    "summary":     ("generate_summary_report",     "summary_report.json",     (),
+                    ("dsqi", "expert", "coordinator")),
+}
+
+
+def norm_1_5(score):
+    return (score - 1) / 4
+
+
+def save_report(path: Path, data):
+    with tracing.span("write_json", file=path.name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        raw = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+        path.write_bytes(raw)
+        tracing.add("bytes_written", len(raw))
+        tracing.add("files_written")
+
+
+# ── Evaluation model ──
+
+def _read_layer(layer: str, paths: list[Path]) -> tuple[list[tuple[Path, dict]], str]:
+    """Read a layer's files once, returning parsed documents and a content hash."""
+    digest = hashlib.sha256()
+    docs = []
+    for path, raw in zip(paths, read_many(paths)):
+        digest.update(path.name.encode("utf-8") + b"\0" + raw + b"\0")
+        docs.append((path, raw, parse_json(raw)))
+    check_documents(layer, docs)
+    return [(path, doc) for path, _, doc in docs], digest.hexdigest()
+
+
+MODEL_LAYERS = ("dsqi", "expert", "coordinator")
+
+_kept_model = None  # (model, loaded with validation?) held by worker.py; see keep_model()
+
+
+def _load_layer(model: dict, layer: str):
+    """(Re)load one layer of the model in place."""
+    with tracing.span(f"load.{layer}"):
+        if layer == "dsqi":
+            dsqi_paths = [DSQI_DIR / f"dsqi-{slug}.json" for slug in ARTIFACT_SLUGS]
+            docs, digest = _read_layer("dsqi", [p for p in dsqi_paths if p.exists()])
+            by_name = {path.name: data for path, data in docs}
+            model["dsqi"] = {slug: by_name[f"dsqi-{slug}.json"]
+                             for slug in ARTIFACT_SLUGS if f"dsqi-{slug}.json" in by_name}
+            model["dsqi_missing"] = [p.name for p in dsqi_paths if p.name not in by_name]
+        else:
+            directory, pattern = {"expert": (EXPERT_DIR, "dsqi-review-*.json"),
+                                  "coordinator": (COORD_DIR, "dsqi-coordinator-*.json")}[layer]
+            docs, digest = _read_layer(layer, sorted(directory.glob(pattern)))
+            model[layer] = [data for _, data in docs]
+        model["hashes"][layer] = digest
+
+
+@tracing.traced()
+def load_model() -> dict:
+    """Load all three evaluation layers once.
+
+    Returns:
+        dict with keys:
+            dsqi          — slug → DSQI data (ARTIFACT_SLUGS order)
+            dsqi_missing  — expected DSQI file names not found
+            expert        — expert review dicts (sorted by file name)
+            coordinator   — coordinator review dicts (sorted by file name)
+            hashes        — layer name → sha256 of the layer's file contents
+
+    A model kept with keep_model() is returned as is, unless validation is
+    on and the kept model was loaded without it.
+    """
+    if _kept_model is not None and (_kept_model[1] or not validation_enabled()):
+        return _kept_model[0]
+    model = {"hashes": {}}
+    for layer in MODEL_LAYERS:
+        _load_layer(model, layer)
+    return model
+
+
+def keep_model(model: dict | None):
+    """Serve load_model() from a model the caller keeps current with refresh_model()."""
+    global _kept_model
+    _kept_model = None if model is None else (model, validation_enabled())
+
+
+@tracing.traced()
+def refresh_model(model: dict, layers) -> dict:
+    """Reload only the given layers of a model kept in memory (watch.py, worker.py)."""
+    for layer in layers:
+        if layer in MODEL_LAYERS:
+            _load_layer(model, layer)
+    return model
+
+
+# ── Shared aggregates ──
+
+def _e_stats(scores: list) -> dict:
+    return {
+        "raw_scores": scores,
+        "mean_raw": round(statistics.mean(scores), 2),
+        "mean_normalized": round(statistics.mean([norm_1_5(s) for s in scores]), 4),
+    }
+
+
+@tracing.traced()
+def compute_shared(model: dict) -> dict:
+    """Compute the aggregates that more than one report depends on.
+
+    Returns:
+        dict with "expert" and "coordinator" sections. Heuristic statistics
+        are keyed by HEURISTIC_KEYS; per-artifact sections only include
+        artifacts that have at least one observation.
+    """
+    observations = [
+        (review["reviewer"]["name"], artifact["artifact_id"], artifact)
+        for review in model["expert"]
+        for artifact in review["artifacts"]
+    ]
+
+    by_artifact = {}
+    for slug in ARTIFACT_SLUGS:
+        obs = [(r, a) for (r, s, a) in observations if s == slug]
+        if obs:
+            by_artifact[slug] = obs
+
+    heuristics, grand_means, icap_levels, e_scores = {}, {}, {}, {}
+    for slug, obs in by_artifact.items():
+        per_key = {}
+        for key in HEURISTIC_KEYS:
+            scores = [a["heuristics"][key] for (_, a) in obs]
+            per_key[key] = {
+                "scores": scores,
+                "mean": round(statistics.mean(scores), 2),
+                "min": min(scores),
+                "max": max(scores),
+            }
+        heuristics[slug] = per_key
+        grand_means[slug] = round(statistics.mean(
+            [s for stats in per_key.values() for s in stats["scores"]]
+        ), 2)
+        icap_levels[slug] = [a["icap"]["level"] for (_, a) in obs]
+        e_scores[slug] = {
+            "E1": _e_stats([a["dsqi"]["E1_conceptual_fidelity"]["score"] for (_, a) in obs]),
+            "E2": _e_stats([a["dsqi"]["E2_process_replicability"]["score"] for (_, a) in obs]),
+        }
+
+    heuristics_cross = {}
+    for key in HEURISTIC_KEYS:
+        scores = [a["heuristics"][key] for (_, _, a) in observations]
+        if not scores:
+            continue
+        heuristics_cross[key] = {
+            "grand_mean": round(statistics.mean(scores), 2),
+            "stdev": round(statistics.stdev(scores), 2) if len(scores) > 1 else 0,
+            "min": min(scores),
+            "max": max(scores),
+        }
+
+    all_expert_icap = [a["icap"]["level"] for (_, _, a) in observations]
+    e_cross = {}
+    if observations:
+        e_cross = {
+            "E1": _e_stats([a["dsqi"]["E1_conceptual_fidelity"]["score"] for (_, _, a) in observations]),
+            "E2": _e_stats([a["dsqi"]["E2_process_replicability"]["score"] for (_, _, a) in observations]),
+        }
+
+    all_coord_icap = [r["icap"]["Q4_engagement_mode"] for r in model["coordinator"]]
+
+    return {
+        "expert": {
+            "observations": observations,
+            "by_artifact": by_artifact,
+            "heuristics": heuristics,
+            "heuristic_grand_mean": grand_means,
+            "heuristics_cross": heuristics_cross,
+            "icap_levels": icap_levels,
+            "icap_distribution": {level: all_expert_icap.count(level) for level in ICAP_ORDER},
+            "e_scores": e_scores,
+            "e_cross": e_cross,
+        },
+        "coordinator": {
+            "icap_distribution": {level: all_coord_icap.count(level) for level in ICAP_ORDER},
+        },
+    }
+
+
+# ── Stamps ──
+
+def _load_stamps() -> dict:
+    if not STAMP_PATH.exists():
+        return {}
+    try:
+        data = load_json(STAMP_PATH)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != STAMP_VERSION:
+        return {}
+    return data.get("targets", {})
+
+
+def _save_stamps(stamps: dict):
+    save_report(STAMP_PATH, {"version": STAMP_VERSION, "targets": stamps})
+
+
+def _source_hash(module_name: str) -> str:
+    path = Path(__file__).resolve().parent / f"{module_name}.py"
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# Modules every target depends on: the builder itself, the loader that builds
+# the records the generators read, and the normalisation thresholds
+BUILDER_MODULES = ("report_build", "data_loader", "dsqi_norm")
+
+
+def compute_stamps(model: dict, order: list[str]) -> dict:
+    """Hash each target's inputs: model layers, generator + builder source, upstream stamps."""
+    builder = "".join(_source_hash(m) for m in BUILDER_MODULES)
+    stamps = {}
+    for name in order:
+        module_name, _, layers, deps = TARGETS[name]
+        digest = hashlib.sha256()
+        digest.update(builder.encode())
+        digest.update(_source_hash(module_name).encode())
+        for layer in layers:
+            digest.update(f"{layer}:{model['hashes'][layer]}".encode())
+        for dep in deps:
+            digest.update(f"{dep}:{stamps[dep]}".encode())
+        stamps[name] = digest.hexdigest()
+    return stamps
+
+
+# ── Scheduling ──
+
+def resolve_order(names: list[str]) -> list[str]:
+    """Return the requested targets plus their upstream targets, dependencies first."""
+    order = []
+
+    def visit(name):
+        if name in order:
+            return
+        for dep in TARGETS[name][3]:
+            visit(dep)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def _build_one(name: str, model: dict, shared: dict, deps: dict) -> dict:
+    with tracing.span(f"report.{name}"):
+        module = __import__(TARGETS[name][0])
+        with tracing.span("build_report"):
+            report = module.build_report(model, shared, deps)
+        save_report(REPORT_DIR / TARGETS[name][1], report)
+        return report
+
+
+def build_targets(names: list[str] | None = None, force: bool = False,
+                  jobs: int | None = None, model: dict | None = None) -> dict[str, str]:
+    """Build report targets, skipping any whose inputs are unchanged.
+
+    Args:
+        names: targets to build (default: all). Upstream targets are pulled in
+               and built only if stale.
+        force: rebuild the requested targets even if their stamps match.
+        jobs:  worker threads (default: one per independent target).
+        model: an already loaded model (default: load_model()).
+
+    Returns:
+        dict mapping target → "built" | "skipped" | "failed" | "blocked"
+    """
+    requested = list(names or TARGETS)
+    order = resolve_order(requested)
+
+    model = load_model() if model is None else model
+    stamps = compute_stamps(model, order)
+    previous = _load_stamps()
+
+    status = {}
+    pending = []
+    for name in order:
+        output = REPORT_DIR / TARGETS[name][1]
+        forced = force and name in requested
+        if not forced and previous.get(name) == stamps[name] and output.exists():
+            status[name] = "skipped"
+        else:
+            pending.append(name)
+
+    for name in order:
+        if status.get(name) == "skipped":
+            print(f"  · {TARGETS[name][1]:<26} up to date (skipped)")
+    if status:
+        print()
+
+    if not pending:
+        return {name: status[name] for name in order}
+
+    shared = compute_shared(model)
+    reports = {}
+
+    def dep_reports(name):
+        deps = {}
+        for dep in TARGETS[name][3]:
+            if dep not in reports:
+                reports[dep] = load_json(REPORT_DIR / TARGETS[dep][1])
+            deps[dep] = reports[dep]
+        return deps
+
+    workers = jobs or max(1, sum(1 for n in pending if not TARGETS[n][3]))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            for name in list(pending):
+                deps = TARGETS[name][3]
+                if any(status.get(d) in ("failed", "blocked") for d in deps):
+                    status[name] = "blocked"
+                    pending.remove(name)
+                    print(f"  ✗ {TARGETS[name][1]:<26} blocked by failed upstream target")
+                    continue
+                if all(status.get(d) in ("built", "skipped") for d in deps):
+                    pending.remove(name)
+                    future = pool.submit(_build_one, name, model, shared, dep_reports(name))
+                    running[future] = (name, time.time())
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, started = running.pop(future)
+                try:
+                    reports[name] = future.result()
+                except Exception as e:
+                    status[name] = "failed"
+                    print(f"  ✗ {TARGETS[name][1]:<26} failed: {e}")
+                    continue
+                status[name] = "built"
+                previous[name] = stamps[name]
+                __import__(TARGETS[name][0]).print_report(reports[name], model)
+                out_path = REPORT_DIR / TARGETS[name][1]
+                print(f"\n  → Report saved to {out_path.relative_to(ROOT)}"
+                      f"  ({time.time() - started:.2f}s)\n")
+
+    _save_stamps(previous)
+    return {name: status[name] for name in order}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the core DSQI / expert / coordinator / summary reports")
+    parser.add_argument("--only", nargs="+", choices=list(TARGETS), metavar="TARGET",
+                        help=f"Build only these targets ({', '.join(TARGETS)})")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild selected targets even if inputs are unchanged")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Number of worker threads (default: one per independent target)")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate input layers against data/schemas/ while they are read")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "report_build")
+    if args.validate:
+        enable_validation()
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Report Build — Disposable Software Study                ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    start = time.time()
+    try:
+        status = build_targets(args.only, force=args.force, jobs=args.jobs)
+    except DataValidationError as e:
+        print(f"  ✗ Invalid input: {e}")
+        sys.exit(1)
+
+    print("═" * 60)
+    for name, state in status.items():
+        marker = {"built": "✓", "skipped": "·"}.get(state, "✗")
+        print(f"  {marker} {name:<12} {state}")
+    print(f"\n  Total time: {time.time() - start:.2f}s\n")
+
+    if any(state in ("failed", "blocked") for state in status.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import worker
+    worker.dispatch("report_build", main)
@@ -12,6 +12,8 @@ Usage:
     python analysis/run_extended.py --skip H I   # Skip specific analyses
     python analysis/run_extended.py --no-figures  # Suppress figure generation
     python analysis/run_extended.py --dry-run    # Dry-run for J (extract only)
+    python analysis/run_extended.py --trace      # Write Chrome trace + Prometheus metrics
+    python analysis/run_extended.py --memtrack   # Report peak memory per analysis
 """
 
 import argparse
@@ -22,6 +24,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+import data_loader
+import figure_pool
+import memtrack
+import tracing
+
 ANALYSES = {
     "A": ("extended_descriptive",       "Descriptive Statistics"),
     "B": ("extended_irr",               "Inter-Rater Reliability"),
@@ -35,8 +42,24 @@ ANALYSES = {
     "J": ("extended_qualitative",       "AI-Assisted Thematic Analysis"),
 }
 
+# Data layers each analysis reads (data_loader layer names); watch.py
+# re-runs an analysis only when one of them changed
+INPUTS = {
+    "A": ("registry", "dsqi", "expert", "coordinator"),
+    "B": ("expert",),
+    "C": ("expert",),
+    "D": ("dsqi", "expert", "coordinator"),
+    "E": ("registry", "coordinator"),
+    "F": ("expert",),
+    "G": ("registry", "dsqi", "sessions"),
+    "H": ("dsqi",),
+    "I": ("registry", "dsqi", "expert", "coordinator"),
+    "J": ("expert", "coordinator"),
+}
+
 
-def run_analysis(key, module_name, label, verbose=False, no_figures=False, dry_run=False):
+def run_analysis(key, module_name, label, verbose=False, no_figures=False, dry_run=False,
+                 memory=False):
     """Import and run a single analysis module."""
     print()
     print(f"{'─' * 60}")
@@ -59,10 +82,17 @@ def run_analysis(key, module_name, label, verbose=False, no_figures=False, dry_r
             kwargs["dry_run"] = dry_run
 
         start = time.time()
-        result = run_fn(**kwargs)
+        with tracing.span(f"analysis.{key}", module=module_name, label=label):
+            if memory:
+                with memtrack.Tracker() as mem:
+                    result = run_fn(**kwargs)
+            else:
+                result = run_fn(**kwargs)
         elapsed = time.time() - start
 
         print(f"\n  ✓ Analysis {key} completed in {elapsed:.1f}s")
+        if memory:
+            print(memtrack.format_report(mem.report()))
         return True
 
     except Exception as e:
@@ -98,7 +128,15 @@ Analyses:
                         help="Suppress figure generation")
     parser.add_argument("--dry-run", action="store_true",
                         help="Dry-run mode for Analysis J (extract segments only)")
+    parser.add_argument("--memtrack", action="store_true",
+                        help="Report peak memory and top allocation sites per analysis")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate data against data/schemas/ while it is loaded")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "run_extended")
+    if args.validate:
+        data_loader.enable_validation()
 
     # Determine which analyses to run
     if args.only:
@@ -129,6 +167,8 @@ Analyses:
     print()
     print(f"  Analyses to run: {', '.join(keys)}")
     print(f"  Figures: {'disabled' if args.no_figures else 'enabled'}")
+    if data_loader.validation_enabled():
+        print("  Validation: enabled (data/schemas/)")
     if "J" in keys:
         print(f"  Qualitative: {'dry-run' if args.dry_run else 'LIVE (requires API key)'}")
     print()
@@ -143,9 +183,21 @@ Analyses:
             verbose=args.verbose,
             no_figures=args.no_figures,
             dry_run=args.dry_run,
+            memory=args.memtrack,
         )
         results[key] = success
 
+    # ── Collect background figures ──
+    figure_stats = None
+    if not args.no_figures:
+        print()
+        print(f"{'─' * 60}")
+        print("  Waiting for figures")
+        print(f"{'─' * 60}")
+        print()
+        with tracing.span("figures.wait"):
+            figure_stats = figure_pool.wait()
+
     total_elapsed = time.time() - total_start
 
     # ── Summary ──
@@ -163,10 +215,13 @@ Analyses:
 
     print()
     print(f"  Passed: {passed}/{len(results)}  |  Failed: {failed}/{len(results)}")
+    if figure_stats:
+        print(f"  Figures: {figure_stats['rendered']} rendered, "
+              f"{figure_stats['skipped']} unchanged, {figure_stats['failed']} failed")
     print(f"  Total time: {total_elapsed:.1f}s")
     print()
 
-    if failed:
+    if failed or (figure_stats and figure_stats["failed"]):
         sys.exit(1)
 
 
@@ -9,7 +9,7 @@ Usage:
 
 What it does:
     1. Records an exact ISO 8601 closing timestamp.
-    2. Counts lines of code in the artifact's src/ directory.
+    2. Counts lines of code in the artifact's src/ tree (source_scan.py).
     3. Fetches WakaTime stats for the project (today) and saves the raw response.
     4. Updates the open session entry in the development log with:
        - closed_timestamp, duration_minutes, files_produced, total_lines, wakatime block
@@ -23,27 +23,15 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from source_scan import scan
+import tracing
+
 STUDY_ROOT = Path(__file__).resolve().parent.parent
 REGISTRY_PATH = STUDY_ROOT / "data" / "artifact-registry.json"
 DEV_LOGS_DIR = STUDY_ROOT / "data" / "development-logs"
 ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
 
-# Language detection by extension
-EXT_LANG = {
-    ".html": "HTML",
-    ".htm": "HTML",
-    ".css": "CSS",
-    ".js": "JavaScript",
-    ".ts": "TypeScript",
-    ".jsx": "JSX",
-    ".tsx": "TSX",
-    ".py": "Python",
-    ".json": "JSON",
-    ".md": "Markdown",
-    ".svg": "SVG",
-    ".xml": "XML",
-}
-
 
 def load_json(path: Path) -> dict | list:
     return json.loads(path.read_text(encoding="utf-8"))
@@ -61,16 +49,10 @@ def get_artifact(registry: dict, artifact_id: int) -> dict | None:
 
 
 def count_source_lines(src_dir: Path) -> list[dict]:
-    """Count lines per file in a src/ directory. Returns list of {file, lines, language}."""
-    if not src_dir.exists():
-        return []
-    results = []
-    for f in sorted(src_dir.iterdir()):
-        if f.is_file() and not f.name.startswith("."):
-            lines = len(f.read_text(encoding="utf-8", errors="replace").splitlines())
-            lang = EXT_LANG.get(f.suffix.lower(), f.suffix.lstrip(".").upper() or "Unknown")
-            results.append({"file": f.name, "lines": lines, "language": lang})
-    return results
+    """Count lines per file under a src/ directory (recursively, skipping ignored
+    files). Returns list of {file, lines, language}; file is relative to src_dir."""
+    return [{"file": f["rel"], "lines": f["lines"], "language": f["language"]}
+            for f in scan(src_dir)]
 
 
 def fetch_wakatime(project: str, query_date: str) -> dict | None:
@@ -103,7 +85,9 @@ def main():
     parser.add_argument("--deps", type=int, default=0, help="Number of external dependencies (default: 0)")
     parser.add_argument("--ai-ratio", type=float, default=1.0, help="AI generation ratio 0.0-1.0 (default: 1.0)")
     parser.add_argument("--skip-wakatime", action="store_true", help="Skip WakaTime fetch")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "session_close")
 
     now_local = datetime.now().astimezone()
     now_utc = datetime.now(timezone.utc)
@@ -19,6 +19,9 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
+
 STUDY_ROOT = Path(__file__).resolve().parent.parent
 REGISTRY_PATH = STUDY_ROOT / "data" / "artifact-registry.json"
 DEV_LOGS_DIR = STUDY_ROOT / "data" / "development-logs"
@@ -58,7 +61,9 @@ def main():
     parser = argparse.ArgumentParser(description="Start a new development session")
     parser.add_argument("--artifact", type=int, required=True, help="Artifact ID (1-5)")
     parser.add_argument("--ai-tool", default="GitHub Copilot with Claude Opus 4.6", help="AI tool being used")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "session_start")
 
     now = datetime.now(timezone.utc)
     now_local = datetime.now().astimezone()
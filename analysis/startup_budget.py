@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+startup_budget.py — Check import-time cost of every package.json entry point.
+
+For each ``python analysis/<script>.py`` command in package.json, imports the
+script's module in a fresh interpreter under ``python -X importtime`` and
+reads the module's cumulative import time. Heavy dependencies (numpy,
+tabulate, jsonschema, matplotlib, ...) are expected to be deferred via
+lazy_import.py, so importing an entry point should stay well under budget.
+
+Exits with status 1 if any entry point exceeds its budget.
+
+Usage:
+    python analysis/startup_budget.py                 # Check all entry points
+    python analysis/startup_budget.py --budget-ms 80  # Tighter default budget
+    python analysis/startup_budget.py --top 5         # Show slowest imports
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_JSON = ROOT / "package.json"
+
+DEFAULT_BUDGET_MS = 120
+
+# Per-module overrides (ms) for entry points with unavoidable stdlib cost
+BUDGETS_MS = {}
+
+SCRIPT_RE = re.compile(r"\bpython3?\s+analysis/([\w]+)\.py\b")
+
+
+def entry_points() -> dict[str, list[str]]:
+    """Map module name → npm script names that run it."""
+    scripts = json.loads(PACKAGE_JSON.read_text(encoding="utf-8")).get("scripts", {})
+    modules = {}
+    for name, command in scripts.items():
+        m = SCRIPT_RE.search(command)
+        if m:
+            modules.setdefault(m.group(1), []).append(name)
+    return modules
+
+
+def measure(module: str) -> tuple[float, list[tuple[float, str]]]:
+    """Import a module under -X importtime; return (cumulative ms, [(ms, name)] of its imports)."""
+    code = f"import sys; sys.path.insert(0, {str(ROOT / 'analysis')!r}); import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+
+    rows = []
+    total = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        rows.append((int(cumulative_us) / 1000, name.rstrip()))
+        if name.strip() == module and not name.startswith("  "):
+            total = int(cumulative_us) / 1000
+    if total is None:
+        raise RuntimeError(f"{module} not found in importtime output")
+    return total, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time budget of package.json entry points")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Default per-entry-point budget in ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Measurements per entry point; the fastest is used (default: 3)")
+    parser.add_argument("--top", type=int, default=0, metavar="N",
+                        help="Show the N slowest imports for each entry point")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "startup_budget")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Startup Budget Check                                    ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    over = []
+    for module, scripts in sorted(entry_points().items()):
+        budget = BUDGETS_MS.get(module, args.budget_ms)
+        try:
+            samples = [measure(module) for _ in range(max(1, args.repeat))]
+        except RuntimeError as e:
+            print(f"  ✗ {module:<30} import failed: {e}")
+            over.append(module)
+            continue
+        total, rows = min(samples, key=lambda s: s[0])
+        ok = total <= budget
+        marker = "✓" if ok else "✗"
+        print(f"  {marker} {module:<30} {total:7.1f} ms  (budget {budget:.0f} ms)  [{', '.join(scripts)}]")
+        if not ok:
+            over.append(module)
+        if args.top:
+            for ms, name in sorted(rows, reverse=True)[1:args.top + 1]:
+                print(f"      {ms:7.1f} ms  {name.strip()}")
+
+    print()
+    if over:
+        print(f"  ✗ Over budget: {', '.join(over)}")
+        sys.exit(1)
+    print("  ✓ All entry points within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,15 @@ Usage:
     npm run status
 """
 
+import argparse
 import json
 import os
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
+
 # Resolve paths relative to this script
 ROOT = Path(__file__).resolve().parent.parent
 REGISTRY_PATH = ROOT / "data" / "artifact-registry.json"
@@ -86,6 +90,11 @@ def count_dev_sessions(slug: str) -> int:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Print the study progress dashboard")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "study_status")
+
     registry = load_registry()
     study = registry["study"]
 
@@ -124,4 +133,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("study_status", main)
@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+"""
+synth_data.py — Generate a synthetic study tree at arbitrary scale.
+
+Writes a self-contained copy of the study's data layout for N artifacts
+and R expert reviewers, in the same shape the loaders and collectors read:
+
+    <out>/data/artifact-registry.json
+    <out>/data/development-logs/sessions-{slug}.json
+    <out>/data/evaluations/layer2-expert-review/dsqi-review-{reviewer}-{date}.json
+    <out>/data/evaluations/layer3-coordinator-review/dsqi-coordinator-{name}-{slug}-{date}.json
+    <out>/data/static-analysis/{slug}/cloc-output.json   (cloc-compatible, counted here)
+    <out>/artifacts/{slug}/src/                         (HTML, CSS and JS sources)
+
+Layer 1 DSQI files are then produced the way the real study produces them:
+dsqi_collect.py (with --reuse-cloc) for every artifact, then dsqi_score.py,
+both run against the new tree via DSQI_STUDY_ROOT. Use --raw-only to stop
+before that step (bench.py times it separately).
+
+The finished tree is then checked against data/schemas/ and the run fails
+on any error. The one exception is the constraints that encode the real
+study's five artifacts (IDs 1–5, two-digit slug prefixes; SCALE_LIMITS),
+which a tree of another size necessarily exceeds. A tree of five
+artifacts passes validate_data.py unchanged.
+
+Point any analysis script at the tree with the same variable:
+    DSQI_STUDY_ROOT=/tmp/synth-200 python analysis/run_extended.py --skip J
+
+Output is deterministic for a given --seed.
+
+Usage:
+    python analysis/synth_data.py --artifacts 200 --reviewers 8 --out /tmp/synth-200
+    python analysis/synth_data.py --artifacts 50 --out /tmp/synth-50 --raw-only
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import STUDY_ROOT_ENV, HEURISTIC_KEYS
+from lazy_import import lazy_module
+import tracing
+
+try:
+    jsonschema = lazy_module("jsonschema")
+except ImportError:
+    jsonschema = None
+
+ANALYSIS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_SEED = 42
+ICAP_LEVELS = ["passive", "active", "constructive", "interactive"]
+START_DATE = datetime(2026, 2, 18, 9, 0, tzinfo=timezone.utc)
+
+# ── Vocabulary ──
+
+TOPICS = [
+    "Recursion", "Binary Search", "Hash Table", "Graph Traversal", "Regex",
+    "Pointer Arithmetic", "Concurrency", "Deadlock", "Normalisation", "Git Branching",
+    "Big-O", "Sorting", "Stack Frame", "Closure", "Event Loop", "TCP Handshake",
+    "Cache Locality", "Finite Automaton", "Type Inference", "Unit Testing",
+]
+KINDS = ["Visualiser", "Trainer", "Simulator", "Gauntlet", "Playground", "Explorer"]
+MODULES = [
+    ("CS4013", "Object-Oriented Development"), ("CS4115", "Data Structures and Algorithms"),
+    ("CS4416", "Database Systems"), ("CS5703", "Software Quality"),
+    ("CS4457", "Project Management"), ("CS4023", "Operating Systems"),
+]
+FIRST_NAMES = ["Aoife", "Brian", "Ciara", "Declan", "Eimear", "Fionn", "Grainne", "Hugh",
+               "Isolde", "Jack", "Kate", "Liam", "Maeve", "Niall", "Orla", "Padraig"]
+LAST_NAMES = ["Byrne", "Walsh", "Ryan", "Kelly", "Doyle", "Murphy", "Nolan", "Quinn",
+              "Burke", "Healy", "Lynch", "Power", "Ward", "Dunne", "Kenny", "Moran"]
+ROLES = ["Software Engineer", "Lecturer", "Teaching Assistant", "Engineering Manager"]
+EXPERTISE = ["software-engineering", "cs-education", "both"]
+POSITIVE = [
+    "The {topic} concept is made tangible within minutes.",
+    "Immediate feedback keeps students working through the {topic} exercises.",
+    "Levels escalate sensibly and the scaffolding fades at the right pace.",
+    "It is a compact tool that would slot into a single tutorial.",
+    "Students have to construct their own answer rather than just watch.",
+]
+NEGATIVE = [
+    "Layout breaks on small screens.",
+    "Some error messages do not explain what went wrong.",
+    "The final level jumps in difficulty compared to the earlier ones.",
+    "There is no way to reset progress without reloading the page.",
+    "Instructions assume prior knowledge of {topic}.",
+]
+COMMENTS = ["", "", "Would like a short worked example at the start.",
+            "Consider an instructor view to see class progress.", "n/a"]
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def clamp_score(value: float) -> int:
+    return max(1, min(5, round(value)))
+
+
+# ── Artifact sources ──
+
+def js_source(rng: random.Random, n_functions: int) -> str:
+    """A JS file whose functions carry a realistic spread of decision points."""
+    lines = ["// Generated by synth_data.py", "'use strict';", ""]
+    for i in range(n_functions):
+        lines.append(f"function step{i}(state, input) {{")
+        lines.append("  let score = 0;")
+        for _ in range(rng.randint(0, 6)):
+            cond = rng.choice(["input.value > state.limit", "state.ready && input.ok",
+                               "input.kind === 'answer' || state.retry", "!state.locked"])
+            lines.append(f"  if ({cond}) {{")
+            lines.append("    score += 1;")
+            lines.append("  }")
+        if rng.random() < 0.3:
+            lines.append("  for (let k = 0; k < state.items.length; k++) {")
+            lines.append("    score += state.items[k] ? 1 : 0;")
+            lines.append("  }")
+        lines.append("  return score;")
+        lines.append("}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def css_source(rng: random.Random, n_rules: int) -> str:
+    lines = ["/* Generated by synth_data.py */", ""]
+    for i in range(n_rules):
+        lines.append(f".panel-{i} {{")
+        lines.append(f"  margin: {rng.randint(0, 24)}px;")
+        lines.append(f"  color: #{rng.randrange(0x1000000):06x};")
+        lines.append("}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def html_source(name: str, scripts: list[str]) -> str:
+    tags = "\n".join(f'  <script src="{s}"></script>' for s in scripts)
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "  <!-- Generated by synth_data.py -->\n"
+        f"  <meta charset=\"utf-8\">\n  <title>{name}</title>\n"
+        "  <link rel=\"stylesheet\" href=\"style.css\">\n</head>\n<body>\n"
+        "  <main id=\"app\"></main>\n"
+        f"{tags}\n</body>\n</html>\n"
+    )
+
+
+def count_lines(text: str, comment_prefixes: tuple[str, ...]) -> tuple[int, int, int]:
+    """(blank, comment, code) line counts, in the manner of cloc."""
+    blank = comment = code = 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            blank += 1
+        elif stripped.startswith(comment_prefixes):
+            comment += 1
+        else:
+            code += 1
+    return blank, comment, code
+
+
+def write_sources(src_dir: Path, name: str, rng: random.Random) -> dict:
+    """Write one artifact's sources; return cloc-compatible counts."""
+    src_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    scripts = [f"module{i}.js" for i in range(rng.randint(1, 4))]
+    for script in scripts:
+        files[script] = ("JavaScript", js_source(rng, rng.randint(5, 60)), ("//",))
+    files["style.css"] = ("CSS", css_source(rng, rng.randint(10, 120)), ("/*",))
+    files["index.html"] = ("HTML", html_source(name, scripts), ("<!--",))
+
+    dependencies = rng.choice([0, 0, 0, 0, 1, 2, 4])
+    if dependencies:
+        pkg = {
+            "name": slugify(name),
+            "private": True,
+            "dependencies": {f"synthetic-dep-{i}": "^1.0.0" for i in range(dependencies)},
+        }
+        if rng.random() < 0.5:
+            pkg["scripts"] = {"build": "vite build"}
+        (src_dir / "package.json").write_text(json.dumps(pkg, indent=2) + "\n", encoding="utf-8")
+
+    cloc = {}
+    total_lines = 0
+    for filename, (language, text, prefixes) in files.items():
+        (src_dir / filename).write_text(text, encoding="utf-8")
+        blank, comment, code = count_lines(text, prefixes)
+        entry = cloc.setdefault(language, {"nFiles": 0, "blank": 0, "comment": 0, "code": 0})
+        entry["nFiles"] += 1
+        entry["blank"] += blank
+        entry["comment"] += comment
+        entry["code"] += code
+        total_lines += blank + comment + code
+
+    summary = {key: sum(v[key] for v in cloc.values()) for key in ("blank", "comment", "code", "nFiles")}
+    return {
+        "header": {
+            "cloc_url": "github.com/AlDanial/cloc",
+            "cloc_version": "synthetic",
+            "elapsed_seconds": 0.0,
+            "n_files": summary["nFiles"],
+            "n_lines": total_lines,
+            "files_per_second": 0.0,
+            "lines_per_second": 0.0,
+        },
+        **cloc,
+        "SUM": summary,
+    }
+
+
+# ── Study documents ──
+
+def person(rng: random.Random, used: set) -> str:
+    while True:
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if name not in used:
+            used.add(name)
+            return name
+        if len(used) >= len(FIRST_NAMES) * len(LAST_NAMES):
+            name = f"{name} {len(used)}"
+            used.add(name)
+            return name
+
+
+def make_artifacts(n: int, rng: random.Random) -> list[dict]:
+    width = max(2, len(str(n)))
+    artifacts = []
+    for i in range(1, n + 1):
+        topic, kind = rng.choice(TOPICS), rng.choice(KINDS)
+        name = f"The {topic} {kind} {i}"
+        module_code, module_name = rng.choice(MODULES)
+        artifacts.append({
+            "id": i,
+            "name": name,
+            "slug": f"{i:0{width}d}-{slugify(f'{topic} {kind}')}",
+            "topic": topic,
+            "module": (module_code, module_name),
+            "quality": rng.uniform(2.5, 4.8),  # latent quality driving review scores
+            "start": START_DATE + timedelta(hours=6 * i),
+        })
+    return artifacts
+
+
+def make_sessions(artifact: dict, code_lines: int, rng: random.Random) -> list[dict]:
+    n_sessions = rng.randint(1, 4)
+    sessions, start = [], artifact["start"]
+    remaining = code_lines
+    for k in range(1, n_sessions + 1):
+        lines = remaining if k == n_sessions else rng.randint(0, remaining)
+        remaining -= lines
+        human = round(lines * rng.choice([0, 0, 0.05, 0.2]))
+        minutes = rng.randint(10, 120)
+        sessions.append({
+            "artifact_id": artifact["id"],
+            "artifact_slug": artifact["slug"],
+            "session_number": k,
+            "timestamp": start.isoformat(),
+            "date": start.strftime("%Y-%m-%d"),
+            "duration_minutes": minutes,
+            "ai_tools_used": ["GitHub Copilot"],
+            "prompts": [{
+                "prompt_number": 1,
+                "timestamp": start.isoformat(),
+                "type": "implementation",
+                "summary": f"Asked AI to implement the {artifact['topic']} exercise.",
+                "outcome": "Source files generated.",
+            }],
+            "prompt_strategy": "Single high-level prompt followed by refinements.",
+            "outcome": "Working build.",
+            "observations": "",
+            "code_written_lines": human,
+            "code_ai_generated_lines": lines - human,
+            "prompts_count": 1,
+            "session_closed": True,
+            "closed_timestamp": (start + timedelta(minutes=minutes)).isoformat(),
+            "total_lines": lines,
+            "wakatime": {
+                "project": artifact["slug"],
+                "date": start.strftime("%Y-%m-%d"),
+                "total_seconds": round(minutes * 60 * rng.uniform(0.1, 0.6), 3),
+            },
+        })
+        start += timedelta(minutes=minutes + rng.randint(30, 600))
+    return sessions
+
+
+def make_expert_review(reviewer: dict, artifacts: list[dict], rng: random.Random) -> dict:
+    reviews = []
+    for a in artifacts:
+        q = a["quality"] + reviewer["bias"]
+
+        def score():
+            return clamp_score(q + rng.gauss(0, 0.7))
+
+        fill = {"topic": a["topic"]}
+        reviews.append({
+            "artifact_id": a["slug"],
+            "icap": {
+                "level": ICAP_LEVELS[min(3, max(0, int(q - 1.5 + rng.gauss(0, 0.6))))],
+                "justification": rng.choice(POSITIVE).format(**fill),
+            },
+            "constructionism": {
+                "meaningful_artifact": {"score": score(), "justification": rng.choice(POSITIVE).format(**fill)},
+                "learning_through_building": {"score": score(), "justification": rng.choice(POSITIVE).format(**fill)},
+            },
+            "heuristics": {**{k: score() for k in HEURISTIC_KEYS},
+                           "comments": rng.choice(NEGATIVE).format(**fill)},
+            "dsqi": {
+                "E1_conceptual_fidelity": {"score": score(), "justification": rng.choice(POSITIVE).format(**fill)},
+                "E2_process_replicability": {"score": score(), "justification": rng.choice(POSITIVE).format(**fill)},
+            },
+            "open_ended": {
+                "most_positive": rng.choice(POSITIVE).format(**fill),
+                "most_negative": rng.choice(NEGATIVE).format(**fill),
+                "other_comments": rng.choice(COMMENTS),
+            },
+        })
+    return {
+        "schema": "dsqi-expert-review-v1",
+        "timestamp": reviewer["date"].isoformat(),
+        "reviewer": {
+            "name": reviewer["name"],
+            "email": f"{slugify(reviewer['name']).replace('-', '.')}@example.org",
+            "role": reviewer["role"],
+            "experience_years": reviewer["experience_years"],
+            "institution": "Synthetic University",
+        },
+        "artifacts": reviews,
+    }
+
+
+def make_coordinator_review(artifact: dict, name: str, date: datetime, rng: random.Random) -> dict:
+    q = artifact["quality"]
+    q1, q2, q3 = (clamp_score(q + rng.gauss(0, 0.6)) for _ in range(3))
+    fill = {"topic": artifact["topic"]}
+    return {
+        "schema": "dsqi-coordinator-review-v1",
+        "timestamp": date.isoformat(),
+        "coordinator": {
+            "name": name,
+            "email": f"{slugify(name).replace('-', '.')}@example.org",
+            "department": "Synthetic Department of Computing",
+        },
+        "artifact_id": artifact["slug"],
+        "artifact_name": artifact["name"],
+        "module": artifact["module"][0],
+        "module_name": artifact["module"][1],
+        "pedagogical_alignment": {
+            "Q1_curriculum_relevance": q1,
+            "Q2_concept_challenge": q2,
+            "Q3_objective_coverage": q3,
+            "P1_average": round((q1 + q2 + q3) / 3, 2),
+        },
+        "icap": {"Q4_engagement_mode": ICAP_LEVELS[min(3, max(0, int(q - 1.5 + rng.gauss(0, 0.6))))]},
+        "adoption_intention": {
+            "Q5_ease_of_integration": clamp_score(q + rng.gauss(0, 0.8)),
+            "Q6_likelihood_of_use": clamp_score(q + rng.gauss(0, 0.8)),
+        },
+        "open_ended": {
+            "Q7_most_significant_benefit": rng.choice(POSITIVE).format(**fill),
+            "Q8_most_significant_drawback": rng.choice(NEGATIVE).format(**fill),
+        },
+    }
+
+
+def registry_entry(a: dict, sessions: list[dict], cloc: dict, dependencies: int, reviewers: int) -> dict:
+    end = datetime.fromisoformat(sessions[-1]["closed_timestamp"])
+    total_lines = sum(s["total_lines"] for s in sessions)
+    ai_lines = sum(s["code_ai_generated_lines"] for s in sessions)
+    return {
+        "id": a["id"],
+        "name": a["name"],
+        "slug": a["slug"],
+        "learning_objective": f"Understand {a['topic'].lower()}",
+        "target_module": {
+            "code": a["module"][0],
+            "name": a["module"][1],
+            "coordinator": None,
+            "coordinator_email": None,
+        },
+        "status": "coordinator-reviewed",
+        "deployment_url": None,
+        "repository_url": None,
+        "tech_stack": ["HTML", "CSS", "JavaScript"],
+        "development": {
+            "start_date": a["start"].strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end_date": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "total_sessions": len(sessions),
+            "total_duration_minutes": sum(s["duration_minutes"] for s in sessions),
+            "lines_of_code": cloc["SUM"]["code"],
+            "ai_generation_ratio": round(ai_lines / total_lines, 4) if total_lines else 1.0,
+            "dependency_count": dependencies,
+            "wakatime_active_seconds": round(sum(s["wakatime"]["total_seconds"] for s in sessions), 3),
+        },
+        "evaluation": {
+            "dsqi_score": None,
+            "dsqi_completed": False,
+            "dsqi_partial": {},
+            "expert_reviews_received": 0,
+            "expert_reviews_target": reviewers,
+            "coordinator_review_received": False,
+        },
+    }
+
+
+# ── Generation ──
+
+def write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+@tracing.traced()
+def generate(out: Path, n_artifacts: int, n_reviewers: int, seed: int = DEFAULT_SEED) -> dict:
+    """Write the raw (pre-DSQI) synthetic study tree. Returns file counts."""
+    rng = random.Random(seed)
+    data = out / "data"
+    artifacts = make_artifacts(n_artifacts, rng)
+    used_names = set()
+
+    entries = []
+    for a in artifacts:
+        src_dir = out / "artifacts" / a["slug"] / "src"
+        cloc = write_sources(src_dir, a["name"], rng)
+        write_json(data / "static-analysis" / a["slug"] / "cloc-output.json", cloc)
+        sessions = make_sessions(a, cloc["SUM"]["code"], rng)
+        write_json(data / "development-logs" / f"sessions-{a['slug']}.json", sessions)
+        pkg = src_dir / "package.json"
+        dependencies = len(json.loads(pkg.read_text())["dependencies"]) if pkg.exists() else 0
+        entries.append(registry_entry(a, sessions, cloc, dependencies, n_reviewers))
+
+    reviewers = []
+    for r in range(n_reviewers):
+        reviewers.append({
+            "name": person(rng, used_names),
+            "role": rng.choice(ROLES),
+            "experience_years": rng.randint(2, 30),
+            "bias": rng.gauss(0, 0.4),
+            "date": START_DATE + timedelta(days=30 + r),
+        })
+    for reviewer in reviewers:
+        review = make_expert_review(reviewer, artifacts, rng)
+        name = f"dsqi-review-{slugify(reviewer['name'])}-{reviewer['date']:%Y-%m-%d}.json"
+        write_json(data / "evaluations" / "layer2-expert-review" / name, review)
+
+    coordinators = [person(rng, used_names) for _ in range(max(1, n_artifacts // 10))]
+    for a in artifacts:
+        name = rng.choice(coordinators)
+        date = a["start"] + timedelta(days=rng.randint(1, 20))
+        review = make_coordinator_review(a, name, date, rng)
+        filename = f"dsqi-coordinator-{slugify(name)}-{a['slug']}-{date:%Y-%m-%d}.json"
+        write_json(data / "evaluations" / "layer3-coordinator-review" / filename, review)
+
+    write_json(data / "artifact-registry.json", {
+        "study": {
+            "title": f"Synthetic study ({n_artifacts} artifacts, {n_reviewers} reviewers, seed {seed})",
+            "methodology": "Design-Based Research (DBR)",
+            "target_journal": "(synthetic)",
+            "start_date": START_DATE.strftime("%Y-%m-%d"),
+            "current_phase": "analysis",
+        },
+        "expert_reviewers": [{
+            "id": f"R{k}",
+            "name": r["name"],
+            "affiliation": "Synthetic University",
+            "expertise": EXPERTISE[(k - 1) % len(EXPERTISE)],
+            "assigned_artifacts": [a["id"] for a in artifacts],
+            "reviews_submitted": len(artifacts),
+        } for k, r in enumerate(reviewers, start=1)],
+        "current_phase": "analysis",
+        "artifacts": entries,
+    })
+    (data / "evaluations" / "layer1-dsqi").mkdir(parents=True, exist_ok=True)
+
+    return {"artifacts": n_artifacts, "expert_reviews": n_reviewers,
+            "coordinator_reviews": n_artifacts, "session_logs": n_artifacts}
+
+
+def study_env(root: Path) -> dict:
+    """Environment that points the analysis scripts at a study tree."""
+    return {**os.environ, STUDY_ROOT_ENV: str(Path(root).resolve())}
+
+
+def run_script(root: Path, script: str, *args: str) -> subprocess.CompletedProcess:
+    """Run an analysis script against a study tree, capturing its output."""
+    return subprocess.run(
+        [sys.executable, str(ANALYSIS_DIR / script), *args],
+        capture_output=True, text=True, env=study_env(root),
+    )
+
+
+@tracing.traced()
+def score(root: Path, n_artifacts: int, jobs: int | None = None) -> list[int]:
+    """Produce Layer 1 files with dsqi_collect.py and dsqi_score.py. Returns failed artifact ids."""
+    with ThreadPoolExecutor(max_workers=jobs or min(8, os.cpu_count() or 1)) as pool:
+        results = list(pool.map(
+            lambda i: run_script(root, "dsqi_collect.py", "--artifact", str(i), "--reuse-cloc"),
+            range(1, n_artifacts + 1)))
+    failed = [i for i, proc in enumerate(results, start=1) if proc.returncode != 0]
+    proc = run_script(root, "dsqi_score.py")
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        failed.append(0)
+    return failed
+
+
+# ── Validation ──
+
+# Constraints in data/schemas/ that encode the size of the real study (five
+# artifacts, IDs 1–5, two-digit slug prefixes) rather than the shape of a
+# document: (schema, JSON path with * for list indices, keyword). A tree of
+# any other size breaks these and only these; every other error fails it.
+SCALE_LIMITS = {
+    ("artifact-registry", "artifacts", "minItems"),
+    ("artifact-registry", "artifacts", "maxItems"),
+    ("artifact-registry", "artifacts/*/id", "maximum"),
+    ("artifact-registry", "artifacts/*/slug", "pattern"),  # only a 3+ digit prefix (≥ 100 artifacts)
+    ("artifact-registry", "expert_reviewers/*/assigned_artifacts/*", "maximum"),
+    ("dsqi-result", "artifact_id", "maximum"),
+    ("dev-session", "*/artifact_id", "maximum"),
+}
+
+
+def scale_limited(schema: str, error) -> bool:
+    """True if a validation error only reflects a SCALE_LIMITS constraint."""
+    path = "/".join("*" if isinstance(p, int) else str(p) for p in error.absolute_path)
+    if (schema, path, error.validator) not in SCALE_LIMITS:
+        return False
+    if error.validator == "pattern":
+        return re.fullmatch(r"[0-9]{3,}-[a-z-]+", error.instance) is not None
+    return True
+
+
+@tracing.traced()
+def validate(root: Path) -> tuple[list[str], int]:
+    """Check every document of a study tree against data/schemas/.
+
+    Returns (errors, scale-limit errors ignored); errors are "file: path: message".
+    """
+    import data_loader
+
+    data = Path(root) / "data"
+    evaluations = data / "evaluations"
+    documents = [("registry", data / "artifact-registry.json")]
+    documents += [("dsqi", p) for p in sorted((evaluations / "layer1-dsqi").glob("dsqi-*.json"))]
+    documents += [("expert", p) for p in sorted((evaluations / "layer2-expert-review").glob("*.json"))]
+    documents += [("coordinator", p)
+                  for p in sorted((evaluations / "layer3-coordinator-review").glob("*.json"))]
+    documents += [("sessions", p) for p in sorted((data / "development-logs").glob("sessions-*.json"))]
+
+    errors, ignored = [], 0
+    for layer, path in documents:
+        doc = json.loads(path.read_bytes())
+        schema = data_loader.schema_name_for(layer, doc)
+        for error in data_loader.iter_schema_errors(layer, doc):
+            if scale_limited(schema, error):
+                ignored += 1
+                continue
+            where = "/".join(str(p) for p in error.absolute_path) or "(root)"
+            errors.append(f"{path.relative_to(root)}: {where}: {error.message}")
+    return errors, ignored
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic study tree for scale testing")
+    parser.add_argument("--artifacts", "-n", type=int, default=50, help="Number of artifacts (default: 50)")
+    parser.add_argument("--reviewers", "-r", type=int, default=3, help="Number of expert reviewers (default: 3)")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory (replaced if it exists)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Random seed (default: {DEFAULT_SEED})")
+    parser.add_argument("--raw-only", action="store_true",
+                        help="Skip dsqi_collect/dsqi_score; leave Layer 1 empty")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="Skip checking the generated tree against data/schemas/")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "synth_data")
+
+    out = args.out.resolve()
+    if out == ANALYSIS_DIR.parent:
+        parser.error("refusing to overwrite the repository's own study tree")
+    if out.exists():
+        if not (out / "data" / "artifact-registry.json").exists():
+            parser.error(f"{out} exists and is not a study tree; refusing to replace it")
+        shutil.rmtree(out)
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Synthetic Study Data                                    ║")
+    print("╚══════════════════════════════════════════════════════════╝\n")
+
+    counts = generate(out, args.artifacts, args.reviewers, args.seed)
+    print(f"  ✓ {counts['artifacts']} artifacts, {counts['expert_reviews']} expert reviews "
+          f"({counts['artifacts'] * counts['expert_reviews']} observations), "
+          f"{counts['coordinator_reviews']} coordinator reviews → {out}")
+
+    if not args.raw_only:
+        failed = score(out, args.artifacts)
+        if failed:
+            print(f"  ✗ DSQI collection/scoring failed for: {', '.join(map(str, failed))}")
+            sys.exit(1)
+        print("  ✓ Layer 1 DSQI files collected and scored")
+
+    if not args.no_validate:
+        if jsonschema is None:
+            print("  ⚠ jsonschema not available — tree not validated")
+        else:
+            errors, ignored = validate(out)
+            if errors:
+                print(f"  ✗ {len(errors)} schema error(s):")
+                for line in errors[:20]:
+                    print(f"    → {line}")
+                sys.exit(1)
+            note = f" ({ignored} five-artifact scale limit(s) exceeded)" if ignored else ""
+            print(f"  ✓ Schema-valid{note}")
+
+    print(f"\n  Use it with: {STUDY_ROOT_ENV}={out} python analysis/<script>.py")
+
+
+if __name__ == "__main__":
+    main()
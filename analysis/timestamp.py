@@ -13,7 +13,12 @@ truncation when running PowerShell's Get-Date.
 
 import argparse
 import json
+import sys
 from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
 
 
 def get_timestamp(local: bool = False) -> str:
@@ -30,7 +35,9 @@ def main():
     parser.add_argument("--local", action="store_true", help="Use local time with UTC offset (default: UTC)")
     parser.add_argument("--file", action="store_true", help="Also write to .timestamp.tmp")
     parser.add_argument("--json", action="store_true", dest="as_json", help="Output as JSON object")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "timestamp")
 
     ts = get_timestamp(local=args.local)
 
@@ -40,7 +47,6 @@ def main():
         print(ts)
 
     if args.file:
-        from pathlib import Path
         root = Path(__file__).resolve().parent.parent
         tmp = root / ".timestamp.tmp"
         tmp.write_text(ts, encoding="utf-8")
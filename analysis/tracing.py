@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+tracing.py — Lightweight span tracing and metrics export for the analysis pipeline.
+
+Records nested, timed spans with attributes and counters (file bytes read
+and written, files, observations, ...). Tracing is off by default: every
+call is a cheap no-op until enable() is called, normally via the
+``--trace [DIR]`` flag that each entry point registers with
+add_trace_argument().
+
+On exit, an enabled trace is written as:
+    <DIR>/<name>.trace.json   Chrome trace-event JSON (chrome://tracing, Perfetto)
+    <DIR>/<name>.prom         Prometheus text-format metrics, aggregated by span
+
+Usage:
+    import tracing
+
+    with tracing.span("load", layer="expert"):
+        raw = path.read_bytes()
+        tracing.add("bytes_read", len(raw))
+
+    @tracing.traced("compute")
+    def compute(...): ...
+
+    parser = argparse.ArgumentParser(...)
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "dsqi_collect")
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TRACE_DIR = ROOT / "analysis" / "output" / "traces"
+
+METRIC_PREFIX = "dsqi"
+
+_enabled = False
+_name = None
+_out_dir = None
+_lock = threading.Lock()
+_local = threading.local()
+_events = []     # completed spans
+_origin_ns = 0   # wall-clock origin for trace timestamps
+_root = None     # span covering the whole entry point
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "counters", "start_ns", "wall_ns", "parent")
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.counters = {}
+        self.parent = None
+
+    def __enter__(self):
+        stack = _stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.wall_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        dur_ns = time.perf_counter_ns() - self.start_ns
+        stack = _stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        _record(self.name, self.wall_ns, dur_ns, self.attrs, self.counters,
+                os.getpid(), threading.get_ident())
+        # Counters roll up into the enclosing span
+        if self.parent is not None:
+            for key, value in self.counters.items():
+                self.parent.counters[key] = self.parent.counters.get(key, 0) + value
+        return False
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _record(name, wall_ns, dur_ns, attrs, counters, pid, tid):
+    with _lock:
+        _events.append((name, wall_ns, dur_ns, attrs, dict(counters), pid, tid))
+
+
+# ── Public API ──
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def span(name: str, **attrs):
+    """Context manager timing a nested span. No-op unless tracing is enabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def traced(name: str | None = None):
+    """Decorator wrapping a function call in a span (default name: function name)."""
+    def decorate(fn):
+        span_name = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def add(counter: str, value: int | float = 1):
+    """Add to a counter on the innermost open span (e.g. bytes_read, files)."""
+    if not _enabled:
+        return
+    stack = _stack()
+    if stack:
+        current = stack[-1]
+        current.counters[counter] = current.counters.get(counter, 0) + value
+
+
+def record_span(name: str, wall_ns: int, dur_ns: int, pid: int | None = None,
+                tid: int | None = None, **attrs):
+    """Record a span measured elsewhere (e.g. in a worker process)."""
+    if not _enabled:
+        return
+    _record(name, wall_ns, dur_ns, attrs, {}, pid or os.getpid(), tid or 0)
+
+
+def enable(name: str, out_dir: Path | None = None):
+    """Start collecting spans; write the trace files for `name` at interpreter exit.
+
+    Opens a root span named after the entry point, so the trace always
+    records the total run time even if nothing else is instrumented.
+    """
+    global _enabled, _name, _out_dir, _origin_ns, _root
+    if _enabled:
+        return
+    _enabled = True
+    _name = name
+    _out_dir = Path(out_dir) if out_dir else DEFAULT_TRACE_DIR
+    _origin_ns = time.time_ns()
+    _root = _Span(name, {}).__enter__()
+    atexit.register(_flush)
+
+
+def add_trace_argument(parser):
+    """Register the shared ``--trace [DIR]`` option on an argparse parser."""
+    parser.add_argument("--trace", nargs="?", const=str(DEFAULT_TRACE_DIR), default=None,
+                        metavar="DIR",
+                        help="Write a Chrome trace and Prometheus metrics "
+                             f"(default dir: {DEFAULT_TRACE_DIR.relative_to(ROOT)})")
+
+
+def enable_from_args(args, name: str):
+    """Enable tracing if ``--trace`` was given on the command line."""
+    if getattr(args, "trace", None):
+        enable(name, Path(args.trace))
+
+
+# ── Export ──
+
+def chrome_trace() -> dict:
+    """Completed spans as Chrome trace-event JSON."""
+    with _lock:
+        events = list(_events)
+    trace_events = []
+    for name, wall_ns, dur_ns, attrs, counters, pid, tid in events:
+        trace_events.append({
+            "name": name,
+            "cat": _name or "analysis",
+            "ph": "X",
+            "ts": (wall_ns - _origin_ns) / 1000,
+            "dur": dur_ns / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": {**attrs, **counters},
+        })
+    trace_events.sort(key=lambda e: (e["ts"], -e["dur"]))
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text() -> str:
+    """Completed spans aggregated by name in Prometheus text exposition format."""
+    with _lock:
+        events = list(_events)
+
+    durations, calls, counters = {}, {}, {}
+    for name, _, dur_ns, _, span_counters, _, _ in events:
+        durations[name] = durations.get(name, 0) + dur_ns / 1e9
+        calls[name] = calls.get(name, 0) + 1
+        for key, value in span_counters.items():
+            counters.setdefault(key, {})
+            counters[key][name] = counters[key].get(name, 0) + value
+
+    p = METRIC_PREFIX
+    job = _label(_name or "analysis")
+    lines = [
+        f"# HELP {p}_span_seconds_total Total wall time spent in each span.",
+        f"# TYPE {p}_span_seconds_total counter",
+    ]
+    for name in sorted(durations):
+        lines.append(f'{p}_span_seconds_total{{job="{job}",span="{_label(name)}"}} {durations[name]:.6f}')
+    lines += [
+        f"# HELP {p}_span_calls_total Number of times each span was entered.",
+        f"# TYPE {p}_span_calls_total counter",
+    ]
+    for name in sorted(calls):
+        lines.append(f'{p}_span_calls_total{{job="{job}",span="{_label(name)}"}} {calls[name]}')
+    # Counters are recorded inclusively (children roll up into parents)
+    for key in sorted(counters):
+        metric = f"{p}_{''.join(c if c.isalnum() else '_' for c in key)}_total"
+        lines += [
+            f"# HELP {metric} Inclusive '{key}' counter per span.",
+            f"# TYPE {metric} counter",
+        ]
+        for name in sorted(counters[key]):
+            lines.append(f'{metric}{{job="{job}",span="{_label(name)}"}} {counters[key][name]}')
+    return "\n".join(lines) + "\n"
+
+
+def write(out_dir: Path | None = None) -> tuple[Path, Path]:
+    """Write the trace JSON and Prometheus metrics; return both paths."""
+    out_dir = Path(out_dir or _out_dir or DEFAULT_TRACE_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    trace_path = out_dir / f"{_name}.trace.json"
+    prom_path = out_dir / f"{_name}.prom"
+    trace_path.write_text(json.dumps(chrome_trace()) + "\n", encoding="utf-8")
+    prom_path.write_text(prometheus_text(), encoding="utf-8")
+    return trace_path, prom_path
+
+
+def _flush():
+    global _root
+    if _root is not None:
+        _root.__exit__(None, None, None)
+        _root = None
+    trace_path, prom_path = write()
+    for path in (trace_path, prom_path):
+        try:
+            shown = path.relative_to(ROOT)
+        except ValueError:
+            shown = path
+        print(f"  → Trace written to {shown}", file=sys.stderr)
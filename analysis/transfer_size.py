@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+transfer_size.py — Bytes over the wire for an artifact's deployable files.
+
+Artifacts are static sites served to whole classes at once, so their
+operating cost is page weight rather than lines of code. For every file
+under src/ (as found by source_scan.py) this reports:
+
+    bytes    raw size on disk
+    gzip     gzip -9 size (what GitHub Pages and most static hosts serve)
+    brotli   brotli quality-11 size; when the brotli package is not
+             installed, an estimate from raw LZMA2 (preset 9e), which lands
+             within a few percent of brotli on HTML/CSS/JS
+
+Files are compressed in a thread pool (zlib, lzma and brotli release the
+GIL while compressing). Results are cached by content hash in
+output/.transfer-size-cache.json, so unchanged assets are not compressed
+again. dsqi_collect.py stores the result as raw_metrics["transfer_size"].
+
+Usage:
+    python analysis/transfer_size.py artifacts/01-unit-testing-gauntlet/src
+    python analysis/transfer_size.py --all
+"""
+
+import argparse
+import gzip
+import hashlib
+import lzma
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT as STUDY_ROOT, ContentCache, save_json
+from lazy_import import lazy_callable
+from source_scan import scan
+import tracing
+
+tabulate = lazy_callable("tabulate", "tabulate")
+
+try:
+    import brotli
+    BROTLI_METHOD = "brotli-q11"
+except ImportError:
+    brotli = None
+    BROTLI_METHOD = "lzma-estimate"
+
+ARTIFACTS_DIR = STUDY_ROOT / "artifacts"
+CACHE_PATH = STUDY_ROOT / "analysis" / "output" / ".transfer-size-cache.json"
+CACHE_VERSION = 1
+
+TOOL = "gzip/brotli transfer size (transfer_size.py)"
+COMPRESS_WORKERS = min(8, os.cpu_count() or 1)
+_LZMA_FILTERS = [{"id": lzma.FILTER_LZMA2, "preset": 9 | lzma.PRESET_EXTREME}]
+
+
+def compressed_sizes(raw: bytes) -> dict:
+    """Raw, gzip and brotli(-equivalent) sizes of one asset."""
+    if brotli is not None:
+        br = len(brotli.compress(raw, quality=11))
+    else:
+        br = len(lzma.compress(raw, format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS)) if raw else 0
+    return {
+        "bytes": len(raw),
+        "gzip": len(gzip.compress(raw, compresslevel=9, mtime=0)),
+        "brotli": br,
+    }
+
+
+# ── Cache ──
+
+def load_cache(path: Path = CACHE_PATH) -> ContentCache:
+    """{sha256: sizes} for the current brotli method (empty if stale or missing)."""
+    return ContentCache(path, {"version": CACHE_VERSION, "brotli_method": BROTLI_METHOD})
+
+
+# ── Measurement ──
+
+@tracing.traced()
+def measure(src_dir: Path, workers: int | None = None, cache: dict | None = None) -> dict:
+    """Per-asset and total transfer sizes for one src/ tree.
+
+    Args:
+        cache: {sha256: sizes}, read and updated in place (default: the
+               on-disk cache, saved when it changed)
+
+    Returns:
+        {"tool", "brotli_method", "assets": [{"file", "language", "bytes",
+         "gzip", "brotli"}], "total": {"files", "bytes", "gzip", "brotli"},
+         "cached": assets served from the cache}
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = load_cache()
+
+    files = scan(src_dir, count=False)
+    blobs = [f["path"].read_bytes() for f in files]
+    digests = [hashlib.sha256(raw).hexdigest() for raw in blobs]
+    todo = sorted({d: raw for d, raw in zip(digests, blobs) if d not in cache}.items())
+    tracing.add("bytes_read", sum(len(raw) for raw in blobs))
+
+    if todo:
+        workers = min(workers or COMPRESS_WORKERS, len(todo))
+        with tracing.span("compress", assets=len(todo), workers=workers):
+            if workers <= 1:
+                sizes = [compressed_sizes(raw) for _, raw in todo]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    sizes = list(pool.map(compressed_sizes, [raw for _, raw in todo]))
+        cache.update((d, s) for (d, _), s in zip(todo, sizes))
+        if own_cache:
+            cache.save()
+
+    assets = [{"file": f["rel"], "language": f["language"], **cache[d]}
+              for f, d in zip(files, digests)]
+    return {
+        "tool": TOOL,
+        "brotli_method": BROTLI_METHOD,
+        "assets": assets,
+        "total": {
+            "files": len(assets),
+            "bytes": sum(a["bytes"] for a in assets),
+            "gzip": sum(a["gzip"] for a in assets),
+            "brotli": sum(a["brotli"] for a in assets),
+        },
+        "cached": len(files) - len(todo),
+    }
+
+
+def transfer_kb(result: dict) -> float:
+    """Total gzip transfer in KB, the value normalised as a DSQI sub-metric."""
+    return round(result["total"]["gzip"] / 1024, 2)
+
+
+# ── Main ──
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw, gzip and brotli sizes of an artifact's files")
+    parser.add_argument("src", nargs="*", type=Path, help="src/ directories to measure")
+    parser.add_argument("--all", action="store_true", help="Measure every artifacts/*/src")
+    parser.add_argument("--workers", type=int, default=COMPRESS_WORKERS,
+                        help=f"Compression threads (default: {COMPRESS_WORKERS})")
+    parser.add_argument("--json", type=Path, metavar="OUT", help="Also write the results as JSON")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "transfer_size")
+
+    dirs = list(args.src)
+    if args.all:
+        dirs += sorted(p / "src" for p in ARTIFACTS_DIR.iterdir() if (p / "src").is_dir())
+    if not dirs:
+        parser.error("give src/ directories or --all")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Transfer Size                                           ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+    if brotli is None:
+        print("  ⚠ brotli not available — brotli column estimated with LZMA2")
+        print()
+
+    cache = load_cache()
+    results, rows = {}, []
+    for src in dirs:
+        name = src.parent.name if src.name == "src" else src.name
+        result = measure(src, workers=args.workers, cache=cache)
+        results[name] = result
+        total = result["total"]
+        rows.append([name, total["files"], _kb(total["bytes"]), _kb(total["gzip"]), _kb(total["brotli"]),
+                     f"{100 * total['gzip'] / total['bytes']:.0f}%" if total["bytes"] else "—"])
+        if len(dirs) == 1:
+            print(tabulate([[a["file"], a["language"], _kb(a["bytes"]), _kb(a["gzip"]), _kb(a["brotli"])]
+                            for a in result["assets"]],
+                           headers=["Asset", "Language", "Raw KB", "gzip KB", "brotli KB"],
+                           tablefmt="simple_outline"))
+            print()
+    cache.save()
+
+    print(tabulate(rows, headers=["Artifact", "Files", "Raw KB", "gzip KB", "brotli KB", "gzip/raw"],
+                   tablefmt="simple_outline"))
+    cached = sum(r["cached"] for r in results.values())
+    print(f"\n  Assets from cache: {cached}/{sum(r['total']['files'] for r in results.values())}")
+
+    if args.json:
+        save_json(args.json, results)
+        print(f"  ✓ Results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,36 +12,40 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import json
 import sys
 from pathlib import Path
 
-try:
-    from jsonschema import validate, ValidationError
-except ImportError:
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from data_loader import ROOT, schema_errors, schema_name_for
+import tracing
+
+# data_loader imports jsonschema when it first validates; only check it is there.
+if importlib.util.find_spec("jsonschema") is None:
     print("ERROR: jsonschema not installed. Run: pip install jsonschema")
     sys.exit(1)
 
-ROOT = Path(__file__).resolve().parent.parent
-SCHEMA_DIR = ROOT / "data" / "schemas"
-
 
 def load_json(path: Path):
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def validate_file(data_path: Path, schema_path: Path) -> bool:
-    """Validate a single JSON file against a schema. Returns True if valid."""
+def validate_file(data_path: Path, layer: str) -> bool:
+    """Validate a single JSON file against its layer's schema. Returns True if valid.
+
+    The schema is chosen as in data_loader's validating load: the file's own
+    "schema" tag when data/schemas/ has it, else the layer default.
+    """
     try:
         data = load_json(data_path)
-        schema = load_json(schema_path)
-        validate(instance=data, schema=schema)
-        print(f"  ✓ {data_path.relative_to(ROOT)}")
-        return True
-    except ValidationError as e:
+        errors = schema_errors(layer, data, limit=1)
+        if not errors:
+            print(f"  ✓ {data_path.relative_to(ROOT)}  ({schema_name_for(layer, data)})")
+            return True
         print(f"  ✗ {data_path.relative_to(ROOT)}")
-        print(f"    → {e.message}")
+        print(f"    → {errors[0]}")
         return False
     except FileNotFoundError:
         print(f"  ⚠ {data_path.relative_to(ROOT)} — file not found")
@@ -52,7 +56,7 @@ def validate_registry():
     print("\n— Validating Artifact Registry —")
     return validate_file(
         ROOT / "data" / "artifact-registry.json",
-        SCHEMA_DIR / "artifact-registry.schema.json",
+        "registry",
     )
 
 
@@ -63,7 +67,7 @@ def validate_dsqi():
     if not files:
         print("  (no DSQI files found yet)")
         return True
-    return all(validate_file(f, SCHEMA_DIR / "dsqi-result.schema.json") for f in files)
+    return all(validate_file(f, "dsqi") for f in files)
 
 
 def validate_expert():
@@ -73,7 +77,7 @@ def validate_expert():
     if not files:
         print("  (no expert review files found yet)")
         return True
-    return all(validate_file(f, SCHEMA_DIR / "expert-review.schema.json") for f in files)
+    return all(validate_file(f, "expert") for f in files)
 
 
 def validate_coordinator():
@@ -83,7 +87,7 @@ def validate_coordinator():
     if not files:
         print("  (no coordinator review files found yet)")
         return True
-    return all(validate_file(f, SCHEMA_DIR / "coordinator-review.schema.json") for f in files)
+    return all(validate_file(f, "coordinator") for f in files)
 
 
 TARGETS = {
@@ -98,7 +102,9 @@ TARGETS = {
 def main():
     parser = argparse.ArgumentParser(description="Validate study data against schemas")
     parser.add_argument("--target", choices=TARGETS.keys(), default="all")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "validate_data")
 
     print(f"Validating: {args.target}")
     results = [fn() for fn in TARGETS[args.target]]
@@ -111,4 +117,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import worker
+    worker.dispatch("validate_data", main)
@@ -21,6 +21,9 @@ import urllib.error
 from datetime import date, datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import tracing
+
 STUDY_ROOT = Path(__file__).resolve().parent.parent
 WAKATIME_CFG = Path.home() / ".wakatime.cfg"
 WAKATIME_API_BASE = "https://wakatime.com/api/v1"
@@ -125,7 +128,9 @@ def main():
     parser.add_argument("--save", action="store_true", help="Save full API response to data/development-logs/")
     parser.add_argument("--summary", action="store_true", help="Print compact summary instead of full response")
     parser.add_argument("--json", action="store_true", dest="as_json", help="Output raw JSON (for piping)")
+    tracing.add_trace_argument(parser)
     args = parser.parse_args()
+    tracing.enable_from_args(args, "wakatime_fetch")
 
     api_key = get_api_key()
     raw = fetch_summaries(api_key, args.project, args.date)
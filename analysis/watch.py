@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+watch.py — Re-run scoring, reports and analyses as evaluation data arrives.
+
+Polls the study's input files, waits for a burst of changes to settle,
+then re-runs only the steps whose inputs changed, in dependency order:
+
+    input                                   steps
+    artifacts/{slug}/                       dsqi_collect.py --artifact N (with --collect)
+    data/evaluations/layer1-dsqi/           score, reports, analyses reading "dsqi"
+    data/evaluations/layer2-expert-review/  score, reports, analyses reading "expert"
+    data/evaluations/layer3-coordinator-review/  score, reports, analyses reading "coordinator"
+    data/artifact-registry.json             analyses reading "registry"
+    data/development-logs/sessions-*, wakatime-*  analyses reading "sessions"
+
+score is dsqi_score.py; reports are the report_build.py targets (each
+skipped when its input stamp is unchanged); analyses are the extended
+analyses A–I of run_extended.py, selected by run_extended.INPUTS. Files
+written by a step (DSQI files and the registry after scoring) feed the
+later steps of the same run and do not trigger another one.
+
+Changes are detected by content hash, so saving a file unchanged or
+touching it triggers nothing. Everything stays loaded between runs: the
+analysis modules (numpy, scipy, …), the report model, of which only the
+changed layers are re-read, and the data_loader layers (keep_warm).
+
+Polling rather than inotify keeps this dependency-free and portable; at
+the default 1 s interval a scan of the study tree takes a few milliseconds.
+
+Usage:
+    python analysis/watch.py                     # Watch until Ctrl-C
+    python analysis/watch.py --initial           # Run every step first, then watch
+    python analysis/watch.py --once              # Run every step once and exit
+    python analysis/watch.py --collect --no-figures
+"""
+
+import argparse
+import hashlib
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import data_loader
+from data_loader import ROOT, DATA_DIR, DEV_LOG_DIR, REGISTRY_PATH
+import dsqi_score
+import figure_pool
+import report_build
+import run_extended
+from source_scan import walk
+import tracing
+
+ANALYSIS_DIR = Path(__file__).resolve().parent
+ARTIFACTS_DIR = ROOT / "artifacts"
+WATCHED_DIRS = (DATA_DIR / "evaluations", DEV_LOG_DIR, ARTIFACTS_DIR)
+WATCHED_FILES = (REGISTRY_PATH,)
+
+LAYER_DIRS = {
+    "layer1-dsqi": "dsqi",
+    "layer2-expert-review": "expert",
+    "layer3-coordinator-review": "coordinator",
+}
+ALL_LAYERS = ("registry", "dsqi", "expert", "coordinator", "sessions")
+SCORE_INPUTS = {"dsqi", "expert", "coordinator"}
+DEFAULT_ANALYSES = [k for k in run_extended.ANALYSES if k != "J"]  # J calls an external API
+
+
+def layer_of(path: Path) -> str | None:
+    """Input layer a watched file belongs to ("artifact:{slug}" for artifact sources)."""
+    parts = path.relative_to(ROOT).parts
+    name = parts[-1]
+    if name.endswith(("~", ".tmp", ".swp")) or name.startswith("."):
+        return None
+    if path == REGISTRY_PATH:
+        return "registry"
+    if parts[0] == "artifacts" and len(parts) > 2:
+        return f"artifact:{parts[1]}"
+    if parts[:2] == ("data", "evaluations") and len(parts) > 3 and name.endswith(".json"):
+        return LAYER_DIRS.get(parts[2])
+    if parts[:2] == ("data", "development-logs") and name.startswith(("sessions-", "wakatime-")):
+        return "sessions"
+    return None
+
+
+# ── Change detection ──
+
+class Watcher:
+    """Content snapshot of the watched files; poll() reports what changed since the last one."""
+
+    def __init__(self):
+        self.snapshot = self._scan({})
+
+    @staticmethod
+    def _scan(previous: dict) -> dict:
+        """{path: (mtime_ns, size, sha256)}; files whose stat is unchanged are not re-hashed."""
+        paths = [Path(p) for d in WATCHED_DIRS for _, p in walk(d)]
+        paths += [p for p in WATCHED_FILES if p.is_file()]
+        current = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # removed while scanning
+            old = previous.get(path)
+            if old and old[:2] == (st.st_mtime_ns, st.st_size):
+                current[path] = old
+                continue
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+            tracing.add("files_hashed")
+            current[path] = (st.st_mtime_ns, st.st_size, digest)
+        return current
+
+    def poll(self) -> set[Path]:
+        """Files added, removed or changed in content since the last poll."""
+        current = self._scan(self.snapshot)
+        changed = {p for p in current.keys() | self.snapshot.keys()
+                   if (current.get(p) or (None,) * 3)[2] != (self.snapshot.get(p) or (None,) * 3)[2]}
+        self.snapshot = current
+        return changed
+
+    def wait_for_changes(self, interval: float, debounce: float) -> set[Path]:
+        """Block until something changes, then until no change for `debounce` seconds."""
+        changed = set()
+        while not changed:
+            time.sleep(interval)
+            changed = self.poll()
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < debounce:
+            time.sleep(min(interval, debounce))
+            more = self.poll()
+            if more:
+                changed |= more
+                quiet_since = time.monotonic()
+        return changed
+
+
+def layers_of(paths) -> set[str]:
+    return {layer for layer in map(layer_of, paths) if layer}
+
+
+# ── Steps ──
+
+class Pipeline:
+    """The scoring, report and analysis steps, with their state kept loaded between runs."""
+
+    def __init__(self, watcher: Watcher, collect: bool = False, reports: bool = True,
+                 analyses: list[str] | None = None, figures: bool = True, verbose: bool = False):
+        self.watcher = watcher
+        self.collect = collect
+        self.reports = reports
+        self.analyses = DEFAULT_ANALYSES if analyses is None else analyses
+        self.figures = figures
+        self.verbose = verbose
+        self.model = None
+        data_loader.keep_warm()
+
+    def _absorb(self, layers: set[str]):
+        """Add what the last step wrote (or anything else that changed meanwhile) to `layers`."""
+        layers |= layers_of(self.watcher.poll())
+
+    @tracing.traced()
+    def run(self, layers: set[str]) -> bool:
+        """Run every step affected by changes to `layers`; False if one failed."""
+        ok = True
+        layers = set(layers)
+
+        slugs = sorted(layer.split(":", 1)[1] for layer in layers if layer.startswith("artifact:"))
+        if slugs and self.collect:
+            ids = {a["slug"]: a["id"] for a in data_loader.load_registry_artifacts()}
+            for slug in slugs:
+                if slug not in ids:
+                    print(f"  ⚠ {slug} is not in the registry — not collected")
+                    continue
+                print(f"▸ Collecting {slug}")
+                with tracing.span("step.collect", artifact=slug):
+                    result = subprocess.run([sys.executable, str(ANALYSIS_DIR / "dsqi_collect.py"),
+                                             "--artifact", str(ids[slug])])
+                ok &= result.returncode == 0
+            self._absorb(layers)
+
+        if layers & SCORE_INPUTS:
+            print("▸ Scoring")
+            ok &= self._step("score", dsqi_score.score, verbose=self.verbose)
+            self._absorb(layers)
+
+        data_loader.invalidate(*(layers & set(ALL_LAYERS)))
+
+        if self.reports and layers & set(report_build.MODEL_LAYERS):
+            print("▸ Reports")
+            ok &= self._step("reports", self._build_reports, layers)
+
+        keys = [k for k in self.analyses if layers & set(run_extended.INPUTS[k])]
+        for key in keys:
+            module_name, label = run_extended.ANALYSES[key]
+            ok &= run_extended.run_analysis(key, module_name, label, verbose=self.verbose,
+                                            no_figures=not self.figures)
+        if keys and self.figures:
+            with tracing.span("figures.wait"):
+                stats = figure_pool.wait()
+            ok &= not stats["failed"]
+        return ok
+
+    def _build_reports(self, layers: set[str]):
+        if self.model is None:
+            self.model = report_build.load_model()
+        else:
+            report_build.refresh_model(self.model, layers)
+        status = report_build.build_targets(model=self.model)
+        if any(state in ("failed", "blocked") for state in status.values()):
+            raise RuntimeError(", ".join(n for n, s in status.items() if s in ("failed", "blocked")))
+
+    @staticmethod
+    def _step(name: str, fn, *args, **kwargs) -> bool:
+        with tracing.span(f"step.{name}"):
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:  # keep watching; the next change may fix the input
+                print(f"  ✗ {name} failed: {type(e).__name__}: {e}")
+                return False
+        return True
+
+
+# ── Main ──
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%H:%M:%S")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run scoring, reports and analyses when study data changes")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls (default: 1)")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="Seconds without further changes before running (default: 2)")
+    parser.add_argument("--collect", action="store_true",
+                        help="Re-collect an artifact's M and C metrics when its sources change")
+    parser.add_argument("--initial", action="store_true", help="Run every step once before watching")
+    parser.add_argument("--once", action="store_true", help="Run every step once and exit")
+    parser.add_argument("--only", nargs="+", metavar="X", help="Extended analyses to keep current (default: A–I)")
+    parser.add_argument("--no-reports", action="store_true", help="Do not rebuild the core reports")
+    parser.add_argument("--no-figures", action="store_true", help="Suppress figure generation")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate data against data/schemas/ while it is loaded")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose step output")
+    tracing.add_trace_argument(parser)
+    args = parser.parse_args()
+    tracing.enable_from_args(args, "watch")
+    if args.validate:
+        data_loader.enable_validation()
+
+    analyses = DEFAULT_ANALYSES
+    if args.only:
+        analyses = [k.upper() for k in args.only]
+        invalid = [k for k in analyses if k not in run_extended.ANALYSES]
+        if invalid:
+            parser.error(f"unknown analysis keys: {', '.join(invalid)}")
+
+    print("╔══════════════════════════════════════════════════════════╗")
+    print("║  Watch — Disposable Software Study                       ║")
+    print("╚══════════════════════════════════════════════════════════╝")
+    print()
+
+    watcher = Watcher()
+    pipeline = Pipeline(watcher, collect=args.collect, reports=not args.no_reports,
+                        analyses=analyses, figures=not args.no_figures, verbose=args.verbose)
+    print(f"  Watching {len(watcher.snapshot)} files under {ROOT}")
+    print(f"  Analyses: {', '.join(analyses) or 'none'}  |  Reports: {'off' if args.no_reports else 'on'}"
+          f"  |  Collect: {'on' if args.collect else 'off'}")
+    print()
+
+    if args.initial or args.once:
+        print(f"▸ {_timestamp()}  initial run")
+        ok = pipeline.run(set(ALL_LAYERS))
+        print(f"\n  {'✓' if ok else '✗'} Initial run {'done' if ok else 'finished with failures'}\n")
+        if args.once:
+            sys.exit(0 if ok else 1)
+
+    try:
+        while True:
+            changed = watcher.wait_for_changes(args.interval, args.debounce)
+            layers = layers_of(changed)
+            print(f"▸ {_timestamp()}  {len(changed)} file(s) changed: {', '.join(sorted(layers)) or 'no inputs'}")
+            for path in sorted(changed)[:10]:
+                print(f"  · {path.relative_to(ROOT)}")
+            if not layers:
+                continue
+            start = time.time()
+            ok = pipeline.run(layers)
+            print(f"\n  {'✓' if ok else '✗'} Up to date in {time.time() - start:.1f}s — watching\n")
+    except KeyboardInterrupt:
+        print("\n  Stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+worker.py — Warm worker process for the package.json CLI scripts.
+
+Most of the latency of `npm run status`, `validate:all` or `report:*` is
+interpreter startup, importing numpy/scipy/jsonschema and re-reading the
+evaluation data. A worker started once keeps all of that loaded; the
+entry points below then act as thin clients that forward their argv to it
+over a Unix socket and exit with the code it reports:
+
+    study_status  dsqi_collect  validate_data  report_build
+    generate_{dsqi,expert,coordinator,summary}_report
+
+Each request runs in a process forked from the warm worker, with the
+client's stdin/stdout/stderr passed over the socket, so output, colours
+and prompts behave exactly as in-process; Ctrl-C in the client interrupts
+the request. The worker keeps:
+
+    imports        the entry modules and their dependencies
+    schemas        compiled validators for every schema in data/schemas/
+    report model   the three evaluation layers (report_build.keep_model),
+                   re-read per layer when its files change (watch.Watcher)
+
+When analysis/*.py or a schema changes, the worker answers with "run it
+yourself" and restarts once idle, so a request never runs stale code.
+With no worker running — or on platforms without fork/SCM_RIGHTS, or
+with DSQI_NO_WORKER=1 — the entry points run in-process as before.
+
+One worker serves one study tree (DSQI_STUDY_ROOT). Its socket lives in a
+directory private to the user (mode 0700, under $XDG_RUNTIME_DIR or else
+the temp directory), keyed by tree; the worker refuses to serve from a
+directory someone else owns or can enter. Both ends check the peer's uid
+(SO_PEERCRED, where available) before anything is exchanged, and a request
+carries only the environment variables in FORWARD_ENV.
+
+Usage:
+    python analysis/worker.py start             # Start in the background
+    python analysis/worker.py status            # Is it running? requests served
+    python analysis/worker.py stop
+    python analysis/worker.py serve             # Run in the foreground (logs requests)
+    python analysis/worker.py serve --idle-timeout 600
+"""
+
+import argparse
+import hashlib
+import os
+import stat
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from lazy_import import lazy_module
+
+# Clients pay for nothing beyond a stat of the socket path when no worker runs.
+json = lazy_module("json")
+socket = lazy_module("socket")
+
+ANALYSIS_DIR = Path(__file__).resolve().parent
+# As data_loader.ROOT / SCHEMA_DIR, without importing data_loader in the client.
+ROOT = Path(os.environ.get("DSQI_STUDY_ROOT") or ANALYSIS_DIR.parent).resolve()
+SCHEMA_DIR = ANALYSIS_DIR.parent / "data" / "schemas"
+DISABLE_ENV = "DSQI_NO_WORKER"
+UID = os.getuid() if hasattr(os, "getuid") else 0
+SOCKET_DIR = Path(os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp") / f"dsqi-worker-{UID}"
+SOCKET_PATH = SOCKET_DIR / f"{hashlib.sha1(str(ROOT).encode()).hexdigest()[:12]}.sock"
+LOG_PATH = ROOT / "analysis" / "output" / "worker.log"
+
+# Environment a request takes from its client: what the served entry points
+# read (data_loader) and what dsqi_collect.py needs to find cloc/npx.
+# Everything else is the worker's own environment.
+FORWARD_ENV = ("DSQI_STUDY_ROOT", "DSQI_VALIDATE", "PATH")
+
+# Entry points served by the worker. Interactive and networked scripts
+# (session_*, wakatime_fetch, run_extended with its figure pool) stay in-process.
+ENTRY_POINTS = (
+    "study_status", "dsqi_collect", "validate_data", "report_build",
+    "generate_dsqi_report", "generate_expert_report",
+    "generate_coordinator_report", "generate_summary_report",
+)
+PRELOAD = ("numpy", "scipy.stats", "jsonschema", "tabulate", "radon")
+DEFAULT_IDLE_TIMEOUT = 3600
+
+
+def supported() -> bool:
+    return os.name == "posix" and hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+def _send(conn, message: dict):
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _receive(conn) -> dict | None:
+    """One newline-terminated JSON message; None if the peer closed first."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data)
+
+
+def _private(directory: Path) -> bool:
+    """Whether `directory` is a real directory of ours that nobody else can enter."""
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == UID and not st.st_mode & 0o077
+
+
+def _make_socket_dir():
+    """Create the socket directory, or exit if it exists and is not private to us."""
+    try:
+        SOCKET_DIR.mkdir(mode=0o700, exist_ok=True)
+    except OSError as e:
+        sys.exit(f"  ✗ Cannot create {SOCKET_DIR}: {e}")
+    if not _private(SOCKET_DIR):
+        sys.exit(f"  ✗ {SOCKET_DIR} is not a directory private to you (owner uid {UID}, mode 0700)"
+                 f" — remove it or set XDG_RUNTIME_DIR")
+
+
+def _peer_is_us(conn) -> bool:
+    """Whether the process at the other end of `conn` runs as our user.
+
+    Without SO_PEERCRED (non-Linux) the private socket directory is the
+    only check.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    import struct
+
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", creds)[1] == UID
+
+
+def _connect(timeout: float | None = None):
+    """Connection to the worker for this tree; None unless it is ours."""
+    if not supported() or not SOCKET_PATH.exists() or not _private(SOCKET_DIR):
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(timeout)
+    try:
+        conn.connect(str(SOCKET_PATH))
+        if _peer_is_us(conn):
+            return conn
+    except OSError:
+        pass
+    conn.close()
+    return None
+
+
+# ── Client ──
+
+def dispatch(name: str, main):
+    """Run entry point `name` in the worker if one serves this tree, else call main()."""
+    if os.environ.get(DISABLE_ENV, "") not in ("", "0") or not SOCKET_PATH.exists():
+        return main()
+    conn = _connect()
+    if conn is None:
+        return main()
+    request = {"module": name, "argv": sys.argv, "cwd": os.getcwd(),
+               "env": {k: os.environ[k] for k in FORWARD_ENV if k in os.environ}, "root": str(ROOT)}
+    try:
+        with conn:
+            socket.send_fds(conn, [b"R"], [0, 1, 2])
+            _send(conn, request)
+            try:
+                reply = _receive(conn)
+            except KeyboardInterrupt:
+                conn.shutdown(socket.SHUT_WR)  # the worker interrupts the request
+                reply = _receive(conn)
+    except OSError:
+        return main()  # worker went away before taking the request
+    if reply is None:
+        print("  ✗ Worker exited without finishing the request", file=sys.stderr)
+        sys.exit(1)
+    if reply.get("fallback"):
+        return main()
+    sys.exit(reply["exit"])
+
+
+# ── Server ──
+
+def _log(message: str):
+    print(f"{datetime.now().strftime('%H:%M:%S')}  {message}", flush=True)
+
+
+def _source_stamp() -> dict:
+    """mtime of every module and schema a request may run or compile."""
+    paths = [*ANALYSIS_DIR.glob("*.py"), *SCHEMA_DIR.glob("*.schema.json")]
+    return {str(p): p.stat().st_mtime_ns for p in paths if p.exists()}
+
+
+class Worker:
+    """Listening socket, warm state and the requests forked from it."""
+
+    def __init__(self, idle_timeout: float):
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.served = 0
+        self.children = {}  # pid → (connection, module, start time)
+        self.restart = False
+        self.stopping = False
+
+    def warm(self):
+        import importlib
+
+        import data_loader
+        import report_build
+        import watch
+
+        start = time.time()
+        for name in PRELOAD:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+        for name in ENTRY_POINTS:
+            importlib.import_module(name)
+        schemas = data_loader.warm_validators()
+        self.watcher = watch.Watcher()
+        self.model = report_build.load_model()
+        report_build.keep_model(self.model)
+        self.stamp = _source_stamp()
+        _log(f"warm in {time.time() - start:.2f}s — {len(ENTRY_POINTS)} entry points, "
+             f"{schemas} validators, {len(self.watcher.snapshot)} files watched")
+
+    def refresh(self):
+        """Bring the kept model up to date with the files before forking a request."""
+        import report_build
+        import watch
+
+        layers = watch.layers_of(self.watcher.poll())
+        stale = layers & set(report_build.MODEL_LAYERS)
+        if stale:
+            report_build.refresh_model(self.model, stale)
+            _log(f"reloaded {', '.join(sorted(stale))}")
+        if not self.restart and _source_stamp() != self.stamp:
+            self.restart = True
+            _log("analysis sources changed — restarting once idle")
+
+    def serve(self):
+        import selectors
+
+        if (conn := _connect(timeout=1)) is not None:
+            conn.close()
+            sys.exit(f"  ✗ A worker is already serving {ROOT} ({SOCKET_PATH})")
+        SOCKET_PATH.unlink(missing_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(SOCKET_PATH))
+        os.chmod(SOCKET_PATH, 0o600)
+        listener.listen(16)
+        self.listener = listener
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(listener, selectors.EVENT_READ)
+        _log(f"serving {ROOT} on {SOCKET_PATH} (pid {os.getpid()})")
+
+        last_active = time.time()
+        try:
+            while not self.stopping:
+                for key, _ in self.selector.select(timeout=0.5):
+                    if key.fileobj is listener:
+                        self._accept()
+                    else:
+                        self._client_closed(key.data)
+                    last_active = time.time()
+                self._reap()
+                if self.children:
+                    last_active = time.time()
+                elif self.restart:
+                    break
+                elif self.idle_timeout and time.time() - last_active > self.idle_timeout:
+                    _log(f"idle for {self.idle_timeout:.0f}s — exiting")
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            listener.close()
+            SOCKET_PATH.unlink(missing_ok=True)
+        if self.restart and not self.stopping:
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+        _log("stopped")
+
+    def _accept(self):
+        conn, _ = self.listener.accept()
+        try:
+            trusted = _peer_is_us(conn)
+        except OSError:
+            trusted = False
+        if not trusted:
+            _log("refused a connection from another user")
+            conn.close()
+            return
+        conn.settimeout(5)  # a client that connects and sends nothing must not block the worker
+        try:
+            _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+            request = _receive(conn)
+        except (OSError, ValueError):
+            conn.close()
+            return
+        conn.settimeout(None)
+        if request is None:
+            conn.close()
+            for fd in fds:
+                os.close(fd)
+            return
+        command = request.get("command")
+        if command is not None:
+            self._command(conn, command)
+            conn.close()
+            return
+        self.refresh()
+        if (self.restart or request.get("root") != str(ROOT)
+                or request.get("module") not in ENTRY_POINTS or len(fds) != 3):
+            _send(conn, {"fallback": True})
+            conn.close()
+            for fd in fds:
+                os.close(fd)
+            return
+        self._fork(conn, fds, request)
+
+    def _command(self, conn, command: str):
+        if command == "stop":
+            self.stopping = True
+        _send(conn, {"pid": os.getpid(), "root": str(ROOT), "uptime": time.time() - self.started,
+                     "served": self.served, "running": len(self.children)})
+
+    def _fork(self, conn, fds: list[int], request: dict):
+        import selectors
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self.listener.close()
+            self.selector.close()
+            for other, _, _ in self.children.values():
+                other.close()
+            _run_request(conn, fds, request)  # never returns
+        for fd in fds:
+            os.close(fd)
+        self.served += 1
+        self.children[pid] = (conn, request["module"], time.time())
+        self.selector.register(conn, selectors.EVENT_READ, pid)
+
+    def _client_closed(self, pid: int):
+        """The client hung up (Ctrl-C) while its request runs: interrupt the request."""
+        import signal
+
+        if pid in self.children:
+            conn = self.children[pid][0]
+            self.selector.unregister(conn)
+            try:
+                os.kill(pid, signal.SIGINT)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self):
+        for pid in list(self.children):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if not done:
+                continue
+            conn, module, start = self.children.pop(pid)
+            try:
+                self.selector.unregister(conn)
+            except (KeyError, ValueError):
+                pass
+            conn.close()
+            _log(f"{module:<28} exit {os.waitstatus_to_exitcode(status):<3} {time.time() - start:.2f}s")
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run_request(conn, fds: list[int], request: dict):
+    """Child side of a request: become the client's process, run its main(), report the code.
+
+    Never returns: whatever happens, the child must not fall back into the
+    worker's accept loop.
+    """
+    import atexit
+    import signal
+    import traceback
+
+    import data_loader
+
+    code = 1
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        for stream in (sys.stdout, sys.stderr):
+            stream.reconfigure(line_buffering=stream.isatty())
+        for name in FORWARD_ENV:
+            if name in request["env"]:
+                os.environ[name] = request["env"][name]
+            else:
+                os.environ.pop(name, None)
+        data_loader.enable_validation(os.environ.get(data_loader.VALIDATE_ENV, "") not in ("", "0"))
+        os.chdir(request["cwd"])
+        sys.argv = request["argv"]
+        try:
+            sys.modules[request["module"]].main()
+            code = 0
+        except SystemExit as e:
+            code = _exit_code(e.code)
+        except KeyboardInterrupt:
+            code = 130
+        except BaseException:
+            traceback.print_exc()
+        # The client hangs up once it has the code; the worker's SIGINT for that must not land here.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        _send(conn, {"exit": code})
+    except BaseException:
+        pass
+    finally:
+        os._exit(code)
+
+
+# ── Control ──
+
+def _ask(command: str) -> dict | None:
+    conn = _connect(timeout=5)
+    if conn is None:
+        return None
+    with conn:
+        try:
+            socket.send_fds(conn, [b"C"], [])
+            _send(conn, {"command": command})
+            return _receive(conn)
+        except OSError:
+            return None
+
+
+def start(idle_timeout: float) -> bool:
+    import subprocess
+
+    if _ask("status") is not None:
+        print(f"  · Worker already running for {ROOT}")
+        return True
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOG_PATH, "a", encoding="utf-8") as log:
+        proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve", "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if (status := _ask("status")) is not None:
+            print(f"  ✓ Worker started (pid {status['pid']}) — log: {LOG_PATH.relative_to(ROOT)}")
+            return True
+        if proc.poll() is not None:
+            break
+        time.sleep(0.1)
+    print(f"  ✗ Worker did not start — see {LOG_PATH}")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm worker process for the package.json CLI scripts")
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"])
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help=f"Exit after this many seconds without requests; 0 = never "
+                             f"(default: {DEFAULT_IDLE_TIMEOUT})")
+    args = parser.parse_args()
+
+    if not supported():
+        print("  ⚠ Unix sockets with descriptor passing not available — scripts run in-process")
+        sys.exit(0 if args.command in ("status", "stop") else 1)
+
+    if args.command == "serve":
+        _make_socket_dir()
+        worker = Worker(args.idle_timeout)
+        worker.warm()
+        worker.serve()
+    elif args.command == "start":
+        sys.exit(0 if start(args.idle_timeout) else 1)
+    elif args.command == "stop":
+        status = _ask("stop")
+        print(f"  ✓ Stopped worker (pid {status['pid']})" if status else "  · No worker running")
+    else:
+        status = _ask("status")
+        if status is None:
+            print(f"  · No worker running for {ROOT} — scripts run in-process")
+            return
+        print(f"  ✓ Worker pid {status['pid']}  |  up {status['uptime'] / 60:.0f} min"
+              f"  |  {status['served']} request(s) served, {status['running']} running")
+        print(f"    {status['root']}  ({SOCKET_PATH})")
+
+
+if __name__ == "__main__":
+    main()